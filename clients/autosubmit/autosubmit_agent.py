@@ -2,12 +2,17 @@ import os
 import subprocess
 from time import sleep
 
+from sregym.conductor.problem_token import PROBLEM_TOKEN_HEADER, problem_token
+
 api_hostname = os.getenv("API_HOSTNAME", "localhost")
 api_port = os.getenv("API_PORT", "8000")
 server_url = f"http://{api_hostname}:{api_port}"
 
 
 def automatic_submit():
+    # Name this agent's problem when several run at once
+    token = problem_token()
+    token_header = ["-H", f"{PROBLEM_TOKEN_HEADER}: {token}"] if token else []
     ctr = 0
     while ctr < 10000:
         subprocess.run(
@@ -18,6 +23,7 @@ def automatic_submit():
                 f"{server_url}/submit",
                 "-H",
                 "Content-Type: application/json",
+                *token_header,
                 "-d",
                 '{"solution":"yes"}',
             ],
@@ -15,6 +15,7 @@ import requests
 
 from clients.claudecode.claudecode_agent import ClaudeCodeAgent
 from logger import init_logger
+from sregym.conductor.problem_token import PROBLEM_TOKEN_HEADER, problem_token, problem_token_headers
 
 # Add SREGym root to path
 sregym_root = Path(__file__).resolve().parents[2]
@@ -65,7 +66,7 @@ def get_app_info() -> dict:
     logger.info(f"Fetching app info from {api_url}")
 
     try:
-        response = requests.get(api_url)
+        response = requests.get(api_url, headers=problem_token_headers())
         response.raise_for_status()
         app_info = response.json()
         logger.info(f"App info: {app_info}")
@@ -81,7 +82,7 @@ def get_problem_id() -> str:
     logger.info(f"Fetching problem ID from {api_url}")
 
     try:
-        response = requests.get(api_url)
+        response = requests.get(api_url, headers=problem_token_headers())
         response.raise_for_status()
         problem_data = response.json()
         problem_id = problem_data.get("problem_id")
@@ -115,7 +116,7 @@ def wait_for_ready_stage(timeout: int = 300) -> str:
 
     while time.time() - start_time < timeout:
         try:
-            response = requests.get(api_url)
+            response = requests.get(api_url, headers=problem_token_headers())
             response.raise_for_status()
             status_data = response.json()
             stage = status_data.get("stage")
@@ -156,6 +157,13 @@ def build_instruction(app_info: dict) -> str:
     else:
         namespace_block = f"Namespace: {namespaces[0]}"
 
+    # Several problems share the conductor API when run concurrently; name this one in every request
+    token = problem_token()
+    token_field = f', "token": "{token}"' if token else ""
+    token_note = (
+        f"- Send the header {PROBLEM_TOKEN_HEADER}: {token} with every conductor API request\n" if token else ""
+    )
+
     # Build instruction similar to how it would be done in Harbor
     instruction = f"""You are an SRE agent tasked with diagnosing and fixing issues in a Kubernetes application.
 
@@ -187,17 +195,17 @@ The submission endpoint is: {get_api_base_url()}/submit
 
 For DIAGNOSIS stage:
 - Submit with a natural language description of the issue
-- Example: POST {get_api_base_url()}/submit with JSON: {{"solution": "The frontend service is crashing due to missing environment variable"}}
+- Example: POST {get_api_base_url()}/submit with JSON: {{"solution": "The frontend service is crashing due to missing environment variable"{token_field}}}
 
 For MITIGATION stage:
 - Submit with an EMPTY STRING after you have applied the fix
-- POST {get_api_base_url()}/submit with JSON: {{"solution": ""}}
+- POST {get_api_base_url()}/submit with JSON: {{"solution": ""{token_field}}}
 
 Important:
 - You have access to kubectl commands to inspect and modify resources in namespace(s): {", ".join(namespaces)}
 - You can query metrics and traces through the available observability tools
 - The conductor API is available at {get_api_base_url()}
-"""
+{token_note}"""
 
     logger.info(f"Built instruction:\n{instruction}")
     return instruction
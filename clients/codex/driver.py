@@ -19,6 +19,7 @@ if str(sregym_root) not in sys.path:
     sys.path.insert(0, str(sregym_root))
 
 from logger import init_logger  # noqa: E402
+from sregym.conductor.problem_token import PROBLEM_TOKEN_HEADER, problem_token, problem_token_headers  # noqa: E402
 
 init_logger()
 
@@ -82,7 +83,7 @@ def get_app_info() -> dict:
     logger.info(f"Fetching app info from {api_url}")
 
     try:
-        response = requests.get(api_url)
+        response = requests.get(api_url, headers=problem_token_headers())
         response.raise_for_status()
         app_info = response.json()
         logger.info(f"App info: {app_info}")
@@ -98,7 +99,7 @@ def get_problem_id() -> str:
     logger.info(f"Fetching problem ID from {api_url}")
 
     try:
-        response = requests.get(api_url)
+        response = requests.get(api_url, headers=problem_token_headers())
         response.raise_for_status()
         problem_data = response.json()
         problem_id = problem_data.get("problem_id")
@@ -132,7 +133,7 @@ def wait_for_ready_stage(timeout: int = 300) -> str:
 
     while time.time() - start_time < timeout:
         try:
-            response = requests.get(api_url)
+            response = requests.get(api_url, headers=problem_token_headers())
             response.raise_for_status()
             status_data = response.json()
             stage = status_data.get("stage")
@@ -165,6 +166,13 @@ def build_instruction(app_info: dict) -> str:
     namespace = app_info.get("namespace", "default")
     descriptions = app_info.get("descriptions", "")
 
+    # Several problems share the conductor API when run concurrently; name this one in every request
+    token = problem_token()
+    token_field = f', "token": "{token}"' if token else ""
+    token_note = (
+        f"- Send the header {PROBLEM_TOKEN_HEADER}: {token} with every conductor API request\n" if token else ""
+    )
+
     # Build instruction similar to how it would be done in Harbor
     instruction = f"""You are an SRE agent tasked with diagnosing and fixing issues in a Kubernetes application.
 
@@ -197,18 +205,18 @@ The submission endpoint is: {get_api_base_url()}/submit
 
 For DIAGNOSIS stage:
 - Submit with a natural language description of the issue
-- Example: POST {get_api_base_url()}/submit with JSON: {{"solution": "The frontend service is crashing due to missing environment variable"}}
+- Example: POST {get_api_base_url()}/submit with JSON: {{"solution": "The frontend service is crashing due to missing environment variable"{token_field}}}
 
 For MITIGATION stage:
 - After applying your fix, YOU MUST submit with an EMPTY STRING
-- POST {get_api_base_url()}/submit with JSON: {{"solution": ""}}
+- POST {get_api_base_url()}/submit with JSON: {{"solution": ""{token_field}}}
 - This submission is MANDATORY - the conductor needs it to validate your fix
 
 Important:
 - You have access to kubectl commands to inspect and modify resources in namespace '{namespace}'
 - You can query metrics and traces through the available observability tools
 - The conductor API is available at {get_api_base_url()}
-"""
+{token_note}"""
 
     logger.info(f"Built instruction:\n{instruction}")
     return instruction
@@ -41,8 +41,8 @@ class BaseAgent:
             raise ValueError("Agent must have at least one tool!")
         return tools
 
-    def call_model(self, state: State):
-        ai_message = self.llm.inference(messages=state["messages"], tools=self._all_tools())
+    async def call_model(self, state: State):
+        ai_message = await self.llm.ainference(messages=state["messages"], tools=self._all_tools())
         self.logger.debug(f"[Step {state['num_steps']}] LLM response: {ai_message.content}")
         if ai_message.content == "Server side error":
             return {"messages": []}
@@ -64,7 +64,7 @@ class BaseAgent:
     async def force_submit(self, state: State):
         self.logger.warning(f"Agent reached step limit ({self.max_step}), forcing submission.")
         prompt = HumanMessage("You have reached your step limit. Please submit your best answer using the submit tool.")
-        ai_message = self.llm.inference(messages=state["messages"] + [prompt], tools=[self.submit_tool])
+        ai_message = await self.llm.ainference(messages=state["messages"] + [prompt], tools=[self.submit_tool])
 
         if isinstance(ai_message, AIMessage) and ai_message.tool_calls:
             tool_call = ai_message.tool_calls[0]
@@ -80,7 +80,7 @@ class BaseAgent:
             # LLM didn't use the submit tool — ask for its best answer as plain text instead.
             self.logger.warning("LLM did not call the submit tool during force submit. Extracting plain-text answer.")
             plain_prompt = HumanMessage("Please write out your best answer as plain text.")
-            plain_response = self.llm.inference(messages=state["messages"] + [prompt, ai_message, plain_prompt])
+            plain_response = await self.llm.ainference(messages=state["messages"] + [prompt, ai_message, plain_prompt])
             ans = plain_response.content if isinstance(plain_response, AIMessage) else ""
 
         await manual_submit_tool(ans=ans)
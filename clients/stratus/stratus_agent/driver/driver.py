@@ -41,10 +41,13 @@ from clients.stratus.stratus_agent.mitigation_agent import (  # noqa: E402
     single_run_with_predefined_prompts as mitigation_agent_single_run,
 )
 from clients.stratus.stratus_agent.rollback_agent import perform_rollback  # noqa: E402
+from clients.stratus.stratus_utils.trajectory import DeltaEncoder  # noqa: E402
+from clients.stratus.stratus_utils.trajectory import metadata_fields as trajectory_metadata_fields  # noqa: E402
 from clients.stratus.tools.submit_tool import manual_submit_tool  # noqa: E402
 from clients.stratus.weak_oracles.alert_oracle import AlertOracle  # noqa: E402
 from clients.stratus.weak_oracles.base_oracle import BaseOracle, OracleResult  # noqa: E402
 from clients.stratus.weak_oracles.cluster_state_oracle import ClusterStateOracle  # noqa: E402
+from sregym.conductor.problem_token import problem_token_headers  # noqa: E402
 
 logger = logging.getLogger("all.stratus.driver")
 logger.propagate = True
@@ -143,13 +146,18 @@ def save_combined_trajectory(all_trajectories, problem_id, output_dir=None):
                 "timestamp_readable": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 "total_stages": len(all_trajectories),
                 "total_events": total_events,
+                **trajectory_metadata_fields(),
             }
             f.write(json.dumps(metadata) + "\n")
 
+            # Events carry the cumulative history; store only what each one adds (see stratus_utils.trajectory)
+            encoder = DeltaEncoder(serialize=serialize_message)
+
             # Write each stage
             for _stage_idx, stage_data in enumerate(all_trajectories):
                 stage_name = stage_data.get("stage", "unknown")
                 events = stage_data.get("events", [])
+                encoder.reset()
 
                 # Write stage marker
                 stage_marker = {
@@ -173,8 +181,7 @@ def save_combined_trajectory(all_trajectories, problem_id, output_dir=None):
 
                         # Serialize messages
                         if "messages" in event and event["messages"]:
-                            event_data["messages"] = [serialize_message(msg) for msg in event["messages"]]
-                            event_data["last_message"] = serialize_message(event["messages"][-1])
+                            event_data.update(encoder.encode(event["messages"]))
 
                         f.write(json.dumps(event_data) + "\n")
                     except Exception as e:
@@ -217,7 +224,7 @@ def get_app_info():
     ltc = LanggraphToolConfig()
     url = ltc.benchmark_app_info_url
     try:
-        response = requests.get(url)
+        response = requests.get(url, headers=problem_token_headers())
         logger.debug(f"Agent gets response: status: {response.status_code}, text: {response.text}")
         app_info_str = str(response.text)
         logger.debug(f"App info as str: {app_info_str} ")
@@ -233,7 +240,7 @@ def get_curr_problem():
     ltc = LanggraphToolConfig()
     url = ltc.benchmark_current_problem
     try:
-        response = requests.get(url)
+        response = requests.get(url, headers=problem_token_headers())
         logger.info(f"Response status: {response.status_code}, text: {response.text}")
         problem_str = str(response.text)
         logger.info(f"problem as str: {problem_str}")
@@ -257,7 +264,7 @@ def get_benchmark_status():
         api_port = os.getenv("API_PORT", "8000")
         status_url = f"http://{api_hostname}:{api_port}/status"
 
-        response = requests.get(status_url, timeout=5)
+        response = requests.get(status_url, headers=problem_token_headers(), timeout=5)
         if response.status_code == 200:
             data = response.json()
             return data.get("stage", "error")
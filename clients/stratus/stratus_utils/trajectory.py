@@ -0,0 +1,198 @@
+"""
+Agent trajectory files (JSONL): a metadata line, then per stage a
+"stage_start" line followed by its "event" lines.
+
+Version 1 stores the full message history in every event (and its last message
+a second time). LangGraph events carry the cumulative history, so v1 files grow
+quadratically with the number of steps.
+
+Version 2 (metadata "format_version": 2) stores in each event only the messages
+appended since the previous event of the same stage, as "messages_base" (the
+length of the history they extend) and "new_messages". An event holds the full
+"messages" list instead ("checkpoint": true) when it is the first of its stage,
+every `checkpoint_every` events, and whenever the history was rewritten rather
+than extended (e.g. after a rollback or summarization).
+
+TrajectoryReader reads both versions. It indexes the file once and rebuilds an
+event's full history only when asked for it, replaying deltas from the nearest
+checkpoint. Only the standard library is used, so the visualizer can import it.
+"""
+
+import json
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+FORMAT_VERSION = 2
+CHECKPOINT_EVERY = 20
+
+
+class DeltaEncoder:
+    """Turns the successive cumulative message histories of one stage into v2 event fields."""
+
+    def __init__(self, serialize: Callable[[Any], dict] | None = None, checkpoint_every: int = CHECKPOINT_EVERY):
+        self.serialize = serialize or (lambda message: message)
+        self.checkpoint_every = checkpoint_every
+        self.reset()
+
+    def reset(self):
+        """Start a new stage; its first event is a checkpoint."""
+        self._previous: list = []
+        self._since_checkpoint: int | None = None
+
+    def _extends_previous(self, messages: list) -> bool:
+        if len(messages) < len(self._previous):
+            return False
+        return all(old is new or old == new for old, new in zip(self._previous, messages, strict=False))
+
+    def encode(self, messages: list) -> dict:
+        """Fields to add to the event record whose full history is `messages`."""
+        if (
+            self._since_checkpoint is None
+            or self._since_checkpoint + 1 >= self.checkpoint_every
+            or not self._extends_previous(messages)
+        ):
+            fields = {"checkpoint": True, "messages": [self.serialize(m) for m in messages]}
+            since_checkpoint = 0
+        else:
+            base = len(self._previous)
+            fields = {"messages_base": base, "new_messages": [self.serialize(m) for m in messages[base:]]}
+            since_checkpoint = self._since_checkpoint + 1
+        # Only advance once serialization succeeded, so a failed event does not desync the next delta
+        self._previous = list(messages)
+        self._since_checkpoint = since_checkpoint
+        return fields
+
+
+def metadata_fields(checkpoint_every: int = CHECKPOINT_EVERY) -> dict:
+    """Fields identifying a v2 file, for its metadata line."""
+    return {"format_version": FORMAT_VERSION, "checkpoint_every": checkpoint_every}
+
+
+def write_trajectory(
+    path: str | Path,
+    metadata: dict,
+    stages: list[tuple[str, list[dict]]],
+    checkpoint_every: int = CHECKPOINT_EVERY,
+):
+    """
+    Write a v2 file from already serialized events. `stages` holds (stage, events)
+    pairs; each event's cumulative "messages" is delta-encoded, its other keys are kept.
+    """
+    encoder = DeltaEncoder(checkpoint_every=checkpoint_every)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({**metadata, **metadata_fields(checkpoint_every)}, ensure_ascii=False) + "\n")
+        for stage, events in stages:
+            encoder.reset()
+            f.write(json.dumps({"type": "stage_start", "stage": stage, "num_events": len(events)}) + "\n")
+            for event in events:
+                record = {k: v for k, v in event.items() if k not in ("messages", "last_message")}
+                if event.get("messages"):
+                    record.update(encoder.encode(event["messages"]))
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def has_messages(record: dict) -> bool:
+    """Whether an event record has a non-empty message history, in either format."""
+    # A delta always extends a non-empty history, even when it adds nothing
+    return bool(record.get("messages")) or "new_messages" in record
+
+
+class TrajectoryReader:
+    """Reads v1 and v2 trajectory files; full histories are rebuilt on demand."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.metadata: dict = {}
+        # (stage, event_index) -> (offset of the event line, offset of the checkpoint it builds on)
+        self._events: dict[tuple[str, int], tuple[int, int | None]] = {}
+        self._index()
+
+    @property
+    def version(self) -> int:
+        return self.metadata.get("format_version", 1)
+
+    def _lines(self, start: int = 0) -> Iterator[tuple[int, dict]]:
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                line_offset, offset = offset, offset + len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield line_offset, record
+
+    def _index(self):
+        checkpoints: dict[str, int] = {}
+        for offset, record in self._lines():
+            kind = record.get("type")
+            if kind == "metadata" and not self.metadata:
+                self.metadata = record
+            elif kind == "event" and isinstance(record.get("event_index"), int):
+                stage = record.get("stage", "")
+                if "messages" in record:
+                    checkpoints[stage] = offset
+                self._events[(stage, record["event_index"])] = (offset, checkpoints.get(stage))
+
+    def records(self) -> Iterator[dict]:
+        """Every record as stored; v2 events keep their deltas."""
+        for _, record in self._lines():
+            yield record
+
+    def event_keys(self) -> list[tuple[str, int]]:
+        """(stage, event_index) of every event, in file order."""
+        return list(self._events)
+
+    def messages(self, stage: str, event_index: int) -> list[dict]:
+        """The full message history as of the given event."""
+        offset, checkpoint = self._events[(stage, event_index)]
+        if checkpoint is None:
+            return []
+        history: list[dict] = []
+        for line_offset, record in self._lines(checkpoint):
+            if line_offset >= offset:
+                # An event without messages has no history of its own, whatever came before it
+                return _apply(history, record) if has_messages(record) else []
+            if record.get("type") == "event" and record.get("stage", "") == stage:
+                history = _apply(history, record)
+        return history
+
+    def event(self, stage: str, event_index: int) -> dict:
+        """The event as a v1 record, with its full "messages" and "last_message"."""
+        offset, _ = self._events[(stage, event_index)]
+        record = next(self._lines(offset))[1]
+        return _as_v1(record, self.messages(stage, event_index) if has_messages(record) else [])
+
+    def events(self) -> Iterator[dict]:
+        """Every event as a v1 record, rebuilt in a single pass over the file."""
+        histories: dict[str, list[dict]] = {}
+        for record in self.records():
+            if record.get("type") != "event":
+                continue
+            stage = record.get("stage", "")
+            if has_messages(record):
+                histories[stage] = _apply(histories.get(stage, []), record)
+                yield _as_v1(record, histories[stage])
+            else:
+                yield _as_v1(record, [])
+
+
+def _apply(history: list[dict], record: dict) -> list[dict]:
+    if "messages" in record:
+        return list(record["messages"] or [])
+    if "new_messages" in record:
+        return history[: record.get("messages_base", len(history))] + list(record["new_messages"])
+    return history
+
+
+def _as_v1(record: dict, history: list[dict]) -> dict:
+    event = {k: v for k, v in record.items() if k not in ("checkpoint", "messages_base", "new_messages")}
+    if history:
+        event["messages"] = list(history)
+        event["last_message"] = history[-1]
+    return event
@@ -14,6 +14,7 @@ from mcp.client.sse import sse_client
 
 from clients.stratus.configs.langgraph_tool_configs import LanggraphToolConfig
 from clients.stratus.stratus_agent.state import State
+from sregym.conductor.problem_token import problem_token, problem_token_headers
 
 submit_tool_docstring = """
 Use this tool to submit your answer to the assigned tasks. You can give partial answer or empty answer
@@ -42,7 +43,7 @@ def get_benchmark_status() -> str:
         api_port = os.getenv("API_PORT", "8000")
         status_url = f"http://{api_hostname}:{api_port}/status"
 
-        response = requests.get(status_url, timeout=5)
+        response = requests.get(status_url, headers=problem_token_headers(), timeout=5)
         if response.status_code == 200:
             data = response.json()
             return data.get("stage", "error")
@@ -54,6 +55,15 @@ def get_benchmark_status() -> str:
         return "error"
 
 
+def _submit_arguments(ans: str) -> dict:
+    """Arguments for the MCP submit tool, naming this agent's problem when several run at once."""
+    arguments = {"ans": ans}
+    token = problem_token()
+    if token:
+        arguments["token"] = token
+    return arguments
+
+
 @tool(description=submit_tool_docstring)
 async def submit_tool(
     ans: str, state: Annotated[State, InjectedState], tool_call_id: Annotated[str, InjectedToolCallId]
@@ -71,9 +81,7 @@ async def submit_tool(
 
     result = await session.call_tool(
         "submit",
-        arguments={
-            "ans": ans,
-        },
+        arguments=_submit_arguments(ans),
     )
     result = result.content[0].text
     result = ast.literal_eval(result)
@@ -166,9 +174,7 @@ async def manual_submit_tool(ans: str) -> str:
 
     await session.call_tool(
         "submit",
-        arguments={
-            "ans": ans,
-        },
+        arguments=_submit_arguments(ans),
     )
     try:
         await exit_stack.aclose()
@@ -7,6 +7,7 @@ import time
 import requests
 
 from clients.stratus.weak_oracles.base_oracle import BaseOracle, OracleResult
+from sregym.conductor.problem_token import problem_token_headers
 
 logger = logging.getLogger("all.stratus.alert_oracle")
 
@@ -19,7 +20,7 @@ def _get_benchmark_status() -> str:
     try:
         api_hostname = os.getenv("API_HOSTNAME", "localhost")
         api_port = os.getenv("API_PORT", "8000")
-        response = requests.get(f"http://{api_hostname}:{api_port}/status", timeout=5)
+        response = requests.get(f"http://{api_hostname}:{api_port}/status", headers=problem_token_headers(), timeout=5)
         if response.status_code == 200:
             return response.json().get("stage", "unknown")
     except Exception:
@@ -25,6 +25,7 @@ if str(sregym_root) not in sys.path:
     sys.path.insert(0, str(sregym_root))
 
 from logger import init_logger  # noqa: E402
+from sregym.conductor.problem_token import problem_token_headers  # noqa: E402
 
 init_logger()
 
@@ -151,7 +152,7 @@ def get_app_info(max_retries: int = 6, backoff: int = 5) -> dict:
     """Fetch application info from conductor."""
     for attempt in range(1, max_retries + 1):
         try:
-            resp = requests.get(f"{CONDUCTOR_URL}/get_app", timeout=10)
+            resp = requests.get(f"{CONDUCTOR_URL}/get_app", headers=problem_token_headers(), timeout=10)
             resp.raise_for_status()
             info = resp.json()
             logger.info(f"App info: {info}")
@@ -166,7 +167,7 @@ def get_app_info(max_retries: int = 6, backoff: int = 5) -> dict:
 
 def get_problem_id() -> str:
     """Fetch current problem ID from conductor."""
-    resp = requests.get(f"{CONDUCTOR_URL}/get_problem", timeout=10)
+    resp = requests.get(f"{CONDUCTOR_URL}/get_problem", headers=problem_token_headers(), timeout=10)
     resp.raise_for_status()
     problem_id = resp.json().get("problem_id", "unknown")
     logger.info(f"Problem ID: {problem_id}")
@@ -178,7 +179,7 @@ def wait_for_stage(target_stages: set[str], timeout: int = 300) -> str:
     start = time.time()
     while time.time() - start < timeout:
         try:
-            resp = requests.get(f"{CONDUCTOR_URL}/status", timeout=10)
+            resp = requests.get(f"{CONDUCTOR_URL}/status", headers=problem_token_headers(), timeout=10)
             resp.raise_for_status()
             stage = resp.json().get("stage", "")
             if stage in target_stages:
@@ -197,6 +198,7 @@ def submit_to_conductor(solution: str) -> None:
     resp = requests.post(
         f"{CONDUCTOR_URL}/submit",
         json={"solution": solution},
+        headers=problem_token_headers(),
         timeout=30,
     )
     if not resp.ok:
@@ -1,23 +1,88 @@
+import asyncio
 import contextlib
 import json
 import logging
 import os
+import threading
 import time
+from collections import deque
+from dataclasses import dataclass
 from typing import Any
 
+import httpx
 import litellm
 import openai
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    message_to_dict,
+    messages_from_dict,
+)
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langchain_litellm import ChatLiteLLM
 from requests.exceptions import HTTPError
 
 from llm_backend.trim_util import trim_messages_conservative
+from sregym.utils.cache import LLM_CACHE_MODES, LLMCache, LLMCacheMiss
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 LLM_QUERY_MAX_RETRIES = int(os.getenv("LLM_QUERY_MAX_RETRIES", "5"))
 LLM_QUERY_INIT_RETRY_DELAY = int(os.getenv("LLM_QUERY_INIT_RETRY_DELAY", "1"))
+LLM_HTTP_MAX_CONNECTIONS = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "100"))
+# Per-call metrics kept per backend; totals cover every call
+LLM_METRICS_HISTORY = 1000
+
+
+@dataclass
+class LLMCallMetrics:
+    """Latency and token usage of one inference call (including its retries)."""
+
+    model: str
+    latency_s: float
+    attempts: int
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    ok: bool = True
+    cached: bool = False
+
+
+@dataclass
+class _RetryPlan:
+    delay: float
+    next_retry_delay: float
+    trim: bool = False
+
+
+_http_client_lock = threading.Lock()
+
+
+def _canonical_message(message) -> dict:
+    """The parts of a message that reach the model; ids and response metadata do not."""
+    if not isinstance(message, BaseMessage):
+        return message
+    data = {"type": message.type, "content": message.content}
+    tool_calls = getattr(message, "tool_calls", None)
+    if tool_calls:
+        data["tool_calls"] = [{"name": tc["name"], "args": tc["args"], "id": tc.get("id")} for tc in tool_calls]
+    tool_call_id = getattr(message, "tool_call_id", None)
+    if tool_call_id:
+        data["tool_call_id"] = tool_call_id
+    return data
+
+
+def _share_http_connections():
+    """Make litellm's sync provider clients share one pooled HTTP client instead of reconnecting per call."""
+    with _http_client_lock:
+        if litellm.client_session is None:
+            litellm.client_session = httpx.Client(
+                limits=httpx.Limits(max_connections=LLM_HTTP_MAX_CONNECTIONS, max_keepalive_connections=20),
+                timeout=httpx.Timeout(600.0, connect=10.0),
+            )
 
 
 class LiteLLMBackend:
@@ -38,13 +103,95 @@ class LiteLLMBackend:
         self.max_tokens = max_tokens
         litellm.drop_params = True
         litellm.modify_params = True
+        _share_http_connections()
 
-    def inference(
+        model_config = {"model": self.model_name}
+        if self.temperature is not None:
+            model_config["temperature"] = self.temperature
+        if self.top_p is not None:
+            model_config["top_p"] = self.top_p
+        if self.api_key is not None:
+            model_config["api_key"] = self.api_key
+        if self.api_base is not None:
+            model_config["api_base"] = self.api_base
+        if self.max_tokens is not None:
+            model_config["max_tokens"] = self.max_tokens
+        self.llm = ChatLiteLLM(**model_config)
+        # Tool bindings (and tool schemas, for cache keys) by the identities of the tools; the tools
+        # are kept alive so their ids stay unique
+        self._bound: dict[tuple[int, ...], tuple[tuple, Any, list[dict]]] = {}
+
+        self.cache_mode = os.getenv("LLM_CACHE_MODE", "off")
+        if self.cache_mode not in LLM_CACHE_MODES:
+            raise ValueError(f"LLM_CACHE_MODE must be one of {LLM_CACHE_MODES}, got '{self.cache_mode}'")
+        self.cache = LLMCache() if self.cache_mode != "off" else None
+
+        self.calls: deque[LLMCallMetrics] = deque(maxlen=LLM_METRICS_HISTORY)
+        self.totals = {
+            "calls": 0,
+            "failed_calls": 0,
+            "cache_hits": 0,
+            "latency_s": 0.0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+        }
+        self._metrics_lock = threading.Lock()
+
+    def _binding(self, tools: list) -> tuple[tuple, Any, list[dict]]:
+        key = tuple(id(tool) for tool in tools)
+        entry = self._bound.get(key)
+        if entry is None:
+            entry = (
+                tuple(tools),
+                self.llm.bind_tools(tools, tool_choice="auto"),
+                [convert_to_openai_tool(tool) for tool in tools],
+            )
+            self._bound[key] = entry
+        return entry
+
+    def _client(self, tools: list | None):
+        return self._binding(tools)[1] if tools else self.llm
+
+    def _cache_key(self, prompt_messages: list, tools: list | None) -> str | None:
+        if self.cache is None:
+            return None
+        return LLMCache.request_key(
+            {
+                "model": self.model_name,
+                "messages": [_canonical_message(m) for m in prompt_messages],
+                "tools": self._binding(tools)[2] if tools else None,
+                "tool_choice": "auto" if tools else None,
+                "temperature": self.temperature,
+                "top_p": self.top_p,
+                "max_tokens": self.max_tokens,
+            }
+        )
+
+    def _cached_response(self, cache_key: str | None, started: float):
+        if cache_key is None or self.cache_mode == "record":
+            return None
+        entry = self.cache.get(cache_key)
+        if entry is None:
+            if self.cache_mode == "replay":
+                raise LLMCacheMiss(f"No recorded {self.model_name} response for request {cache_key}")
+            return None
+        completion = messages_from_dict([entry["response"]])[0]
+        self._record(started, 0, completion, cached=True)
+        return completion
+
+    def _store_response(self, cache_key: str | None, completion):
+        if cache_key is None or not isinstance(completion, BaseMessage):
+            return
+        try:
+            self.cache.put(cache_key, {"model": self.model_name, "response": message_to_dict(completion)})
+        except OSError as e:
+            logger.warning(f"Failed to store LLM response in the cache: {e}")
+
+    def _prompt_messages(
         self,
         messages: str | list[SystemMessage | HumanMessage | AIMessage],
-        system_prompt: str | None = None,
-        tools: list[any] | None = None,
-    ):
+        system_prompt: str | None,
+    ) -> list:
         if isinstance(messages, str):
             if system_prompt is None:
                 logger.info("No system prompt provided. Using default system prompt.")
@@ -67,26 +214,92 @@ class LiteLLMBackend:
                 prompt_messages.insert(0, system_message)
         else:
             raise ValueError(f"messages must be either a string or a list of dicts, but got {type(messages)}")
+        return prompt_messages
 
-        model_config = {"model": self.model_name}
-        if self.temperature is not None:
-            model_config["temperature"] = self.temperature
-        if self.top_p is not None:
-            model_config["top_p"] = self.top_p
-        if self.api_key is not None:
-            model_config["api_key"] = self.api_key
-        if self.api_base is not None:
-            model_config["api_base"] = self.api_base
-        if self.max_tokens is not None:
-            model_config["max_tokens"] = self.max_tokens
-
-        llm = ChatLiteLLM(**model_config)
+    def _retry_plan(self, e: Exception, attempt: int, retry_delay: float, prompt_messages: list) -> _RetryPlan:
+        """How long to back off after `e`, or re-raise it when retrying cannot help."""
+        if isinstance(e, openai.BadRequestError):
+            logger.error(f"Bad request error - request is malformed: {e}")
+            logger.error(f"Error details: {_safe_response_details(e)}")
+            logger.error("This often happens when tool_calls don't have matching tool response messages.")
+            logger.error(f"Last few messages: {prompt_messages[-3:] if len(prompt_messages) >= 3 else prompt_messages}")
+            raise e
+        if isinstance(e, (openai.RateLimitError, HTTPError)):
+            logger.warning(
+                f"Rate-limited. Retrying in {retry_delay} seconds... (Attempt {attempt + 1}/{LLM_QUERY_MAX_RETRIES})"
+            )
+            return _RetryPlan(retry_delay, retry_delay * 2)
+        if isinstance(e, openai.APIError):
+            logger.warning(
+                f"OpenAI API error occurred: {e}. Retrying in {retry_delay} seconds... (Attempt {attempt + 1}/{LLM_QUERY_MAX_RETRIES})"
+            )
+            return _RetryPlan(retry_delay, retry_delay * 2)
+        if isinstance(e, litellm.RateLimitError):
+            provider_delay = _extract_retry_delay_seconds_from_exception(e)
+            if provider_delay is not None and provider_delay > 0:
+                logger.warning(
+                    f"Rate-limited by provider. Retrying in {provider_delay} seconds... (Attempt {attempt + 1}/{LLM_QUERY_MAX_RETRIES})"
+                )
+                return _RetryPlan(provider_delay, retry_delay, trim=True)
+            logger.warning(
+                f"Rate-limited. Retrying in {retry_delay} seconds... (Attempt {attempt + 1}/{LLM_QUERY_MAX_RETRIES})"
+            )
+            return _RetryPlan(retry_delay, retry_delay * 2, trim=True)
+        if isinstance(e, litellm.ServiceUnavailableError):
+            logger.warning(
+                f"Service unavailable (mostly 503). Retrying in 60 seconds... (Attempt {attempt + 1}/{LLM_QUERY_MAX_RETRIES})"
+            )
+            return _RetryPlan(60, retry_delay, trim=True)
+        if isinstance(e, IndexError):
+            logger.warning(
+                f"IndexError occurred on Gemini Server Side: {e}, keep calm for a while... {attempt + 1}/{LLM_QUERY_MAX_RETRIES}"
+            )
+            return _RetryPlan(30, retry_delay, trim=True)
+        logger.error(f"An unexpected error occurred: {e}")
+        raise e
 
-        if tools:
-            llm = llm.bind_tools(tools, tool_choice="auto")
+    def _record(self, started: float, attempts: int, completion=None, cached: bool = False):
+        usage = getattr(completion, "usage_metadata", None) or {}
+        metrics = LLMCallMetrics(
+            model=self.model_name,
+            latency_s=time.monotonic() - started,
+            attempts=attempts,
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+            ok=completion is not None,
+            cached=cached,
+        )
+        with self._metrics_lock:
+            self.calls.append(metrics)
+            self.totals["calls"] += 1
+            self.totals["failed_calls"] += not metrics.ok
+            self.totals["cache_hits"] += cached
+            self.totals["latency_s"] += metrics.latency_s
+            self.totals["input_tokens"] += metrics.input_tokens
+            self.totals["output_tokens"] += metrics.output_tokens
+        logger.debug(
+            f"LLM call to {self.model_name}{' (cached)' if cached else ''}: {metrics.latency_s:.2f}s, {attempts} attempt(s), "
+            f"{metrics.input_tokens} in / {metrics.output_tokens} out tokens"
+        )
 
+    def inference(
+        self,
+        messages: str | list[SystemMessage | HumanMessage | AIMessage],
+        system_prompt: str | None = None,
+        tools: list[any] | None = None,
+    ):
+        """Blocking inference; backs off with time.sleep(). Use ainference() from async code."""
+        prompt_messages = self._prompt_messages(messages, system_prompt)
+        llm = self._client(tools)
         retry_delay = LLM_QUERY_INIT_RETRY_DELAY
         trim_message = False
+        started = time.monotonic()
+        # Keyed by the request as asked, before any trimming on retry
+        cache_key = self._cache_key(prompt_messages, tools)
+        cached = self._cached_response(cache_key, started)
+        if cached is not None:
+            return cached
 
         for attempt in range(LLM_QUERY_MAX_RETRIES):
             try:
@@ -95,62 +308,69 @@ class LiteLLMBackend:
                     logger.info(f"Trimming the {trim_sum}/{len(prompt_messages)} messages")
                     prompt_messages = new_prompt_messages
                 completion = llm.invoke(input=prompt_messages)
+                self._store_response(cache_key, completion)
+                self._record(started, attempt + 1, completion)
                 return completion
-            except openai.BadRequestError as e:
-                logger.error(f"Bad request error - request is malformed: {e}")
-                logger.error(f"Error details: {_safe_response_details(e)}")
-                logger.error("This often happens when tool_calls don't have matching tool response messages.")
-                logger.error(
-                    f"Last few messages: {prompt_messages[-3:] if len(prompt_messages) >= 3 else prompt_messages}"
-                )
-                raise
-            except (openai.RateLimitError, HTTPError):
-                logger.warning(
-                    f"Rate-limited. Retrying in {retry_delay} seconds... (Attempt {attempt + 1}/{LLM_QUERY_MAX_RETRIES})"
-                )
-                time.sleep(retry_delay)
-                retry_delay *= 2
-            except openai.APIError as e:
-                logger.warning(
-                    f"OpenAI API error occurred: {e}. Retrying in {retry_delay} seconds... (Attempt {attempt + 1}/{LLM_QUERY_MAX_RETRIES})"
-                )
-                time.sleep(retry_delay)
-                retry_delay *= 2
-
-            except litellm.RateLimitError as e:
-                provider_delay = _extract_retry_delay_seconds_from_exception(e)
-                if provider_delay is not None and provider_delay > 0:
-                    logger.warning(
-                        f"Rate-limited by provider. Retrying in {provider_delay} seconds... (Attempt {attempt + 1}/{LLM_QUERY_MAX_RETRIES})"
-                    )
-                    time.sleep(provider_delay)
-                else:
-                    logger.warning(
-                        f"Rate-limited. Retrying in {retry_delay} seconds... (Attempt {attempt + 1}/{LLM_QUERY_MAX_RETRIES})"
-                    )
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-
-                trim_message = True
-            except litellm.ServiceUnavailableError:
-                logger.warning(
-                    f"Service unavailable (mostly 503). Retrying in 60 seconds... (Attempt {attempt + 1}/{LLM_QUERY_MAX_RETRIES})"
-                )
-                time.sleep(60)
-                trim_message = True
-            except IndexError as e:
-                logger.warning(
-                    f"IndexError occurred on Gemini Server Side: {e}, keep calm for a while... {attempt + 1}/{LLM_QUERY_MAX_RETRIES}"
-                )
-                trim_message = True
-                time.sleep(30)
-                if attempt == LLM_QUERY_MAX_RETRIES - 1:
+            except Exception as e:
+                try:
+                    plan = self._retry_plan(e, attempt, retry_delay, prompt_messages)
+                except Exception:
+                    self._record(started, attempt + 1)
+                    raise
+                if isinstance(e, IndexError) and attempt == LLM_QUERY_MAX_RETRIES - 1:
                     logger.error("Max retries exceeded due to index error. Unable to complete the request.")
+                    self._record(started, attempt + 1)
                     return AIMessage(content="Server side error")
+                time.sleep(plan.delay)
+                retry_delay = plan.next_retry_delay
+                trim_message = trim_message or plan.trim
+
+        self._record(started, LLM_QUERY_MAX_RETRIES)
+        raise RuntimeError("Max retries exceeded. Unable to complete the request.")
+
+    async def ainference(
+        self,
+        messages: str | list[SystemMessage | HumanMessage | AIMessage],
+        system_prompt: str | None = None,
+        tools: list[any] | None = None,
+    ):
+        """Same as inference(), but calls litellm's async API and backs off without blocking the event loop."""
+        prompt_messages = self._prompt_messages(messages, system_prompt)
+        llm = self._client(tools)
+        retry_delay = LLM_QUERY_INIT_RETRY_DELAY
+        trim_message = False
+        started = time.monotonic()
+        # Keyed by the request as asked, before any trimming on retry
+        cache_key = self._cache_key(prompt_messages, tools)
+        cached = self._cached_response(cache_key, started)
+        if cached is not None:
+            return cached
+
+        for attempt in range(LLM_QUERY_MAX_RETRIES):
+            try:
+                if trim_message:
+                    new_prompt_messages, trim_sum = trim_messages_conservative(prompt_messages)
+                    logger.info(f"Trimming the {trim_sum}/{len(prompt_messages)} messages")
+                    prompt_messages = new_prompt_messages
+                completion = await llm.ainvoke(input=prompt_messages)
+                self._store_response(cache_key, completion)
+                self._record(started, attempt + 1, completion)
+                return completion
             except Exception as e:
-                logger.error(f"An unexpected error occurred: {e}")
-                raise
+                try:
+                    plan = self._retry_plan(e, attempt, retry_delay, prompt_messages)
+                except Exception:
+                    self._record(started, attempt + 1)
+                    raise
+                if isinstance(e, IndexError) and attempt == LLM_QUERY_MAX_RETRIES - 1:
+                    logger.error("Max retries exceeded due to index error. Unable to complete the request.")
+                    self._record(started, attempt + 1)
+                    return AIMessage(content="Server side error")
+                await asyncio.sleep(plan.delay)
+                retry_delay = plan.next_retry_delay
+                trim_message = trim_message or plan.trim
 
+        self._record(started, LLM_QUERY_MAX_RETRIES)
         raise RuntimeError("Max retries exceeded. Unable to complete the request.")
 
 
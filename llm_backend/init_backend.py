@@ -1,10 +1,12 @@
 import os
+from functools import cache
 
 from llm_backend.get_llm_backend import LiteLLMBackend
 
 
+@cache
 def get_llm_backend(model_name: str) -> LiteLLMBackend:
-    """Initialize an LLM backend for the given litellm model string."""
+    """The LLM backend for the given litellm model string; one long-lived instance per model."""
     print(f"🔧 Initializing LLM backend — model: {model_name}")
     return LiteLLMBackend(model_name=model_name)
 
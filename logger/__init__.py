@@ -1,11 +1,21 @@
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import RotatingFileHandler
 
 from rich.console import Console
 from rich.logging import RichHandler
 
-from .handler import ExhaustInfoFormatter
+from .handler import (
+    BatchingQueueListener,
+    CompressedRotatingFileHandler,
+    ExhaustInfoFormatter,
+    OwnRecordsFilter,
+    RateLimitFilter,
+    RecordQueueHandler,
+)
 
 # Shared Console used by both the logging stack and any rich.Live displays
 # (e.g. the benchmark Progress bar in main.py). Routing both through the same
@@ -20,6 +30,86 @@ def get_current_datetime_formatted():
     return formatted_datetime
 
 
+# Log pipeline settings: the 'all' logger and the root logger only enqueue records; a background
+# listener formats them and does the file and terminal I/O.
+LOG_MAX_BYTES = int(os.environ.get("SREGYM_LOG_MAX_BYTES", str(256 * 1024**2)))  # rotate past this size, 0 = never
+LOG_BACKUP_COUNT = int(os.environ.get("SREGYM_LOG_BACKUP_COUNT", "10"))
+LOG_COMPRESS = os.environ.get("SREGYM_LOG_COMPRESS", "0") == "1"  # write sregym_<ts>.log.gz
+LOG_LINE_BUFFERED = os.environ.get("SREGYM_LOG_LINE_BUFFERED", "0") == "1"  # sync .gz output after every line
+# Per-logger INFO/DEBUG records per second (bursts up to 10x), 0 = unlimited (the default)
+LOG_RATE_LIMIT = float(os.environ.get("SREGYM_LOG_RATE_LIMIT", "0"))
+
+_listener: BatchingQueueListener | None = None
+
+
+def _rich_handler() -> RichHandler:
+    rich_handler = RichHandler(
+        console=console,
+        show_time=True,
+        show_level=True,
+        show_path=False,
+        rich_tracebacks=True,
+        markup=False,
+    )
+    rich_handler.setFormatter(logging.Formatter(fmt="%(name)s - %(message)s"))
+    rich_handler.setLevel(logging.INFO)
+    return rich_handler
+
+
+def _queue_handler() -> RecordQueueHandler:
+    queue_handler = RecordQueueHandler(_listener.queue)
+    if LOG_RATE_LIMIT > 0:
+        queue_handler.addFilter(RateLimitFilter(LOG_RATE_LIMIT, burst=int(LOG_RATE_LIMIT * 10)))
+    return queue_handler
+
+
+def _start_listener():
+    global _listener
+    if _listener is not None:
+        return
+
+    timestamp = get_current_datetime_formatted()
+    # create dir and file
+    log_dir = os.environ.get("AGENT_LOGS_DIR", "./logs")
+    os.makedirs(log_dir, exist_ok=True)
+    if LOG_COMPRESS:
+        file_handler = CompressedRotatingFileHandler(
+            f"{log_dir}/sregym_{timestamp}.log.gz",
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            line_buffered=LOG_LINE_BUFFERED,
+        )
+    else:
+        file_handler = RotatingFileHandler(
+            f"{log_dir}/sregym_{timestamp}.log", maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+        )
+    # add code line and filename and function name
+    file_handler.setFormatter(
+        ExhaustInfoFormatter(
+            fmt="%(asctime)s - %(levelname)s - %(name)s - %(message)s - %(filename)s:%(funcName)s:%(lineno)d",
+            datefmt="%Y-%m-%d %H:%M:%S",
+            extra_attributes=["sol", "result", "Full Prompt", "Tool Calls"],
+        )
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.addFilter(OwnRecordsFilter())
+
+    _listener = BatchingQueueListener(queue.SimpleQueue(), file_handler, _rich_handler(), respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logger)
+
+
+def stop_logger():
+    """Drain the queue and close the log files (registered with atexit)."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
 def init_logger():
     # set up the logger for log file
     root_logger = logging.getLogger("all")
@@ -28,35 +118,8 @@ def init_logger():
 
     # Only add handlers if they don't exist to prevent duplication
     if not root_logger.handlers:
-        timestamp = get_current_datetime_formatted()
-        # create dir and file
-        log_dir = os.environ.get("AGENT_LOGS_DIR", "./logs")
-        path = f"{log_dir}/sregym_{timestamp}.log"
-        os.makedirs(log_dir, exist_ok=True)
-
-        handler = logging.FileHandler(path)
-        # add code line and filename and function name
-        handler.setFormatter(
-            ExhaustInfoFormatter(
-                fmt="%(asctime)s - %(levelname)s - %(name)s - %(message)s - %(filename)s:%(funcName)s:%(lineno)d",
-                datefmt="%Y-%m-%d %H:%M:%S",
-                extra_attributes=["sol", "result", "Full Prompt", "Tool Calls"],
-            )
-        )
-        handler.setLevel(logging.DEBUG)
-        root_logger.addHandler(handler)
-
-        rich_handler = RichHandler(
-            console=console,
-            show_time=True,
-            show_level=True,
-            show_path=False,
-            rich_tracebacks=True,
-            markup=False,
-        )
-        rich_handler.setFormatter(logging.Formatter(fmt="%(name)s - %(message)s"))
-        rich_handler.setLevel(logging.INFO)
-        root_logger.addHandler(rich_handler)
+        _start_listener()
+        root_logger.addHandler(_queue_handler())
 
     unify_third_party_loggers()
     silent_litellm_loggers()
@@ -97,17 +160,11 @@ def unify_third_party_loggers():
     # before any rich.Live was active, and would tear through the progress bar.
     root.handlers = []
 
-    rich_handler = RichHandler(
-        console=console,
-        show_time=True,
-        show_level=True,
-        show_path=False,
-        rich_tracebacks=True,
-        markup=False,
-    )
-    rich_handler.setFormatter(logging.Formatter(fmt="%(name)s - %(message)s"))
-    rich_handler.setLevel(logging.INFO)
-    root.addHandler(rich_handler)
+    if _listener is None:
+        root.addHandler(_rich_handler())
+    else:
+        # Through the listener, whose file handler keeps only our own records
+        root.addHandler(_queue_handler())
 
 
 # silent uvicorn: main.py:96
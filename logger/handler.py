@@ -1,4 +1,9 @@
+import copy
+import gzip
 import logging
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 class ExhaustInfoFormatter(logging.Formatter):
@@ -43,3 +48,118 @@ class ColorFormatter(logging.Formatter):
         elif record.levelno == logging.ERROR:  # red
             return f"\033[95m{base_log_message}\033[0m"
         return base_log_message
+
+
+class RecordQueueHandler(QueueHandler):
+    """
+    Hands records to the background listener with as little work as possible on
+    the caller's thread: the message is merged with its args (they may change
+    later) and nothing else is formatted. The queue never leaves the process,
+    so exc_info is kept for the terminal's rich tracebacks.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BatchingQueueListener(QueueListener):
+    """Flushes its handlers when the queue runs dry instead of after every record."""
+
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                if isinstance(handler, CompressedRotatingFileHandler):
+                    handler.sync()
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Per-logger token bucket: each logger may emit `rate` records per second on
+    average, in bursts of up to `burst`. Warnings and errors always pass. The
+    next record a throttled logger gets through reports how many were dropped;
+    the note goes on a copy, so other handlers of the record do not see it.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        # logger name -> [tokens, last refill time, dropped since last pass]
+        self._buckets: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = self._buckets[record.name] = [float(self.burst), now, 0]
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1
+            dropped, bucket[2] = bucket[2], 0
+        if dropped:
+            # A filter returning a record replaces it for this handler only
+            record = copy.copy(record)
+            record.msg = f"{record.getMessage()} [rate limited: {dropped} earlier records from this logger dropped]"
+            record.args = None
+            return record
+        return True
+
+
+class OwnRecordsFilter(logging.Filter):
+    """Only records of the 'all' logger tree (third-party records go to the terminal only)."""
+
+    def filter(self, record):
+        return record.name == "all" or record.name.startswith("all.")
+
+
+class CompressedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler writing gzip members. maxBytes counts the uncompressed
+    bytes this handler wrote to the current file. Unless line_buffered, the gzip
+    stream is only synced (sync()) when the listener's queue runs dry, so busy
+    periods compress in large blocks.
+    """
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, line_buffered=False):
+        self.line_buffered = line_buffered
+        self._written = 0
+        super().__init__(filename, mode="a", maxBytes=maxBytes, backupCount=backupCount, encoding="utf-8", delay=True)
+        self.namer = self._gz_name
+
+    @staticmethod
+    def _gz_name(default_name: str) -> str:
+        # sregym_x.log.gz.1 -> sregym_x.log.1.gz, so rotated files still open as gzip
+        base, _, index = default_name.rpartition(".")
+        return f"{base.removesuffix('.gz')}.{index}.gz"
+
+    def _open(self):
+        return gzip.open(self.baseFilename, "at", encoding=self.encoding)
+
+    def shouldRollover(self, record):
+        # The text stream's tell() would flush the gzip stream on every record, so count instead
+        size = len(self.format(record)) + 1
+        if self.maxBytes > 0 and self._written and self._written + size >= self.maxBytes:
+            self._written = size
+            return True
+        self._written += size
+        return False
+
+    def flush(self):
+        if self.line_buffered:
+            self.sync()
+
+    def sync(self):
+        with self.lock:
+            if self.stream is not None:
+                self.stream.flush()
@@ -1,6 +1,5 @@
 import argparse
 import asyncio
-import csv
 import importlib
 import logging
 import os
@@ -8,6 +7,7 @@ import sys
 import threading
 import time
 from datetime import datetime
+from enum import StrEnum
 from pathlib import Path
 
 from rich.progress import (
@@ -26,7 +26,12 @@ from sregym.agent_registry import get_agent, list_agents
 from sregym.conductor.conductor import Conductor, ConductorConfig
 from sregym.conductor.conductor_api import request_shutdown, run_api
 from sregym.conductor.constants import StartProblemResult
+from sregym.conductor.multi_tenant import PROBLEM_TOKEN_ENV, MultiTenantConductor
+from sregym.paths import CACHE_DIR
+from sregym.results_journal import ResultsJournal, completed_attempts, read_results, write_results_csv
 from sregym.service.container_runner import ContainerRunner, ExecInput
+from sregym.utils.cache import LLM_CACHE_MODES
+from sregym.work_queue import WorkQueue
 
 LAUNCHER = AgentLauncher()
 logger = logging.getLogger(__name__)
@@ -34,6 +39,16 @@ _driver_results: list[dict] = []
 _driver_base_dir: Path | None = None
 
 
+class ProblemRun(StrEnum):
+    """How running a problem's attempts ended."""
+
+    DONE = "done"
+    # No attempt could be deployed
+    FAILED = "failed"
+    # The driver should stop (e.g. the fault was injected for an external harness)
+    STOP = "stop"
+
+
 def run_preflight_check(
     agent_name: str,
     container_runner: ContainerRunner | None = None,
@@ -77,6 +92,18 @@ def run_preflight_check(
     logger.info(f"✅ Pre-flight check passed for '{agent_name}'")
 
 
+def result_row(pid: str, attempt: int, results: dict) -> dict:
+    """One attempt's results as a flat row ({stage}.{key} columns) for the journal and CSVs."""
+    row = {"problem_id": pid, "attempt": attempt}
+    for stage, outcome in results.items():
+        if isinstance(outcome, dict):
+            for k, v in outcome.items():
+                row[f"{stage}.{k}"] = v
+        else:
+            row[stage] = outcome
+    return row
+
+
 def get_current_datetime_formatted():
     now = datetime.now()
     formatted_datetime = now.strftime("%m%d_%H%M")
@@ -91,6 +118,9 @@ def driver_loop(
     n_attempts: int = 1,
     agent_timeout: int = 1800,
     resume_csv: str | None = None,
+    results_dir: str | None = None,
+    work_queue: str | None = None,
+    shard_name: str | None = None,
 ):
     """
     Deploy each problem and wait for HTTP grading via POST /submit.
@@ -102,11 +132,16 @@ def driver_loop(
         agent_to_run: Agent name to run (required unless use_external_harness is True).
         use_external_harness: If True, inject fault and exit without running evaluation logic.
         n_attempts: Number of end-to-end attempts to run each problem.
-        resume_csv: Path to a previous results CSV to resume from (skip completed problems).
+        resume_csv: Path to a previous run's results journal (<agent>_results.jsonl) or results CSV
+            to resume from (completed attempts are skipped).
+        results_dir: Directory for this run's results (default: results/<timestamp>).
+        work_queue: Path to a shared WorkQueue file. If set, problems are claimed from the
+            queue (see sharded_main.py) instead of iterating the registry.
+        shard_name: Name this driver claims queue entries under.
     """
 
     async def driver():
-        base_dir = Path("results") / get_current_datetime_formatted()
+        base_dir = Path(results_dir) if results_dir else Path("results") / get_current_datetime_formatted()
         base_dir.mkdir(parents=True, exist_ok=True)
         global _driver_base_dir
         _driver_base_dir = base_dir
@@ -129,9 +164,12 @@ def driver_loop(
             LAUNCHER.set_agent_kubeconfig(conductor.get_agent_kubeconfig_path())
 
         all_results_for_agent = []
+        # Every finished attempt is appended here; the CSVs are materialized from it
+        journal = ResultsJournal(base_dir / f"{agent_to_run or 'agent'}_results.jsonl")
+        resume_rows: list[dict] = []
 
-        # Get all problem IDs and filter if needed
-        problem_ids = conductor.problems.get_problem_ids()
+        # Get all problem IDs and filter if needed (queue mode: the queue decides what runs)
+        problem_ids = conductor.problems.get_problem_ids() if work_queue is None else []
         all_problem_ids = conductor.problems.get_problem_ids(all=True)
         if problem_filter:
             if problem_filter not in all_problem_ids:
@@ -156,20 +194,23 @@ def driver_loop(
         attempt_counts: Counter[str] = Counter()
         if resume_csv:
             try:
-                with open(resume_csv, newline="") as f:
-                    reader = csv.DictReader(f)
-                    resume_rows = list(reader)
-                # Group by problem_id and count attempts
-                attempt_counts = Counter(r["problem_id"] for r in resume_rows)
+                resume_rows = read_results(resume_csv)
+                if Path(resume_csv).resolve() == journal.path.resolve():
+                    # Resuming into the same run directory: the rows are already in this journal
+                    resume_rows, prior_rows = [], resume_rows
+                else:
+                    prior_rows = resume_rows
+                # Count the attempts each problem completed; only the missing ones run again
+                attempt_counts = completed_attempts(prior_rows)
                 completed_problems = {pid for pid, count in attempt_counts.items() if count >= n_attempts}
 
-                for row in resume_rows:
-                    all_results_for_agent.append(row)
+                all_results_for_agent.extend(prior_rows)
                 console.log(
-                    f"📋 Resuming from {resume_csv}: {len(completed_problems)} problems already done, skipping them"
+                    f"📋 Resuming from {resume_csv}: {len(completed_problems)} problems already done, skipping them; "
+                    f"{len(set(attempt_counts) - completed_problems)} resume after their completed attempts"
                 )
             except Exception as e:
-                console.log(f"⚠️  Failed to load resume CSV: {e}")
+                console.log(f"⚠️  Failed to load resume results: {e}")
 
         # Bar tracks attempts (problems × n_attempts), not problems, so the
         # 0/N total reflects total work even when n_attempts > 1.
@@ -183,25 +224,22 @@ def driver_loop(
             TimeRemainingColumn(),
             console=console,
         )
+        total_problems = len(problem_ids) if work_queue is None else WorkQueue(work_queue).total()
         task_id = progress.add_task(
             f"[cyan]Benchmarking {agent_to_run or 'agent'}",
-            total=len(problem_ids) * n_attempts,
+            total=total_problems * n_attempts,
             completed=already_done,
         )
         progress.start()
 
-        for pid in problem_ids:
-            if pid in completed_problems:
-                console.log(f"⏭️  Skipping already-completed problem: {pid}")
-                progress.advance(task_id, n_attempts)
-                continue
+        queue = WorkQueue(work_queue) if work_queue is not None else None
 
+        async def run_problem(pid: str, first_attempt: int = 1) -> ProblemRun:
+            """Run attempts first_attempt..n_attempts of one problem."""
             conductor.problem_id = pid
+            problem_rows = []
 
-            # Keep a record of results for this problem in a temp file in case an attempt fails
-            tmp_path = f"_running_{pid}_{agent_to_run}_results.csv"
-
-            for attempt in range(1, n_attempts + 1):
+            for attempt in range(first_attempt, n_attempts + 1):
                 progress.update(
                     task_id,
                     description=f"[cyan]Benchmarking {agent_to_run or 'agent'} — {pid} (attempt {attempt}/{n_attempts})",
@@ -247,15 +285,11 @@ def driver_loop(
                         "deploy_failed": True,
                     }
                     all_results_for_agent.append(snapshot)
-                    fieldnames = sorted({key for row in all_results_for_agent for key in row})
-                    with open(tmp_path, "w", newline="") as csvfile:
-                        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                        writer.writeheader()
-                        writer.writerows(all_results_for_agent)
+                    journal.append(snapshot)
                     console.log(f"⏭️  Skipping remaining attempts for '{pid}' and moving to next problem")
                     # Account for this attempt + remaining skipped attempts on the bar.
                     progress.advance(task_id, n_attempts - attempt + 1)
-                    break
+                    return ProblemRun.FAILED
 
                 if result == StartProblemResult.SKIPPED_KHAOS_REQUIRED:
                     console.log(f"⏭️  Skipping problem '{pid}': requires Khaos but running on emulated cluster")
@@ -265,8 +299,7 @@ def driver_loop(
                 # If using external harness, fault is injected - exit now
                 if use_external_harness:
                     console.log(f"✅ Fault injected for problem '{pid}'. Exiting for external harness.")
-                    progress.stop()
-                    return []
+                    return ProblemRun.STOP
 
                 assert agent_to_run is not None
 
@@ -346,41 +379,23 @@ def driver_loop(
                         else:
                             console.log(f"⚠️  Agent process did not complete within {timeout}s, will force cleanup")
 
-                snapshot = {
-                    "problem_id": pid,
-                    "attempt": attempt,
-                }
-
-                for stage, outcome in conductor.results.items():
-                    if isinstance(outcome, dict):
-                        for k, v in outcome.items():
-                            snapshot[f"{stage}.{k}"] = v
-                    else:
-                        snapshot[stage] = outcome
-
+                snapshot = result_row(pid, attempt, conductor.results)
                 all_results_for_agent.append(snapshot)
-
-                fieldnames = sorted({key for row in all_results_for_agent for key in row})
-
-                with open(tmp_path, "w", newline="") as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(all_results_for_agent)
+                problem_rows.append(snapshot)
+                journal.append(snapshot)
+                if queue is not None:
+                    queue.record_attempt(pid)
 
                 # run_dir was created above before agent launch; write per-attempt CSV into it
-                attempt_path = run_dir / f"{pid}_results.csv"
-                with open(attempt_path, "w", newline="") as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerow(snapshot)
+                write_results_csv(run_dir / f"{pid}_results.csv", [snapshot])
 
                 logger.info(
-                    f"⏳ Attempt {attempt} of {n_attempts} for problem {pid} complete - Intermediate results written to {tmp_path}"
+                    f"⏳ Attempt {attempt} of {n_attempts} for problem {pid} complete - Results journaled to {journal.path}"
                 )
 
                 if attempt == n_attempts:
                     final_csv_path = base_dir / agent_to_run / pid / f"{pid}_{agent_to_run}_results.csv"
-                    os.replace(tmp_path, final_csv_path)
+                    write_results_csv(final_csv_path, problem_rows)
                     logger.info(
                         f"✅ Problem {pid} for agent {agent_to_run} complete! Results written to {final_csv_path}"
                     )
@@ -391,8 +406,44 @@ def driver_loop(
                     console.log(f"🧹 Cleaned up agent process for {agent_to_run}")
 
                 progress.advance(task_id)
-
-        progress.stop()
+            return ProblemRun.DONE
+
+        # Compact the journal however the run ends (a stop for an external harness, or a crash)
+        try:
+            if queue is None:
+                for pid in problem_ids:
+                    if pid in completed_problems:
+                        console.log(f"⏭️  Skipping already-completed problem: {pid}")
+                        progress.advance(task_id, n_attempts)
+                        continue
+                    if attempt_counts[pid]:
+                        console.log(f"⏩ Resuming {pid} after {attempt_counts[pid]} completed attempts")
+                    if await run_problem(pid, attempt_counts[pid] + 1) == ProblemRun.STOP:
+                        return []
+            else:
+                while (pid := queue.claim(shard_name or "default")) is not None:
+                    done_attempts = queue.attempts(pid)
+                    if done_attempts:
+                        console.log(f"⏩ Resuming {pid} after {done_attempts} completed attempts")
+                        progress.advance(task_id, min(done_attempts, n_attempts))
+                    try:
+                        outcome = await run_problem(pid, done_attempts + 1)
+                    except Exception:
+                        queue.fail(pid)
+                        raise
+                    if outcome == ProblemRun.FAILED:
+                        retried = queue.fail(pid)
+                        console.log(f"❌ {pid} failed; {'re-queued for a retry' if retried else 'marked failed'}")
+                    else:
+                        queue.complete(pid)
+                    if outcome == ProblemRun.STOP:
+                        return []
+        finally:
+            progress.stop()
+            if agent_to_run:
+                csv_path = base_dir / f"{agent_to_run}_ALL_results.csv"
+                journal.compact(csv_path, extra_rows=resume_rows)
+                console.log(f"📝 Results for {agent_to_run} written to {csv_path}")
 
         # Stop K8s API proxy when all problems are done
         if not use_external_harness:
@@ -404,31 +455,186 @@ def driver_loop(
     return asyncio.run(driver())
 
 
+def multi_tenant_driver_loop(
+    conductor: MultiTenantConductor,
+    problem_filter: str | None = None,
+    agent_to_run: str | None = None,
+    n_attempts: int = 1,
+    agent_timeout: int = 1800,
+    resume_csv: str | None = None,
+    results_dir: str | None = None,
+):
+    """
+    Like driver_loop(), but runs up to conductor.max_concurrent problems at once, each in
+    namespaces of its own (see MultiTenantConductor). Every agent gets its problem's token in
+    the SREGYM_PROBLEM_TOKEN environment variable, to pass to the conductor API and the
+    submit tool.
+    """
+
+    async def driver():
+        base_dir = Path(results_dir) if results_dir else Path("results") / get_current_datetime_formatted()
+        base_dir.mkdir(parents=True, exist_ok=True)
+        global _driver_base_dir
+        _driver_base_dir = base_dir
+        # give the API a moment to bind
+        await asyncio.sleep(1)
+
+        agents_file = Path(os.path.dirname(os.path.abspath(__file__))) / "agents.yaml"
+        available_agents = list_agents(path=agents_file).keys()
+        if agent_to_run not in available_agents:
+            console.log(f"⚠️ Agent '{agent_to_run}' not found in registry. Available agents: {available_agents}")
+            sys.exit(1)
+        reg = get_agent(agent_to_run, path=agents_file)
+
+        owner = conductor.owner
+        console.log(f"Starting agent now: {agent_to_run}")
+        owner.register_agent(agent_to_run)
+        console.log("🔒 Starting Kubernetes API proxy to hide chaos namespaces...")
+        owner.start_k8s_proxy()
+        LAUNCHER.set_agent_kubeconfig(owner.get_agent_kubeconfig_path())
+
+        journal = ResultsJournal(base_dir / f"{agent_to_run}_results.jsonl")
+        problem_ids = [problem_filter] if problem_filter else owner.problems.get_problem_ids()
+        resume_rows: list[dict] = []
+        prior_rows: list[dict] = []
+        if resume_csv:
+            prior_rows = read_results(resume_csv)
+            if Path(resume_csv).resolve() != journal.path.resolve():
+                resume_rows = prior_rows
+        done_attempts = completed_attempts(prior_rows)
+        runs = [(pid, attempt) for pid in problem_ids for attempt in range(done_attempts[pid] + 1, n_attempts + 1)]
+        all_results_for_agent = list(prior_rows)
+        console.log(
+            f"🧮 {len(runs)} attempts of {len(problem_ids)} problems, "
+            f"up to {conductor.max_concurrent} at a time on one cluster"
+        )
+
+        # Admission also bounds concurrency; this keeps waiting attempts from building their problems early
+        slots = asyncio.Semaphore(conductor.max_concurrent)
+
+        def record(row: dict):
+            all_results_for_agent.append(row)
+            journal.append(row)
+
+        async def wait_for_agent(token: str, launcher: AgentLauncher) -> bool:
+            """Until the problem's stages are graded or its agent exits. Returns False on timeout."""
+            tenant = conductor.sessions[token]
+            deadline = time.time() + agent_timeout
+            while tenant.submission_stage != "done":
+                if time.time() > deadline:
+                    return False
+                agent_proc = launcher._procs.get(agent_to_run)
+                if agent_proc and agent_proc.proc.poll() is not None:
+                    console.log(f"⚠️  Agent for {token} exited with return code {agent_proc.proc.returncode}")
+                    return True
+                await asyncio.sleep(1)
+            # Graded; give the agent a moment to save its trajectory before it is stopped
+            agent_proc = launcher._procs.get(agent_to_run)
+            for _ in range(60):
+                if agent_proc is None or agent_proc.proc.poll() is not None:
+                    break
+                await asyncio.sleep(1)
+            return True
+
+        async def run_attempt(pid: str, attempt: int):
+            async with slots:
+                try:
+                    token, result = await conductor.start_problem(pid)
+                except Exception as e:
+                    console.log(f"❌ start_problem failed for '{pid}' (attempt {attempt}): {e}")
+                    record({"problem_id": pid, "attempt": attempt, "deploy_failed": True})
+                    return
+                if result == StartProblemResult.SKIPPED_KHAOS_REQUIRED:
+                    console.log(f"⏭️  Skipping problem '{pid}': requires Khaos but running on emulated cluster")
+                    await conductor.finish(token)
+                    return
+
+                console.log(f"\n🔍 Started problem: {pid} (attempt {attempt} of {n_attempts}, token {token})")
+                run_dir = base_dir / agent_to_run / pid / f"run_{attempt}"
+                run_dir.mkdir(parents=True, exist_ok=True)
+                launcher = LAUNCHER.session()
+                finished = True
+                try:
+                    await launcher.ensure_started(
+                        reg, env={"AGENT_LOGS_DIR": str(run_dir.resolve()), PROBLEM_TOKEN_ENV: token}
+                    )
+                    finished = await wait_for_agent(token, launcher)
+                    if not finished:
+                        console.log(f"⏰ Agent timeout ({agent_timeout}s) exceeded for {pid} ({token}), killing agent")
+                finally:
+                    launcher.cleanup_agent(agent_to_run)
+                    results = await conductor.finish(token)
+
+                row = result_row(pid, attempt, results)
+                row["token"] = token
+                if not finished:
+                    row["timed_out"] = True
+                    row["agent_timeout_seconds"] = agent_timeout
+                record(row)
+                write_results_csv(run_dir / f"{pid}_results.csv", [row])
+                console.log(f"✅ Completed {pid} (attempt {attempt}): results={results}", markup=False)
+
+        csv_path = base_dir / f"{agent_to_run}_ALL_results.csv"
+        try:
+            await asyncio.gather(*(run_attempt(pid, attempt) for pid, attempt in runs))
+        finally:
+            journal.compact(csv_path, extra_rows=resume_rows)
+            console.log(f"📝 Results for {agent_to_run} written to {csv_path}")
+            console.log("🔓 Stopping Kubernetes API proxy...")
+            owner.stop_k8s_proxy()
+
+        return [{agent_to_run: all_results_for_agent}]
+
+    return asyncio.run(driver())
+
+
 def _run_driver_and_shutdown(
-    conductor: Conductor,
+    conductor: Conductor | MultiTenantConductor,
     problem_filter: str | None = None,
     agent_to_run: str | None = None,
     use_external_harness: bool = False,
     n_attempts: int = 1,
     agent_timeout: int = 1800,
     resume_csv: str | None = None,
+    results_dir: str | None = None,
+    work_queue: str | None = None,
+    shard_name: str | None = None,
 ):
     """Run the benchmark driver, stash results, then tell the API to exit."""
     try:
-        results = driver_loop(
-            conductor,
-            problem_filter=problem_filter,
-            agent_to_run=agent_to_run,
-            use_external_harness=use_external_harness,
-            n_attempts=n_attempts,
-            agent_timeout=agent_timeout,
-            resume_csv=resume_csv,
-        )
+        if isinstance(conductor, MultiTenantConductor):
+            results = multi_tenant_driver_loop(
+                conductor,
+                problem_filter=problem_filter,
+                agent_to_run=agent_to_run,
+                n_attempts=n_attempts,
+                agent_timeout=agent_timeout,
+                resume_csv=resume_csv,
+                results_dir=results_dir,
+            )
+        else:
+            results = driver_loop(
+                conductor,
+                problem_filter=problem_filter,
+                agent_to_run=agent_to_run,
+                use_external_harness=use_external_harness,
+                n_attempts=n_attempts,
+                agent_timeout=agent_timeout,
+                resume_csv=resume_csv,
+                results_dir=results_dir,
+                work_queue=work_queue,
+                shard_name=shard_name,
+            )
         global _driver_results
         _driver_results = results
     except Exception:
         logger.exception("Driver thread crashed")
     finally:
+        try:
+            owner = conductor.owner if isinstance(conductor, MultiTenantConductor) else conductor
+            owner.teardown_retained_app()
+        except Exception:
+            logger.exception("Failed to tear down the app kept for reuse")
         LAUNCHER.cleanup_all()
         request_shutdown()
 
@@ -446,10 +652,13 @@ def main(args):
     # Push to env so downstream code picks it up
     os.environ["AGENT_MODEL_ID"] = agent_model
     os.environ["JUDGE_MODEL_ID"] = judge_model
+    os.environ["LLM_CACHE_MODE"] = args.llm_cache
+    if args.llm_cache_dir:
+        os.environ["LLM_CACHE_DIR"] = str(Path(args.llm_cache_dir).resolve())
     os.environ["API_HOSTNAME"] = "0.0.0.0"
-    os.environ["API_PORT"] = "8000"
-    os.environ["MCP_SERVER_PORT"] = "9954"
-    os.environ["MCP_SERVER_URL"] = "http://127.0.0.1:9954"
+    os.environ["API_PORT"] = str(args.api_port)
+    os.environ["MCP_SERVER_PORT"] = str(args.mcp_port)
+    os.environ["MCP_SERVER_URL"] = f"http://127.0.0.1:{args.mcp_port}"
 
     logger.info(f"🔧 Config — agent: {args.agent}, agent_model: {agent_model}, judge_model: {judge_model}")
 
@@ -470,21 +679,39 @@ def main(args):
         install_script=agent_reg.install_script if agent_reg else None,
     )
 
-    conductor_config = ConductorConfig(deploy_loki=not args.use_external_harness, enable_noise=args.noise)
-    conductor = Conductor(config=conductor_config)
+    conductor_config = ConductorConfig(
+        deploy_loki=not args.use_external_harness,
+        enable_noise=args.noise,
+        use_informer_cache=args.informer_cache,
+        warm_platform=args.warm_platform,
+        reuse_apps=args.reuse_apps,
+        deploy_workers=args.deploy_workers,
+        k8s_proxy_port=args.proxy_port,
+    )
+    if args.shard:
+        # Each shard drives its own cluster, so each needs its own baseline snapshot
+        conductor_config.baseline_state_file = CACHE_DIR / f"cluster_baseline_state.{args.shard}.json"
+    if args.concurrent_problems > 1:
+        conductor = MultiTenantConductor(config=conductor_config, max_concurrent=args.concurrent_problems)
+        api_conductor = conductor.owner
+    else:
+        conductor = api_conductor = Conductor(config=conductor_config)
 
     # Start the driver in the background; it will call request_shutdown() when finished
     driver_thread = threading.Thread(
         target=_run_driver_and_shutdown,
-        args=(
-            conductor,
-            args.problem,
-            args.agent,
-            args.use_external_harness,
-            args.n_attempts,
-            args.agent_timeout,
-            args.resume,
-        ),
+        kwargs={
+            "conductor": conductor,
+            "problem_filter": args.problem,
+            "agent_to_run": args.agent,
+            "use_external_harness": args.use_external_harness,
+            "n_attempts": args.n_attempts,
+            "agent_timeout": args.agent_timeout,
+            "resume_csv": args.resume,
+            "results_dir": args.results_dir,
+            "work_queue": args.work_queue,
+            "shard_name": args.shard,
+        },
         name="driver",
         daemon=True,
     )
@@ -492,7 +719,7 @@ def main(args):
 
     # Start the Conductor HTTP API in the MAIN thread (blocking)
     try:
-        run_api(conductor)
+        run_api(api_conductor)
     except KeyboardInterrupt:
         # If interrupted, still try to shut down cleanly
         LAUNCHER.cleanup_all()
@@ -518,20 +745,11 @@ def main(args):
     results = _driver_results
 
     if results:
-        aggregated = {}
+        # The driver already compacted its results journal into <agent>_ALL_results.csv
+        out_dir = _driver_base_dir if _driver_base_dir else Path("results")
         for entry in results:
-            for agent_name, agent_rows in entry.items():
-                aggregated.setdefault(agent_name, []).extend(agent_rows)
-
-        for agent_name, agent_results in aggregated.items():
-            fieldnames = sorted({key for row in agent_results for key in row})
-            out_dir = _driver_base_dir if _driver_base_dir else Path("results")
-            csv_path = out_dir / f"{agent_name}_ALL_results.csv"
-            with open(csv_path, "w", newline="") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(agent_results)
-            logger.info(f"✅ Benchmark complete! Results for {agent_name} written to {csv_path}")
+            for agent_name in entry:
+                logger.info(f"✅ Benchmark complete! Results for {agent_name} written to {out_dir}")
     else:
         logger.warning("⚠️ No results to write.")
 
@@ -578,6 +796,39 @@ if __name__ == "__main__":
         action="store_true",
         help="Enable transient noise injection via Chaos Mesh during problem runs",
     )
+    parser.add_argument(
+        "--informer-cache",
+        action="store_true",
+        help="Serve pod/deployment/service/node/event reads and readiness waits from a shared watch-based cache",
+    )
+    parser.add_argument(
+        "--warm-platform",
+        action="store_true",
+        help="Keep metrics-server, OpenEBS and the observability stack deployed across problems, "
+        "redeploying a component only when its manifests or Helm values change",
+    )
+    parser.add_argument(
+        "--reuse-apps",
+        action="store_true",
+        help="Between problems on the same app, restore the app to a snapshot taken after its deploy instead of "
+        "deleting and redeploying it (requires --warm-platform)",
+    )
+    parser.add_argument(
+        "--deploy-workers",
+        type=int,
+        default=8,
+        help="Setup steps (platform components and the app) deployed concurrently (default: 8, 1 = sequential)",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        choices=LLM_CACHE_MODES,
+        default="off",
+        help="LLM response cache for the agent and the judge: record every response, replay recorded ones only "
+        "(fails on a miss, no model access needed), or read-through (default: off)",
+    )
+    parser.add_argument(
+        "--llm-cache-dir", type=str, default=None, help="LLM cache directory (default: ~/cache_dir/llm_cache)"
+    )
     parser.add_argument(
         "--n-attempts",
         type=int,
@@ -599,12 +850,47 @@ if __name__ == "__main__":
         "--resume",
         type=str,
         default=None,
-        help="Resume from a previous results CSV file. Problems already in the CSV will be skipped.",
+        help="Resume from a previous run's results journal (<agent>_results.jsonl, survives crashes) "
+        "or results CSV. Problems already recorded there will be skipped.",
+    )
+    parser.add_argument("--api-port", type=int, default=8000, help="Conductor API port (default: 8000)")
+    parser.add_argument(
+        "--mcp-port", type=int, default=9954, help="Local port forwarded to the MCP server (default: 9954)"
+    )
+    parser.add_argument(
+        "--proxy-port", type=int, default=16443, help="Port of the agent-facing Kubernetes API proxy (default: 16443)"
+    )
+    parser.add_argument(
+        "--results-dir", type=str, default=None, help="Directory for this run's results (default: results/<timestamp>)"
+    )
+    parser.add_argument(
+        "--work-queue",
+        type=str,
+        default=None,
+        help="Claim problems from this shared queue file instead of the registry (set by sharded_main.py)",
+    )
+    parser.add_argument(
+        "--shard", type=str, default=None, help="Shard name, used for queue claims and the per-cluster baseline"
+    )
+    parser.add_argument(
+        "--concurrent-problems",
+        type=int,
+        default=1,
+        help=(
+            "Run up to N problems at once on the cluster, each in its own namespaces (default: 1). "
+            "Agents share one Kubernetes API proxy, so each can see the other problems' namespaces"
+        ),
     )
     args = parser.parse_args()
 
     # Validate that n_attempts is positive
     if args.n_attempts is not None and args.n_attempts < 1:
         parser.error("--n-attempts must be a positive integer")
+    if args.concurrent_problems < 1:
+        parser.error("--concurrent-problems must be a positive integer")
+    if args.concurrent_problems > 1 and (args.work_queue or args.use_external_harness or args.reuse_apps):
+        parser.error(
+            "--concurrent-problems cannot be combined with --work-queue, --use-external-harness or --reuse-apps"
+        )
 
     main(args)
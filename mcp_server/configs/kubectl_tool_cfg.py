@@ -35,6 +35,11 @@ class KubectlToolCfg(BaseModel):
         description="Kubernetes namespace to use for the agent.",
     )
 
+    use_inprocess_engine: bool = Field(
+        default=True,
+        description="Serve common kubectl verbs with direct API calls instead of forking the kubectl binary.",
+    )
+
     use_rollback_stack: bool = Field(
         default=True,
         description="Enable rollback stack for the rollback tool.",
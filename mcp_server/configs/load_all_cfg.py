@@ -38,6 +38,8 @@ def str_to_bool(s: str) -> bool:
 mcp_server_cfg = McpServerCfg(
     mcp_server_port=int(os.getenv("MCP_SERVER_PORT", "9954")),
     expose_server=str_to_bool(os.getenv("EXPOSE_SERVER", "False")),
+    tool_workers=int(os.getenv("MCP_TOOL_WORKERS", "32")),
+    per_session_tool_limit=int(os.getenv("MCP_SESSION_TOOL_LIMIT", "4")),
 )
 
 kubectl_session_cfg = KubectlSessionCfg(
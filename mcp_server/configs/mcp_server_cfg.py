@@ -10,3 +10,15 @@ class McpServerCfg(BaseModel):
     )
 
     expose_server: bool = Field(description="If true, will use 0.0.0.0 for arg host otherwise use 127.0.0.0")
+
+    tool_workers: int = Field(
+        default=32,
+        description="Worker threads shared by all MCP tool calls",
+        gt=0,
+    )
+
+    per_session_tool_limit: int = Field(
+        default=4,
+        description="Maximum concurrent tool calls per session; extra calls wait without holding a worker",
+        gt=0,
+    )
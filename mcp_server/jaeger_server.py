@@ -1,34 +1,27 @@
 import logging
 from datetime import datetime, timedelta
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
-from mcp_server.utils import ObservabilityClient
+from mcp_server.tool_pool import run_tool
+from mcp_server.utils import fetch_json, get_observability_client
 
 logger = logging.getLogger("all.mcp.jaeger_server")
 logger.info("Starting Jaeger MCP Server")
 mcp = FastMCP("Jaeger MCP Server")
 
+JAEGER_URL = "http://jaeger-out.observe.svc.cluster.local:16686"
 
-@mcp.tool(name="get_services")
-def get_services() -> str:
-    """Retrieve the list of service names from the Grafana instance.
-
-    Returns:
-        str: String of a list of service names available in Grafana or error information.
-    """
 
+def _get_services() -> str:
     logger.debug("[ob_mcp] get_services called, getting jaeger services")
 
-    jaeger_url = "http://jaeger-out.observe.svc.cluster.local:16686"
-    jaeger_client = ObservabilityClient(jaeger_url)
+    jaeger_client = get_observability_client(JAEGER_URL)
     try:
-        url = f"{jaeger_url}/api/services"
-        response = jaeger_client.make_request("GET", url)
-        logger.debug(f"[ob_mcp] get_services status code: {response.status_code}")
-        logger.debug(f"[ob_mcp] get_services result: {response}")
-        logger.debug(f"[ob_mcp] result: {response.json()}")
-        services = str(response.json()["data"])
+        url = f"{JAEGER_URL}/api/services"
+        data = fetch_json(jaeger_client, url)
+        logger.debug(f"[ob_mcp] result: {data}")
+        services = str(data["data"])
         result = services if services else "None"
 
         return result
@@ -38,27 +31,24 @@ def get_services() -> str:
         return err_str
 
 
-@mcp.tool(name="get_operations")
-def get_operations(service: str) -> str:
-    """Query available operations for a specific service from the Grafana instance.
-
-    Args:
-        service (str): The name of the service whose operations should be retrieved.
+@mcp.tool(name="get_services")
+async def get_services(ctx: Context) -> str:
+    """Retrieve the list of service names from the Grafana instance.
 
     Returns:
-        str: String of a list of operation names associated with the specified service or error information.
+        str: String of a list of service names available in Grafana or error information.
     """
+    return await run_tool(ctx, _get_services)
 
+
+def _get_operations(service: str) -> str:
     logger.debug("[ob_mcp] get_operations called, getting jaeger operations")
 
-    jaeger_url = "http://jaeger-out.observe.svc.cluster.local:16686"
-    jaeger_client = ObservabilityClient(jaeger_url)
+    jaeger_client = get_observability_client(JAEGER_URL)
     try:
-        url = f"{jaeger_url}/api/operations"
+        url = f"{JAEGER_URL}/api/operations"
         params = {"service": service}
-        response = jaeger_client.make_request("GET", url, params=params)
-        logger.debug(f"[ob_mcp] get_operations: {response.status_code}")
-        operations = str(response.json()["data"])
+        operations = str(fetch_json(jaeger_client, url, params=params)["data"])
         result = operations if operations else "None"
 
         return result
@@ -68,24 +58,25 @@ def get_operations(service: str) -> str:
         return err_str
 
 
-@mcp.tool(name="get_traces")
-def get_traces(service: str, last_n_minutes: int) -> str:
-    """Get Jaeger traces for a given service in the last n minutes.
+@mcp.tool(name="get_operations")
+async def get_operations(service: str, ctx: Context) -> str:
+    """Query available operations for a specific service from the Grafana instance.
 
     Args:
-        service (str): The name of the service for which to retrieve trace data.
-        last_n_minutes (int): The time range (in minutes) to look back from the current time.
+        service (str): The name of the service whose operations should be retrieved.
 
     Returns:
-        str: String of Jaeger traces or error information
+        str: String of a list of operation names associated with the specified service or error information.
     """
+    return await run_tool(ctx, _get_operations, service)
+
 
+def _get_traces(service: str, last_n_minutes: int) -> str:
     logger.debug("[ob_mcp] get_traces called, getting jaeger traces")
 
-    jaeger_url = "http://jaeger-out.observe.svc.cluster.local:16686"
-    jaeger_client = ObservabilityClient(jaeger_url)
+    jaeger_client = get_observability_client(JAEGER_URL)
     try:
-        url = f"{jaeger_url}/api/traces"
+        url = f"{JAEGER_URL}/api/traces"
         start_time = datetime.now() - timedelta(minutes=last_n_minutes)
         start_time = int(start_time.timestamp() * 1_000_000)
         end_time = int(datetime.now().timestamp() * 1_000_000)
@@ -96,9 +87,8 @@ def get_traces(service: str, last_n_minutes: int) -> str:
             "end": end_time,
             "limit": 20,
         }
-        response = jaeger_client.make_request("GET", url, params=params)
-        logger.debug(f"[ob_mcp] get_traces: {response.status_code}")
-        traces = str(response.json()["data"])
+        data = fetch_json(jaeger_client, url, params=params, cache_key=("jaeger.traces", service, last_n_minutes))
+        traces = str(data["data"])
         result = traces if traces else "None"
 
         return result
@@ -108,25 +98,40 @@ def get_traces(service: str, last_n_minutes: int) -> str:
         return err_str
 
 
-@mcp.tool(name="get_dependency_graph")
-def get_dependency_graph(last_n_minutes: int = 30) -> str:
-    """
-    Get service dependency graph from Jaeger's native dependencies API.
+@mcp.tool(name="get_traces")
+async def get_traces(service: str, last_n_minutes: int, ctx: Context) -> str:
+    """Get Jaeger traces for a given service in the last n minutes.
+
     Args:
+        service (str): The name of the service for which to retrieve trace data.
         last_n_minutes (int): The time range (in minutes) to look back from the current time.
+
     Returns:
-        str: JSON object representing the dependency graph.
+        str: String of Jaeger traces or error information
     """
+    return await run_tool(ctx, _get_traces, service, last_n_minutes)
 
-    jaeger_url = "http://jaeger-out.observe.svc.cluster.local:16686"
-    client = ObservabilityClient(jaeger_url)
+
+def _get_dependency_graph(last_n_minutes: int = 30) -> str:
+    client = get_observability_client(JAEGER_URL)
     end_time = int(datetime.now().timestamp() * 1000)
 
-    url = f"{jaeger_url}/api/dependencies"
+    url = f"{JAEGER_URL}/api/dependencies"
     params = {"endTs": end_time, "lookback": last_n_minutes * 60 * 1000}
 
-    response = client.make_request("GET", url, params=params)
-    logger.info(f"[ob_mcp] get_dependency_graph: {response.status_code}")
-    result = str(response.json())
+    result = str(fetch_json(client, url, params=params, cache_key=("jaeger.dependencies", last_n_minutes)))
+    logger.info("[ob_mcp] get_dependency_graph done")
 
     return result
+
+
+@mcp.tool(name="get_dependency_graph")
+async def get_dependency_graph(last_n_minutes: int = 30, ctx: Context | None = None) -> str:
+    """
+    Get service dependency graph from Jaeger's native dependencies API.
+    Args:
+        last_n_minutes (int): The time range (in minutes) to look back from the current time.
+    Returns:
+        str: JSON object representing the dependency graph.
+    """
+    return await run_tool(ctx, _get_dependency_graph, last_n_minutes)
@@ -7,6 +7,7 @@ from clients.stratus.stratus_utils.get_logger import get_logger
 from mcp_server.configs.load_all_cfg import kubectl_session_cfg
 from mcp_server.kubectl_server_helper.kubectl_tool_set import KubectlToolSet
 from mcp_server.kubectl_server_helper.sliding_lru_session_cache import SlidingLRUSessionCache
+from mcp_server.tool_pool import get_tool_pool
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("all.mcp.kubectl")
@@ -52,7 +53,7 @@ def get_tools(session_id: str) -> KubectlToolSet:
 
 
 @kubectl_mcp.tool()
-def exec_kubectl_cmd_safely(cmd: str, ctx: Context) -> str:
+async def exec_kubectl_cmd_safely(cmd: str, ctx: Context) -> str:
     """
     Use this function to execute kubectl commands.
     Args:
@@ -65,14 +66,16 @@ def exec_kubectl_cmd_safely(cmd: str, ctx: Context) -> str:
     kubctl_tool = get_tools(ssid)
     logger.debug(f'session {ssid} is using tool "exec_kubectl_cmd_safely"; Command: {cmd}.')
 
-    result = kubctl_tool.cmd_runner.exec_kubectl_cmd_safely(cmd)
+    # Commands of one session run in order so the rollback stack matches execution order
+    async with kubctl_tool.exec_lock:
+        result = await get_tool_pool().run(ssid, kubctl_tool.cmd_runner.exec_kubectl_cmd_safely, cmd)
     assert isinstance(result, str)
     logger.info(f"[ACTION_STACK] after exec ssid={ssid!r}: {kubctl_tool.action_stack}")
     return result
 
 
 @kubectl_mcp.tool()
-def rollback_command(ctx: Context) -> str:
+async def rollback_command(ctx: Context) -> str:
     """
     Use this function to roll back the last kubectl command
     you successfully executed with the "exec_kubectl_cmd_safely" tool.
@@ -83,13 +86,14 @@ def rollback_command(ctx: Context) -> str:
     ssid = extract_session_id(ctx)
     kubectl_tool = get_tools(ssid)
     logger.debug(f'session {ssid} is using tool "rollback_command".')
-    result = kubectl_tool.rollback_tool.rollback()
+    async with kubectl_tool.exec_lock:
+        result = await get_tool_pool().run(ssid, kubectl_tool.rollback_tool.rollback)
     assert isinstance(result, str)
     return f"{result}, action_stack: {kubectl_tool.rollback_tool.action_stack}"
 
 
 @kubectl_mcp.tool()
-def get_previous_rollbackable_cmd(ctx: Context) -> str:
+async def get_previous_rollbackable_cmd(ctx: Context) -> str:
     """
     Use this function to get a list of commands you
     previously executed that could be roll-backed.
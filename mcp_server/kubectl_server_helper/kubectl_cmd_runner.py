@@ -12,6 +12,7 @@ from mcp_server.kubectl_server_helper.cmd_category import (
     kubectl_unsupported_commands,
 )
 from mcp_server.kubectl_server_helper.kubectl import DryRunResult, DryRunStatus, KubeCtl
+from mcp_server.kubectl_server_helper.kubectl_engine import get_kubectl_engine
 from mcp_server.kubectl_server_helper.rollback_tool import RollbackCommand, RollbackNode, RollbackTool
 from mcp_server.kubectl_server_helper.utils import cleanup_kubernetes_yaml, parse_text
 
@@ -23,6 +24,8 @@ class KubectlCmdRunner:
     def __init__(self, config: KubectlToolCfg, action_stack=None):
         self.action_stack = action_stack
         self.config = config
+        # The engine mirrors KubeCtl's exec/dry-run helpers and falls back to the binary on its own
+        self.kubectl = get_kubectl_engine() if config.use_inprocess_engine else KubeCtl
 
     def exec_kubectl_cmd_safely(self, command: str) -> str:
         try:
@@ -34,7 +37,7 @@ class KubectlCmdRunner:
             self._check_kubectl_command(command)
 
             logger.info("[EXEC] running dry-run")
-            dry_run_result = KubeCtl.dry_run_json_output(command)
+            dry_run_result = self.kubectl.dry_run_json_output(command)
             logger.info(
                 f"[EXEC] dry-run done: status={dry_run_result.status}, description={dry_run_result.description!r}"
             )
@@ -160,7 +163,7 @@ class KubectlCmdRunner:
             command = KubeCtl.insert_flags(command, "--wait=false")
             logger.info(f"[EXEC] injected --wait=false: {command!r}")
         logger.debug(f"Executing command: {command}")
-        result = KubeCtl.exec_command(command)
+        result = self.kubectl.exec_command(command)
         if result.returncode == 0:
             output = parse_text(result.stdout, 1000)
             logger.debug(f"Kubectl MCP Tool command execution:\n{output}")
@@ -209,7 +212,7 @@ class KubectlCmdRunner:
         rollback_commands = []
 
         if "created (server dry run)" in dry_run_stdout or "exposed (server dry run)" in dry_run_stdout:
-            result = KubeCtl.dry_run_json_output(command, "name")
+            result = self.kubectl.dry_run_json_output(command, "name")
             rollback_commands = [
                 RollbackCommand(
                     "command",
@@ -217,7 +220,7 @@ class KubectlCmdRunner:
                 )
             ]
         elif "deleted (server dry run)" in dry_run_stdout:
-            result = KubeCtl.dry_run_json_output(command, "name")
+            result = self.kubectl.dry_run_json_output(command, "name")
             if result.result[0] == "namespace":
                 raise RuntimeError("Deleting a namespace is not allowed.")
 
@@ -230,8 +233,8 @@ class KubectlCmdRunner:
                 )
             ]
         elif "autoscaled (server dry run)" in dry_run_stdout:
-            hpa = KubeCtl.dry_run_json_output(command, "name")
-            result = KubeCtl.dry_run_json_output(command, [".spec.scaleTargetRef.kind", ".metadata.name"])
+            hpa = self.kubectl.dry_run_json_output(command, "name")
+            result = self.kubectl.dry_run_json_output(command, [".spec.scaleTargetRef.kind", ".metadata.name"])
             rollback_commands = [
                 RollbackCommand(
                     "command",
@@ -245,7 +248,7 @@ class KubectlCmdRunner:
                 ),
             ]
         else:
-            result = KubeCtl.dry_run_json_output(command, "name")
+            result = self.kubectl.dry_run_json_output(command, "name")
             rollback_commands = [
                 self._store_resource_state(
                     state_file,
@@ -284,7 +287,7 @@ class KubectlCmdRunner:
 
         logger.debug(f"Capturing cluster state with: {state_cmd}")
 
-        cluster_state = KubeCtl.exec_command_result(state_cmd)
+        cluster_state = self.kubectl.exec_command_result(state_cmd)
 
         with open(state_file, "w") as f:
             cleaned_state = cleanup_kubernetes_yaml(cluster_state)
@@ -0,0 +1,759 @@
+"""
+In-process execution engine for the kubectl MCP tool.
+
+Parses kubectl command lines and serves the common verbs (get, describe, patch,
+scale, delete, apply, set image) with direct API calls on one shared client
+whose API discovery is resolved once and cached, instead of forking a kubectl
+binary (which reloads kubeconfig and rediscovers the API) for every dry-run,
+rollback-state capture and execution.
+
+Anything the engine does not understand - other verbs, unknown flags, shell
+constructs, multi-object commands - runs through the kubectl binary exactly as
+before, so the engine is a drop-in replacement for the KubeCtl helpers used by
+KubectlCmdRunner (exec_command, exec_command_result, dry_run_json_output).
+"""
+
+import copy
+import datetime
+import json
+import logging
+import os
+import subprocess  # nosec B404
+import threading
+import time
+from dataclasses import dataclass, field
+
+import bashlex
+import yaml
+from kubernetes import client, config
+from kubernetes.dynamic import DynamicClient
+from kubernetes.dynamic.exceptions import DynamicApiError, NotFoundError
+from kubernetes.dynamic.resource import Resource, ResourceList
+
+from mcp_server.kubectl_server_helper.kubectl import DryRunResult, DryRunStatus, KubeCtl
+from mcp_server.kubectl_server_helper.utils import parse_text
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+logger = logging.getLogger("all.mcp.kubectl_engine")
+
+# Minimum seconds between discovery refreshes triggered by unknown resource types
+DISCOVERY_REFRESH_SECONDS = 30
+# Seconds to wait before retrying client setup after the API server was unreachable
+CLIENT_RETRY_SECONDS = 30
+
+DEFAULT_KUBECONFIG = "~/.kube/config"
+SERVICE_ACCOUNT_NAMESPACE_FILE = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
+TABLE_ACCEPT = "application/json;as=Table;v=v1;g=meta.k8s.io,application/json"
+
+SHORT_FLAGS = {
+    "-n": "--namespace",
+    "-A": "--all-namespaces",
+    "-l": "--selector",
+    "-o": "--output",
+    "-p": "--patch",
+    "-f": "--filename",
+}
+
+# flag -> whether it takes a value
+FLAGS = {
+    "--namespace": True,
+    "--all-namespaces": False,
+    "--selector": True,
+    "--field-selector": True,
+    "--output": True,
+    "--no-headers": False,
+    "--ignore-not-found": False,
+    "--show-events": False,
+    "--patch": True,
+    "--type": True,
+    "--replicas": True,
+    "--wait": False,
+    "--grace-period": True,
+    "--now": False,
+    "--cascade": True,
+    "--filename": True,
+}
+
+# verb -> flags the engine understands; any other flag sends the command to the kubectl binary
+VERB_FLAGS = {
+    "get": {
+        "--namespace",
+        "--all-namespaces",
+        "--selector",
+        "--field-selector",
+        "--output",
+        "--no-headers",
+        "--ignore-not-found",
+    },
+    "describe": {"--namespace", "--all-namespaces", "--selector", "--show-events"},
+    "patch": {"--namespace", "--patch", "--type"},
+    "scale": {"--namespace", "--replicas"},
+    "delete": {"--namespace", "--ignore-not-found", "--wait", "--grace-period", "--now", "--cascade", "--output"},
+    "apply": {"--namespace", "--filename"},
+    "set image": {"--namespace"},
+}
+
+# Verbs kubectl rejects --dry-run for; their dry-run is answered without touching the cluster
+NO_DRY_RUN_VERBS = {"get", "describe"}
+
+PATCH_CONTENT_TYPES = {
+    "strategic": "application/strategic-merge-patch+json",
+    "merge": "application/merge-patch+json",
+    "json": "application/json-patch+json",
+}
+
+CASCADE_POLICIES = {"background": "Background", "foreground": "Foreground", "orphan": "Orphan"}
+
+
+class UnsupportedCommand(Exception):
+    """The engine cannot serve this command in-process; it runs through the kubectl binary."""
+
+
+class CommandError(Exception):
+    """A client-side error kubectl itself would report as "error: ..."."""
+
+
+@dataclass
+class ParsedCommand:
+    verb: str
+    args: list[str] = field(default_factory=list)
+    flags: dict[str, str] = field(default_factory=dict)
+
+    def flag(self, name: str, default: str | None = None) -> str | None:
+        return self.flags.get(name, default)
+
+    def enabled(self, name: str) -> bool:
+        return self.flags.get(name) == "true"
+
+
+def tokenize(command: str) -> list[str] | None:
+    """Split a plain command line into words; None if it uses any shell construct beyond quoting."""
+    try:
+        nodes = bashlex.parse(command)
+    except Exception:
+        return None
+    if len(nodes) != 1 or nodes[0].kind != "command":
+        return None
+    words = nodes[0].parts
+    if any(part.kind != "word" or getattr(part, "parts", None) for part in words):
+        return None
+    return [part.word for part in words]
+
+
+def parse_command(command: str) -> ParsedCommand | None:
+    """Parse a kubectl command line the engine can serve, or return None."""
+    tokens = tokenize(command)
+    if not tokens or tokens[0] != "kubectl":
+        return None
+
+    args: list[str] = []
+    flags: dict[str, str] = {}
+    i = 1
+    while i < len(tokens):
+        token = tokens[i]
+        i += 1
+        if token == "--":
+            return None
+        if token.startswith("--"):
+            name, has_value, value = token.partition("=")
+        elif token.startswith("-") and len(token) > 1:
+            name = SHORT_FLAGS.get(token[:2])
+            value = token[2:].removeprefix("=")
+            has_value = bool(token[2:])
+            if name is None:
+                return None
+        else:
+            args.append(token)
+            continue
+
+        if name not in FLAGS or name in flags:
+            return None
+        if FLAGS[name]:
+            if not has_value:
+                if i >= len(tokens):
+                    return None
+                value = tokens[i]
+                i += 1
+        elif not has_value:
+            value = "true"
+        elif value not in ("true", "false"):
+            return None
+        flags[name] = value
+
+    if not args:
+        return None
+    verb = args.pop(0)
+    if verb == "set":
+        if not args or args.pop(0) != "image":
+            return None
+        verb = "set image"
+    if verb not in VERB_FLAGS or not set(flags) <= VERB_FLAGS[verb]:
+        return None
+    return ParsedCommand(verb, args, flags)
+
+
+def human_duration(seconds: float) -> str:
+    """Format an age the way kubectl does (e.g. "45s", "5m12s", "3h", "12d")."""
+    if seconds < -1:
+        return "<invalid>"
+    seconds = max(0, int(seconds))
+    minutes, hours, days = seconds // 60, seconds // 3600, seconds // 86400
+    if seconds < 120:
+        return f"{seconds}s"
+    if minutes < 10:
+        return f"{minutes}m{seconds % 60}s" if seconds % 60 else f"{minutes}m"
+    if minutes < 180:
+        return f"{minutes}m"
+    if hours < 8:
+        return f"{hours}h{minutes % 60}m" if minutes % 60 else f"{hours}h"
+    if hours < 48:
+        return f"{hours}h"
+    if hours < 192:
+        return f"{days}d{hours % 24}h" if hours % 24 else f"{days}d"
+    if days < 730:
+        return f"{days}d"
+    years = days // 365
+    if years < 8:
+        return f"{years}y{days % 365}d" if days % 365 else f"{years}y"
+    return f"{years}y"
+
+
+def format_cell(value, column: dict) -> str:
+    if value is None:
+        return "<none>"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if column.get("type") == "date" and isinstance(value, str):
+        try:
+            created = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value
+        return human_duration((datetime.datetime.now(datetime.UTC) - created).total_seconds())
+    return str(value)
+
+
+def render_table(rows: list[list[str]]) -> str:
+    """Align rows like kubectl's tabwriter (minimum width 10, padding 3)."""
+    if not rows:
+        return ""
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]) - 1)]
+    lines = []
+    for row in rows:
+        cells = [cell.ljust(max(width + 3, 10)) for cell, width in zip(row, widths, strict=False)]
+        lines.append("".join(cells) + row[-1])
+    return "\n".join(lines) + "\n"
+
+
+def format_api_error(e: DynamicApiError) -> str:
+    """Render an API error the way kubectl prints it."""
+    try:
+        status = json.loads(e.body) if e.body else {}
+    except (TypeError, ValueError):
+        status = {}
+    message = status.get("message") or e.reason or str(e)
+    reason = status.get("reason")
+    if reason == "Invalid":
+        return f"{message}\n"
+    if reason:
+        return f"Error from server ({reason}): {message}\n"
+    return f"Error from server: {message}\n"
+
+
+def strip_managed_fields(obj: dict) -> dict:
+    obj.get("metadata", {}).pop("managedFields", None)
+    return obj
+
+
+class KubectlEngine:
+    """Serves parsed kubectl verbs with direct API calls on a shared, discovery-cached client."""
+
+    def __init__(self, api_client: client.ApiClient | None = None):
+        self._api_client = api_client
+        self._client: DynamicClient | None = None
+        self._default_namespace = "default"
+        # resource alias (plural, singular, kind, short name, optionally ".group"-qualified) -> Resource
+        self._aliases: dict[str, Resource] = {}
+        # (apiVersion, kind) -> Resource
+        self._kinds: dict[tuple[str, str], Resource] = {}
+        self._discovered_at = 0.0
+        self._client_failed_at: float | None = None
+        self._lock = threading.Lock()
+
+    # ── Client and discovery ──────────────────────────────────────────
+
+    def _ensure_client(self) -> DynamicClient:
+        with self._lock:
+            if self._client is not None:
+                return self._client
+            if self._client_failed_at is not None and time.monotonic() - self._client_failed_at < CLIENT_RETRY_SECONDS:
+                raise UnsupportedCommand("API client unavailable")
+            try:
+                api_client = self._api_client
+                if api_client is None:
+                    configuration = client.Configuration()
+                    # Honor KUBECONFIG as the kubectl binary does: in the MCP pod it points at the filtering
+                    # KubernetesAPIProxy, which the ServiceAccount credentials would bypass. It is read here
+                    # rather than by the kubernetes package, which only looks at it once, on import.
+                    kubeconfig = os.environ.get("KUBECONFIG")
+                    try:
+                        config.load_kube_config(
+                            config_file=kubeconfig or DEFAULT_KUBECONFIG, client_configuration=configuration
+                        )
+                        _, context = config.list_kube_config_contexts(config_file=kubeconfig or DEFAULT_KUBECONFIG)
+                        self._default_namespace = context.get("context", {}).get("namespace") or "default"
+                    except config.ConfigException:
+                        if kubeconfig:
+                            raise
+                        config.load_incluster_config(client_configuration=configuration)
+                        with open(SERVICE_ACCOUNT_NAMESPACE_FILE) as f:
+                            self._default_namespace = f.read().strip() or "default"
+                    api_client = client.ApiClient(configuration)
+                self._client = DynamicClient(api_client)
+                self._index_resources()
+            except Exception as e:
+                self._client = None
+                self._client_failed_at = time.monotonic()
+                logger.warning(f"In-process kubectl engine unavailable, using the kubectl binary: {e}")
+                raise UnsupportedCommand(f"API client unavailable: {e}") from e
+            self._client_failed_at = None
+            return self._client
+
+    def _index_resources(self):
+        """Build the alias tables from the (disk-cached) discovery data. Caller holds the lock."""
+        core, grouped = [], []
+        for entry in self._client.resources:
+            for resource in entry if isinstance(entry, list) else [entry]:
+                if isinstance(resource, ResourceList):
+                    continue
+                (grouped if resource.group else core).append(resource)
+
+        aliases: dict[str, Resource] = {}
+        kinds: dict[tuple[str, str], Resource] = {}
+        # Core resources win alias collisions (e.g. "events"), as in kubectl
+        for resource in core + grouped:
+            kinds.setdefault((resource.group_version, resource.kind), resource)
+            if not resource.preferred:
+                continue
+            names = {resource.name, resource.singular_name, resource.kind.lower(), *(resource.short_names or [])}
+            for name in filter(None, names):
+                aliases.setdefault(name.lower(), resource)
+                if resource.group:
+                    aliases.setdefault(f"{name.lower()}.{resource.group}", resource)
+        self._aliases, self._kinds = aliases, kinds
+        self._discovered_at = time.monotonic()
+        logger.debug(f"Indexed {len(kinds)} API resources")
+
+    def _refresh_discovery(self) -> bool:
+        with self._lock:
+            if time.monotonic() - self._discovered_at < DISCOVERY_REFRESH_SECONDS:
+                return False
+            self._client.resources.invalidate_cache()
+            self._index_resources()
+            return True
+
+    def _resolve(self, resource_type: str) -> Resource:
+        self._ensure_client()
+        key = resource_type.lower()
+        resource = self._aliases.get(key)
+        if resource is None and self._refresh_discovery():
+            resource = self._aliases.get(key)
+        if resource is None:
+            raise UnsupportedCommand(f"unknown resource type {resource_type!r}")
+        return resource
+
+    def _resolve_kind(self, api_version: str, kind: str) -> Resource:
+        self._ensure_client()
+        resource = self._kinds.get((api_version, kind))
+        if resource is None and self._refresh_discovery():
+            resource = self._kinds.get((api_version, kind))
+        if resource is None:
+            raise UnsupportedCommand(f"unknown kind {api_version}/{kind}")
+        return resource
+
+    @staticmethod
+    def _ref(resource: Resource) -> str:
+        """The "<kind>.<group>" prefix kubectl uses in -o name output and messages."""
+        kind = resource.kind.lower()
+        return f"{kind}.{resource.group}" if resource.group else kind
+
+    def _namespace(self, parsed: ParsedCommand, resource: Resource) -> str | None:
+        if not resource.namespaced:
+            return None
+        return parsed.flag("--namespace") or self._default_namespace
+
+    def _request(self, method: str, path: str, **kwargs) -> dict:
+        response = self._ensure_client().request(method, path, serialize=False, **kwargs)
+        return json.loads(response.data)
+
+    def _target(self, parsed: ParsedCommand, args: list[str] | None = None) -> tuple[Resource, str, str | None]:
+        """Resolve a single "TYPE NAME" or "TYPE/NAME" target."""
+        args = parsed.args if args is None else args
+        if len(args) == 1 and "/" in args[0]:
+            resource_type, name = args[0].split("/", 1)
+        elif len(args) == 2 and "/" not in args[0]:
+            resource_type, name = args
+        else:
+            raise UnsupportedCommand("expected exactly one TYPE NAME target")
+        if "," in resource_type or not name:
+            raise UnsupportedCommand("expected exactly one TYPE NAME target")
+        resource = self._resolve(resource_type)
+        return resource, name, self._namespace(parsed, resource)
+
+    # ── Verbs ─────────────────────────────────────────────────────────
+
+    def _get(self, parsed: ParsedCommand, dry_run: bool) -> tuple[str, str]:
+        args = parsed.args
+        if not args:
+            raise UnsupportedCommand("get without a resource type")
+        if "/" in args[0]:
+            resource_type, name = args[0].split("/", 1)
+            names = [name, *args[1:]]
+        else:
+            resource_type, names = args[0], args[1:]
+        all_namespaces = parsed.enabled("--all-namespaces")
+        if "," in resource_type or len(names) > 1 or (names and all_namespaces):
+            raise UnsupportedCommand("multi-type, multi-name or cross-namespace named get")
+
+        output = parsed.flag("--output", "")
+        if output not in ("", "wide", "json", "yaml", "name"):
+            raise UnsupportedCommand(f"output format {output!r}")
+
+        resource = self._resolve(resource_type)
+        name = names[0] if names else None
+        namespace = None if all_namespaces else self._namespace(parsed, resource)
+        selectors = {}
+        if parsed.flag("--selector"):
+            selectors["label_selector"] = parsed.flag("--selector")
+        if parsed.flag("--field-selector"):
+            selectors["field_selector"] = parsed.flag("--field-selector")
+        if name and selectors:
+            raise UnsupportedCommand("selectors with a named get")
+        path = resource.path(name=name, namespace=namespace)
+
+        not_found = f"No resources found in {namespace} namespace.\n" if namespace else "No resources found\n"
+
+        try:
+            if output in ("", "wide"):
+                table = self._request("get", path, header_params={"Accept": TABLE_ACCEPT}, **selectors)
+                if table.get("kind") != "Table":
+                    raise UnsupportedCommand("server-side table printing not available")
+                with_namespace = all_namespaces and resource.namespaced
+                return self._render_get_table(table, output == "wide", with_namespace, parsed, not_found)
+            data = self._request("get", path, **selectors)
+        except NotFoundError:
+            if name and parsed.enabled("--ignore-not-found"):
+                return "", ""
+            raise
+
+        if name:
+            items = [data]
+        else:
+            items = data.get("items") or []
+            for item in items:
+                item.setdefault("apiVersion", resource.group_version)
+                item.setdefault("kind", resource.kind)
+        items = [strip_managed_fields(item) for item in items]
+
+        if output == "name":
+            if not items:
+                return "", not_found
+            return "".join(f"{self._ref(resource)}/{item['metadata']['name']}\n" for item in items), ""
+
+        obj = (
+            items[0]
+            if name
+            else {"apiVersion": "v1", "items": items, "kind": "List", "metadata": {"resourceVersion": ""}}
+        )
+        if output == "json":
+            return json.dumps(obj, indent=4, sort_keys=True, ensure_ascii=False) + "\n", ""
+        return yaml.safe_dump(obj, default_flow_style=False, allow_unicode=True, width=1 << 30), ""
+
+    @staticmethod
+    def _render_get_table(table: dict, wide: bool, with_namespace: bool, parsed: ParsedCommand, not_found: str):
+        rows = table.get("rows") or []
+        if not rows:
+            return "", not_found
+
+        columns = [
+            (i, column)
+            for i, column in enumerate(table.get("columnDefinitions") or [])
+            if wide or column.get("priority", 0) == 0
+        ]
+        lines = []
+        if not parsed.enabled("--no-headers"):
+            lines.append((["NAMESPACE"] if with_namespace else []) + [column["name"].upper() for _, column in columns])
+        for row in rows:
+            cells = row.get("cells") or []
+            line = [format_cell(cells[i] if i < len(cells) else None, column) for i, column in columns]
+            if with_namespace:
+                line.insert(0, ((row.get("object") or {}).get("metadata") or {}).get("namespace", ""))
+            lines.append(line)
+        return render_table(lines), ""
+
+    def _describe(self, parsed: ParsedCommand, dry_run: bool) -> tuple[str, str]:
+        # Describers are implemented client-side in kubectl; only the (no-op) dry-run is served here
+        raise UnsupportedCommand("describe output is rendered by kubectl")
+
+    def _patch(self, parsed: ParsedCommand, dry_run: bool) -> tuple[str, str]:
+        resource, name, namespace = self._target(parsed)
+        content_type = PATCH_CONTENT_TYPES.get(parsed.flag("--type", "strategic"))
+        if content_type is None or parsed.flag("--patch") is None:
+            raise UnsupportedCommand("patch type or body")
+        try:
+            body = yaml.safe_load(parsed.flag("--patch"))
+        except yaml.YAMLError as e:
+            raise UnsupportedCommand("unparsable patch") from e
+
+        path = resource.path(name=name, namespace=namespace)
+        if dry_run:
+            self._request("patch", path, body=body, content_type=content_type, dry_run="All")
+            return f"{self._ref(resource)}/{name} patched (server dry run)\n", ""
+        before = self._request("get", path)
+        after = self._request("patch", path, body=body, content_type=content_type)
+        unchanged = before["metadata"].get("resourceVersion") == after["metadata"].get("resourceVersion")
+        return f"{self._ref(resource)}/{name} patched{' (no change)' if unchanged else ''}\n", ""
+
+    def _scale(self, parsed: ParsedCommand, dry_run: bool) -> tuple[str, str]:
+        resource, name, namespace = self._target(parsed)
+        try:
+            replicas = int(parsed.flag("--replicas", ""))
+        except ValueError as e:
+            raise UnsupportedCommand("invalid --replicas") from e
+        if replicas < 0 or "scale" not in resource.subresources:
+            raise UnsupportedCommand("resource cannot be scaled in-process")
+
+        path = resource.path(name=name, namespace=namespace) + "/scale"
+        self._request(
+            "patch",
+            path,
+            body={"spec": {"replicas": replicas}},
+            content_type=PATCH_CONTENT_TYPES["merge"],
+            dry_run="All" if dry_run else None,
+        )
+        return f"{self._ref(resource)}/{name} scaled{' (server dry run)' if dry_run else ''}\n", ""
+
+    def _delete(self, parsed: ParsedCommand, dry_run: bool) -> tuple[str, str]:
+        resource, name, namespace = self._target(parsed)
+        output = parsed.flag("--output")
+        cascade = CASCADE_POLICIES.get(parsed.flag("--cascade", "background"))
+        if output not in (None, "name") or cascade is None:
+            raise UnsupportedCommand("delete output or cascade mode")
+        if not dry_run and parsed.flag("--wait", "true") != "false":
+            # Waiting for finalizers is left to kubectl
+            raise UnsupportedCommand("delete with --wait")
+
+        body = {"apiVersion": "v1", "kind": "DeleteOptions", "propagationPolicy": cascade}
+        if parsed.enabled("--now"):
+            body["gracePeriodSeconds"] = 1
+        elif parsed.flag("--grace-period") is not None:
+            try:
+                grace_period = int(parsed.flag("--grace-period"))
+            except ValueError as e:
+                raise UnsupportedCommand("invalid --grace-period") from e
+            if grace_period >= 0:
+                body["gracePeriodSeconds"] = grace_period
+
+        try:
+            self._request(
+                "delete",
+                resource.path(name=name, namespace=namespace),
+                body=body,
+                dry_run="All" if dry_run else None,
+            )
+        except NotFoundError:
+            if parsed.enabled("--ignore-not-found"):
+                return "", ""
+            raise
+        if output == "name":
+            return f"{self._ref(resource)}/{name}\n", ""
+        return f'{self._ref(resource)} "{name}" deleted{" (server dry run)" if dry_run else ""}\n', ""
+
+    def _load_manifest(self, parsed: ParsedCommand) -> tuple[Resource, dict, str | None]:
+        filename = parsed.flag("--filename")
+        if parsed.args or not filename or filename == "-" or "://" in filename or not os.path.isfile(filename):
+            raise UnsupportedCommand("apply needs a single local manifest file")
+        with open(filename) as f:
+            try:
+                documents = [doc for doc in yaml.safe_load_all(f) if doc]
+            except yaml.YAMLError as e:
+                raise UnsupportedCommand("unparsable manifest") from e
+        if len(documents) != 1 or not isinstance(documents[0], dict):
+            raise UnsupportedCommand("apply of multiple objects")
+
+        manifest = copy.deepcopy(documents[0])
+        metadata = manifest.get("metadata") or {}
+        if not manifest.get("apiVersion") or not manifest.get("kind") or not metadata.get("name"):
+            raise UnsupportedCommand("manifest without apiVersion, kind or metadata.name")
+        resource = self._resolve_kind(manifest["apiVersion"], manifest["kind"])
+
+        namespace = None
+        if resource.namespaced:
+            flag_namespace = parsed.flag("--namespace")
+            if flag_namespace and metadata.get("namespace") and flag_namespace != metadata["namespace"]:
+                raise UnsupportedCommand("namespace mismatch")
+            namespace = metadata.get("namespace") or flag_namespace or self._default_namespace
+            metadata["namespace"] = namespace
+        manifest["metadata"] = metadata
+        return resource, manifest, namespace
+
+    def _apply(self, parsed: ParsedCommand, dry_run: bool) -> tuple[str, str]:
+        resource, manifest, namespace = self._load_manifest(parsed)
+        if not dry_run:
+            # Client-side apply (last-applied annotation and three-way merge) stays with kubectl
+            raise UnsupportedCommand("apply is executed by kubectl")
+
+        name = manifest["metadata"]["name"]
+        try:
+            self._request("get", resource.path(name=name, namespace=namespace))
+        except NotFoundError:
+            self._request("post", resource.path(namespace=namespace), body=manifest, dry_run="All")
+            return f"{self._ref(resource)}/{name} created (server dry run)\n", ""
+
+        path = resource.path(name=name, namespace=namespace)
+        try:
+            self._request("patch", path, body=manifest, content_type=PATCH_CONTENT_TYPES["strategic"], dry_run="All")
+        except DynamicApiError as e:
+            # Custom resources do not support strategic merge patches
+            if e.status != 415:
+                raise
+            self._request("patch", path, body=manifest, content_type=PATCH_CONTENT_TYPES["merge"], dry_run="All")
+        return f"{self._ref(resource)}/{name} configured (server dry run)\n", ""
+
+    def _set_image(self, parsed: ParsedCommand, dry_run: bool) -> tuple[str, str]:
+        images = [arg for arg in parsed.args if "=" in arg]
+        resource, name, namespace = self._target(parsed, [arg for arg in parsed.args if "=" not in arg])
+        if not images:
+            raise UnsupportedCommand("set image without container=image pairs")
+
+        if resource.kind == "Pod":
+            spec_path = ["spec"]
+        elif resource.kind == "CronJob":
+            spec_path = ["spec", "jobTemplate", "spec", "template", "spec"]
+        else:
+            spec_path = ["spec", "template", "spec"]
+
+        path = resource.path(name=name, namespace=namespace)
+        pod_spec = self._request("get", path)
+        for key in spec_path:
+            pod_spec = pod_spec.get(key) if isinstance(pod_spec, dict) else None
+        if not isinstance(pod_spec, dict):
+            raise UnsupportedCommand(f"{resource.kind} has no pod template")
+
+        spec_patch: dict[str, list] = {}
+        for pair in images:
+            container_name, image = pair.split("=", 1)
+            matched = False
+            for list_name in ("initContainers", "containers"):
+                for container in pod_spec.get(list_name) or []:
+                    if container_name in ("*", container.get("name")):
+                        spec_patch.setdefault(list_name, []).append({"name": container["name"], "image": image})
+                        matched = True
+            if not matched:
+                raise CommandError(f'unable to find container named "{container_name}"')
+
+        body = spec_patch
+        for key in reversed(spec_path):
+            body = {key: body}
+        self._request(
+            "patch",
+            path,
+            body=body,
+            content_type=PATCH_CONTENT_TYPES["strategic"],
+            dry_run="All" if dry_run else None,
+        )
+        return f"{self._ref(resource)}/{name} image updated{' (server dry run)' if dry_run else ''}\n", ""
+
+    # ── KubeCtl-compatible entry points ───────────────────────────────
+
+    def _run(self, command: str, parsed: ParsedCommand, dry_run: bool) -> subprocess.CompletedProcess:
+        handler = getattr(self, "_" + parsed.verb.replace(" ", "_"))
+        try:
+            stdout, stderr = handler(parsed, dry_run)
+            return subprocess.CompletedProcess(command, 0, stdout, stderr)
+        except DynamicApiError as e:
+            return subprocess.CompletedProcess(command, 1, "", format_api_error(e))
+        except CommandError as e:
+            return subprocess.CompletedProcess(command, 1, "", f"error: {e}\n")
+
+    def exec_command(self, command: str, input_data=None):
+        """Execute a kubectl command in-process when possible, otherwise through the kubectl binary."""
+        parsed = parse_command(command) if input_data is None else None
+        if parsed is not None:
+            try:
+                result = self._run(command, parsed, dry_run=False)
+                logger.debug(f"Served in-process: {command!r} (exit {result.returncode})")
+                return result
+            except UnsupportedCommand as e:
+                logger.debug(f"Falling back to kubectl for {command!r}: {e}")
+        return KubeCtl.exec_command(command, input_data)
+
+    def exec_command_result(self, command: str, input_data=None) -> str:
+        result = self.exec_command(command, input_data)
+        if result.returncode == 0:
+            logger.info(f"Command execution:\n{parse_text(result.stdout, 500)}")
+            return result.stdout
+        else:
+            logger.error(f"Error executing kubectl command:\n{result.stderr}")
+            return f"Error executing kubectl command:\n{result.stderr}"
+
+    def dry_run_json_output(self, command: str, keylist: list[str] | str | None = None) -> DryRunResult:
+        """Server-side dry-run with the same contract as KubeCtl.dry_run_json_output."""
+        parsed = parse_command(command)
+        if parsed is not None and parsed.verb in NO_DRY_RUN_VERBS:
+            return DryRunResult(
+                status=DryRunStatus.NOEFFECT,
+                description="Dry-run not supported. Possibly it's a safe command.",
+                result=[],
+            )
+
+        if parsed is not None and keylist in (None, "name"):
+            try:
+                if keylist == "name":
+                    if parsed.verb == "apply":
+                        resource, manifest, _ = self._load_manifest(parsed)
+                        name = manifest["metadata"]["name"]
+                    else:
+                        resource, name, _ = self._target(parsed, [a for a in parsed.args if "=" not in a])
+                    return DryRunResult(
+                        status=DryRunStatus.SUCCESS,
+                        description="Dry run executed successfully.",
+                        result=[self._ref(resource), name],
+                    )
+
+                result = self._run(command, parsed, dry_run=True)
+                if result.returncode != 0:
+                    return DryRunResult(
+                        status=DryRunStatus.ERROR,
+                        description=f"Dry-run failed. Potentially it's an invalid command. stderr: {parse_text(result.stderr, 200)}",
+                        result=[],
+                    )
+                if len(result.stdout.strip()) == 0:
+                    return DryRunResult(
+                        status=DryRunStatus.NOEFFECT,
+                        description="The dry-run output is empty. Possibly this command won't affect any resources.",
+                        result=[],
+                    )
+                return DryRunResult(
+                    status=DryRunStatus.SUCCESS,
+                    description="Dry run executed successfully.",
+                    result=[result.stdout],
+                )
+            except UnsupportedCommand as e:
+                logger.debug(f"Falling back to kubectl dry-run for {command!r}: {e}")
+        return KubeCtl.dry_run_json_output(command, keylist)
+
+
+# Shared by every kubectl tool session in the process
+_engine: KubectlEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_kubectl_engine() -> KubectlEngine:
+    """Return the process-wide engine, creating it on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = KubectlEngine()
+        return _engine
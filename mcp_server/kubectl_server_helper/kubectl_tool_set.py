@@ -1,3 +1,5 @@
+import asyncio
+
 from mcp_server.configs.kubectl_tool_cfg import KubectlToolCfg, output_parent_dir
 from mcp_server.kubectl_server_helper.action_stack import ActionStack
 from mcp_server.kubectl_server_helper.kubectl_cmd_runner import KubectlCmdRunner
@@ -16,3 +18,5 @@ class KubectlToolSet:
 
         self.cmd_runner = KubectlCmdRunner(self.config, self.action_stack)
         self.rollback_tool = RollbackTool(self.config, self.action_stack)
+        # Serializes mutating tool calls of this session
+        self.exec_lock = asyncio.Lock()
@@ -1,29 +1,21 @@
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from clients.stratus.stratus_utils.get_logger import get_logger
-from mcp_server.utils import ObservabilityClient
+from mcp_server.tool_pool import run_tool
+from mcp_server.utils import fetch_json, get_observability_client, normalize_query
 
 logger = get_logger()
 logger.info("Starting Loki MCP Server")
 
 mcp = FastMCP("Loki MCP Server")
 
+LOKI_URL = "http://loki.observe.svc.cluster.local:3100"
 
-@mcp.tool(name="get_logs")
-def get_logs(query: str, last_n_minutes: int = 15) -> str:
-    """Query logs from Loki using LogQL.
-
-    Args:
-        query (str): A LogQL query expression (e.g., '{namespace="default"}' or '{app="nginx"} |= "error"').
-        last_n_minutes (int): Number of minutes to look back for logs. Defaults to 15.
 
-    Returns:
-        str: Log entries matching the query, or error information.
-    """
+def _get_logs(query: str, last_n_minutes: int = 15) -> str:
     logger.info(f"[loki_mcp] get_logs called with query: {query}")
 
-    loki_url = "http://loki.observe.svc.cluster.local:3100"
-    observability_client = ObservabilityClient(loki_url)
+    observability_client = get_observability_client(LOKI_URL)
 
     try:
         import time
@@ -31,7 +23,7 @@ def get_logs(query: str, last_n_minutes: int = 15) -> str:
         end_time = int(time.time() * 1e9)  # nanoseconds
         start_time = end_time - (last_n_minutes * 60 * 1_000_000_000)
 
-        url = f"{loki_url}/loki/api/v1/query_range"
+        url = f"{LOKI_URL}/loki/api/v1/query_range"
         params = {
             "query": query,
             "start": start_time,
@@ -39,10 +31,8 @@ def get_logs(query: str, last_n_minutes: int = 15) -> str:
             "limit": 100,
         }
 
-        response = observability_client.make_request("GET", url, params=params)
-        logger.info(f"[loki_mcp] get_logs status code: {response.status_code}")
-
-        data = response.json()
+        cache_key = ("loki.query_range", normalize_query(query), last_n_minutes)
+        data = fetch_json(observability_client, url, params=params, cache_key=cache_key)
         if data.get("status") != "success":
             return f"Query failed: {data.get('error', 'Unknown error')}"
 
@@ -71,24 +61,28 @@ def get_logs(query: str, last_n_minutes: int = 15) -> str:
         return err_str
 
 
-@mcp.tool(name="get_labels")
-def get_labels() -> str:
-    """Get all available label names from Loki.
+@mcp.tool(name="get_logs")
+async def get_logs(query: str, last_n_minutes: int = 15, ctx: Context | None = None) -> str:
+    """Query logs from Loki using LogQL.
+
+    Args:
+        query (str): A LogQL query expression (e.g., '{namespace="default"}' or '{app="nginx"} |= "error"').
+        last_n_minutes (int): Number of minutes to look back for logs. Defaults to 15.
 
     Returns:
-        str: List of available label names for filtering logs.
+        str: Log entries matching the query, or error information.
     """
+    return await run_tool(ctx, _get_logs, query, last_n_minutes)
+
+
+def _get_labels() -> str:
     logger.info("[loki_mcp] get_labels called")
 
-    loki_url = "http://loki.observe.svc.cluster.local:3100"
-    observability_client = ObservabilityClient(loki_url)
+    observability_client = get_observability_client(LOKI_URL)
 
     try:
-        url = f"{loki_url}/loki/api/v1/labels"
-        response = observability_client.make_request("GET", url)
-        logger.info(f"[loki_mcp] get_labels status code: {response.status_code}")
-
-        data = response.json()
+        url = f"{LOKI_URL}/loki/api/v1/labels"
+        data = fetch_json(observability_client, url)
         if data.get("status") != "success":
             return f"Query failed: {data.get('error', 'Unknown error')}"
 
@@ -102,27 +96,24 @@ def get_labels() -> str:
         return err_str
 
 
-@mcp.tool(name="get_label_values")
-def get_label_values(label: str) -> str:
-    """Get all values for a specific label from Loki.
-
-    Args:
-        label (str): The label name to get values for (e.g., 'namespace', 'app', 'pod').
+@mcp.tool(name="get_labels")
+async def get_labels(ctx: Context) -> str:
+    """Get all available label names from Loki.
 
     Returns:
-        str: List of values for the specified label.
+        str: List of available label names for filtering logs.
     """
+    return await run_tool(ctx, _get_labels)
+
+
+def _get_label_values(label: str) -> str:
     logger.info(f"[loki_mcp] get_label_values called for label: {label}")
 
-    loki_url = "http://loki.observe.svc.cluster.local:3100"
-    observability_client = ObservabilityClient(loki_url)
+    observability_client = get_observability_client(LOKI_URL)
 
     try:
-        url = f"{loki_url}/loki/api/v1/label/{label}/values"
-        response = observability_client.make_request("GET", url)
-        logger.info(f"[loki_mcp] get_label_values status code: {response.status_code}")
-
-        data = response.json()
+        url = f"{LOKI_URL}/loki/api/v1/label/{label}/values"
+        data = fetch_json(observability_client, url)
         if data.get("status") != "success":
             return f"Query failed: {data.get('error', 'Unknown error')}"
 
@@ -137,3 +128,16 @@ def get_label_values(label: str) -> str:
         err_str = f"[loki_mcp] Error querying get_label_values: {str(e)}"
         logger.error(err_str)
         return err_str
+
+
+@mcp.tool(name="get_label_values")
+async def get_label_values(label: str, ctx: Context) -> str:
+    """Get all values for a specific label from Loki.
+
+    Args:
+        label (str): The label name to get values for (e.g., 'namespace', 'app', 'pod').
+
+    Returns:
+        str: List of values for the specified label.
+    """
+    return await run_tool(ctx, _get_label_values, label)
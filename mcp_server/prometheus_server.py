@@ -1,7 +1,8 @@
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from clients.stratus.stratus_utils.get_logger import get_logger
-from mcp_server.utils import ObservabilityClient
+from mcp_server.tool_pool import run_tool
+from mcp_server.utils import fetch_json, get_observability_client
 
 logger = get_logger()
 logger.info("Starting Prometheus MCP Server")
@@ -12,27 +13,15 @@ mcp = FastMCP("Prometheus MCP Server")
 PROMETHEUS_URL = "http://prometheus-server.observe.svc.cluster.local:80"
 
 
-@mcp.tool(name="get_metrics")
-def get_metrics(query: str) -> str:
-    """Query real-time metrics data from the Prometheus instance.
-
-    Args:
-        query (str): A Prometheus Query Language (PromQL) expression used to fetch metric values.
-
-    Returns:
-        str: String of metric results, including timestamps, values, and labels or error information.
-    """
-
+def _get_metrics(query: str) -> str:
     logger.info("[prom_mcp] get_metrics called, getting prometheus metrics")
 
-    observability_client = ObservabilityClient(PROMETHEUS_URL)
+    observability_client = get_observability_client(PROMETHEUS_URL)
     try:
         url = f"{PROMETHEUS_URL}/api/v1/query"
         param = {"query": query}
-        response = observability_client.make_request("GET", url, params=param)
-        logger.info(f"[prom_mcp] get_metrics status code: {response.status_code}")
-        logger.info(f"[prom_mcp] get_metrics result: {response}")
-        metrics = str(response.json()["data"])
+        data = fetch_json(observability_client, url, params=param)
+        metrics = str(data["data"])
         result = metrics if metrics else "None"
 
         return result
@@ -42,27 +31,26 @@ def get_metrics(query: str) -> str:
         return err_str
 
 
-@mcp.tool(name="get_alerts")
-def get_alerts() -> str:
-    """Get all currently firing alerts from the Prometheus instance.
+@mcp.tool(name="get_metrics")
+async def get_metrics(query: str, ctx: Context) -> str:
+    """Query real-time metrics data from the Prometheus instance.
 
-    Returns a list of firing alerts with their labels (alertname, severity,
-    namespace, service_name, etc.) and annotations (summary, description).
+    Args:
+        query (str): A Prometheus Query Language (PromQL) expression used to fetch metric values.
 
     Returns:
-        str: String of firing alert data including alert names, labels,
-             and annotations, or "No firing alerts" if none are active.
+        str: String of metric results, including timestamps, values, and labels or error information.
     """
+    return await run_tool(ctx, _get_metrics, query)
 
+
+def _get_alerts() -> str:
     logger.info("[prom_mcp] get_alerts called")
 
-    observability_client = ObservabilityClient(PROMETHEUS_URL)
+    observability_client = get_observability_client(PROMETHEUS_URL)
     try:
         url = f"{PROMETHEUS_URL}/api/v1/alerts"
-        response = observability_client.make_request("GET", url)
-        logger.info(f"[prom_mcp] get_alerts status code: {response.status_code}")
-
-        alerts = response.json().get("data", {}).get("alerts", [])
+        alerts = fetch_json(observability_client, url).get("data", {}).get("alerts", [])
         firing = [a for a in alerts if a.get("state") == "firing"]
 
         if not firing:
@@ -73,3 +61,17 @@ def get_alerts() -> str:
         err_str = f"[prom_mcp] Error querying get_alerts: {str(e)}"
         logger.error(err_str)
         return err_str
+
+
+@mcp.tool(name="get_alerts")
+async def get_alerts(ctx: Context) -> str:
+    """Get all currently firing alerts from the Prometheus instance.
+
+    Returns a list of firing alerts with their labels (alertname, severity,
+    namespace, service_name, etc.) and annotations (summary, description).
+
+    Returns:
+        str: String of firing alert data including alert names, labels,
+             and annotations, or "No firing alerts" if none are active.
+    """
+    return await run_tool(ctx, _get_alerts)
@@ -6,7 +6,8 @@ from fastmcp.server.http import create_sse_app
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
-from starlette.routing import Mount
+from starlette.responses import JSONResponse
+from starlette.routing import Mount, Route
 
 from mcp_server.configs.load_all_cfg import mcp_server_cfg
 from mcp_server.jaeger_server import mcp as observability_mcp
@@ -14,12 +15,27 @@ from mcp_server.kubectl_mcp_tools import kubectl_mcp
 from mcp_server.loki_server import mcp as loki_mcp
 from mcp_server.prometheus_server import mcp as prometheus_mcp
 from mcp_server.submit_server import mcp as submit_mcp
+from mcp_server.tool_pool import get_tool_pool
+from mcp_server.utils import response_cache
 from sregym.service.k8s_proxy import KubernetesAPIProxy
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+
+async def tool_pool_stats(request):
+    """Queue depths and counters of the shared tool worker pool."""
+    return JSONResponse(get_tool_pool().stats())
+
+
+async def observability_cache_stats(request):
+    """Hit/miss counters of the shared observability response cache."""
+    return JSONResponse(response_cache.stats())
+
+
 routes = [
+    Route("/tool_pool/stats", tool_pool_stats),
+    Route("/observability/cache_stats", observability_cache_stats),
     Mount("/kubectl", app=create_sse_app(kubectl_mcp, "/messages/", "/sse")),
     Mount("/jaeger", app=create_sse_app(observability_mcp, "/messages/", "/sse")),
     Mount("/loki", app=create_sse_app(loki_mcp, "/messages/", "/sse")),
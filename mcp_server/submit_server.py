@@ -1,8 +1,9 @@
 import requests
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from clients.stratus.configs.langgraph_tool_configs import LanggraphToolConfig
 from clients.stratus.stratus_utils.get_logger import get_logger
+from mcp_server.tool_pool import run_tool
 
 logger = get_logger()
 logger.info("Starting Submission MCP Server")
@@ -12,21 +13,14 @@ langgraph_tool_config = LanggraphToolConfig()
 mcp = FastMCP("Submission MCP Server")
 
 
-@mcp.tool(name="submit")
-def submit(ans: str) -> dict[str, str]:
-    """Submit task result to benchmark
-
-    Args:
-        ans (str): task result that the agent submits
-
-    Returns:
-        dict[str]: http response code and response text of benchmark submission server
-    """
-
+def _submit(ans: str, token: str | None = None) -> dict[str, str]:
     logger.info("[submit_mcp] submit mcp called")
     # FIXME: reference url from config file, remove hard coding
     url = langgraph_tool_config.benchmark_submit_url
     headers = {"Content-Type": "application/json"}
+    # Names the problem when several run at once (main.py --concurrent-problems)
+    if token:
+        headers["X-Problem-Token"] = token
     # Match curl behavior: send "\"yes\"" when ans is "yes"
     payload = {"solution": f"{ans}"}
 
@@ -38,3 +32,17 @@ def submit(ans: str) -> dict[str, str]:
     except Exception as e:
         logger.error(f"[submit_mcp] HTTP submission failed: {e}")
         return {"status": "N/A", "text": f"[submit_mcp] HTTP submission failed: {e}"}
+
+
+@mcp.tool(name="submit")
+async def submit(ans: str, ctx: Context, token: str | None = None) -> dict[str, str]:
+    """Submit task result to benchmark
+
+    Args:
+        ans (str): task result that the agent submits
+        token (str, optional): problem token, only needed when several problems run at once
+
+    Returns:
+        dict[str]: http response code and response text of benchmark submission server
+    """
+    return await run_tool(ctx, _submit, ans, token)
@@ -0,0 +1,149 @@
+"""
+Bounded worker pool for MCP tool bodies.
+
+Tool bodies block on subprocesses and HTTP calls. Running them directly inside
+the uvicorn event loop lets one slow call (a `kubectl rollout status`, a large
+Loki query) stall every other session's SSE stream, so the tools are declared
+`async` and hand their blocking body to this pool instead. Each session may
+run at most `per_session_limit` tool calls at once; further calls from the same
+session wait their turn without occupying a worker thread.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from fastmcp import Context
+from yarl import URL
+
+from mcp_server.configs.load_all_cfg import mcp_server_cfg
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+logger = logging.getLogger("all.mcp.tool_pool")
+
+
+def session_key(ctx: Context | None) -> str:
+    """Identify the calling session: the sregym_ssid header, then the session_id query parameter."""
+    if ctx is None:
+        return "default"
+    try:
+        request = ctx.request_context.request
+        ssid = request.headers.get("sregym_ssid") or URL(str(request.url)).query.get("session_id")
+    except (AttributeError, LookupError, ValueError):
+        ssid = None
+    return ssid or getattr(ctx, "session_id", None) or "default"
+
+
+class _SessionSlot:
+    """Concurrency limit for one session; dropped once the session has nothing running or waiting."""
+
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.users = 0
+
+
+class ToolWorkerPool:
+    """Runs blocking tool bodies on a bounded thread pool with per-session concurrency limits."""
+
+    def __init__(self, max_workers: int, per_session_limit: int):
+        self.max_workers = max_workers
+        self.per_session_limit = per_session_limit
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-tool")
+        # Only touched from the event loop thread
+        self._sessions: dict[str, _SessionSlot] = {}
+
+        self._stats_lock = threading.Lock()
+        # Calls waiting on their session's limit
+        self._session_waiting = 0
+        # Calls submitted to the executor but not yet picked up by a worker
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._peak_queue_depth = 0
+        self._queue_wait_total = 0.0
+
+    async def run(self, session_id: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run func(*args, **kwargs) on a worker thread, within session_id's concurrency limit."""
+        slot = self._sessions.get(session_id)
+        if slot is None:
+            slot = self._sessions[session_id] = _SessionSlot(self.per_session_limit)
+        slot.users += 1
+        self._update(session_waiting=1)
+        try:
+            async with slot.semaphore:
+                self._update(session_waiting=-1, queued=1)
+                submitted = time.monotonic()
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._executor, self._call, submitted, func, args, kwargs
+                )
+        finally:
+            slot.users -= 1
+            if slot.users == 0:
+                self._sessions.pop(session_id, None)
+
+    def _call(self, submitted: float, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        self._update(queued=-1, running=1, queue_wait=time.monotonic() - submitted)
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            self._update(running=-1, failed=1)
+            raise
+        self._update(running=-1, completed=1)
+        return result
+
+    def _update(self, session_waiting=0, queued=0, running=0, completed=0, failed=0, queue_wait=0.0):
+        with self._stats_lock:
+            self._session_waiting += session_waiting
+            self._queued += queued
+            self._running += running
+            self._completed += completed
+            self._failed += failed
+            self._queue_wait_total += queue_wait
+            self._peak_queue_depth = max(self._peak_queue_depth, self._queued)
+
+    def stats(self) -> dict[str, Any]:
+        """Current queue depths and counters."""
+        with self._stats_lock:
+            started = self._completed + self._failed + self._running
+            return {
+                "max_workers": self.max_workers,
+                "per_session_limit": self.per_session_limit,
+                "active_sessions": len(self._sessions),
+                "session_waiting": self._session_waiting,
+                "queue_depth": self._queued,
+                "peak_queue_depth": self._peak_queue_depth,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "mean_queue_wait_ms": round(1000 * self._queue_wait_total / started, 3) if started else 0.0,
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_tool_pool: ToolWorkerPool | None = None
+_tool_pool_lock = threading.Lock()
+
+
+def get_tool_pool() -> ToolWorkerPool:
+    """Return the process-wide tool pool, sized from the MCP server config."""
+    global _tool_pool
+    with _tool_pool_lock:
+        if _tool_pool is None:
+            _tool_pool = ToolWorkerPool(mcp_server_cfg.tool_workers, mcp_server_cfg.per_session_tool_limit)
+            logger.info(
+                f"MCP tool pool started: {mcp_server_cfg.tool_workers} workers, "
+                f"{mcp_server_cfg.per_session_tool_limit} concurrent calls per session"
+            )
+        return _tool_pool
+
+
+async def run_tool(ctx: Context | None, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking tool body on the shared pool under the calling session's limit."""
+    return await get_tool_pool().run(session_key(ctx), func, *args, **kwargs)
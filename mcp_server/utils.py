@@ -1,5 +1,9 @@
+import copy
 import logging
 import os
+import threading
+import time
+from collections.abc import Callable, Hashable
 from typing import Any
 
 import requests
@@ -14,6 +18,11 @@ logger = logging.getLogger("all.mcp.utils")
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", 120))
 RETRY_TOTAL = int(os.getenv("RETRY_TOTAL", 3))
 RETRY_BACKOFF_FACTOR = float(os.getenv("RETRY_BACKOFF_FACWTOR", 0.3))
+# Keep-alive connections kept per backend; sized for the MCP tool worker pool
+POOL_MAXSIZE = int(os.getenv("OBSERVABILITY_POOL_MAXSIZE", 32))
+# Seconds a cached observability response stays valid; 0 disables the cache
+CACHE_TTL = float(os.getenv("OBSERVABILITY_CACHE_TTL", 10))
+CACHE_MAX_ENTRIES = int(os.getenv("OBSERVABILITY_CACHE_MAX_ENTRIES", 1024))
 
 
 class ObservabilityClient:
@@ -53,7 +62,7 @@ class ObservabilityClient:
             backoff_factor=RETRY_BACKOFF_FACTOR,
             status_forcelist=[500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retries)
+        adapter = HTTPAdapter(max_retries=retries, pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
@@ -69,3 +78,121 @@ class ObservabilityClient:
         except requests.RequestException as e:
             logger.error(f"Request failed: {e}")
             raise
+
+
+_clients: dict[str, ObservabilityClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_observability_client(observability_url: str) -> ObservabilityClient:
+    """Return the shared keep-alive client for a backend URL, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(observability_url)
+        if client is None:
+            client = _clients[observability_url] = ObservabilityClient(observability_url)
+        return client
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace so trivially different spellings of a query share a cache entry."""
+    return " ".join(str(query).split())
+
+
+class ResponseCache:
+    """
+    Short-TTL cache for backend responses.
+
+    Every hit returns the same cached object; callers must not modify it (fetch_json
+    hands out copies).
+
+    Keys are bucketed by time (floor(now / ttl)), so a query over a relative window
+    ("last 15 minutes") is reused only within the same bucket. Concurrent misses on
+    the same key wait for a single fetch instead of each querying the backend.
+    Failed fetches are not cached.
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL, max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._inflight: dict[Hashable, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        if self.ttl <= 0:
+            with self._lock:
+                self.misses += 1
+            return fetch()
+
+        key = (key, int(time.time() // self.ttl))
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self.hits += 1
+                    return entry[1]
+                event = self._inflight.get(key)
+                if event is None:
+                    self.misses += 1
+                    event = self._inflight[key] = threading.Event()
+                    break
+            # Another thread is fetching this key; use its result (or retry if it failed)
+            event.wait()
+
+        try:
+            value = fetch()
+            with self._lock:
+                if len(self._entries) >= self.max_entries:
+                    self._evict(now)
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()
+
+    def _evict(self, now: float):
+        expired = [key for key, (expires, _) in self._entries.items() if expires <= now]
+        for key in expired or list(self._entries)[: max(1, self.max_entries // 10)]:
+            del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "ttl_seconds": self.ttl,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Shared by the Prometheus, Jaeger and Loki MCP servers
+response_cache = ResponseCache()
+
+
+def fetch_json(client: ObservabilityClient, url: str, params: dict | None = None, cache_key: Hashable = None) -> Any:
+    """
+    GET url and decode the JSON body through the shared response cache.
+
+    cache_key defaults to the URL plus normalized params; pass an explicit key for
+    queries whose params carry absolute timestamps (e.g. "last n minutes" windows).
+    Returns a copy of the cached response, so callers may modify it.
+    """
+    if cache_key is None:
+        cache_key = (url, tuple(sorted((k, normalize_query(v)) for k, v in (params or {}).items())))
+
+    def fetch():
+        response = client.make_request("GET", url, params=params)
+        logger.debug(f"GET {url} status code: {response.status_code}")
+        return response.json()
+
+    return copy.deepcopy(response_cache.get_or_fetch(cache_key, fetch))
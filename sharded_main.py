@@ -0,0 +1,237 @@
+"""
+Run the benchmark on several clusters at once.
+
+One main.py process (a "shard") is started per kubeconfig context. Each shard
+gets its own flattened kubeconfig, Conductor API port, MCP port-forward port and
+Kubernetes API proxy port, and claims problems from a shared WorkQueue, so a
+faster cluster simply takes more problems. A shard that dies has its claimed
+problem put back on the queue and is restarted while work remains. Once every
+shard has finished, the per-shard results journals are merged into
+<run dir>/<agent>_ALL_results.csv, the same file main.py writes.
+
+Arguments not recognised here (e.g. --model, --judge-model, --noise,
+--warm-platform) are passed through to every shard's main.py. --resume takes a
+previous merged results CSV or a results journal, exactly as main.py's does;
+a problem that completed some of its attempts runs only the missing ones.
+A problem whose attempts cannot be deployed is retried once (on whichever
+shard claims it next) and then reported as failed.
+
+### Example
+python sharded_main.py --contexts kind-sregym-1,kind-sregym-2,kind-sregym-3 --agent stratus --model gpt-5
+"""
+
+import argparse
+import logging
+import os
+import re
+import signal
+import subprocess  # nosec B404
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sregym.results_journal import ResultsJournal, completed_attempts, read_results, write_results_csv
+from sregym.work_queue import WorkQueue
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+logger = logging.getLogger("all.sharded_runner")
+
+MAIN_PY = Path(__file__).resolve().parent / "main.py"
+
+
+class Shard:
+    """One main.py process bound to one kubeconfig context."""
+
+    def __init__(self, index: int, context: str, run_dir: Path, args, passthrough: list[str]):
+        self.index = index
+        self.context = context
+        self.name = re.sub(r"[^A-Za-z0-9_.-]", "-", context)
+        self.dir = run_dir / "shards" / self.name
+        self.results_dir = self.dir / "results"
+        self.kubeconfig = self.dir / "kubeconfig"
+        self.api_port = args.base_api_port + index
+        self.mcp_port = args.base_mcp_port + index
+        self.proxy_port = args.base_proxy_port + index
+        self.restarts = 0
+        self.proc: subprocess.Popen | None = None
+        self._command = [
+            sys.executable,
+            str(MAIN_PY),
+            "--agent",
+            args.agent,
+            "--n-attempts",
+            str(args.n_attempts),
+            "--api-port",
+            str(self.api_port),
+            "--mcp-port",
+            str(self.mcp_port),
+            "--proxy-port",
+            str(self.proxy_port),
+            "--results-dir",
+            str(self.results_dir),
+            "--work-queue",
+            str(run_dir / "queue.json"),
+            "--shard",
+            self.name,
+            *passthrough,
+        ]
+
+    def prepare(self):
+        """Write a self-contained kubeconfig for this shard's context."""
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        result = subprocess.run(
+            ["kubectl", "config", "view", "--minify", "--flatten", f"--context={self.context}"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Cannot export kubeconfig for context '{self.context}': {result.stderr.strip()}")
+        self.kubeconfig.write_text(result.stdout)
+
+    def start(self):
+        env = {**os.environ, "KUBECONFIG": str(self.kubeconfig)}
+        # The child keeps its own handle on the log file
+        with open(self.dir / "main.log", "a") as log:
+            self.proc = subprocess.Popen(self._command, env=env, stdout=log, stderr=subprocess.STDOUT)
+        logger.info(
+            f"Shard {self.name}: started (pid {self.proc.pid}, API :{self.api_port}, "
+            f"MCP :{self.mcp_port}, proxy :{self.proxy_port}), log at {self.dir / 'main.log'}"
+        )
+
+    def results(self, agent: str) -> list[dict]:
+        # The journal, not the CSV: it also holds the attempts of a shard that crashed
+        journal = ResultsJournal(self.results_dir / f"{agent}_results.jsonl")
+        return [{**row, "shard": self.name} for row in journal.rows()]
+
+
+def load_problem_ids(problems: str | None) -> list[str]:
+    if problems:
+        return [p.strip() for p in problems.split(",") if p.strip()]
+    from sregym.conductor.problems.registry import ProblemRegistry
+
+    return ProblemRegistry().get_problem_ids()
+
+
+def load_resume_rows(resume: str | None) -> list[dict]:
+    return read_results(resume) if resume else []
+
+
+def prepare_agent_image(agent: str, force_build: bool):
+    """Build or check the agent container image once, before the shards start."""
+    from sregym.agent_launcher import AgentLauncher
+    from sregym.agent_registry import get_agent
+
+    agent_reg = get_agent(agent, path=MAIN_PY.parent / "agents.yaml")
+    if not agent_reg or agent_reg.container_isolation:
+        AgentLauncher().enable_container_isolation(force_build=force_build)
+
+
+def supervise(shards: list[Shard], queue: WorkQueue, max_restarts: int):
+    """Wait for every shard to exit, re-queueing a dead shard's work and restarting it while work remains."""
+    running = {shard.name: shard for shard in shards}
+    while running:
+        time.sleep(5)
+        for shard in list(running.values()):
+            returncode = shard.proc.poll()
+            if returncode is None:
+                continue
+            released = queue.release(shard.name)
+            if released:
+                logger.warning(f"Shard {shard.name}: exited ({returncode}) while running {released}; re-queued")
+            else:
+                logger.info(f"Shard {shard.name}: exited ({returncode})")
+            if queue.counts()["pending"] and shard.restarts < max_restarts:
+                shard.restarts += 1
+                logger.info(f"Shard {shard.name}: restarting ({shard.restarts}/{max_restarts})")
+                shard.start()
+            else:
+                del running[shard.name]
+        counts = queue.counts()
+        logger.debug(
+            f"Queue: {counts['pending']} pending, {counts['claimed']} running, "
+            f"{counts['done']} done, {counts['failed']} failed"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run SREGym on several clusters, one main.py per kubeconfig context",
+        epilog="Unrecognised arguments are passed through to every shard's main.py.",
+    )
+    parser.add_argument("--contexts", type=str, required=True, help="Comma-separated kubeconfig contexts")
+    parser.add_argument("--agent", type=str, default="stratus", help="Agent to run (default: stratus)")
+    parser.add_argument("--problems", type=str, default=None, help="Comma-separated problem IDs (default: tasklist)")
+    parser.add_argument("--n-attempts", type=int, default=1, help="Attempts per problem (default: 1)")
+    parser.add_argument("--resume", type=str, default=None, help="Previous merged results CSV or journal to resume")
+    parser.add_argument("--results-dir", type=str, default=None, help="Run directory (default: results/<timestamp>)")
+    parser.add_argument("--base-api-port", type=int, default=8000, help="API port of shard 0 (default: 8000)")
+    parser.add_argument("--base-mcp-port", type=int, default=9954, help="MCP port of shard 0 (default: 9954)")
+    parser.add_argument("--base-proxy-port", type=int, default=16443, help="Proxy port of shard 0 (default: 16443)")
+    parser.add_argument("--max-restarts", type=int, default=2, help="Restarts per shard after a crash (default: 2)")
+    parser.add_argument("--force-build", action="store_true", help="Rebuild the agent image before starting")
+    args, passthrough = parser.parse_known_args()
+
+    contexts = [c.strip() for c in args.contexts.split(",") if c.strip()]
+    if not contexts:
+        parser.error("--contexts needs at least one context")
+    if args.n_attempts < 1:
+        parser.error("--n-attempts must be a positive integer")
+
+    run_dir = Path(args.results_dir or Path("results") / datetime.now().strftime("%m%d_%H%M"))
+    run_dir.mkdir(parents=True, exist_ok=True)
+
+    resume_rows = load_resume_rows(args.resume)
+    attempt_counts = completed_attempts(resume_rows)
+    problem_ids = [pid for pid in load_problem_ids(args.problems) if attempt_counts[pid] < args.n_attempts]
+    if resume_rows:
+        partial = sum(1 for pid in problem_ids if attempt_counts[pid])
+        logger.info(
+            f"Resuming from {args.resume}: {len(attempt_counts)} problems already have results, "
+            f"{partial} of them still miss attempts"
+        )
+    queue = WorkQueue.create(run_dir / "queue.json", problem_ids, attempts=attempt_counts)
+    logger.info(f"{len(problem_ids)} problems x {args.n_attempts} attempts on {len(contexts)} clusters")
+
+    prepare_agent_image(args.agent, args.force_build)
+
+    shards = [Shard(i, context, run_dir, args, passthrough) for i, context in enumerate(contexts)]
+    for shard in shards:
+        shard.prepare()
+    start = time.monotonic()
+    for shard in shards:
+        shard.start()
+
+    try:
+        supervise(shards, queue, args.max_restarts)
+    except KeyboardInterrupt:
+        logger.warning("Interrupted, stopping shards...")
+        for shard in shards:
+            if shard.proc and shard.proc.poll() is None:
+                shard.proc.send_signal(signal.SIGINT)
+        for shard in shards:
+            if shard.proc:
+                shard.proc.wait()
+    elapsed = time.monotonic() - start
+
+    rows = list(resume_rows)
+    for shard in shards:
+        shard_rows = shard.results(args.agent)
+        rows.extend(shard_rows)
+        done = len({row["problem_id"] for row in shard_rows})
+        logger.info(f"Shard {shard.name}: {done} problems, {len(shard_rows)} attempts")
+
+    csv_path = run_dir / f"{args.agent}_ALL_results.csv"
+    write_results_csv(csv_path, rows)
+
+    counts = queue.counts()
+    logger.info(
+        f"Sharded run finished in {elapsed / 3600:.2f}h: {counts['done']} problems done, {counts['failed']} failed, "
+        f"{counts['pending'] + counts['claimed']} not run. Results written to {csv_path}"
+    )
+    if counts["failed"]:
+        logger.warning(f"Failed problems: {', '.join(queue.failed())}")
+
+
+if __name__ == "__main__":
+    main()
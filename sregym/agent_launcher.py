@@ -35,6 +35,17 @@ class AgentLauncher:
         """
         self._agent_kubeconfig_path = kubeconfig_path
 
+    def session(self) -> "AgentLauncher":
+        """
+        A launcher sharing this one's container runner and agent kubeconfig but tracking
+        its own agent processes, for agents of problems that run side by side.
+        """
+        launcher = AgentLauncher()
+        launcher._agent_kubeconfig_path = self._agent_kubeconfig_path
+        launcher._use_containers = self._use_containers
+        launcher._container_runner = self._container_runner
+        return launcher
+
     def enable_container_isolation(self, force_build: bool = False):
         """Initialize the container runner and build/check the image."""
         if not self._container_runner:
@@ -50,7 +61,8 @@ class AgentLauncher:
             else:
                 self._container_runner.ensure_image_exists()
 
-    async def ensure_started(self, reg: AgentRegistration) -> AgentProcess | None:
+    async def ensure_started(self, reg: AgentRegistration, env: dict[str, str] | None = None) -> AgentProcess | None:
+        """Start the agent unless it is running; `env` is added to its environment (e.g. AGENT_LOGS_DIR)."""
         if not reg or not reg.kickoff_command:
             return None
         existing = self._procs.get(reg.name)
@@ -61,21 +73,19 @@ class AgentLauncher:
                 return existing
 
         if self._use_containers and reg.container_isolation:
-            return await self._start_containerized(reg)
+            return await self._start_containerized(reg, env)
 
-        env = os.environ.copy()
-        if reg.kickoff_env:
-            env.update(reg.kickoff_env)
+        process_env = {**os.environ, **(reg.kickoff_env or {}), **(env or {})}
 
         # Use filtered kubeconfig if set (hides chaos engineering namespaces)
         if self._agent_kubeconfig_path:
-            env["KUBECONFIG"] = self._agent_kubeconfig_path
+            process_env["KUBECONFIG"] = self._agent_kubeconfig_path
 
         proc = subprocess.Popen(
             reg.kickoff_command,
             shell=True,
             cwd=reg.kickoff_workdir or os.getcwd(),
-            env=env,
+            env=process_env,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
@@ -98,7 +108,9 @@ class AgentLauncher:
             except Exception:
                 break
 
-    async def _start_containerized(self, reg: AgentRegistration) -> AgentProcess | None:
+    async def _start_containerized(
+        self, reg: AgentRegistration, env: dict[str, str] | None = None
+    ) -> AgentProcess | None:
         """Start an agent in a Docker container with install-then-run pattern."""
         if not reg.kickoff_command:
             logger.warning("No kickoff command defined for agent '%s' — skipping containerized start", reg.name)
@@ -115,7 +127,8 @@ class AgentLauncher:
         # If AGENT_LOGS_DIR is set by the orchestrator (e.g. run_1/), mount that
         # host directory to /logs so the agent writes into the right run folder.
         # Otherwise fall back to the default per-agent logs directory.
-        agent_logs_dir = os.environ.get("AGENT_LOGS_DIR")
+        env = dict(env or {})
+        agent_logs_dir = env.pop("AGENT_LOGS_DIR", None) or os.environ.get("AGENT_LOGS_DIR")
         self._container_runner.config.logs_path = Path(agent_logs_dir) if agent_logs_dir else Path(f"./logs/{reg.name}")
         self._container_runner.config.workspace_path = None
 
@@ -127,7 +140,7 @@ class AgentLauncher:
 
         exec_input = ExecInput(
             command=composite_cmd,
-            env=reg.kickoff_env or {},
+            env={**(reg.kickoff_env or {}), **env},
             label=f"{reg.name}-run",
         )
         exec_input.env.setdefault("AGENT_LOGS_DIR", "/logs")
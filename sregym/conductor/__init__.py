@@ -1 +1,7 @@
-from .conductor import Conductor  # noqa: F401
+def __getattr__(name):
+    # Imported on first use, so that e.g. the problem registry can be loaded without the whole conductor
+    if name == "Conductor":
+        from .conductor import Conductor
+
+        return Conductor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 import asyncio
 import concurrent.futures
+import functools
 import logging
 import shutil
 import time
@@ -15,17 +16,22 @@ from sregym.conductor.problems.registry import ProblemRegistry
 from sregym.conductor.utils import is_ordered_subset
 from sregym.generators.fault.inject_remote_os import RemoteOSFaultInjector
 from sregym.generators.fault.inject_virtual import VirtualizationFaultInjector
+from sregym.generators.fault.settle import collect_settle_reports
 from sregym.generators.noise.manager import get_noise_manager
 from sregym.observer.jaeger import Jaeger
 from sregym.observer.otel_collector import OtelCollector
 from sregym.paths import CLUSTER_BASELINE_STATE_FILE
+from sregym.service.app_snapshot import AppSnapshot, AppSnapshotManager
 from sregym.service.apps.app_registry import AppRegistry
 from sregym.service.cluster_state import ClusterStateManager
+from sregym.service.deploy_graph import DeployReport, DeployStep, run_deploy_graph
 from sregym.service.dm_flakey_manager import DmFlakeyManager
+from sregym.service.informer import enable_cluster_cache
 from sregym.service.k8s_proxy import KubernetesAPIProxy
 from sregym.service.khaos import KhaosController
 from sregym.service.kubectl import KubeCtl
 from sregym.service.mcp_server import MCPServer
+from sregym.service.platform import PlatformComponent, PlatformManager, content_hash, deployments_ready
 from sregym.service.telemetry.loki import Loki
 from sregym.service.telemetry.prometheus import Prometheus
 
@@ -36,6 +42,45 @@ class ConductorConfig:
 
     deploy_loki: bool = True
     enable_noise: bool = False
+    # Serve KubeCtl list/wait calls (and the oracles built on them) from a shared watch-based cache
+    use_informer_cache: bool = False
+    # Keep unchanged, healthy platform components (metrics-server, OpenEBS, observability) across problems
+    warm_platform: bool = False
+    # Between problems on the same app, restore the app to a snapshot taken after its deploy instead of
+    # tearing it down and redeploying it (needs warm_platform, and is ignored for tenants)
+    reuse_apps: bool = False
+    # Setup steps deployed concurrently when their dependencies allow (1 = sequential)
+    deploy_workers: int = 8
+    # Port of the agent-facing Kubernetes API proxy (distinct per shard when several run on one host)
+    k8s_proxy_port: int = 16443
+    # Where the cluster's baseline snapshot is persisted (one file per cluster)
+    baseline_state_file: Path = CLUSTER_BASELINE_STATE_FILE
+    # One of several problems running concurrently (see MultiTenantConductor): only the problem's own app
+    # is deployed and torn down; platform setup, cluster fixes and reconciliation are left to the owner
+    tenant: bool = False
+
+
+METRICS_SERVER_MANIFEST = "https://github.com/kubernetes-sigs/metrics-server/releases/latest/download/components.yaml"
+METRICS_SERVER_PATCH = (
+    "["
+    '{"op":"add","path":"/spec/template/spec/containers/0/args/-","value":"--kubelet-insecure-tls"},'
+    '{"op":"add","path":"/spec/template/spec/containers/0/args/-","value":"--kubelet-preferred-address-types=InternalIP"}'
+    "]"
+)
+OPENEBS_MANIFEST = "https://openebs.github.io/charts/openebs-operator.yaml"
+OPENEBS_DEFAULT_CLASS_PATCH = '{"metadata":{"annotations":{"storageclass.kubernetes.io/is-default-class":"true"}}}'
+OPENEBS_DEVICE_SC_YAML = """
+        apiVersion: storage.k8s.io/v1
+        kind: StorageClass
+        metadata:
+        name: openebs-device
+        annotations:
+            openebs.io/cas-type: local
+        provisioner: openebs.io/local
+        parameters:
+        localpvType: "device"
+        volumeBindingMode: WaitForFirstConsumer
+        """
 
 
 class Conductor:
@@ -45,6 +90,8 @@ class Conductor:
         # core services
         self.problems = ProblemRegistry()
         self.kubectl = KubeCtl()
+        if self.config.use_informer_cache:
+            enable_cluster_cache()
         self.prometheus = Prometheus()
         self.jaeger = Jaeger()
         self.otel_collector = OtelCollector()
@@ -57,11 +104,20 @@ class Conductor:
         self.dm_flakey_manager = DmFlakeyManager(self.kubectl)
         self.cluster_state = ClusterStateManager(self.kubectl)
         self._baseline_captured = False
+        self.platform = PlatformManager(warm=self.config.warm_platform)
+        self.app_snapshots = AppSnapshotManager()
+        # Snapshot of the deployed app while reuse_apps keeps it, and the app kept from the previous problem
+        self.app_snapshot: AppSnapshot | None = None
+        self._retained_app = None
+        self._reusing_app = False
+        self.deploy_report: DeployReport | None = None
+        # How long each fault of the current problem took to settle after injection
+        self.fault_settle: list[dict] = []
 
         # Kubernetes API proxy to hide chaos engineering namespaces and load generators from agents
         self.k8s_proxy = KubernetesAPIProxy(
             hidden_namespaces={"chaos-mesh", "khaos"},
-            listen_port=16443,
+            listen_port=self.config.k8s_proxy_port,
         )
         self._agent_kubeconfig_path: str | None = None
 
@@ -79,6 +135,10 @@ class Conductor:
 
         self.tasklist = None
         self.logger = logging.getLogger("all.sregym.conductor")
+        if self.config.reuse_apps and (not self.config.warm_platform or self.config.tenant):
+            # Without a warm platform, reconciliation removes the storage the kept app's volumes live on
+            self.logger.warning("App reuse needs a warm platform and a cluster of its own; redeploying apps instead")
+            self.config.reuse_apps = False
 
         self.stage_sequence: list[dict] = []
         self.current_stage_index: int = 0
@@ -217,8 +277,12 @@ class Conductor:
     def _inject_fault(self):
         """Inject fault and prepare diagnosis checkpoint if available."""
         problem = self.current_problem
-        problem.inject_fault()
+        with collect_settle_reports() as settles:
+            problem.inject_fault()
+        self.fault_settle = [report.as_dict() for report in settles]
         self.logger.info("[ENV] Injected fault")
+        for report in settles:
+            self.logger.info(f"[ENV] Fault settle {report.fault_type}: {report.outcome} after {report.seconds:.2f}s")
         self.fault_injected = True
 
         # Prepare diagnosis checkpoint if available, after fault injection but before agent stages
@@ -337,7 +401,7 @@ class Conductor:
         # Undeploy app using the captured problem reference
         self.logger.info("[CLEANUP] Undeploying app...")
         if problem:
-            problem.app.cleanup()
+            self._reset_app(problem.app)
         self.logger.info("[CLEANUP] App undeployed")
 
         # Reconcile cluster state to baseline
@@ -369,11 +433,15 @@ class Conductor:
         self._cleanup_sync()
         self.logger.info("[STAGE] Teardown complete")
 
-    async def start_problem(self) -> StartProblemResult:
+    async def start_problem(self, problem=None) -> StartProblemResult:
         """
         1) Provision infra & workload
         2) Initialize Act registry and execute initial GymActs and first AgentAct precondition
 
+        Args:
+            problem: An already built instance of problem_id (e.g. with a namespace suffix).
+                Built from the registry if omitted.
+
         Returns:
             StartProblemResult: Result status indicating success or skip reason
         """
@@ -390,8 +458,14 @@ class Conductor:
             self.logger.info("[WAIT] Previous problem's cleanup finished")
         self._submit_future = None
 
+        # Deploying and injecting take minutes; off the event loop, so concurrent problems
+        # (MultiTenantConductor) deploy side by side and the driver keeps polling the others
+        return await asyncio.to_thread(self._start_problem_blocking, problem)
+
+    def _start_problem_blocking(self, problem=None) -> StartProblemResult:
+        """The blocking part of start_problem(): build the problem, deploy its app and inject the fault."""
         self.execution_start_time = time.time()
-        self.problem = self.problems.get_problem_instance(self.problem_id)
+        self.problem = problem or self.problems.get_problem_instance(self.problem_id)
         self.app = self.problem.app
         self.detection_oracle = DetectionOracle(self.problem)
         self.results = {}
@@ -410,14 +484,17 @@ class Conductor:
             )
             return StartProblemResult.SKIPPED_KHAOS_REQUIRED
 
-        self.fix_kubernetes()
+        if not self.config.tenant:
+            self.fix_kubernetes()
 
         self.get_problem_stages()
         self._build_stage_sequence()
 
-        self.logger.info("Undeploying app leftovers...")
-        self.undeploy_app()  # Cleanup any leftovers
-        self.logger.info("App leftovers undeployed.")
+        self._reusing_app = self.config.reuse_apps and self._take_retained_app(self.problem.app)
+        if not self._reusing_app:
+            self.logger.info("Undeploying app leftovers...")
+            self.undeploy_app()  # Cleanup any leftovers
+            self.logger.info("App leftovers undeployed.")
         self.logger.info("Deploying app...")
         self.deploy_app()
         self.logger.info("App deployed.")
@@ -583,87 +660,90 @@ class Conductor:
         """Kubectl + Prometheus + problem.app deployment."""
         problem = self.current_problem
         self.submission_stage = "setup"
+        self._run_deploy_steps(self._deploy_steps(problem))
+
+    def deploy_platform(self):
+        """Deploy only the shared platform, for problems that deploy their apps themselves (tenants)."""
+        self._run_deploy_steps(self._deploy_steps(None))
 
+    def _run_deploy_steps(self, steps: list[DeployStep]):
         # Load or capture baseline state BEFORE any infrastructure deployment.
         # This captures the bare cluster state so reconciliation can clean up
         # everything added during a problem run (including infrastructure drift).
-        if not self._baseline_captured:
-            if self.cluster_state.load_baseline_state(CLUSTER_BASELINE_STATE_FILE):
+        if not self._baseline_captured and not self.config.tenant:
+            if self.cluster_state.load_baseline_state(self.config.baseline_state_file):
                 self.logger.info("[DEPLOY] Loaded persisted cluster baseline state")
             else:
                 self.logger.info("[DEPLOY] No persisted baseline state found, capturing and saving...")
-                self.cluster_state.save_baseline_state(CLUSTER_BASELINE_STATE_FILE)
+                self.cluster_state.save_baseline_state(self.config.baseline_state_file)
             self._baseline_captured = True
 
-        self.logger.info("[DEPLOY] Setting up metrics-server…")
-        self.kubectl.exec_command(
-            "kubectl apply -f https://github.com/kubernetes-sigs/metrics-server/"
-            "releases/latest/download/components.yaml"
-        )
-        self.kubectl.exec_command(
-            "kubectl -n kube-system patch deployment metrics-server "
-            "--type=json -p='["
-            '{"op":"add","path":"/spec/template/spec/containers/0/args/-","value":"--kubelet-insecure-tls"},'
-            '{"op":"add","path":"/spec/template/spec/containers/0/args/-","value":"--kubelet-preferred-address-types=InternalIP"}'
-            "]'"
-        )
-        self.kubectl.wait_for_ready("kube-system")
-
-        # Only deploy Khaos if the problem requires it
-        if problem.requires_khaos():
-            self.logger.info("[DEPLOY] Deploying Khaos DaemonSet...")
-            self.khaos.ensure_deployed()
+        self.logger.info(f"[DEPLOY] Deploying {', '.join(step.name for step in steps)}")
+        self.deploy_report = run_deploy_graph(steps, max_workers=self.config.deploy_workers)
+        self.logger.info(f"[DEPLOY] Setup timing:\n{self.deploy_report.format()}")
 
-        self.logger.info("[DEPLOY] Setting up OpenEBS…")
-        self.kubectl.exec_command("kubectl apply -f https://openebs.github.io/charts/openebs-operator.yaml")
-        self.kubectl.exec_command(
-            "kubectl patch storageclass openebs-hostpath "
-            '-p \'{"metadata":{"annotations":{"storageclass.kubernetes.io/is-default-class":"true"}}}\''
-        )
-        self.kubectl.wait_for_ready("openebs")
-
-        print("Setting up OpenEBS LocalPV-Device…")
-        device_sc_yaml = """
-        apiVersion: storage.k8s.io/v1
-        kind: StorageClass
-        metadata:
-        name: openebs-device
-        annotations:
-            openebs.io/cas-type: local
-        provisioner: openebs.io/local
-        parameters:
-        localpvType: "device"
-        volumeBindingMode: WaitForFirstConsumer
+    def _deploy_steps(self, problem) -> list[DeployStep]:
         """
-        self.kubectl.exec_command("kubectl apply -f - <<EOF\n" + device_sc_yaml + "\nEOF")
-
-        self.logger.info("[DEPLOY] Deploying Prometheus…")
-        self.prometheus.deploy()
-
-        self.logger.info("[DEPLOY] Deploying Jaeger…")
-        self.jaeger.deploy()
-
-        self.logger.info("[DEPLOY] Deploying OTel Collector…")
-        self.otel_collector.deploy()
-
-        if self.config.deploy_loki:
-            self.logger.info("[DEPLOY] Deploying Loki…")
-            self.loki.deploy()
-        else:
+        The setup graph for a problem: shared platform components, then the app once the
+        components it really needs (storage, and the trace pipeline its ExternalName
+        services point at) are ready. Without a problem, only the platform; for a tenant,
+        only the problem's own parts.
+        """
+        if self.config.tenant:
+            steps = [DeployStep("app", functools.partial(self._deploy_and_start_app, problem))]
+            if problem.requires_khaos():
+                steps.append(DeployStep("khaos", self.khaos.ensure_deployed))
+            return steps
+
+        components = self._platform_components()
+        if not self.config.deploy_loki:
             self.logger.info("[DEPLOY] Skipping Loki deployment (external harness mode)")
+            del components["loki"]
 
-        self.logger.info("[DEPLOY] Deploying MCP server…")
-        self.mcp_server.deploy()
+        steps = [
+            DeployStep(name, functools.partial(self.platform.ensure, component), component.depends_on)
+            for name, component in components.items()
+        ]
+        # Only deploy Khaos if the problem requires it
+        if problem is not None and problem.requires_khaos():
+            steps.append(DeployStep("khaos", self.khaos.ensure_deployed))
+        steps.append(DeployStep("mcp-server", self.mcp_server.deploy))
+
+        app_deps = ["openebs", "jaeger", "otel-collector"]
+        if self.platform.warm:
+            # The platform whitelist must be taken before the app adds resources of its own
+            steps.append(DeployStep("platform-state", self._record_platform_state, list(components)))
+            app_deps.append("platform-state")
+        if problem is not None:
+            steps.append(DeployStep("app", functools.partial(self._deploy_and_start_app, problem), app_deps))
+        return steps
+
+    def _record_platform_state(self):
+        if self.platform.skipped:
+            self.logger.info(f"[DEPLOY] Warm platform: kept {', '.join(self.platform.skipped)}")
+        self.platform.skipped.clear()
+        self.cluster_state.record_platform_state(self.platform.namespaces())
+
+    def _deploy_and_start_app(self, problem):
+        if self._reusing_app:
+            # Restored to its snapshot (ExternalName services included) when the previous problem was cleaned up
+            self.logger.info(f"[ENV] Reuse application: {problem.app.name}")
+        else:
+            self._deploy_app(problem.app)
+            if self.config.reuse_apps:
+                self._capture_app_snapshot(problem.app)
 
-        self.logger.info("[ENV] Set up necessary components: metrics-server, Khaos, OpenEBS, Prometheus, Jaeger, Loki")
+        problem.app.start_workload()
+        self.logger.info("[ENV] Start workload")
 
+    def _deploy_app(self, app):
         # train-ticket pods need jaeger at startup; create ExternalName before deploy.
         # Other apps get it after deploy to avoid Helm ownership conflicts.
-        is_train_ticket = problem.app.__class__.__name__ == "TrainTicket"
+        is_train_ticket = app.__class__.__name__ == "TrainTicket"
 
         # Composite apps span multiple namespaces; fall back to the single
         # `namespace` attribute for regular apps.
-        app_namespaces = getattr(problem.app, "namespaces", None) or [problem.app.namespace]
+        app_namespaces = self._app_namespaces(app)
 
         if is_train_ticket:
             for ns in app_namespaces:
@@ -673,15 +753,164 @@ class Conductor:
                 self.jaeger.create_external_name_service(ns)
 
         self.logger.info("[DEPLOY] Deploying and starting workload")
-        problem.app.deploy()
-        self.logger.info(f"[ENV] Deploy application: {problem.app.name}")
+        app.deploy()
+        self.logger.info(f"[ENV] Deploy application: {app.name}")
 
         if not is_train_ticket:
             for ns in app_namespaces:
                 self.jaeger.create_external_name_service(ns)
 
-        problem.app.start_workload()
-        self.logger.info("[ENV] Start workload")
+    @staticmethod
+    def _app_namespaces(app) -> list[str]:
+        return getattr(app, "namespaces", None) or [app.namespace]
+
+    def _app_key(self, app) -> str:
+        """Identifies an app and what it is deployed from, so a snapshot is only restored for the same deploy."""
+        return content_hash(
+            app.__class__.__name__,
+            self._app_namespaces(app),
+            getattr(app, "helm_configs", None) or {},
+            getattr(app, "k8s_deploy_path", None) or "",
+        )
+
+    def _capture_app_snapshot(self, app):
+        namespaces = self._app_namespaces(app)
+        try:
+            self.app_snapshot = self.app_snapshots.capture(self._app_key(app), namespaces)
+            self.cluster_state.record_app_state(set(namespaces))
+        except Exception as e:
+            self.logger.warning(
+                f"[DEPLOY] Failed to snapshot {app.name}; it will be redeployed for the next problem: {e}"
+            )
+            self._drop_app_snapshot()
+
+    def _reset_app(self, app):
+        """
+        Undeploy the app, or with reuse_apps restore it to its snapshot and keep it for
+        the next problem. Falls back to undeploying it when the restore fails.
+        """
+        if self.app_snapshot is not None and self.app_snapshot.app_key == self._app_key(app):
+            try:
+                self.app_snapshots.restore(self.app_snapshot)
+                self._retained_app = app
+                self.logger.info(f"[CLEANUP] Restored {app.name} from its snapshot")
+                return
+            except Exception as e:
+                self.logger.warning(f"[CLEANUP] Failed to restore {app.name} from its snapshot, undeploying it: {e}")
+            self._drop_app_snapshot()
+        app.cleanup()
+
+    def _take_retained_app(self, app) -> bool:
+        """
+        True if `app` is the app kept from the previous problem, which it then uses as is.
+        A different kept app is torn down (and the cluster reconciled) first.
+        """
+        if self._retained_app is None:
+            return False
+        if self.app_snapshot is not None and self.app_snapshot.app_key == self._app_key(app):
+            return True
+        self.teardown_retained_app()
+        return False
+
+    def teardown_retained_app(self):
+        """Undeploy the app reuse_apps kept from the previous problem, if any, and reconcile the cluster."""
+        retained = self._retained_app
+        if retained is None:
+            return
+        self.logger.info(f"[CLEANUP] Tearing down {retained.name}, kept from the previous problem")
+        self._drop_app_snapshot()
+        retained.cleanup()
+        if self._baseline_captured and not self.config.tenant:
+            self.cluster_state.reconcile_to_baseline()
+
+    def _drop_app_snapshot(self):
+        self.app_snapshot = None
+        self._retained_app = None
+        self.cluster_state.release_app_state()
+
+    def _platform_components(self) -> dict[str, PlatformComponent]:
+        """The shared platform components deploy_app() sets up before every problem."""
+        loki_values = [
+            Path(arg)
+            for i, arg in enumerate(self.loki.helm_configs.get("extra_args", []))
+            if i and self.loki.helm_configs["extra_args"][i - 1] == "-f"
+        ]
+        components = [
+            PlatformComponent(
+                name="metrics-server",
+                namespaces=["kube-system"],
+                deploy=self._deploy_metrics_server,
+                is_healthy=lambda: deployments_ready("kube-system", ["metrics-server"]),
+                inputs=[METRICS_SERVER_MANIFEST, METRICS_SERVER_PATCH],
+            ),
+            PlatformComponent(
+                name="openebs",
+                namespaces=["openebs"],
+                deploy=self._deploy_openebs,
+                is_healthy=lambda: deployments_ready("openebs"),
+                inputs=[OPENEBS_MANIFEST, OPENEBS_DEFAULT_CLASS_PATCH, OPENEBS_DEVICE_SC_YAML],
+            ),
+            PlatformComponent(
+                name="prometheus",
+                namespaces=[self.prometheus.namespace],
+                deploy=self.prometheus.deploy,
+                is_healthy=self.prometheus._is_prometheus_running,
+                inputs=[
+                    self.prometheus.helm_configs,
+                    Path(self.prometheus.helm_configs["chart_path"]),
+                    Path(self.prometheus.pvc_config_file),
+                ],
+                # Its PVC needs the OpenEBS default StorageClass; Jaeger creates the shared observe namespace
+                depends_on=["openebs", "jaeger"],
+                teardown=self.prometheus.teardown,
+            ),
+            PlatformComponent(
+                name="jaeger",
+                namespaces=[self.jaeger.namespace],
+                deploy=self.jaeger.deploy,
+                is_healthy=lambda: deployments_ready(self.jaeger.namespace, ["jaeger-agent"]),
+                inputs=[self.jaeger.config_file],
+            ),
+            PlatformComponent(
+                name="otel-collector",
+                namespaces=[self.otel_collector.namespace],
+                deploy=self.otel_collector.deploy,
+                is_healthy=lambda: deployments_ready(self.otel_collector.namespace, ["otel-collector"]),
+                inputs=[self.otel_collector.config_file],
+                # Exports to the jaeger-backend service, which selects the Jaeger pod
+                depends_on=["jaeger"],
+            ),
+            PlatformComponent(
+                name="loki",
+                namespaces=[self.loki.namespace],
+                deploy=self.loki.deploy,
+                is_healthy=lambda: self.loki._is_loki_running() and self.loki._is_promtail_running(),
+                inputs=[
+                    self.loki.helm_configs,
+                    *loki_values,
+                    Path(self.loki.promtail_values_file),
+                    Path(self.loki.pvc_config_file),
+                ],
+                depends_on=["openebs", "jaeger"],
+                teardown=self.loki.teardown,
+            ),
+        ]
+        return {component.name: component for component in components}
+
+    def _deploy_metrics_server(self):
+        self.kubectl.exec_command(f"kubectl apply -f {METRICS_SERVER_MANIFEST}")
+        self.kubectl.exec_command(
+            f"kubectl -n kube-system patch deployment metrics-server --type=json -p='{METRICS_SERVER_PATCH}'"
+        )
+        self.kubectl.wait_for_ready("kube-system")
+
+    def _deploy_openebs(self):
+        self.kubectl.exec_command(f"kubectl apply -f {OPENEBS_MANIFEST}")
+        self.kubectl.exec_command(f"kubectl patch storageclass openebs-hostpath -p '{OPENEBS_DEFAULT_CLASS_PATCH}'")
+        self.kubectl.wait_for_ready("openebs")
+
+        print("Setting up OpenEBS LocalPV-Device…")
+        self.kubectl.exec_command("kubectl apply -f - <<EOF\n" + OPENEBS_DEVICE_SC_YAML + "\nEOF")
 
     def undeploy_app(self):
         """Teardown problem.app and, if no other apps running, OpenEBS/Prometheus."""
@@ -4,7 +4,7 @@ import os
 import threading
 
 import pyfiglet
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException
 from fastmcp import FastMCP
 from fastmcp.server.http import create_sse_app
 from pydantic import BaseModel
@@ -16,23 +16,65 @@ from uvicorn import Config, Server
 from logger import console
 
 _conductor = None
+# Problems running concurrently on one cluster (MultiTenantConductor), by problem token
+_sessions: dict = {}
+_sessions_lock = threading.Lock()
 
 submit_mcp = FastMCP("Submit MCP Server")
 
 
+def register_session(token: str, conductor):
+    """Route requests carrying this problem token to the given (tenant) Conductor."""
+    with _sessions_lock:
+        _sessions[token] = conductor
+
+
+def unregister_session(token: str):
+    with _sessions_lock:
+        _sessions.pop(token, None)
+
+
+def _conductor_for(token: str | None = None):
+    """
+    The Conductor a request is for: the session named by token, else the only
+    running session, else the shared conductor of a single-problem run.
+    Raises LookupError for an unknown token, or no token while several problems run.
+    """
+    with _sessions_lock:
+        if token:
+            if token not in _sessions:
+                raise LookupError(f"Unknown problem token: {token!r}")
+            return _sessions[token]
+        if len(_sessions) == 1:
+            return next(iter(_sessions.values()))
+        if _sessions:
+            raise LookupError(f"{len(_sessions)} problems are running; pass the problem token")
+    return _conductor
+
+
+def _request_token(token: str | None = None, x_problem_token: str | None = Header(default=None)) -> str | None:
+    """Problem token from the `token` query parameter or the X-Problem-Token header."""
+    return token or x_problem_token
+
+
 @submit_mcp.tool(name="submit")
-async def submit_via_conductor(ans: str) -> dict[str, str]:
+async def submit_via_conductor(ans: str, token: str | None = None) -> dict[str, str]:
     """Submit task result to benchmark
 
     Args:
         ans (str): task result that the agent submits
+        token (str, optional): problem token, only needed when several problems run at once
 
     Returns:
         dict[str]: acknowledgment of submission status
     """
-    if _conductor is None or _conductor.submission_stage not in {"diagnosis", "mitigation"}:
-        stage = _conductor.submission_stage if _conductor else None
-        if stage == "done" and _conductor is not None:
+    try:
+        conductor = _conductor_for(token)
+    except LookupError as e:
+        return {"status": "error", "text": str(e)}
+    if conductor is None or conductor.submission_stage not in {"diagnosis", "mitigation"}:
+        stage = conductor.submission_stage if conductor else None
+        if stage == "done" and conductor is not None:
             return {
                 "status": "done",
                 "text": "All stages have been completed and graded. No further submissions are needed.",
@@ -42,7 +84,7 @@ async def submit_via_conductor(ans: str) -> dict[str, str]:
     max_wait = 60
     for attempt in range(max_wait):
         try:
-            await _conductor.submit(ans)
+            await conductor.submit(ans)
             return {"status": "200", "text": "Submission received"}
         except RuntimeError:
             if attempt < max_wait - 1:
@@ -109,14 +151,25 @@ def set_conductor(c):
 
 class SubmitRequest(BaseModel):
     solution: str
+    # Only needed when several problems run at once
+    token: str | None = None
+
+
+def _resolve(token: str | None):
+    try:
+        return _conductor_for(token)
+    except LookupError as e:
+        logger.error(str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from None
 
 
 @app.post("/submit")
-async def submit_solution(req: SubmitRequest):
+async def submit_solution(req: SubmitRequest, token: str | None = Depends(_request_token)):
+    conductor = _resolve(req.token or token)
     allowed = {"diagnosis", "mitigation"}
-    if _conductor is None or _conductor.submission_stage not in allowed:
-        stage = _conductor.submission_stage if _conductor else None
-        if stage == "done" and _conductor is not None:
+    if conductor is None or conductor.submission_stage not in allowed:
+        stage = conductor.submission_stage if conductor else None
+        if stage == "done" and conductor is not None:
             logger.debug("Submit received at stage 'done' — problem already graded, returning final results")
             return {
                 "status": "done",
@@ -131,7 +184,7 @@ async def submit_solution(req: SubmitRequest):
     max_wait = 60
     for attempt in range(max_wait):
         try:
-            await _conductor.submit(req.solution)
+            await conductor.submit(req.solution)
             return {"status": "200", "message": "Submission received"}
         except RuntimeError:
             if attempt < max_wait - 1:
@@ -149,21 +202,23 @@ async def submit_solution(req: SubmitRequest):
 
 
 @app.get("/status")
-async def get_status():
-    if _conductor is None:
+async def get_status(token: str | None = Depends(_request_token)):
+    conductor = _resolve(token)
+    if conductor is None:
         logger.error("No problem has been started")
         raise HTTPException(status_code=400, detail="No problem has been started")
-    stage = _conductor.submission_stage
+    stage = conductor.submission_stage
     logger.debug(f"API returns Current stage: {stage}")
     return {"stage": stage}
 
 
 @app.get("/get_app")
-async def get_app():
-    if _conductor is None:
+async def get_app(token: str | None = Depends(_request_token)):
+    conductor = _resolve(token)
+    if conductor is None:
         logger.error("No problem has been started")
         raise HTTPException(status_code=400, detail="No problem has been started")
-    app_inst = _conductor.app
+    app_inst = conductor.app
     logger.debug(f"API returns App instance: {app_inst}")
     namespaces = getattr(app_inst, "namespaces", None) or [app_inst.namespace]
     return {
@@ -175,15 +230,31 @@ async def get_app():
 
 
 @app.get("/get_problem")
-async def get_problem():
-    if _conductor is None:
+async def get_problem(token: str | None = Depends(_request_token)):
+    conductor = _resolve(token)
+    if conductor is None:
         logger.error("No problem has been started")
         raise HTTPException(status_code=400, detail="No problem has been started")
-    problem_id = _conductor.problem_id
+    problem_id = conductor.problem_id
     logger.debug(f"API returns Problem ID: {problem_id}")
     return {"problem_id": problem_id}
 
 
+@app.get("/sessions")
+async def get_sessions():
+    """Problems running concurrently on this cluster, by problem token."""
+    with _sessions_lock:
+        sessions = dict(_sessions)
+    return {
+        token: {
+            "problem_id": c.problem_id,
+            "stage": c.submission_stage,
+            "namespace": c.app.namespace if c.app else None,
+        }
+        for token, c in sessions.items()
+    }
+
+
 def run_api(conductor):
     """
     Start the API server and block until request_shutdown() is called.
@@ -206,6 +277,7 @@ def run_api(conductor):
 **Available Endpoints**
 - **POST /submit**: `{ "solution": "<your-solution>" }` → grades the current stage
 - **GET /status**: returns `{ "stage": "setup" | "diagnosis" | "mitigation" | "tearing_down" | "done" }`
+- **GET /sessions**: problems running concurrently; pass a problem token as `?token=` or `X-Problem-Token`
 """
         )
     )
@@ -0,0 +1,186 @@
+"""
+Run several problems at once on one cluster.
+
+Problems are normally tied to the fixed namespaces in their app metadata, and a
+Conductor runs one problem at a time. MultiTenantConductor builds every problem
+with a unique namespace suffix (hotel-reservation-3fa9c1, ...) and runs it on a
+tenant Conductor of its own, which deploys and tears down only that problem's
+app. The owner conductor deploys the shared platform when the cluster goes from
+idle to busy, and reconciles the cluster to its baseline when the last running
+problem has finished.
+
+The suffix doubles as the problem's token. The conductor API routes /submit,
+/status, /get_app and /get_problem by it (a `token` query parameter or field, or
+the X-Problem-Token header), and the submit MCP tool takes it as an argument.
+Each agent gets its token in SREGYM_PROBLEM_TOKEN and the bundled clients send
+it with every request (see problem_token.py).
+
+Limitation: all agents share the one agent-facing Kubernetes API proxy, which
+hides only the chaos-tooling namespaces. An agent can therefore see, and change,
+the namespaces of the other problems running beside it; its instructions name
+only its own. Run with --concurrent-problems 1 where that isolation matters.
+
+Problems whose faults touch cluster-scoped state (nodes, kubelet, CoreDNS,
+taints, Khaos; see Problem.is_exclusive()) are scheduled alone: they wait for
+the running problems to finish, and no other problem starts until they are done.
+
+main.py --concurrent-problems N drives a benchmark run through this class.
+"""
+
+import asyncio
+import logging
+import secrets
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+
+from sregym.conductor.conductor import Conductor, ConductorConfig
+from sregym.conductor.conductor_api import register_session, unregister_session
+from sregym.conductor.constants import StartProblemResult
+from sregym.conductor.problem_token import PROBLEM_TOKEN_ENV
+
+__all__ = ["PROBLEM_TOKEN_ENV", "Admission", "MultiTenantConductor"]
+
+
+class Admission:
+    """
+    Slots for problems running on one cluster: up to `max_concurrent` at once, and an
+    exclusive problem only on an otherwise idle cluster. Waiters are woken when a slot
+    is released rather than polling for one.
+    """
+
+    def __init__(self, max_concurrent: int):
+        self.max_concurrent = max_concurrent
+        # Admitted problems (including those still deploying) -> whether they run exclusively
+        self.running: dict[str, bool] = {}
+        self._exclusive_waiting = 0
+        self._paused = False
+        self._changed = asyncio.Condition()
+
+    def can_start(self, exclusive: bool) -> bool:
+        if self._paused or any(self.running.values()):
+            return False
+        if exclusive:
+            return not self.running
+        # Waiting exclusive problems go first, otherwise a steady stream of small ones starves them
+        return not self._exclusive_waiting and len(self.running) < self.max_concurrent
+
+    async def admit(self, token: str, exclusive: bool):
+        """Wait for a slot and claim it for `token`."""
+        async with self._changed:
+            if exclusive:
+                self._exclusive_waiting += 1
+            try:
+                await self._changed.wait_for(lambda: self.can_start(exclusive))
+            finally:
+                if exclusive:
+                    self._exclusive_waiting -= 1
+                    # A cancelled exclusive waiter no longer holds back the others
+                    self._changed.notify_all()
+            self.running[token] = exclusive
+
+    async def release(self, token: str, when_idle: Callable[[], Awaitable] | None = None):
+        """
+        Free the slot of `token`. If that leaves the cluster idle, await when_idle()
+        first; no problem is admitted until it returns.
+        """
+        del self.running[token]
+        if not self.running and when_idle is not None:
+            # Set before the first await so nothing is admitted in between
+            self._paused = True
+            try:
+                await when_idle()
+            finally:
+                self._paused = False
+        async with self._changed:
+            self._changed.notify_all()
+
+
+class MultiTenantConductor:
+    def __init__(self, config: ConductorConfig | None = None, max_concurrent: int = 4):
+        self.config = config or ConductorConfig()
+        self.max_concurrent = max_concurrent
+        # Owns the shared platform and the cluster baseline
+        self.owner = Conductor(self.config)
+        self.problems = self.owner.problems
+        # Tenant conductors by problem token
+        self.sessions: dict[str, Conductor] = {}
+        self.admission = Admission(max_concurrent)
+        self._platform_ready = False
+        self._platform_lock = asyncio.Lock()
+        self.logger = logging.getLogger("all.sregym.multi_tenant")
+
+    async def _ensure_platform(self):
+        async with self._platform_lock:
+            if self._platform_ready:
+                return
+            self.logger.info("[TENANTS] Cluster was idle, preparing the shared platform")
+            await asyncio.to_thread(self.owner.fix_kubernetes)
+            await asyncio.to_thread(self.owner.deploy_platform)
+            self._platform_ready = True
+
+    async def start_problem(self, problem_id: str) -> tuple[str, StartProblemResult]:
+        """
+        Wait for a slot, then deploy the problem in its own namespaces. Returns its token
+        and the start result; call finish(token) once it is done (or was skipped).
+        """
+        token = secrets.token_hex(3)
+        problem = await asyncio.to_thread(self.problems.get_problem_instance, problem_id, token)
+        exclusive = problem.is_exclusive()
+        if exclusive:
+            self.logger.info(f"[TENANTS] {problem_id} touches cluster-scoped state, waiting to run alone")
+        await self.admission.admit(token, exclusive)
+
+        tenant = Conductor(replace(self.config, tenant=True, enable_noise=False, reuse_apps=False))
+        tenant.register_agent(self.owner.agent_name)
+        tenant.problem_id = problem_id
+        self.sessions[token] = tenant
+        register_session(token, tenant)
+        self.logger.info(f"[TENANTS] Starting {problem_id} in namespace {problem.app.namespace} (token {token})")
+        try:
+            await self._ensure_platform()
+            result = await tenant.start_problem(problem)
+        except Exception:
+            await self.finish(token)
+            raise
+        return token, result
+
+    async def wait_done(self, token: str, timeout: float | None = None) -> bool:
+        """Wait until the problem's stages are graded and torn down. Returns False on timeout."""
+        tenant = self.sessions[token]
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while tenant.submission_stage != "done":
+            if deadline is not None and loop.time() > deadline:
+                return False
+            await asyncio.sleep(1)
+        return True
+
+    async def finish(self, token: str) -> dict:
+        """Tear the problem down (if its stages did not already) and free its slot. Returns its results."""
+        tenant = self.sessions.get(token)
+        if tenant is None:
+            return {}
+        try:
+            if tenant._submit_future is not None and not tenant._submit_future.done():
+                await asyncio.wrap_future(tenant._submit_future)
+            # None: skipped before anything was deployed
+            if tenant.submission_stage not in (None, "done"):
+                await asyncio.to_thread(tenant._finish_problem)
+        finally:
+            unregister_session(token)
+            del self.sessions[token]
+            await self.admission.release(token, when_idle=self._reconcile)
+        return dict(tenant.results)
+
+    async def _reconcile(self):
+        """Reset the idle cluster to its baseline; the platform is redeployed for the next problem."""
+        try:
+            if self.owner._baseline_captured:
+                self.logger.info("[TENANTS] Cluster is idle, reconciling to baseline")
+                changes = await asyncio.to_thread(self.owner.cluster_state.reconcile_to_baseline)
+                if any(v for v in changes.values() if v):
+                    self.logger.info(f"Cluster state reconciliation changes: {changes}")
+        except Exception as e:
+            self.logger.warning(f"Failed to reconcile cluster state: {e}")
+        finally:
+            self._platform_ready = False
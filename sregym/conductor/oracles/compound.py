@@ -1,10 +1,39 @@
+import time
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
 from sregym.conductor.oracles.base import Oracle
 
+# Children evaluated at once. Sequential by default: children may share the problem's workload
+# generator and kubectl, and print as they go; pass max_workers to run independent ones concurrently.
+COMPOUND_ORACLE_WORKERS = 1
+
 
 class CompoundedOracle(Oracle):
+    """
+    Evaluates several oracles as one; it succeeds when all of them do.
+
+    Children run one at a time unless `max_workers` allows more; then the
+    evaluation takes about as long as the slowest child rather than the sum of
+    all of them. The result lists the children in declaration order whatever
+    order they finish in, each with its wall time. A child running longer than
+    `timeout` seconds fails (and is left to finish in the background); with
+    `short_circuit`, the first failing child named in `required` fails the whole
+    evaluation and the children not yet finished are skipped.
+    """
+
     importance = 1.0
 
-    def __init__(self, problem, *args, **kwargs):
+    def __init__(
+        self,
+        problem,
+        *args,
+        max_workers: int = COMPOUND_ORACLE_WORKERS,
+        timeout: float | None = None,
+        required: Iterable[str] = (),
+        short_circuit: bool = False,
+        **kwargs,
+    ):
         super().__init__(problem)
         self.oracles = dict()
         for i, oracle in enumerate(args):
@@ -18,6 +47,73 @@ class CompoundedOracle(Oracle):
                 raise ValueError(f"Duplicate oracle key: {key}")
             self.oracles[key] = oracle
 
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.required = set(required)
+        unknown = self.required - set(self.oracles)
+        if unknown:
+            raise ValueError(f"Required oracles not in this compound: {', '.join(sorted(unknown))}")
+        self.short_circuit = short_circuit
+
+    def _run_child(self, key: str, oracle: Oracle, started: dict[str, float], args, kwargs) -> dict:
+        started[key] = time.monotonic()
+        try:
+            res = oracle.evaluate(*args, **kwargs)
+            if not isinstance(res, dict):
+                print(f"[❌] Oracle '{key}' returned {type(res).__name__} instead of a result dict")
+                res = {"success": False}
+        except Exception as e:
+            print(f"[❌] Error during evaluation of oracle '{key}': {e}")
+            res = {"success": False}
+        res["wall_time"] = round(time.monotonic() - started[key], 3)
+        return res
+
+    def _evaluate_children(self, args, kwargs) -> dict[str, dict]:
+        started: dict[str, float] = {}
+        children: dict[str, dict] = {}
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.oracles) or 1))
+        futures: dict[Future, str] = {
+            executor.submit(self._run_child, key, oracle, started, args, kwargs): key
+            for key, oracle in self.oracles.items()
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                wait_for = None
+                if self.timeout is not None:
+                    # The earliest deadline among the children already running (queued ones have none yet)
+                    deadlines = [started[futures[f]] + self.timeout for f in pending if futures[f] in started]
+                    wait_for = max(min(deadlines) - time.monotonic(), 0) if deadlines else self.timeout
+                done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    children[futures[future]] = future.result()
+
+                if self.timeout is not None:
+                    now = time.monotonic()
+                    for future in list(pending):
+                        key = futures[future]
+                        if key in started and now - started[key] >= self.timeout:
+                            print(f"[❌] Oracle '{key}' did not finish within {self.timeout}s")
+                            children[key] = {
+                                "success": False,
+                                "timed_out": True,
+                                "wall_time": round(now - started[key], 3),
+                            }
+                            pending.discard(future)
+
+                if self.short_circuit and any(
+                    key in self.required and not res.get("success", False) for key, res in children.items()
+                ):
+                    for future in pending:
+                        key = futures[future]
+                        children[key] = {"success": False, "skipped": True, "wall_time": 0.0}
+                    pending = set()
+        finally:
+            # Children still running (timed out or short-circuited) finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+        return children
+
     def evaluate(self, *args, **kwargs):
         result = {
             "success": True,
@@ -26,32 +122,25 @@ class CompoundedOracle(Oracle):
         }
 
         total_weight = sum(getattr(oracle, "importance", 1.0) for oracle in self.oracles.values())
+        evaluation_start = time.monotonic()
+        children = self._evaluate_children(args, kwargs)
 
         for key, oracle in self.oracles.items():
-            try:
-                res = oracle.evaluate(*args, **kwargs)
-                res["name"] = key
-                result["oracles"].append(res)
-
-                if not res.get("success", False):
-                    result["success"] = False
-
-                accuracy_weight = getattr(oracle, "importance", 1.0) / total_weight
-                if "accuracy" in res:
-                    result["accuracy"] += res["accuracy"] * accuracy_weight
-                else:
-                    accuracy = 100.0 if res.get("success", False) else 0.0
-                    result["accuracy"] += accuracy * accuracy_weight
-
-            except Exception as e:
-                print(f"[❌] Error during evaluation of oracle '{key}': {e}")
+            res = children[key]
+            res["name"] = key
+            result["oracles"].append(res)
+
+            if not res.get("success", False):
                 result["success"] = False
-                result["oracles"].append(
-                    {
-                        "name": key,
-                        "success": False,
-                    }
-                )
+
+            accuracy_weight = getattr(oracle, "importance", 1.0) / total_weight
+            if "accuracy" in res:
+                result["accuracy"] += res["accuracy"] * accuracy_weight
+            else:
+                accuracy = 100.0 if res.get("success", False) else 0.0
+                result["accuracy"] += accuracy * accuracy_weight
+
+        result["wall_time"] = round(time.monotonic() - evaluation_start, 3)
 
         if result["accuracy"] > 100.0 - 1e-3:
             result["accuracy"] = 100.0
@@ -0,0 +1,63 @@
+from sregym.conductor.oracles.base import Oracle
+from sregym.generators.workload.latency import LatencyHistogram
+
+# Percentile -> maximum latency in milliseconds; problems override it with a `latency_slo` attribute
+DEFAULT_LATENCY_SLO = {"p50": 200.0, "p99": 1000.0, "p99.9": 2000.0}
+
+
+class LatencySLOMitigationOracle(Oracle):
+    """
+    Checks the workload's tail latency against the problem's SLO.
+
+    Percentiles come from the HdrHistograms wrk2 reports with every round (see
+    sregym.generators.workload.latency), merged over the rounds that start after
+    the evaluation begins, so no Prometheus queries are needed.
+    """
+
+    importance = 1.0
+
+    def __init__(self, problem, slo: dict[str, float] | None = None, min_requests: int = 1000, wrk_manager=None):
+        super().__init__(problem)
+        self.slo = slo or getattr(problem, "latency_slo", None) or DEFAULT_LATENCY_SLO
+        self.min_requests = min_requests
+        self.wrk = wrk_manager
+
+    @staticmethod
+    def evaluate_histogram(histogram: LatencyHistogram, slo: dict[str, float]) -> dict:
+        """Compare a histogram's percentiles with the SLO thresholds."""
+        if not histogram.total:
+            return {"success": False, "latency_ms": {}, "violations": [], "requests": 0}
+        latency_ms = {}
+        violations = []
+        for name, threshold in slo.items():
+            value = histogram.percentile(float(name.removeprefix("p")))
+            latency_ms[name] = round(value, 3)
+            if value > threshold:
+                violations.append(name)
+        return {
+            "success": not violations,
+            "latency_ms": latency_ms,
+            "violations": violations,
+            "requests": histogram.total,
+        }
+
+    def evaluate(self) -> dict:
+        print("== Latency SLO Evaluation ==")
+        wrk = self.wrk or self.problem.app.wrk
+        try:
+            # Only rounds that start from now on, so the latency before mitigation does not count
+            entries = wrk.collect(number=self.min_requests)
+        except Exception as e:
+            print(f"[❌] Error during workload collection: {e}")
+            return {"success": False}
+
+        histogram = LatencyHistogram.merged(entry.latency for entry in entries)
+        if not histogram.total:
+            print("[❌] The workload reported no latency distribution (is wrk2 running with --latency?)")
+            return {"success": False}
+
+        results = self.evaluate_histogram(histogram, self.slo)
+        for name, threshold in self.slo.items():
+            mark = "❌" if name in results["violations"] else "✅"
+            print(f"[{mark}] {name} latency {results['latency_ms'][name]:.2f}ms (SLO {threshold:.2f}ms)")
+        return results
@@ -6,6 +6,7 @@ root cause in natural language.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from enum import StrEnum
@@ -15,6 +16,8 @@ import yaml
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from llm_backend.init_backend import get_llm_backend_for_judge
+from sregym.paths import JUDGE_VERDICT_CACHE_DIR
+from sregym.utils.cache import LLMCache
 
 # ---------------------------------------------------------------------------
 # Exceptions and enums
@@ -124,6 +127,11 @@ class DiagnosisJudge:
     """Checklist-based RCA evaluator that scores dimensions via chain-of-thought.
 
     Uses chain-of-thought reasoning with in-context examples per dimension.
+
+    The model's checklist answers are cached on disk, keyed on the solution,
+    the expectation, the checklist (its version and the questions the model
+    sees) and the judge model, so grading an unchanged pair again, or after
+    only the scoring weights or threshold changed, does not call the model.
     """
 
     # ------------------------------------------------------------------
@@ -219,6 +227,9 @@ fences, no preamble, no commentary.
         temperature: float = 0.0,
         max_tokens: int = 4096,
         checklist_path: str | None = None,
+        verdict_cache: LLMCache | None = None,
+        use_verdict_cache: bool = True,
+        refresh_verdicts: bool = False,
     ):
         self.provider = provider
         self.model_name = model_name or ""
@@ -258,6 +269,14 @@ fences, no preamble, no commentary.
             "{{num_questions}}", str(self._num_questions)
         ).replace("{{num_dimensions}}", str(self._num_dimensions))
 
+        # Everything in the checklist that reaches the model; scoring is applied to cached answers
+        checklist_prompt = json.dumps([self._system_prompt, self._config.get("dimensions", [])], sort_keys=True)
+        self._checklist_digest = hashlib.sha256(checklist_prompt.encode("utf-8")).hexdigest()
+        self._verdict_cache = verdict_cache
+        self._use_verdict_cache = use_verdict_cache
+        # Grade again (and overwrite the cached answers) even when answers are cached
+        self.refresh_verdicts = refresh_verdicts
+
     @property
     def backend(self):
         """Lazily initialize the LLM backend only when needed."""
@@ -321,9 +340,7 @@ fences, no preamble, no commentary.
         if not solution or not solution.strip():
             return self._empty_report()
 
-        # Build and send prompt
-        user_msg = self._build_user_message(solution, expectation)
-        raw_results = self._call_llm_with_retry(user_msg)
+        raw_results = self._checklist_answers(solution, expectation)
 
         # Build question lookup from config
         q_lookup: dict[str, dict] = {}
@@ -387,6 +404,55 @@ fences, no preamble, no commentary.
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @property
+    def verdict_cache(self) -> LLMCache | None:
+        """Lazily open the on-disk verdict cache (None when disabled or unavailable)."""
+        if self._verdict_cache is None and self._use_verdict_cache:
+            try:
+                self._verdict_cache = LLMCache(JUDGE_VERDICT_CACHE_DIR)
+            except OSError as e:
+                print(f"Warning: judge verdict cache unavailable, grading without it: {e}")
+                self._use_verdict_cache = False
+        return self._verdict_cache
+
+    def verdict_key(self, solution: str, expectation: str) -> str:
+        """Cache key of the checklist answers for this (solution, expectation) pair."""
+        return LLMCache.request_key(
+            {
+                "solution": solution,
+                "expectation": expectation,
+                "checklist_version": self._checklist_version,
+                "checklist": self._checklist_digest,
+                "model": getattr(self.backend, "model_name", self.model_name),
+            }
+        )
+
+    def is_cached(self, solution: str, expectation: str) -> bool:
+        cache = self.verdict_cache
+        return cache is not None and cache.get(self.verdict_key(solution, expectation)) is not None
+
+    def _checklist_answers(self, solution: str, expectation: str) -> list[dict]:
+        cache = self.verdict_cache
+        key = self.verdict_key(solution, expectation) if cache is not None else None
+        if key is not None and not self.refresh_verdicts:
+            entry = cache.get(key)
+            if entry is not None:
+                return entry["answers"]
+
+        user_msg = self._build_user_message(solution, expectation)
+        raw_results, parsed = self._call_llm_with_retry(user_msg)
+        # Parse failures fall back to all-No answers; those are not worth remembering
+        if key is not None and parsed:
+            cache.put(
+                key,
+                {
+                    "answers": raw_results,
+                    "checklist_version": self._checklist_version,
+                    "model": getattr(self.backend, "model_name", self.model_name),
+                },
+            )
+        return raw_results
+
     def _build_user_message(
         self,
         solution: str,
@@ -431,8 +497,11 @@ fences, no preamble, no commentary.
         lines.append("]")
         return "\n".join(lines)
 
-    def _call_llm_with_retry(self, user_msg: str) -> list[dict]:
-        """Call the LLM and parse the response, retrying up to once per failure mode."""
+    def _call_llm_with_retry(self, user_msg: str) -> tuple[list[dict], bool]:
+        """
+        Call the LLM and parse the response, retrying up to once per failure mode.
+        Returns the answers and whether they were parsed (rather than defaulted).
+        """
         messages = [
             SystemMessage(content=self._system_prompt),
             HumanMessage(content=user_msg),
@@ -444,7 +513,7 @@ fences, no preamble, no commentary.
                 response = self.backend.inference(messages)
                 response_text = response.content.strip()
                 results = self._parse_response(response_text, self._all_question_ids)
-                return results
+                return results, True
             except ChecklistParseError as e:
                 last_error = e
                 print(f"Checklist parse attempt {attempt + 1} failed: {e}")
@@ -470,7 +539,7 @@ fences, no preamble, no commentary.
                 "confidence": "Low",
             }
             for qid in self._all_question_ids
-        ]
+        ], False
 
     @staticmethod
     def _parse_response(response_text: str, expected_question_ids: list[str]) -> list[dict]:
@@ -31,6 +31,37 @@ class LLMAsAJudgeOracle(Oracle):
             max_tokens=max_tokens,
         )
 
+    @staticmethod
+    def results_from_report(report) -> dict:
+        """Oracle results (the Diagnosis.* columns of the results CSVs) for a graded JudgmentReport."""
+        # Use composite score (0.0-1.0) scaled to 0-100
+        acc = round(report.composite_score * 100.0, 2)
+        return {
+            "judgment": report.verdict.value,
+            "reasoning": report.reasoning,
+            "success": report.verdict == JudgmentResult.TRUE,
+            "accuracy": acc,
+            "composite_score": report.composite_score,
+            # Include dimension breakdown in results
+            "dimensions": {
+                dim.dimension_id: {
+                    "name": dim.dimension_name,
+                    "score": dim.score,
+                }
+                for dim in report.dimensions
+            },
+            "checklist": [
+                {
+                    "id": q.question_id,
+                    "answer": "Yes" if q.answer else "No",
+                    "evidence": q.evidence,
+                    "confidence": q.confidence,
+                }
+                for dim in report.dimensions
+                for q in dim.questions
+            ],
+        }
+
     def evaluate(self, solution, duration=None) -> dict:
         """Evaluate the agent's diagnosis.
 
@@ -66,11 +97,10 @@ class LLMAsAJudgeOracle(Oracle):
                 results["checklist"] = []
                 return results
 
-            # Use composite score (0.0-1.0) scaled to 0-100
-            acc = round(report.composite_score * 100.0, 2)
-            is_correct = report.verdict == JudgmentResult.TRUE
+            results = self.results_from_report(report)
+            acc = results["accuracy"]
 
-            if is_correct:
+            if results["success"]:
                 print(f"✅ Correct diagnosis: {report.verdict.value} (score: {acc:.1f}/100)")
             else:
                 print(f"❌ Incorrect diagnosis: {report.verdict.value} (score: {acc:.1f}/100)")
@@ -80,30 +110,8 @@ class LLMAsAJudgeOracle(Oracle):
                     else f"   Expected: {self.expected}"
                 )
                 print(f"   Got: {solution[:100]}..." if len(solution) > 100 else f"   Got: {solution}")
-
-            # Include dimension breakdown in results
-            results["judgment"] = report.verdict.value
-            results["reasoning"] = report.reasoning
-            results["success"] = is_correct
-            results["accuracy"] = acc
-            results["composite_score"] = report.composite_score
-            results["dimensions"] = {
-                dim.dimension_id: {
-                    "name": dim.dimension_name,
-                    "score": dim.score,
-                }
-                for dim in report.dimensions
-            }
-            results["checklist"] = [
-                {
-                    "id": q.question_id,
-                    "answer": "Yes" if q.answer else "No",
-                    "evidence": q.evidence,
-                    "confidence": q.confidence,
-                }
-                for dim in report.dimensions
-                for q in dim.questions
-            ]
+            # Kept with the results so finished runs can be re-graded offline
+            results["expected"] = self.expected
 
         except Exception as e:
             print(f"❌ Error during LLM judgment: {e}")
@@ -0,0 +1,215 @@
+"""
+Re-grade finished runs with the current checklist and judge model.
+
+Walks results directories for results CSVs (<pid>_results.csv,
+<pid>_<agent>_results.csv, <agent>_ALL_results.csv), grades every distinct
+(diagnosis, expected root cause) pair once, and writes the updated Diagnosis.*
+columns back into each CSV. Pairs whose checklist answers are already in the
+judge's verdict cache are re-scored without calling the model; the others are
+graded concurrently under a request rate limit.
+
+The expected root cause of a row is its Diagnosis.expected column (recorded by
+LLMAsAJudgeOracle), else the problem's entry in --expectations (a JSON or YAML
+map of problem id to root cause), else the problem registry.
+
+### Example
+python -m sregym.conductor.oracles.llm_as_a_judge.regrade results/0412_1030 --judge-model gpt-5 --rpm 60
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+from collections import Counter
+from pathlib import Path
+
+import yaml
+
+from sregym.conductor.oracles.llm_as_a_judge.judge import DiagnosisJudge
+from sregym.conductor.oracles.llm_as_a_judge.llm_as_a_judge_oracle import LLMAsAJudgeOracle
+from sregym.results_journal import read_results, write_results_csv
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+logger = logging.getLogger("all.sregym.regrade")
+
+
+class RateLimiter:
+    """Spaces out request starts to at most `per_minute` per minute (no limit when 0)."""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+def find_results_csvs(roots: list[Path]) -> list[Path]:
+    paths = set()
+    for root in roots:
+        if root.is_file():
+            paths.add(root)
+        else:
+            paths.update(root.rglob("*_results.csv"))
+    return sorted(paths)
+
+
+def load_expectations(path: str | None) -> dict[str, str]:
+    if not path:
+        return {}
+    with open(path) as f:
+        data = json.load(f) if path.endswith(".json") else yaml.safe_load(f)
+    return {str(k): str(v) for k, v in (data or {}).items()}
+
+
+class ExpectationResolver:
+    """Expected root cause of a result row."""
+
+    def __init__(self, overrides: dict[str, str]):
+        self.overrides = overrides
+        self._from_registry: dict[str, str | None] = {}
+        self._registry = None
+
+    def __call__(self, row: dict) -> str | None:
+        if row.get("Diagnosis.expected"):
+            return row["Diagnosis.expected"]
+        problem_id = row.get("problem_id", "")
+        if problem_id in self.overrides:
+            return self.overrides[problem_id]
+        if problem_id not in self._from_registry:
+            self._from_registry[problem_id] = self._registry_expectation(problem_id)
+        return self._from_registry[problem_id]
+
+    def _registry_expectation(self, problem_id: str) -> str | None:
+        try:
+            if self._registry is None:
+                from sregym.conductor.problems.registry import ProblemRegistry
+
+                self._registry = ProblemRegistry()
+            problem = self._registry.get_problem_instance(problem_id)
+        except Exception as e:
+            logger.warning(f"Cannot load {problem_id} for its root cause ({e}); pass it with --expectations")
+            return None
+        oracle = getattr(problem, "diagnosis_oracle", None)
+        return oracle.expected if isinstance(oracle, LLMAsAJudgeOracle) else None
+
+
+def is_judged_row(row: dict) -> bool:
+    """Rows graded by the LLM judge (other diagnosis oracles have no checklist)."""
+    return "Diagnosis.submission" in row and bool(row.get("Diagnosis.judgment") or row.get("Diagnosis.checklist"))
+
+
+async def grade_pairs(
+    judge: DiagnosisJudge, pairs: set[tuple[str, str]], concurrency: int, per_minute: float
+) -> dict[tuple[str, str], dict]:
+    """Oracle results for every (solution, expectation) pair; only uncached pairs reach the model."""
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(per_minute)
+    graded: dict[tuple[str, str], dict] = {}
+    counts = Counter()
+
+    async def grade(pair: tuple[str, str]):
+        solution, expectation = pair
+        async with semaphore:
+            cached = not judge.refresh_verdicts and await asyncio.to_thread(judge.is_cached, solution, expectation)
+            if not cached:
+                await limiter.wait()
+            try:
+                report = await asyncio.to_thread(judge.judge_detailed, solution, expectation)
+            except Exception as e:
+                logger.warning(f"Grading failed, keeping the old scores: {e}")
+                counts["failed"] += 1
+                return
+        if report.verdict is None:
+            counts["failed"] += 1
+            return
+        graded[pair] = {**LLMAsAJudgeOracle.results_from_report(report), "expected": expectation}
+        counts["cached" if cached else "graded"] += 1
+        done = sum(counts.values())
+        if done % 20 == 0 or done == len(pairs):
+            logger.info(f"{done}/{len(pairs)} pairs: {dict(counts)}")
+
+    await asyncio.gather(*(grade(pair) for pair in pairs))
+    logger.info(f"Grading finished: {dict(counts)}")
+    return graded
+
+
+def write_back(path: Path, rows: list[dict], updates: dict[int, dict]):
+    for index, results in updates.items():
+        for key, value in results.items():
+            rows[index][f"Diagnosis.{key}"] = value
+    tmp_path = path.with_name(path.name + ".tmp")
+    write_results_csv(tmp_path, rows)
+    os.replace(tmp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-grade diagnoses in finished results with the LLM judge")
+    parser.add_argument("paths", nargs="+", help="Results directories (searched recursively) or results CSVs")
+    parser.add_argument("--judge-model", default=None, help="LiteLLM model string (default: $JUDGE_MODEL_ID)")
+    parser.add_argument("--expectations", default=None, help="JSON/YAML map of problem id to expected root cause")
+    parser.add_argument("--concurrency", type=int, default=4, help="Pairs graded at once (default: 4)")
+    parser.add_argument(
+        "--rpm", type=float, default=30, help="Max judge requests per minute, 0 = no limit (default: 30)"
+    )
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached verdicts and grade every pair again")
+    parser.add_argument("--dry-run", action="store_true", help="Grade and report verdict changes, but leave CSVs alone")
+    args = parser.parse_args()
+
+    if args.judge_model:
+        os.environ["JUDGE_MODEL_ID"] = args.judge_model
+    if not os.environ.get("JUDGE_MODEL_ID"):
+        parser.error("--judge-model is required when JUDGE_MODEL_ID is not set")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be a positive integer")
+
+    csv_paths = find_results_csvs([Path(p) for p in args.paths])
+    resolve = ExpectationResolver(load_expectations(args.expectations))
+
+    # path -> (rows, {row index: pair})
+    tables: dict[Path, tuple[list[dict], dict[int, tuple[str, str]]]] = {}
+    for path in csv_paths:
+        rows = read_results(path)
+        row_pairs = {}
+        for index, row in enumerate(rows):
+            if not is_judged_row(row):
+                continue
+            expectation = resolve(row)
+            if expectation is None:
+                continue
+            row_pairs[index] = (row["Diagnosis.submission"], expectation)
+        if row_pairs:
+            tables[path] = (rows, row_pairs)
+
+    pairs = {pair for _, row_pairs in tables.values() for pair in row_pairs.values()}
+    logger.info(f"{len(pairs)} distinct diagnoses to grade in {len(tables)} of {len(csv_paths)} results CSVs")
+    if not pairs:
+        return
+
+    judge = DiagnosisJudge(refresh_verdicts=args.refresh)
+    graded = asyncio.run(grade_pairs(judge, pairs, args.concurrency, args.rpm))
+
+    flipped = 0
+    for path, (rows, row_pairs) in tables.items():
+        updates = {index: graded[pair] for index, pair in row_pairs.items() if pair in graded}
+        flipped += sum(str(rows[i].get("Diagnosis.success")) != str(r["success"]) for i, r in updates.items())
+        if updates and not args.dry_run:
+            write_back(path, rows, updates)
+    logger.info(
+        f"{flipped} rows changed verdict"
+        + (" (dry run, nothing written)" if args.dry_run else f"; updated {len(tables)} results CSVs")
+    )
+
+
+if __name__ == "__main__":
+    main()
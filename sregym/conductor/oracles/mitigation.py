@@ -1,5 +1,3 @@
-import time
-
 from sregym.conductor.oracles.base import Oracle
 
 # Time to wait for deployments to settle after agent submission, so we
@@ -13,10 +11,9 @@ class MitigationOracle(Oracle):
 
     def _wait_for_rollouts(self, kubectl, namespace):
         """Wait for all deployments in the namespace to finish rolling out."""
-        deadline = time.monotonic() + _ROLLOUT_SETTLE_SECONDS
-        while time.monotonic() < deadline:
+
+        def all_settled() -> bool:
             deployments = kubectl.list_deployments(namespace)
-            all_settled = True
             for dep in deployments.items:
                 status = dep.status
                 desired = dep.spec.replicas or 1
@@ -25,12 +22,13 @@ class MitigationOracle(Oracle):
                     or (status.ready_replicas or 0) < desired
                     or (status.unavailable_replicas or 0) > 0
                 ):
-                    all_settled = False
-                    break
-            if all_settled:
-                return
-            time.sleep(_ROLLOUT_POLL_INTERVAL)
-        print("⚠️ Timed out waiting for deployments to settle; evaluating current state")
+                    return False
+            return True
+
+        if not kubectl.wait_until(
+            "deployments", namespace, all_settled, sleep=_ROLLOUT_POLL_INTERVAL, max_wait=_ROLLOUT_SETTLE_SECONDS
+        ):
+            print("⚠️ Timed out waiting for deployments to settle; evaluating current state")
 
     def evaluate(self) -> dict:
         print("== Mitigation Evaluation ==")
@@ -1,91 +1,117 @@
-import time
+from kubernetes import client
 
 from sregym.conductor.oracles.base import Oracle
+from sregym.service.waits import await_condition
+
+
+def pod_not_ready_reason(pod) -> str | None:
+    """Why a pod does not count as ready, or None if it does."""
+    if pod.status.phase != "Running":
+        return f"Pod {pod.metadata.name} is in phase: {pod.status.phase}"
+    for container_status in pod.status.container_statuses or []:
+        if container_status.state.waiting and container_status.state.waiting.reason:
+            return f"Container {container_status.name} is waiting: {container_status.state.waiting.reason}"
+        if container_status.state.terminated and container_status.state.terminated.reason != "Completed":
+            return f"Container {container_status.name} terminated: {container_status.state.terminated.reason}"
+        if not container_status.ready:
+            return f"Container {container_status.name} is not ready"
+    return None
+
+
+class PodReadinessTracker:
+    """
+    Readiness state of the pods in a namespace, fed with successive snapshots.
+
+    update() reports the first transition that breaks sustained readiness: a pod
+    that is not ready, or a container whose restart count went up since the
+    previous snapshot (a restart can happen between two events without the pod
+    ever being seen NotReady).
+    """
+
+    def __init__(self):
+        self.restarts: dict[str, int] = {}  # pod uid -> total container restarts
+        self.violation: str | None = None
+
+    def update(self, pods: list) -> str | None:
+        violation = None
+        restarts = {}
+        for pod in pods:
+            count = sum(status.restart_count or 0 for status in pod.status.container_statuses or [])
+            restarts[pod.metadata.uid] = count
+            if violation:
+                continue
+            if count > self.restarts.get(pod.metadata.uid, count):
+                violation = f"Pod {pod.metadata.name} restarted ({count} restarts)"
+            else:
+                violation = pod_not_ready_reason(pod)
+        self.restarts = restarts
+        self.violation = violation
+        return violation
 
 
 class SustainedReadinessOracle(Oracle):
+    """
+    Succeeds if every pod in the namespace becomes ready within `buffer_period`
+    seconds and then stays ready, without restarting, for `sustained_period`.
+
+    Both phases follow a watch over the namespace's pods (or the shared informer
+    cache when it is enabled) instead of polling, so a NotReady or restart
+    transition ends the evaluation as soon as it happens.
+    """
+
     importance = 1.0
 
-    def __init__(self, problem, buffer_period=10, sustained_period=60, check_interval=0.5):
+    def __init__(
+        self,
+        problem,
+        buffer_period=10,
+        sustained_period=60,
+        check_interval=0.5,
+        api_client: client.ApiClient | None = None,
+    ):
         super().__init__(problem)
         self.buffer_period = buffer_period
         self.sustained_period = sustained_period
+        # Unused since readiness is watched rather than polled; kept for compatibility
         self.check_interval = check_interval
+        self.api_client = api_client
 
     def evaluate(self) -> dict:
         print("== Sustained Readiness Evaluation ==")
 
-        kubectl = self.problem.kubectl
         namespace = self.problem.namespace
+        tracker = PodReadinessTracker()
 
         print(f"⏳ Waiting up to {self.buffer_period}s for all pods to become ready...")
-        start_time = time.time()
-        all_ready_start = None
-
-        while time.time() - start_time < self.buffer_period:
-            if self._check_all_pods_ready(kubectl, namespace):
-                all_ready_start = time.time()
-                print(f"✅ All pods ready after {all_ready_start - start_time:.1f}s")
-                break
-            time.sleep(self.check_interval)
-
-        if all_ready_start is None:
+        ready = await_condition(
+            "pods",
+            lambda pods: tracker.update(pods) is None,
+            namespace=namespace,
+            timeout=self.buffer_period,
+            api_client=self.api_client,
+            description=f"all pods ready in {namespace}",
+        )
+        if not ready.satisfied:
+            if tracker.violation:
+                print(f"⚠️ {tracker.violation}")
             print(f"❌ All the pods did not become ready within {self.buffer_period}s buffer period")
             return {"success": False}
+        print(f"✅ All pods ready after {ready.elapsed:.1f}s")
 
         print(f"⏱️  Monitoring pods for {self.sustained_period}s sustained readiness...")
-        monitoring_start = time.time()
-
-        while time.time() - monitoring_start < self.sustained_period:
-            elapsed = time.time() - monitoring_start
-
-            if not self._check_all_pods_ready(kubectl, namespace, verbose=True):
-                print(f"❌ Pod readiness check failed after {elapsed:.1f}s of monitoring")
-                return {"success": False}
-
-            if int(elapsed) % 10 == 0 and elapsed > 0:
-                print(f"🚧 Pods still ready after {int(elapsed)}s...")
-
-            time.sleep(self.check_interval)
+        # Satisfied means readiness was lost; running out the clock means it held
+        lost = await_condition(
+            "pods",
+            lambda pods: tracker.update(pods) is not None,
+            namespace=namespace,
+            timeout=self.sustained_period,
+            api_client=self.api_client,
+            description=f"loss of readiness in {namespace}",
+        )
+        if lost.satisfied:
+            print(f"⚠️ {tracker.violation}")
+            print(f"❌ Pod readiness check failed after {lost.elapsed:.1f}s of monitoring")
+            return {"success": False}
 
         print(f"✅ All pods remained ready for the full {self.sustained_period}s period!")
         return {"success": True}
-
-    def _check_all_pods_ready(self, kubectl, namespace, verbose=False) -> bool:
-        try:
-            pod_list = kubectl.list_pods(namespace)
-            all_normal = True
-
-            for pod in pod_list.items:
-                if pod.status.phase != "Running":
-                    if verbose:
-                        print(f"⚠️ Pod {pod.metadata.name} is in phase: {pod.status.phase}")
-                    all_normal = False
-                    break
-
-                for container_status in pod.status.container_statuses:
-                    if container_status.state.waiting and container_status.state.waiting.reason:
-                        if verbose:
-                            print(
-                                f"⚠️ Container {container_status.name} is waiting: {container_status.state.waiting.reason}"
-                            )
-                        all_normal = False
-
-                    elif container_status.state.terminated and container_status.state.terminated.reason != "Completed":
-                        if verbose:
-                            print(
-                                f"⚠️ Container {container_status.name} terminated: {container_status.state.terminated.reason}"
-                            )
-                        all_normal = False
-
-                    elif not container_status.ready:
-                        if verbose:
-                            print(f"⚠️ Container {container_status.name} is not ready")
-                        all_normal = False
-
-            return all_normal
-
-        except Exception as e:
-            if verbose:
-                print(f"⚠️ Error checking pod readiness: {e}")
-            return False
@@ -0,0 +1,24 @@
+"""
+The token naming a problem when several run at once (see multi_tenant.py).
+
+main.py --concurrent-problems N gives each agent its problem's token in
+SREGYM_PROBLEM_TOKEN; everything the agent sends to the conductor API carries it
+as the X-Problem-Token header (or a `token` field), so the request reaches that
+problem. Standard library only, so agents and MCP servers can import it.
+"""
+
+import os
+
+PROBLEM_TOKEN_ENV = "SREGYM_PROBLEM_TOKEN"
+PROBLEM_TOKEN_HEADER = "X-Problem-Token"
+
+
+def problem_token() -> str | None:
+    """This process's problem token, or None when only one problem runs."""
+    return os.environ.get(PROBLEM_TOKEN_ENV) or None
+
+
+def problem_token_headers() -> dict[str, str]:
+    """Headers naming this process's problem on conductor API requests (none when only one problem runs)."""
+    token = problem_token()
+    return {PROBLEM_TOKEN_HEADER: token} if token else {}
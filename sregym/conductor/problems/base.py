@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 
+from sregym.service.apps.base import current_namespace_suffix
+
 
 class Problem(ABC):
     def __init__(self, app, namespace: str):
@@ -10,6 +12,8 @@ class Problem(ABC):
         self.fault_injected = False
         self.results = {}
         self.root_cause = None  # root cause of the problem in natural language
+        # Set when the problem was built for a namespace-isolated concurrent run (see MultiTenantConductor)
+        self.namespace_suffix = current_namespace_suffix()
 
         # Optional: attach oracles in subclass
         self.diagnosis_oracle = None
@@ -19,6 +23,13 @@ class Problem(ABC):
         """Override this method to return True if the problem requires Khaos for fault injection."""
         return False
 
+    def is_exclusive(self) -> bool:
+        """
+        Override this method to return True if the fault touches cluster-scoped state (nodes, kubelet,
+        CoreDNS, taints, ...); such problems never run alongside others on the same cluster.
+        """
+        return self.requires_khaos() or not getattr(self.app, "namespace_templatable", True)
+
     @classmethod
     def build_structured_root_cause(
         cls,
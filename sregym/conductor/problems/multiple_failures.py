@@ -54,7 +54,6 @@ class MultipleIndependentFailures(Problem):
         for p in self.problems:
             print(f"Injecting Fault: {p.__class__.__name__} | Namespace: {p.namespace}")
             p.inject_fault()
-            time.sleep(1)
         self.faults_str = " | ".join([f"{p.__class__.__name__}" for p in self.problems])
         print(
             f"Injecting Fault: Multiple faults from included problems: [{self.faults_str}] | Namespace: {self.namespaces}\n"
@@ -32,6 +32,9 @@ class K8SOperatorInvalidAffinityTolerationFault(Problem):
 
         self.mitigation_oracle = InvalidAffinityMitigationOracle(problem=self, deployment_name="basic")
 
+    def is_exclusive(self) -> bool:
+        return True
+
     @mark_fault_injected
     def inject_fault(self):
         print("== Fault Injection ==")
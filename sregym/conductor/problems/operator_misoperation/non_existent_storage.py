@@ -32,6 +32,9 @@ class K8SOperatorNonExistentStorageFault(Problem):
         self.diagnosis_oracle = LLMAsAJudgeOracle(problem=self, expected=self.root_cause)
         self.mitigation_oracle = NonExistentStorageClassMitigationOracle(problem=self, deployment_name="basic")
 
+    def is_exclusive(self) -> bool:
+        return True
+
     @mark_fault_injected
     def inject_fault(self):
         print("== Fault Injection ==")
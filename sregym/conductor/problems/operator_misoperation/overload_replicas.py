@@ -33,6 +33,9 @@ class K8SOperatorOverloadReplicasFault(Problem):
         self.diagnosis_oracle = LLMAsAJudgeOracle(problem=self, expected=self.root_cause)
         self.mitigation_oracle = OverloadReplicasMitigationOracle(problem=self, deployment_name="basic")
 
+    def is_exclusive(self) -> bool:
+        return True
+
     @mark_fault_injected
     def inject_fault(self):
         print("== Fault Injection ==")
@@ -30,6 +30,9 @@ class K8SOperatorSecurityContextFault(Problem):
         self.mitigation_oracle = SecurityContextMitigationOracle(problem=self, deployment_name="basic")
         self.app.create_workload()
 
+    def is_exclusive(self) -> bool:
+        return True
+
     @mark_fault_injected
     def inject_fault(self):
         injector = K8SOperatorFaultInjector(namespace=self.namespace)
@@ -32,6 +32,9 @@ class K8SOperatorWrongOperatorImage(Problem):
         self.diagnosis_oracle = LLMAsAJudgeOracle(problem=self, expected=self.root_cause)
         self.mitigation_oracle = MitigationOracle(problem=self)
 
+    def is_exclusive(self) -> bool:
+        return True
+
     @mark_fault_injected
     def inject_fault(self):
         injector = K8SOperatorFaultInjector(namespace=self.namespace)
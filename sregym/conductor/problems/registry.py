@@ -1,297 +1,300 @@
+"""
+Problem registry.
+
+PROBLEMS maps each problem ID to "<module>:<Class>" (module relative to
+sregym.conductor.problems) and the constructor's keyword arguments. A problem's
+module is only imported when the problem is built, so listing problem IDs costs
+no more than importing this file, and no cluster is needed until a problem is
+built.
+
+problem_index.json records what can only be learned by building a problem (its
+app, namespace, whether it needs Khaos and whether it must run alone), so
+get_problem_metadata() and find_problems() answer without importing anything.
+Regenerate it after adding or changing a problem (needs a kubeconfig, not a
+reachable cluster):
+
+### Example
+python -m sregym.conductor.problems.registry --rebuild-index
+"""
+
+import argparse
+import importlib
+import json
+import logging
+from dataclasses import dataclass, field
+from functools import cache, cached_property
 from pathlib import Path
 
 import yaml
 
-from sregym.conductor.problems.ad_service_failure import AdServiceFailure
-from sregym.conductor.problems.ad_service_high_cpu import AdServiceHighCpu
-from sregym.conductor.problems.ad_service_manual_gc import AdServiceManualGc
-from sregym.conductor.problems.assign_non_existent_node import AssignNonExistentNode
-from sregym.conductor.problems.auth_miss_mongodb import MongoDBAuthMissing
-from sregym.conductor.problems.capacity_decrease_rpc_retry_storm import CapacityDecreaseRPCRetryStorm
-from sregym.conductor.problems.cart_service_failure import CartServiceFailure
-from sregym.conductor.problems.configmap_drift import ConfigMapDrift
-from sregym.conductor.problems.duplicate_pvc_mounts import DuplicatePVCMounts
-from sregym.conductor.problems.env_variable_shadowing import EnvVariableShadowing
-from sregym.conductor.problems.failed_readiness_probe import FailedReadinessProbe
-from sregym.conductor.problems.faulty_image_correlated import FaultyImageCorrelated
-from sregym.conductor.problems.gc_capacity_degradation import GCCapacityDegradation
-from sregym.conductor.problems.image_slow_load import ImageSlowLoad
-from sregym.conductor.problems.incorrect_image import IncorrectImage
-from sregym.conductor.problems.incorrect_port_assignment import IncorrectPortAssignment
-from sregym.conductor.problems.ingress_misroute import IngressMisroute
-from sregym.conductor.problems.kafka_queue_problems import KafkaQueueProblems
-from sregym.conductor.problems.khaos_faults import (
-    KhaosFaultName,
-    KhaosFaultProblem,
-)
-from sregym.conductor.problems.kubelet_crash import KubeletCrash
-from sregym.conductor.problems.liveness_probe_misconfiguration import LivenessProbeMisconfiguration
-from sregym.conductor.problems.liveness_probe_too_aggressive import LivenessProbeTooAggressive
-from sregym.conductor.problems.load_spike_rpc_retry_storm import LoadSpikeRPCRetryStorm
-from sregym.conductor.problems.loadgenerator_flood_homepage import LoadGeneratorFloodHomepage
-from sregym.conductor.problems.misconfig_app import MisconfigAppHotelRes
-from sregym.conductor.problems.missing_configmap import MissingConfigMap
-from sregym.conductor.problems.missing_env_variable import MissingEnvVariable
-from sregym.conductor.problems.missing_service import MissingService
-from sregym.conductor.problems.multiple_failures import MultipleIndependentFailures  # noqa: F401
-from sregym.conductor.problems.namespace_memory_limit import NamespaceMemoryLimit
-from sregym.conductor.problems.network_policy_block import NetworkPolicyBlock
-from sregym.conductor.problems.operator_misoperation.invalid_affinity_toleration import (
-    K8SOperatorInvalidAffinityTolerationFault,
-)
-from sregym.conductor.problems.operator_misoperation.non_existent_storage import K8SOperatorNonExistentStorageFault
-from sregym.conductor.problems.operator_misoperation.overload_replicas import K8SOperatorOverloadReplicasFault
-from sregym.conductor.problems.operator_misoperation.security_context_fault import K8SOperatorSecurityContextFault
-from sregym.conductor.problems.operator_misoperation.wrong_operator_image import K8SOperatorWrongOperatorImage
-from sregym.conductor.problems.operator_misoperation.wrong_update_strategy import K8SOperatorWrongUpdateStrategyFault
-from sregym.conductor.problems.payment_service_failure import PaymentServiceFailure
-from sregym.conductor.problems.payment_service_unreachable import PaymentServiceUnreachable
-from sregym.conductor.problems.persistent_volume_affinity_violation import PersistentVolumeAffinityViolation
-from sregym.conductor.problems.pod_anti_affinity_deadlock import PodAntiAffinityDeadlock
-from sregym.conductor.problems.product_catalog_failure import ProductCatalogServiceFailure
-from sregym.conductor.problems.pvc_claim_mismatch import PVCClaimMismatch
-from sregym.conductor.problems.rbac_misconfiguration import RBACMisconfiguration
-from sregym.conductor.problems.readiness_probe_misconfiguration import ReadinessProbeMisconfiguration
-from sregym.conductor.problems.resource_request import ResourceRequestTooLarge, ResourceRequestTooSmall
-from sregym.conductor.problems.revoke_auth import MongoDBRevokeAuth
-from sregym.conductor.problems.rolling_update_misconfigured import RollingUpdateMisconfigured
-from sregym.conductor.problems.scale_pod import ScalePodSocialNet
-from sregym.conductor.problems.service_dns_resolution_failure import ServiceDNSResolutionFailure
-from sregym.conductor.problems.service_port_conflict import ServicePortConflict
-from sregym.conductor.problems.sidecar_port_conflict import SidecarPortConflict
-from sregym.conductor.problems.silent_data_corruption import SilentDataCorruption
-from sregym.conductor.problems.stale_coredns_config import StaleCoreDNSConfig
-from sregym.conductor.problems.storage_user_unregistered import MongoDBUserUnregistered
-from sregym.conductor.problems.taint_no_toleration import TaintNoToleration
-from sregym.conductor.problems.target_port import K8STargetPortMisconfig
-from sregym.conductor.problems.train_ticket_f22 import TrainTicketF22
-from sregym.conductor.problems.trainticket_f17 import TrainTicketF17
-from sregym.conductor.problems.update_incompatible_correlated import UpdateIncompatibleCorrelated
-from sregym.conductor.problems.valkey_auth_disruption import ValkeyAuthDisruption
-from sregym.conductor.problems.valkey_memory_disruption import ValkeyMemoryDisruption
-from sregym.conductor.problems.workload_imbalance import WorkloadImbalance
-from sregym.conductor.problems.wrong_bin_usage import WrongBinUsage
-from sregym.conductor.problems.wrong_dns_policy import WrongDNSPolicy
-from sregym.conductor.problems.wrong_service_selector import WrongServiceSelector
-from sregym.service.kubectl import KubeCtl
+from sregym.service.apps.base import namespace_suffix as app_namespace_suffix
+
+logger = logging.getLogger("all.sregym.problem_registry")
+
+INDEX_PATH = Path(__file__).parent / "problem_index.json"
+
+
+@dataclass
+class ProblemSpec:
+    """How to build a problem: the class to import and the keyword arguments to pass it."""
+
+    target: str
+    kwargs: dict = field(default_factory=dict)
+    tags: tuple[str, ...] = ()
+
+    def load(self) -> type:
+        """Import the problem's module and return its class."""
+        module, _, name = self.target.partition(":")
+        return getattr(importlib.import_module(f"{__package__}.{module}"), name)
+
+    def __call__(self):
+        return self.load()(**self.kwargs)
+
+
+def _problem(target: str, *tags: str, **kwargs) -> ProblemSpec:
+    return ProblemSpec(target, kwargs, tags)
 
 
 # fmt: off
+PROBLEMS: dict[str, ProblemSpec] = {
+    # ==================== APPLICATION FAULT INJECTOR ====================
+    # --- CORRELATED PROBLEMS ---
+    "faulty_image_correlated": _problem("faulty_image_correlated:FaultyImageCorrelated", "application", "correlated"),
+    "update_incompatible_correlated": _problem("update_incompatible_correlated:UpdateIncompatibleCorrelated", "application", "correlated"),
+    # --- REGULAR APPLICATION PROBLEMS ---
+    "incorrect_image": _problem("incorrect_image:IncorrectImage", "application"),
+    "incorrect_port_assignment": _problem("incorrect_port_assignment:IncorrectPortAssignment", "application"),
+    "unschedulable_incorrect_port_assignment": _problem("incorrect_port_assignment:IncorrectPortAssignment", "application", unschedulable=True),
+    "misconfig_app_hotel_res": _problem("misconfig_app:MisconfigAppHotelRes", "application"),
+    "missing_env_variable_astronomy_shop": _problem("missing_env_variable:MissingEnvVariable", "application", app_name="astronomy_shop", faulty_service="frontend"),
+    "revoke_auth_mongodb-1": _problem("revoke_auth:MongoDBRevokeAuth", "application", faulty_service="mongodb-geo"),
+    "revoke_auth_mongodb-2": _problem("revoke_auth:MongoDBRevokeAuth", "application", faulty_service="mongodb-rate"),
+    "storage_user_unregistered-1": _problem("storage_user_unregistered:MongoDBUserUnregistered", "application", faulty_service="mongodb-geo"),
+    "storage_user_unregistered-2": _problem("storage_user_unregistered:MongoDBUserUnregistered", "application", faulty_service="mongodb-rate"),
+    "valkey_auth_disruption": _problem("valkey_auth_disruption:ValkeyAuthDisruption", "application"),
+    "valkey_memory_disruption": _problem("valkey_memory_disruption:ValkeyMemoryDisruption", "application"),
+    # # ==================== VIRTUALIZATION FAULT INJECTOR ====================
+    # --- METASTABLE FAILURES ---
+    # "cache_flush_capacity_degradation": CacheFlushCapacityDegradation,  # module not yet implemented
+    "capacity_decrease_rpc_retry_storm": _problem("capacity_decrease_rpc_retry_storm:CapacityDecreaseRPCRetryStorm", "virtualization", "metastable"),
+    "gc_capacity_degradation": _problem("gc_capacity_degradation:GCCapacityDegradation", "virtualization", "metastable"),
+    "load_spike_rpc_retry_storm": _problem("load_spike_rpc_retry_storm:LoadSpikeRPCRetryStorm", "virtualization", "metastable"),
+    # --- REGULAR VIRTUALIZATION PROBLEMS ---
+    "assign_to_non_existent_node": _problem("assign_non_existent_node:AssignNonExistentNode", "virtualization"),
+    "auth_miss_mongodb": _problem("auth_miss_mongodb:MongoDBAuthMissing", "virtualization"),
+    "configmap_drift_hotel_reservation": _problem("configmap_drift:ConfigMapDrift", "virtualization", faulty_service="geo"),
+    "duplicate_pvc_mounts_astronomy_shop": _problem("duplicate_pvc_mounts:DuplicatePVCMounts", "virtualization", app_name="astronomy_shop", faulty_service="frontend"),
+    "duplicate_pvc_mounts_hotel_reservation": _problem("duplicate_pvc_mounts:DuplicatePVCMounts", "virtualization", app_name="hotel_reservation", faulty_service="frontend"),
+    "duplicate_pvc_mounts_social_network": _problem("duplicate_pvc_mounts:DuplicatePVCMounts", "virtualization", app_name="social_network", faulty_service="jaeger"),
+    "env_variable_shadowing_astronomy_shop": _problem("env_variable_shadowing:EnvVariableShadowing", "virtualization"),
+    "k8s_target_port-misconfig": _problem("target_port:K8STargetPortMisconfig", "virtualization", faulty_service="user-service"),
+    "liveness_probe_misconfiguration_astronomy_shop": _problem("liveness_probe_misconfiguration:LivenessProbeMisconfiguration", "virtualization", app_name="astronomy_shop", faulty_service="frontend"),
+    "liveness_probe_misconfiguration_hotel_reservation": _problem("liveness_probe_misconfiguration:LivenessProbeMisconfiguration", "virtualization", app_name="hotel_reservation", faulty_service="recommendation"),
+    "liveness_probe_misconfiguration_social_network": _problem("liveness_probe_misconfiguration:LivenessProbeMisconfiguration", "virtualization", app_name="social_network", faulty_service="user-service"),
+    "liveness_probe_too_aggressive_astronomy_shop": _problem("liveness_probe_too_aggressive:LivenessProbeTooAggressive", "virtualization", app_name="astronomy_shop"),
+    "liveness_probe_too_aggressive_hotel_reservation": _problem("liveness_probe_too_aggressive:LivenessProbeTooAggressive", "virtualization", app_name="hotel_reservation"),
+    "liveness_probe_too_aggressive_social_network": _problem("liveness_probe_too_aggressive:LivenessProbeTooAggressive", "virtualization", app_name="social_network"),
+    "missing_configmap_hotel_reservation": _problem("missing_configmap:MissingConfigMap", "virtualization", app_name="hotel_reservation", faulty_service="mongodb-geo"),
+    "missing_configmap_social_network": _problem("missing_configmap:MissingConfigMap", "virtualization", app_name="social_network", faulty_service="media-mongodb"),
+    "missing_service_astronomy_shop": _problem("missing_service:MissingService", "virtualization", app_name="astronomy_shop", faulty_service="ad"),
+    "missing_service_hotel_reservation": _problem("missing_service:MissingService", "virtualization", app_name="hotel_reservation", faulty_service="mongodb-rate"),
+    "missing_service_social_network": _problem("missing_service:MissingService", "virtualization", app_name="social_network", faulty_service="user-service"),
+    "namespace_memory_limit": _problem("namespace_memory_limit:NamespaceMemoryLimit", "virtualization"),
+    "pod_anti_affinity_deadlock": _problem("pod_anti_affinity_deadlock:PodAntiAffinityDeadlock", "virtualization"),
+    "persistent_volume_affinity_violation": _problem("persistent_volume_affinity_violation:PersistentVolumeAffinityViolation", "virtualization"),
+    "pvc_claim_mismatch": _problem("pvc_claim_mismatch:PVCClaimMismatch", "virtualization"),
+    "rbac_misconfiguration": _problem("rbac_misconfiguration:RBACMisconfiguration", "virtualization"),
+    "readiness_probe_misconfiguration_astronomy_shop": _problem("readiness_probe_misconfiguration:ReadinessProbeMisconfiguration", "virtualization", app_name="astronomy_shop", faulty_service="frontend"),
+    "readiness_probe_misconfiguration_hotel_reservation": _problem("readiness_probe_misconfiguration:ReadinessProbeMisconfiguration", "virtualization", app_name="hotel_reservation", faulty_service="frontend"),
+    "readiness_probe_misconfiguration_social_network": _problem("readiness_probe_misconfiguration:ReadinessProbeMisconfiguration", "virtualization", app_name="social_network", faulty_service="user-service"),
+    "resource_request_too_large": _problem("resource_request:ResourceRequestTooLarge", "virtualization", app_name="hotel_reservation", faulty_service="mongodb-rate"),
+    "resource_request_too_small": _problem("resource_request:ResourceRequestTooSmall", "virtualization", app_name="hotel_reservation", faulty_service="mongodb-rate"),
+    "rolling_update_misconfigured_hotel_reservation": _problem("rolling_update_misconfigured:RollingUpdateMisconfigured", "virtualization", app_name="hotel_reservation"),
+    "rolling_update_misconfigured_social_network": _problem("rolling_update_misconfigured:RollingUpdateMisconfigured", "virtualization", app_name="social_network"),
+    "scale_pod_zero_social_net": _problem("scale_pod:ScalePodSocialNet", "virtualization"),
+    "service_dns_resolution_failure_astronomy_shop": _problem("service_dns_resolution_failure:ServiceDNSResolutionFailure", "virtualization", app_name="astronomy_shop", faulty_service="frontend"),
+    "service_dns_resolution_failure_social_network": _problem("service_dns_resolution_failure:ServiceDNSResolutionFailure", "virtualization", app_name="social_network", faulty_service="user-service"),
+    "sidecar_port_conflict_astronomy_shop": _problem("sidecar_port_conflict:SidecarPortConflict", "virtualization", app_name="astronomy_shop", faulty_service="frontend"),
+    "sidecar_port_conflict_hotel_reservation": _problem("sidecar_port_conflict:SidecarPortConflict", "virtualization", app_name="hotel_reservation", faulty_service="frontend"),
+    "sidecar_port_conflict_social_network": _problem("sidecar_port_conflict:SidecarPortConflict", "virtualization", app_name="social_network", faulty_service="user-service"),
+    "service_port_conflict_astronomy_shop": _problem("service_port_conflict:ServicePortConflict", "virtualization", app_name="astronomy_shop", faulty_service="ad"),
+    "service_port_conflict_hotel_reservation": _problem("service_port_conflict:ServicePortConflict", "virtualization", app_name="hotel_reservation", faulty_service="recommendation"),
+    "service_port_conflict_social_network": _problem("service_port_conflict:ServicePortConflict", "virtualization", app_name="social_network", faulty_service="media-service"),
+    "stale_coredns_config_astronomy_shop": _problem("stale_coredns_config:StaleCoreDNSConfig", "virtualization", app_name="astronomy_shop"),
+    "stale_coredns_config_social_network": _problem("stale_coredns_config:StaleCoreDNSConfig", "virtualization", app_name="social_network"),
+    "taint_no_toleration_social_network": _problem("taint_no_toleration:TaintNoToleration", "virtualization"),
+    # "top_of_rack_router_failure_hotel_reservation": lambda: TopOfRackRouterPartitionHotelReservation(app_name="hotel_reservation", faulty_service="frontend"),
+    "wrong_bin_usage": _problem("wrong_bin_usage:WrongBinUsage", "virtualization"),
+    "wrong_dns_policy_astronomy_shop": _problem("wrong_dns_policy:WrongDNSPolicy", "virtualization", app_name="astronomy_shop", faulty_service="frontend"),
+    "wrong_dns_policy_hotel_reservation": _problem("wrong_dns_policy:WrongDNSPolicy", "virtualization", app_name="hotel_reservation", faulty_service="profile"),
+    "wrong_dns_policy_social_network": _problem("wrong_dns_policy:WrongDNSPolicy", "virtualization", app_name="social_network", faulty_service="user-service"),
+    "wrong_service_selector_astronomy_shop": _problem("wrong_service_selector:WrongServiceSelector", "virtualization", app_name="astronomy_shop", faulty_service="frontend"),
+    "wrong_service_selector_hotel_reservation": _problem("wrong_service_selector:WrongServiceSelector", "virtualization", app_name="hotel_reservation", faulty_service="frontend"),
+    "wrong_service_selector_social_network": _problem("wrong_service_selector:WrongServiceSelector", "virtualization", app_name="social_network", faulty_service="user-service"),
+    # ==================== OPENTELEMETRY FAULT INJECTOR ====================
+    "astronomy_shop_ad_service_failure": _problem("ad_service_failure:AdServiceFailure", "opentelemetry"),
+    "astronomy_shop_ad_service_high_cpu": _problem("ad_service_high_cpu:AdServiceHighCpu", "opentelemetry"),
+    "astronomy_shop_ad_service_image_slow_load": _problem("image_slow_load:ImageSlowLoad", "opentelemetry"),
+    "astronomy_shop_ad_service_manual_gc": _problem("ad_service_manual_gc:AdServiceManualGc", "opentelemetry"),
+    "astronomy_shop_cart_service_failure": _problem("cart_service_failure:CartServiceFailure", "opentelemetry"),
+    "astronomy_shop_failed_readiness_probe": _problem("failed_readiness_probe:FailedReadinessProbe", "opentelemetry"),
+    "astronomy_shop_payment_service_failure": _problem("payment_service_failure:PaymentServiceFailure", "opentelemetry"),
+    "astronomy_shop_payment_service_unreachable": _problem("payment_service_unreachable:PaymentServiceUnreachable", "opentelemetry"),
+    "astronomy_shop_product_catalog_service_failure": _problem("product_catalog_failure:ProductCatalogServiceFailure", "opentelemetry"),
+    "kafka_queue_problems": _problem("kafka_queue_problems:KafkaQueueProblems", "opentelemetry"),
+    "loadgenerator_flood_homepage": _problem("loadgenerator_flood_homepage:LoadGeneratorFloodHomepage", "opentelemetry"),
+    # ==================== TRAIN TICKET FAULT INJECTOR ====================
+    "trainticket_f17_nested_sql_select_clause_error": _problem("trainticket_f17:TrainTicketF17", "train_ticket"),
+    "trainticket_f22_sql_column_name_mismatch_error": _problem("train_ticket_f22:TrainTicketF22", "train_ticket"),
+    # ==================== HARDWARE FAULT INJECTOR ====================
+    "silent_data_corruption": _problem("silent_data_corruption:SilentDataCorruption", "hardware"),
+    "latent_sector_error": _problem("khaos_faults:KhaosFaultProblem", "hardware", fault_name="latent_sector_error", inject_args=[30]),
+    # ----- Hardware-failure compound problems (Tier A) -----
+    # "nic_packet_corruption": lambda: KhaosCompoundFaultProblem(
+    #     fault_specs=[
+    #         (KhaosFaultName.packet_loss_sendto, [30]),
+    #         (KhaosFaultName.packet_loss_recvfrom, [30]),
+    #     ],
+    #     root_cause=_HW_NIC_PACKET_CORRUPTION,
+    # ),
+    # "storage_controller_read_failure": lambda: KhaosCompoundFaultProblem(
+    #     fault_specs=[
+    #         (KhaosFaultName.read_error, None),
+    #         (KhaosFaultName.pread_error, None),
+    #     ],
+    #     root_cause=_HW_STORAGE_READ_FAILURE,
+    # ),
+    # "storage_write_failure": lambda: KhaosCompoundFaultProblem(
+    #     fault_specs=[
+    #         (KhaosFaultName.write_error, None),
+    #         (KhaosFaultName.pwrite_error, None),
+    #         (KhaosFaultName.fsync_error, None),
+    #     ],
+    #     root_cause=_HW_STORAGE_WRITE_FAILURE,
+    # ),
+    # "dram_module_failure": lambda: KhaosCompoundFaultProblem(
+    #     fault_specs=[
+    #         (KhaosFaultName.mmap_fail, None),
+    #         (KhaosFaultName.mmap_oom, None),
+    #         (KhaosFaultName.oom_memchunk, None),
+    #     ],
+    #     root_cause=_HW_DRAM_MODULE_FAILURE,
+    # ),
+    # "cpu_clocksource_failure": lambda: KhaosCompoundFaultProblem(
+    #     fault_specs=[
+    #         (KhaosFaultName.clock_drift, None),
+    #         (KhaosFaultName.gettimeofday_fail, None),
+    #     ],
+    #     root_cause=_HW_CPU_CLOCKSOURCE_FAILURE,
+    # ),
+    # # ----- Hardware-failure compound problems (Tier B) -----
+    # "mmu_page_protection_failure": lambda: KhaosCompoundFaultProblem(
+    #     fault_specs=[
+    #         (KhaosFaultName.force_mprotect_eacces, None),
+    #         (KhaosFaultName.stack_rndsegfault, None),
+    #     ],
+    #     root_cause=_HW_MMU_PAGE_PROTECTION_FAILURE,
+    # ),
+    # "network_interface_link_down": lambda: KhaosCompoundFaultProblem(
+    #     fault_specs=[
+    #         (KhaosFaultName.bind_enetdown, None),
+    #         (KhaosFaultName.socket_block, None),
+    #     ],
+    #     root_cause=_HW_NETWORK_INTERFACE_LINK_DOWN,
+    # ),
+    # "dns_resolver_hardware_failure": lambda: KhaosCompoundFaultProblem(
+    #     fault_specs=[
+    #         (KhaosFaultName.getaddrinfo_fail, None),
+    #     ],
+    #     root_cause=_HW_DNS_RESOLVER_FAILURE,
+    # ),
+    # ==================== DIRECT K8S API ====================
+    "ingress_misroute": _problem("ingress_misroute:IngressMisroute", "k8s_api", path="/api", correct_service="frontend-service", wrong_service="recommendation-service"),
+    "network_policy_block": _problem("network_policy_block:NetworkPolicyBlock", "k8s_api", faulty_service="payment-service"),
+    # ==================== MULTIPLE INDEPENDENT FAILURES ====================
+    # "port_misconfig_revoke_auth_wrong_svc_selector": \
+    #     lambda: MultipleIndependentFailures(problems=[
+    #         K8STargetPortMisconfig(faulty_service="user-service"),
+    #         MongoDBRevokeAuth(faulty_service="mongodb-geo"),
+    #         WrongServiceSelector(app_name="astronomy_shop", faulty_service="frontend")
+    # ]),
+    # # another concurrent fault problem that deploys all three apps
+    # "port_misconfig_misconfig_hotelres_missing_env_var": \
+    #     lambda: MultipleIndependentFailures(problems=[
+    #         K8STargetPortMisconfig(faulty_service="user-service"),
+    #         MisconfigAppHotelRes(),
+    #         MissingEnvVariable(app_name="astronomy_shop", faulty_service="frontend")
+    # ]),
+    # # three concurrent fault problems, each only focuses on one app
+    # # astro shop
+    # "valkey_memory_disruption_missing_env_var_incorrect_port": \
+    #     lambda: MultipleIndependentFailures(problems=[
+    #         ValkeyMemoryDisruption(),
+    #         MissingEnvVariable(app_name="astronomy_shop", faulty_service="frontend"),
+    #         IncorrectPortAssignment()
+    #     ]),
+    # # hotel res
+    # "hotel_res_concurrent_fault": lambda: MultipleIndependentFailures(problems=[
+    #     MisconfigAppHotelRes(),
+    #     MongoDBRevokeAuth(faulty_service="mongodb-geo"),
+    #     MongoDBUserUnregistered(faulty_service="mongodb-rate")
+    # ]),
+    # # social net
+    # "social_net_concurrent_fault": lambda: MultipleIndependentFailures(problems=[
+    #     AssignNonExistentNode(),
+    #     MongoDBAuthMissing(),
+    #     LivenessProbeTooAggressive(app_name="social_network"),
+    # ]),
+    # ad hoc:
+    "kubelet_crash": _problem("kubelet_crash:KubeletCrash", "ad_hoc"),
+    "workload_imbalance": _problem("workload_imbalance:WorkloadImbalance", "ad_hoc"),
+    # ==================== K8S OPERATOR MISOPERATION ==================
+    "operator_overload_replicas": _problem("operator_misoperation.overload_replicas:K8SOperatorOverloadReplicasFault", "operator"),
+    "operator_non_existent_storage": _problem("operator_misoperation.non_existent_storage:K8SOperatorNonExistentStorageFault", "operator"),
+    "operator_invalid_affinity_toleration": _problem("operator_misoperation.invalid_affinity_toleration:K8SOperatorInvalidAffinityTolerationFault", "operator"),
+    "operator_security_context_fault": _problem("operator_misoperation.security_context_fault:K8SOperatorSecurityContextFault", "operator"),
+    "operator_wrong_update_strategy_fault": _problem("operator_misoperation.wrong_update_strategy:K8SOperatorWrongUpdateStrategyFault", "operator"),
+    "operator_wrong_operator_image": _problem("operator_misoperation.wrong_operator_image:K8SOperatorWrongOperatorImage", "operator"),
+}
+# fmt: on
+
+
+@cache
+def load_index() -> dict[str, dict]:
+    """problem_index.json, or an empty index if it has not been generated."""
+    try:
+        with open(INDEX_PATH) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.warning(f"{INDEX_PATH} is missing; run `python -m {__name__} --rebuild-index`")
+        return {}
+
+
 class ProblemRegistry:
     def __init__(self):
-        self.PROBLEM_REGISTRY = {
-            # ==================== APPLICATION FAULT INJECTOR ====================
-            # --- CORRELATED PROBLEMS ---
-            "faulty_image_correlated": FaultyImageCorrelated,
-            "update_incompatible_correlated": UpdateIncompatibleCorrelated,
-            # --- REGULAR APPLICATION PROBLEMS ---
-            "incorrect_image": IncorrectImage,
-            "incorrect_port_assignment": IncorrectPortAssignment,
-            "unschedulable_incorrect_port_assignment": lambda: IncorrectPortAssignment(unschedulable=True),
-            "misconfig_app_hotel_res": MisconfigAppHotelRes,
-            "missing_env_variable_astronomy_shop": lambda: MissingEnvVariable(app_name="astronomy_shop", faulty_service="frontend" ),
-            "revoke_auth_mongodb-1": lambda: MongoDBRevokeAuth(faulty_service="mongodb-geo"),
-            "revoke_auth_mongodb-2": lambda: MongoDBRevokeAuth(faulty_service="mongodb-rate"),
-            "storage_user_unregistered-1": lambda: MongoDBUserUnregistered(faulty_service="mongodb-geo"),
-            "storage_user_unregistered-2": lambda: MongoDBUserUnregistered(faulty_service="mongodb-rate"),
-            "valkey_auth_disruption": ValkeyAuthDisruption,
-            "valkey_memory_disruption": ValkeyMemoryDisruption,
-            # # ==================== VIRTUALIZATION FAULT INJECTOR ====================
-            # --- METASTABLE FAILURES ---
-            # "cache_flush_capacity_degradation": CacheFlushCapacityDegradation,  # module not yet implemented
-            "capacity_decrease_rpc_retry_storm": CapacityDecreaseRPCRetryStorm,
-            "gc_capacity_degradation": GCCapacityDegradation,
-            "load_spike_rpc_retry_storm": LoadSpikeRPCRetryStorm,
-            # --- REGULAR VIRTUALIZATION PROBLEMS ---
-            "assign_to_non_existent_node": AssignNonExistentNode,
-            "auth_miss_mongodb": MongoDBAuthMissing,
-            "configmap_drift_hotel_reservation": lambda: ConfigMapDrift(faulty_service="geo"),
-            "duplicate_pvc_mounts_astronomy_shop": lambda: DuplicatePVCMounts(app_name="astronomy_shop", faulty_service="frontend"),
-            "duplicate_pvc_mounts_hotel_reservation": lambda: DuplicatePVCMounts(app_name="hotel_reservation", faulty_service="frontend"),
-            "duplicate_pvc_mounts_social_network": lambda: DuplicatePVCMounts(app_name="social_network", faulty_service="jaeger"),
-            "env_variable_shadowing_astronomy_shop": lambda: EnvVariableShadowing(),
-            "k8s_target_port-misconfig": lambda: K8STargetPortMisconfig(faulty_service="user-service"),
-            "liveness_probe_misconfiguration_astronomy_shop": lambda: LivenessProbeMisconfiguration(app_name="astronomy_shop", faulty_service="frontend"),
-            "liveness_probe_misconfiguration_hotel_reservation": lambda: LivenessProbeMisconfiguration(app_name="hotel_reservation", faulty_service="recommendation"),
-            "liveness_probe_misconfiguration_social_network": lambda: LivenessProbeMisconfiguration(app_name="social_network", faulty_service="user-service"),
-            "liveness_probe_too_aggressive_astronomy_shop": lambda: LivenessProbeTooAggressive(app_name="astronomy_shop"),
-            "liveness_probe_too_aggressive_hotel_reservation": lambda: LivenessProbeTooAggressive(app_name="hotel_reservation"),
-            "liveness_probe_too_aggressive_social_network": lambda: LivenessProbeTooAggressive(app_name="social_network"),
-            "missing_configmap_hotel_reservation": lambda: MissingConfigMap(app_name="hotel_reservation", faulty_service="mongodb-geo"),
-            "missing_configmap_social_network": lambda: MissingConfigMap(app_name="social_network", faulty_service="media-mongodb"),
-            "missing_service_astronomy_shop": lambda: MissingService(app_name="astronomy_shop", faulty_service="ad"),
-            "missing_service_hotel_reservation": lambda: MissingService(app_name="hotel_reservation", faulty_service="mongodb-rate"),
-            "missing_service_social_network": lambda: MissingService(app_name="social_network", faulty_service="user-service"),
-            "namespace_memory_limit": NamespaceMemoryLimit,
-            "pod_anti_affinity_deadlock": PodAntiAffinityDeadlock,
-            "persistent_volume_affinity_violation": PersistentVolumeAffinityViolation,
-            "pvc_claim_mismatch": PVCClaimMismatch,
-            "rbac_misconfiguration": RBACMisconfiguration,
-            "readiness_probe_misconfiguration_astronomy_shop": lambda: ReadinessProbeMisconfiguration(app_name="astronomy_shop", faulty_service="frontend"),
-            "readiness_probe_misconfiguration_hotel_reservation": lambda: ReadinessProbeMisconfiguration(app_name="hotel_reservation", faulty_service="frontend"),
-            "readiness_probe_misconfiguration_social_network": lambda: ReadinessProbeMisconfiguration(app_name="social_network", faulty_service="user-service"),
-            "resource_request_too_large": lambda: ResourceRequestTooLarge(app_name="hotel_reservation", faulty_service="mongodb-rate"),
-            "resource_request_too_small": lambda: ResourceRequestTooSmall(app_name="hotel_reservation", faulty_service="mongodb-rate"),
-            "rolling_update_misconfigured_hotel_reservation": lambda: RollingUpdateMisconfigured(app_name="hotel_reservation"),
-            "rolling_update_misconfigured_social_network": lambda: RollingUpdateMisconfigured(app_name="social_network"),
-            "scale_pod_zero_social_net": ScalePodSocialNet,
-            "service_dns_resolution_failure_astronomy_shop": lambda: ServiceDNSResolutionFailure(app_name="astronomy_shop", faulty_service="frontend"),
-            "service_dns_resolution_failure_social_network": lambda: ServiceDNSResolutionFailure(app_name="social_network", faulty_service="user-service"),
-            "sidecar_port_conflict_astronomy_shop": lambda: SidecarPortConflict(app_name="astronomy_shop", faulty_service="frontend"),
-            "sidecar_port_conflict_hotel_reservation": lambda: SidecarPortConflict(app_name="hotel_reservation", faulty_service="frontend"),
-            "sidecar_port_conflict_social_network": lambda: SidecarPortConflict(app_name="social_network", faulty_service="user-service"),
-            "service_port_conflict_astronomy_shop": lambda: ServicePortConflict(app_name="astronomy_shop", faulty_service="ad"),
-            "service_port_conflict_hotel_reservation": lambda: ServicePortConflict(app_name="hotel_reservation", faulty_service="recommendation"),
-            "service_port_conflict_social_network": lambda: ServicePortConflict(app_name="social_network", faulty_service="media-service"),
-            "stale_coredns_config_astronomy_shop": lambda: StaleCoreDNSConfig(app_name="astronomy_shop"),
-            "stale_coredns_config_social_network": lambda: StaleCoreDNSConfig(app_name="social_network"),
-            "taint_no_toleration_social_network": lambda: TaintNoToleration(),
-            # "top_of_rack_router_failure_hotel_reservation": lambda: TopOfRackRouterPartitionHotelReservation(app_name="hotel_reservation", faulty_service="frontend"),
-            "wrong_bin_usage": WrongBinUsage,
-            "wrong_dns_policy_astronomy_shop": lambda: WrongDNSPolicy(app_name="astronomy_shop", faulty_service="frontend"),
-            "wrong_dns_policy_hotel_reservation": lambda: WrongDNSPolicy(app_name="hotel_reservation", faulty_service="profile"),
-            "wrong_dns_policy_social_network": lambda: WrongDNSPolicy(app_name="social_network", faulty_service="user-service"),
-            "wrong_service_selector_astronomy_shop": lambda: WrongServiceSelector(app_name="astronomy_shop", faulty_service="frontend"),
-            "wrong_service_selector_hotel_reservation": lambda: WrongServiceSelector(app_name="hotel_reservation", faulty_service="frontend"),
-            "wrong_service_selector_social_network": lambda: WrongServiceSelector(app_name="social_network", faulty_service="user-service"),
-            # ==================== OPENTELEMETRY FAULT INJECTOR ====================
-            "astronomy_shop_ad_service_failure": AdServiceFailure,
-            "astronomy_shop_ad_service_high_cpu": AdServiceHighCpu,
-            "astronomy_shop_ad_service_image_slow_load": ImageSlowLoad,
-            "astronomy_shop_ad_service_manual_gc": AdServiceManualGc,
-            "astronomy_shop_cart_service_failure": CartServiceFailure,
-            "astronomy_shop_failed_readiness_probe": FailedReadinessProbe,
-            "astronomy_shop_payment_service_failure": PaymentServiceFailure,
-            "astronomy_shop_payment_service_unreachable": PaymentServiceUnreachable,
-            "astronomy_shop_product_catalog_service_failure": ProductCatalogServiceFailure,
-            "kafka_queue_problems": KafkaQueueProblems,
-            "loadgenerator_flood_homepage": LoadGeneratorFloodHomepage,
-            # ==================== TRAIN TICKET FAULT INJECTOR ====================
-            "trainticket_f17_nested_sql_select_clause_error": TrainTicketF17,
-            "trainticket_f22_sql_column_name_mismatch_error": TrainTicketF22,
-            # ==================== HARDWARE FAULT INJECTOR ====================
-            "silent_data_corruption": SilentDataCorruption,
-            "latent_sector_error": lambda: KhaosFaultProblem(KhaosFaultName.latent_sector_error,inject_args=[30]),
-            # ----- Hardware-failure compound problems (Tier A) -----
-            # "nic_packet_corruption": lambda: KhaosCompoundFaultProblem(
-            #     fault_specs=[
-            #         (KhaosFaultName.packet_loss_sendto, [30]),
-            #         (KhaosFaultName.packet_loss_recvfrom, [30]),
-            #     ],
-            #     root_cause=_HW_NIC_PACKET_CORRUPTION,
-            # ),
-            # "storage_controller_read_failure": lambda: KhaosCompoundFaultProblem(
-            #     fault_specs=[
-            #         (KhaosFaultName.read_error, None),
-            #         (KhaosFaultName.pread_error, None),
-            #     ],
-            #     root_cause=_HW_STORAGE_READ_FAILURE,
-            # ),
-            # "storage_write_failure": lambda: KhaosCompoundFaultProblem(
-            #     fault_specs=[
-            #         (KhaosFaultName.write_error, None),
-            #         (KhaosFaultName.pwrite_error, None),
-            #         (KhaosFaultName.fsync_error, None),
-            #     ],
-            #     root_cause=_HW_STORAGE_WRITE_FAILURE,
-            # ),
-            # "dram_module_failure": lambda: KhaosCompoundFaultProblem(
-            #     fault_specs=[
-            #         (KhaosFaultName.mmap_fail, None),
-            #         (KhaosFaultName.mmap_oom, None),
-            #         (KhaosFaultName.oom_memchunk, None),
-            #     ],
-            #     root_cause=_HW_DRAM_MODULE_FAILURE,
-            # ),
-            # "cpu_clocksource_failure": lambda: KhaosCompoundFaultProblem(
-            #     fault_specs=[
-            #         (KhaosFaultName.clock_drift, None),
-            #         (KhaosFaultName.gettimeofday_fail, None),
-            #     ],
-            #     root_cause=_HW_CPU_CLOCKSOURCE_FAILURE,
-            # ),
-            # # ----- Hardware-failure compound problems (Tier B) -----
-            # "mmu_page_protection_failure": lambda: KhaosCompoundFaultProblem(
-            #     fault_specs=[
-            #         (KhaosFaultName.force_mprotect_eacces, None),
-            #         (KhaosFaultName.stack_rndsegfault, None),
-            #     ],
-            #     root_cause=_HW_MMU_PAGE_PROTECTION_FAILURE,
-            # ),
-            # "network_interface_link_down": lambda: KhaosCompoundFaultProblem(
-            #     fault_specs=[
-            #         (KhaosFaultName.bind_enetdown, None),
-            #         (KhaosFaultName.socket_block, None),
-            #     ],
-            #     root_cause=_HW_NETWORK_INTERFACE_LINK_DOWN,
-            # ),
-            # "dns_resolver_hardware_failure": lambda: KhaosCompoundFaultProblem(
-            #     fault_specs=[
-            #         (KhaosFaultName.getaddrinfo_fail, None),
-            #     ],
-            #     root_cause=_HW_DNS_RESOLVER_FAILURE,
-            # ),
-            # ==================== DIRECT K8S API ====================
-            "ingress_misroute": lambda: IngressMisroute(path="/api", correct_service="frontend-service", wrong_service="recommendation-service"),
-            "network_policy_block": lambda: NetworkPolicyBlock(faulty_service="payment-service"),
-            # ==================== MULTIPLE INDEPENDENT FAILURES ====================
-            # "port_misconfig_revoke_auth_wrong_svc_selector": \
-            #     lambda: MultipleIndependentFailures(problems=[
-            #         K8STargetPortMisconfig(faulty_service="user-service"),
-            #         MongoDBRevokeAuth(faulty_service="mongodb-geo"),
-            #         WrongServiceSelector(app_name="astronomy_shop", faulty_service="frontend")
-            # ]),
-            # # another concurrent fault problem that deploys all three apps
-            # "port_misconfig_misconfig_hotelres_missing_env_var": \
-            #     lambda: MultipleIndependentFailures(problems=[
-            #         K8STargetPortMisconfig(faulty_service="user-service"),
-            #         MisconfigAppHotelRes(),
-            #         MissingEnvVariable(app_name="astronomy_shop", faulty_service="frontend")
-            # ]),
-            # # three concurrent fault problems, each only focuses on one app
-            # # astro shop
-            # "valkey_memory_disruption_missing_env_var_incorrect_port": \
-            #     lambda: MultipleIndependentFailures(problems=[
-            #         ValkeyMemoryDisruption(),
-            #         MissingEnvVariable(app_name="astronomy_shop", faulty_service="frontend"),
-            #         IncorrectPortAssignment()
-            #     ]),
-            # # hotel res
-            # "hotel_res_concurrent_fault": lambda: MultipleIndependentFailures(problems=[
-            #     MisconfigAppHotelRes(),
-            #     MongoDBRevokeAuth(faulty_service="mongodb-geo"),
-            #     MongoDBUserUnregistered(faulty_service="mongodb-rate")
-            # ]),
-            # # social net
-            # "social_net_concurrent_fault": lambda: MultipleIndependentFailures(problems=[
-            #     AssignNonExistentNode(),
-            #     MongoDBAuthMissing(),
-            #     LivenessProbeTooAggressive(app_name="social_network"),
-            # ]),
-            # ad hoc:
-            "kubelet_crash": KubeletCrash,
-            "workload_imbalance": WorkloadImbalance,
-            # ==================== K8S OPERATOR MISOPERATION ==================
-            "operator_overload_replicas": K8SOperatorOverloadReplicasFault,
-            "operator_non_existent_storage": K8SOperatorNonExistentStorageFault,
-            "operator_invalid_affinity_toleration": K8SOperatorInvalidAffinityTolerationFault,
-            "operator_security_context_fault": K8SOperatorSecurityContextFault,
-            "operator_wrong_update_strategy_fault": K8SOperatorWrongUpdateStrategyFault,
-            "operator_wrong_operator_image": K8SOperatorWrongOperatorImage,
-        }
-# fmt: on
-        self.kubectl = KubeCtl()
+        self.PROBLEM_REGISTRY = PROBLEMS
         self.non_emulated_cluster_problems = []
 
-    def get_problem_instance(self, problem_id: str):
+    @cached_property
+    def kubectl(self):
+        from sregym.service.kubectl import KubeCtl
+
+        return KubeCtl()
+
+    def get_problem_instance(self, problem_id: str, namespace_suffix: str | None = None):
+        """
+        Build the problem. With namespace_suffix, its app (and so the problem and its
+        oracles) uses namespaces ending in -<namespace_suffix>.
+        """
         if problem_id not in self.PROBLEM_REGISTRY:
             raise ValueError(f"Problem ID {problem_id} not found in registry.")
 
-        is_emulated_cluster = self.kubectl.is_emulated_cluster()
-        if is_emulated_cluster and problem_id in self.non_emulated_cluster_problems:
+        # Only ask the cluster when the answer matters
+        if problem_id in self.non_emulated_cluster_problems and self.kubectl.is_emulated_cluster():
             raise RuntimeError(f"Problem ID {problem_id} is not supported in emulated clusters.")
 
-        return self.PROBLEM_REGISTRY.get(problem_id)()
+        with app_namespace_suffix(namespace_suffix):
+            return self.PROBLEM_REGISTRY[problem_id]()
 
     def get_problem(self, problem_id: str):
         return self.PROBLEM_REGISTRY.get(problem_id)
@@ -314,8 +317,82 @@ class ProblemRegistry:
             tasklist = yaml.safe_load(f)
         return list(tasklist["all"]["problems"])
 
-
     def get_problem_count(self, task_type: str = None):
         if task_type:
             return len([k for k in self.PROBLEM_REGISTRY if task_type in k])
         return len(self.PROBLEM_REGISTRY)
+
+    def get_problem_metadata(self, problem_id: str) -> dict:
+        """
+        App, namespace, requires_khaos, exclusive and tags of a problem, without building it.
+        The fields recorded in the index are None for a problem added since it was generated.
+        """
+        if problem_id not in self.PROBLEM_REGISTRY:
+            raise ValueError(f"Problem ID {problem_id} not found in registry.")
+        recorded = load_index().get(problem_id, {})
+        return {
+            "app": recorded.get("app"),
+            "namespace": recorded.get("namespace"),
+            "requires_khaos": recorded.get("requires_khaos"),
+            "exclusive": recorded.get("exclusive"),
+            "tags": list(self.PROBLEM_REGISTRY[problem_id].tags),
+        }
+
+    def find_problems(self, tag: str | None = None, **metadata) -> list[str]:
+        """IDs of the problems with the given tag and metadata values, e.g. find_problems(requires_khaos=True)."""
+        matches = []
+        for problem_id in self.PROBLEM_REGISTRY:
+            info = self.get_problem_metadata(problem_id)
+            if tag is not None and tag not in info["tags"]:
+                continue
+            if all(info.get(key) == value for key, value in metadata.items()):
+                matches.append(problem_id)
+        return matches
+
+
+def build_index(problem_ids: list[str] | None = None) -> dict[str, dict]:
+    """Build every problem and record its metadata. Problems that fail to build are left out."""
+    index = {}
+    for problem_id in problem_ids or PROBLEMS:
+        try:
+            problem = PROBLEMS[problem_id]()
+        except Exception as e:
+            logger.error(f"Cannot build {problem_id}, leaving it out of the index: {e}")
+            continue
+        app = getattr(problem, "app", None)
+        index[problem_id] = {
+            "app": getattr(app, "name", None),
+            "namespace": problem.namespace,
+            "requires_khaos": problem.requires_khaos(),
+            "exclusive": problem.is_exclusive(),
+        }
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect the problem registry")
+    parser.add_argument(
+        "--rebuild-index", action="store_true", help=f"Build every problem and rewrite {INDEX_PATH.name}"
+    )
+    args = parser.parse_args()
+
+    if not args.rebuild_index:
+        registry = ProblemRegistry()
+        for problem_id in registry.get_problem_ids(all=True):
+            print(problem_id, json.dumps(registry.get_problem_metadata(problem_id)))
+        return
+
+    built = build_index()
+    # A problem that failed to build keeps its previous entry, if it had one
+    kept = {k: v for k, v in load_index().items() if k in PROBLEMS and k not in built}
+    with open(INDEX_PATH, "w") as f:
+        json.dump({**kept, **built}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    logger.info(f"Wrote {len(built)} problems to {INDEX_PATH}, kept {len(kept)} old entries")
+    missing = set(PROBLEMS) - set(built) - set(kept)
+    if missing:
+        logger.warning(f"Not in the index: {', '.join(sorted(missing))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -51,6 +51,9 @@ class ServicePortConflict(Problem):
         self.app.create_workload()
         self.mitigation_oracle = MitigationOracle(problem=self)
 
+    def is_exclusive(self) -> bool:
+        return True
+
     @mark_fault_injected
     def inject_fault(self):
         print("== Fault Injection ==")
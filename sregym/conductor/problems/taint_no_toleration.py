@@ -41,6 +41,9 @@ class TaintNoToleration(Problem):
         nodes = self.kubectl.core_v1_api.list_node().items
         return [n.metadata.name for n in nodes]
 
+    def is_exclusive(self) -> bool:
+        return True
+
     @mark_fault_injected
     def inject_fault(self):
         print(f"Injecting Fault to Service {self.faulty_service} on Nodes {self.faulty_nodes}")
@@ -38,6 +38,9 @@ class TopOfRackRouterPartitionHotelReservation(Problem):
 
         self.faulty_microservices: list[str] = []
 
+    def is_exclusive(self) -> bool:
+        return True
+
     @mark_fault_injected
     def inject_fault(self):
         print("== Fault Injection ==")
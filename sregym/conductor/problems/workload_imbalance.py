@@ -34,6 +34,9 @@ class WorkloadImbalance(Problem):
 
         self.app.create_workload()
 
+    def is_exclusive(self) -> bool:
+        return True
+
     @mark_fault_injected
     def inject_fault(self):
         print("== Fault Injection ==")
@@ -4,8 +4,13 @@ NOTE: Each layer of injection like ApplicationFaultInjector, OSFaultInjector Har
 are implemented as child classes of FaultInjector.
 """
 
+import logging
 import time
 
+from sregym.generators.fault.settle import SettleCondition, settle
+
+logger = logging.getLogger("all.sregym.fault")
+
 
 class FaultInjector:
     def __init__(self, testbed):
@@ -38,12 +43,28 @@ class FaultInjector:
 
     def _inject(self, fault_type: str, microservices: list[str] = None, duration: str = None):
         if duration:
-            self._invoke_method("inject", fault_type, microservices, duration)
+            args = (microservices, duration)
         elif microservices:
-            self._invoke_method("inject", fault_type, microservices)
+            args = (microservices,)
         else:
-            self._invoke_method("inject", fault_type)
-        time.sleep(6)
+            args = ()
+        conditions = self._settle_conditions(fault_type, *args)
+        self._invoke_method("inject", fault_type, *args)
+        settle(fault_type, conditions)
+
+    def _settle_conditions(self, fault_type: str, *args) -> list[SettleCondition] | None:
+        """The conditions declared by settle_<fault_type>(), read before injecting; None if there are none."""
+        method = getattr(self, f"settle_{fault_type}", None)
+        if method is None:
+            return None
+        try:
+            conditions = method(*args)
+        except Exception as e:
+            logger.warning(f"Could not declare settle conditions for {fault_type}, using a fixed wait: {e}")
+            return None
+        if isinstance(conditions, SettleCondition):
+            return [conditions]
+        return list(conditions)
 
     def _recover(
         self,
@@ -7,6 +7,7 @@ import time
 from kubernetes import client
 
 from sregym.generators.fault.base import FaultInjector
+from sregym.generators.fault.settle import deployment_rolled, pods_replaced
 from sregym.service.kubectl import KubeCtl
 
 
@@ -53,7 +54,19 @@ class ApplicationFaultInjector(FaultInjector):
                     print(f"Injection result for {service}: {result}")
 
                 self.delete_service_pods(target_service_pods)
-                time.sleep(3)
+
+    def settle_revoke_auth(self, microservices: list[str]):
+        return [
+            pods_replaced(
+                self.namespace,
+                f"{self.mongo_service_pod_map[service]} service pods",
+                pod_filter=lambda pod, name=self.mongo_service_pod_map[service]: (
+                    name in pod.metadata.name and "mongodb-" not in pod.metadata.name
+                ),
+            )
+            for service in ["mongodb-rate", "mongodb-geo"]
+            if service in microservices
+        ]
 
     def recover_revoke_auth(self, microservices: list[str]):
         target_services = ["mongodb-rate", "mongodb-geo"]
@@ -102,6 +115,17 @@ class ApplicationFaultInjector(FaultInjector):
 
                 self.delete_service_pods(target_service_pods)
 
+    def settle_storage_user_unregistered(self, microservices: list[str]):
+        return [
+            pods_replaced(
+                self.namespace,
+                f"{self.mongo_service_pod_map[service]} service pods",
+                pod_filter=lambda pod, name=self.mongo_service_pod_map[service]: pod.metadata.name.startswith(name),
+            )
+            for service in ["mongodb-rate", "mongodb-geo"]
+            if service in microservices
+        ]
+
     def recover_storage_user_unregistered(self, microservices: list[str]):
         target_services = ["mongodb-rate", "mongodb-geo"]
         for service in target_services:
@@ -140,7 +164,9 @@ class ApplicationFaultInjector(FaultInjector):
                     if container.name == f"hotel-reserv-{service}":
                         container.image = "yinfangchen/geo:app3"
                 self.kubectl.update_deployment(service, self.namespace, deployment)
-                time.sleep(10)
+
+    def settle_misconfig_app(self, microservices: list[str]):
+        return [deployment_rolled(self.namespace, service) for service in microservices]
 
     def recover_misconfig_app(self, microservices: list[str]):
         for service in microservices:
@@ -167,7 +193,11 @@ class ApplicationFaultInjector(FaultInjector):
 
         # Restart cartservice to force it to re-authenticate
         self.kubectl.exec_command(f"kubectl delete pod -l app.kubernetes.io/name={target_service} -n {self.namespace}")
-        time.sleep(3)
+
+    def settle_valkey_auth_disruption(self, target_service="cart"):
+        return pods_replaced(
+            self.namespace, f"{target_service} pods", label_selector=f"app.kubernetes.io/name={target_service}"
+        )
 
     def recover_valkey_auth_disruption(self, target_service="cart"):
         pods = self.kubectl.list_pods(self.namespace)
@@ -8,7 +8,15 @@ from pathlib import Path
 import yaml
 
 from sregym.generators.fault.base import FaultInjector
+from sregym.generators.fault.settle import (
+    deployment_pods_replaced,
+    deployment_rolled,
+    deployment_scaled,
+    endpoints_emptied,
+    object_deleted,
+)
 from sregym.paths import TARGET_MICROSERVICES
+from sregym.service.apps.base import base_namespace
 from sregym.service.helm import Helm
 from sregym.service.kubectl import KubeCtl
 
@@ -123,6 +131,9 @@ class VirtualizationFaultInjector(FaultInjector):
             self.kubectl.exec_command(f"kubectl scale deployment {service} --replicas=0 -n {self.namespace}")
             print(f"Scaled deployment {service} to 0 replicas | namespace: {self.namespace}")
 
+    def settle_scale_pods_to_zero(self, microservices: list[str]):
+        return [deployment_scaled(self.namespace, service, 0) for service in microservices]
+
     def recover_scale_pods_to_zero(self, microservices: list[str]):
         for service in microservices:
             self.kubectl.exec_command(f"kubectl scale deployment {service} --replicas=1 -n {self.namespace}")
@@ -148,6 +159,9 @@ class VirtualizationFaultInjector(FaultInjector):
             self.kubectl.exec_command(apply_command)
             print(f"Redeployed {service} to node {non_existent_node_name}.")
 
+    def settle_assign_to_non_existent_node(self, microservices: list[str]):
+        return [deployment_rolled(self.namespace, service) for service in microservices]
+
     def recover_assign_to_non_existent_node(self, microservices: list[str]):
         for service in microservices:
             deployment_yaml = self._get_deployment_yaml(service)
@@ -269,6 +283,9 @@ class VirtualizationFaultInjector(FaultInjector):
 
             print(f"Injected wrong binary usage fault for service: {service}")
 
+    def settle_wrong_bin_usage(self, microservices: list[str]):
+        return [deployment_rolled(self.namespace, service) for service in microservices]
+
     def recover_wrong_bin_usage(self, microservices: list[str]):
         for service in microservices:
             deployment_yaml = self._get_deployment_yaml(service)
@@ -303,6 +320,9 @@ class VirtualizationFaultInjector(FaultInjector):
         self.kubectl.exec_command(f"kubectl delete pods --all -n {self.namespace}")
         self.kubectl.wait_for_stable(namespace=self.namespace)
 
+    def settle_missing_service(self, microservices: list[str]):
+        return [object_deleted("services", self.namespace, service) for service in microservices]
+
     def recover_missing_service(self, microservices: list[str]):
         """Recover the fault by recreating the specified service."""
         for service in microservices:
@@ -332,6 +352,9 @@ class VirtualizationFaultInjector(FaultInjector):
 
             self._write_yaml_to_file(service, original_deployment_yaml)
 
+    def settle_resource_request(self, microservices: list[str], memory_limit_func):
+        return [deployment_rolled(self.namespace, service) for service in microservices]
+
     def recover_resource_request(self, microservices: list[str]):
         """Recover the fault by restoring the original resource request of a service."""
         for service in microservices:
@@ -358,6 +381,9 @@ class VirtualizationFaultInjector(FaultInjector):
 
             print(f"Patched service {service} with selector {service_config['spec']['selector']}")
 
+    def settle_wrong_service_selector(self, microservices: list[str]):
+        return [endpoints_emptied(self.namespace, service) for service in microservices]
+
     def recover_wrong_service_selector(self, microservices: list[str]):
         for service in microservices:
             service_config = self.kubectl.get_service_json(service, self.namespace)
@@ -844,9 +870,9 @@ class VirtualizationFaultInjector(FaultInjector):
     def inject_missing_configmap(self, microservices: list[str]):
         for microservice in microservices:
             configmap_name = None
-            if self.namespace == "social-network":
+            if base_namespace(self.namespace) == "social-network":
                 configmap_name = "media-mongodb"
-            elif self.namespace == "hotel-reservation":
+            elif base_namespace(self.namespace) == "hotel-reservation":
                 configmap_name = "mongo-geo-script"
             else:
                 raise ValueError(f"Unknown namespace: {self.namespace}")
@@ -869,6 +895,9 @@ class VirtualizationFaultInjector(FaultInjector):
             self.kubectl.exec_command(f"kubectl scale deployment {microservice} -n {self.namespace} --replicas=1")
             print("Restarted pods to apply ConfigMap fault")
 
+    def settle_missing_configmap(self, microservices: list[str]):
+        return [deployment_pods_replaced(self.namespace, service) for service in microservices]
+
     def recover_missing_configmap(self, microservices: list[str]):
         for microservice in microservices:
             configmap_name = f"{microservice}"
@@ -1017,6 +1046,9 @@ class VirtualizationFaultInjector(FaultInjector):
 
             print(f"Injected readiness probe misconfiguration fault for service: {service}")
 
+    def settle_readiness_probe_misconfiguration(self, microservices: list[str]):
+        return [deployment_rolled(self.namespace, service) for service in microservices]
+
     def recover_readiness_probe_misconfiguration(self, microservices: list[str]):
         for service in microservices:
             original_yaml_path = f"/tmp/{service}_modified.yaml"
@@ -1070,6 +1102,9 @@ class VirtualizationFaultInjector(FaultInjector):
 
             print(f"Injected liveness probe misconfiguration fault for service: {service}")
 
+    def settle_liveness_probe_misconfiguration(self, microservices: list[str]):
+        return [deployment_rolled(self.namespace, service) for service in microservices]
+
     def recover_liveness_probe_misconfiguration(self, microservices: list[str]):
         for service in microservices:
             original_yaml_path = f"/tmp/{service}_modified.yaml"
@@ -1233,7 +1268,7 @@ class VirtualizationFaultInjector(FaultInjector):
 
             shadow_vars = None
 
-            if self.namespace == "astronomy-shop":
+            if base_namespace(self.namespace) == "astronomy-shop":
                 if service == "frontend-proxy":
                     shadow_vars = {"FRONTEND_HOST": "localhost"}
 
@@ -1357,6 +1392,9 @@ class VirtualizationFaultInjector(FaultInjector):
             self.kubectl.exec_command(f"kubectl rollout restart deployment {service} -n {self.namespace}")
             print(f"⚠️ Injected Rolling Update Misconfiguration fault into `{service}`")
 
+    def settle_rolling_update_misconfigured(self, microservices: list[str]):
+        return [deployment_rolled(self.namespace, service) for service in microservices]
+
     def recover_rolling_update_misconfigured(self, microservices: list[str]):
         for service in microservices:
             original_yaml_path = f"/tmp/{service}_modified.yaml"
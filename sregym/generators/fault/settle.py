@@ -0,0 +1,216 @@
+"""
+Settle conditions: the observable state a fault leaves the cluster in once it has taken effect.
+
+An injector declares the conditions of a fault in a settle_<fault_type>() method,
+which FaultInjector._inject() calls with the same arguments as inject_<fault_type>()
+right before injecting; the builders below read the state they compare against
+at that point (a Deployment's generation, the pods' uids). After the injection
+the framework waits on each condition with await_condition(), so it returns as
+soon as the fault is in place, and records a SettleReport with the measured time.
+Faults that declare nothing keep a fixed wait.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sregym.service.informer import resolve_list_func
+from sregym.service.waits import WaitResult, await_condition
+
+logger = logging.getLogger("all.sregym.fault")
+logger.propagate = True
+logger.setLevel(logging.DEBUG)
+
+# Upper bound on the wait for a fault's settle conditions
+SETTLE_TIMEOUT_SECONDS = 60
+# Fixed wait after injecting a fault that declares no settle condition
+UNDECLARED_SETTLE_SECONDS = 6
+
+# Reports collected by the innermost collect_settle_reports() block
+_collected: ContextVar[list | None] = ContextVar("settle_reports", default=None)
+
+
+@dataclass
+class SettleCondition:
+    """Block until predicate(objects) holds for the objects of `kind` (see await_condition())."""
+
+    description: str
+    kind: str
+    predicate: Callable[[list], bool]
+    namespace: str | None = None
+    label_selector: str | None = None
+    field_selector: str | None = None
+
+    def wait(self, timeout: float) -> WaitResult:
+        return await_condition(
+            self.kind,
+            self.predicate,
+            namespace=self.namespace,
+            label_selector=self.label_selector,
+            field_selector=self.field_selector,
+            timeout=timeout,
+            description=self.description,
+        )
+
+
+@dataclass
+class SettleReport:
+    """How long a fault took to settle; `settled` is None when it declared no condition."""
+
+    fault_type: str
+    settled: bool | None
+    seconds: float
+    waits: list[dict] = field(default_factory=list)
+
+    @property
+    def outcome(self) -> str:
+        return {None: "fixed wait", True: "settled", False: "timed out"}[self.settled]
+
+    def as_dict(self) -> dict:
+        return {"fault_type": self.fault_type, "settled": self.settled, "seconds": self.seconds, "waits": self.waits}
+
+
+@contextmanager
+def collect_settle_reports() -> Iterator[list[SettleReport]]:
+    """Collect the reports of the faults injected in this block (in this thread)."""
+    reports: list[SettleReport] = []
+    token = _collected.set(reports)
+    try:
+        yield reports
+    finally:
+        _collected.reset(token)
+
+
+def settle(fault_type: str, conditions: list[SettleCondition] | None, timeout: float = SETTLE_TIMEOUT_SECONDS):
+    """Wait until every condition holds (or `timeout` passes), or the fixed wait if there are none."""
+    start = time.monotonic()
+    if conditions is None:
+        time.sleep(UNDECLARED_SETTLE_SECONDS)
+        report = SettleReport(fault_type, None, round(time.monotonic() - start, 3))
+    else:
+        deadline = start + timeout
+        results = [condition.wait(max(0.0, deadline - time.monotonic())) for condition in conditions]
+        report = SettleReport(
+            fault_type,
+            all(result.satisfied for result in results),
+            round(time.monotonic() - start, 3),
+            [result.as_dict() for result in results],
+        )
+        if not report.settled:
+            pending = ", ".join(result.description for result in results if not result.satisfied)
+            logger.warning(f"Fault {fault_type} did not settle within {timeout}s: still waiting for {pending}")
+
+    logger.info(f"Fault {fault_type}: {report.outcome} after {report.seconds:.2f}s")
+    reports = _collected.get()
+    if reports is not None:
+        reports.append(report)
+    return report
+
+
+def _list(kind: str, namespace: str, **kwargs) -> list:
+    list_func, args = resolve_list_func(kind, namespace)
+    return list_func(*args, **kwargs).items
+
+
+def deployment_rolled(namespace: str, name: str) -> SettleCondition:
+    """
+    The Deployment was changed or recreated (its generation moved or its uid changed)
+    since now, and the controller has created pods for the new spec.
+    """
+    before = _list("deployments", namespace, field_selector=f"metadata.name={name}")
+    uid = before[0].metadata.uid if before else None
+    generation = (before[0].metadata.generation or 0) if before else 0
+
+    def rolled(deployments: list) -> bool:
+        if not deployments:
+            return False
+        deployment = deployments[0]
+        current = deployment.metadata.generation or 0
+        if deployment.metadata.uid == uid and current <= generation:
+            return False
+        if (deployment.status.observed_generation or 0) < current:
+            return False
+        return (deployment.status.updated_replicas or 0) >= min(1, deployment.spec.replicas or 0)
+
+    return SettleCondition(
+        f"rollout of deployment {name}", "deployments", rolled, namespace, field_selector=f"metadata.name={name}"
+    )
+
+
+def deployment_scaled(namespace: str, name: str, replicas: int) -> SettleCondition:
+    """The Deployment runs exactly `replicas` pods."""
+
+    def scaled(deployments: list) -> bool:
+        return bool(deployments) and (deployments[0].status.replicas or 0) == replicas
+
+    return SettleCondition(
+        f"deployment {name} at {replicas} replicas",
+        "deployments",
+        scaled,
+        namespace,
+        field_selector=f"metadata.name={name}",
+    )
+
+
+def pods_replaced(
+    namespace: str,
+    description: str,
+    label_selector: str | None = None,
+    pod_filter: Callable | None = None,
+) -> SettleCondition:
+    """
+    Every pod matching the selector (and `pod_filter`) now is gone or terminating, and
+    at least one new matching pod exists. Whether the new pods get ready is up to the fault.
+    """
+
+    def matching(pods: list) -> list:
+        return [pod for pod in pods if pod_filter is None or pod_filter(pod)]
+
+    kwargs = {"label_selector": label_selector} if label_selector else {}
+    before = {pod.metadata.uid for pod in matching(_list("pods", namespace, **kwargs))}
+
+    def replaced(pods: list) -> bool:
+        pods = matching(pods)
+        if any(pod.metadata.uid in before and pod.metadata.deletion_timestamp is None for pod in pods):
+            return False
+        return any(pod.metadata.uid not in before for pod in pods)
+
+    return SettleCondition(f"replacement of {description}", "pods", replaced, namespace, label_selector=label_selector)
+
+
+def deployment_pods_replaced(namespace: str, name: str) -> SettleCondition:
+    """pods_replaced() for the pods a Deployment selects."""
+    deployments = _list("deployments", namespace, field_selector=f"metadata.name={name}")
+    match_labels = (deployments[0].spec.selector.match_labels or {}) if deployments else {}
+    if not match_labels:
+        raise ValueError(f"Deployment {name} in {namespace} not found or has no matchLabels selector")
+    selector = ",".join(f"{key}={value}" for key, value in match_labels.items())
+    return pods_replaced(namespace, f"pods of deployment {name}", label_selector=selector)
+
+
+def object_deleted(kind: str, namespace: str, name: str) -> SettleCondition:
+    return SettleCondition(
+        f"deletion of {kind[:-1]} {name}",
+        kind,
+        lambda objects: not objects,
+        namespace,
+        field_selector=f"metadata.name={name}",
+    )
+
+
+def endpoints_emptied(namespace: str, service: str) -> SettleCondition:
+    """The Service no longer routes to any ready pod."""
+
+    def emptied(endpoints: list) -> bool:
+        return not any(subset.addresses for endpoint in endpoints for subset in endpoint.subsets or [])
+
+    return SettleCondition(
+        f"removal of the endpoints of service {service}",
+        "endpoints",
+        emptied,
+        namespace,
+        field_selector=f"metadata.name={service}",
+    )
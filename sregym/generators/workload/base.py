@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
 
+from pydantic import ConfigDict
 from pydantic.dataclasses import dataclass
 
+from sregym.generators.workload.latency import LatencyHistogram
+
 # Two types of workload generators:
 # 1. Constantly running workload generator
 # 2. Workload generator that runs for a fixed duration
@@ -12,12 +15,13 @@ from pydantic.dataclasses import dataclass
 # 2. Validation
 
 
-@dataclass
+@dataclass(config=ConfigDict(arbitrary_types_allowed=True))
 class WorkloadEntry:
     time: float  # Start time of the workload run
     number: int  # Number of requests generated in this workload run
     log: str  # Log of the workload run
     ok: bool  # Indicates if the workload was successful
+    latency: LatencyHistogram | None = None  # Latency distribution of the run, if the generator reports one
 
 
 class WorkloadManager(ABC):
@@ -10,6 +10,7 @@ from sregym.generators.noise.impl.stress_injector import ChaosInjector
 from sregym.generators.workload.base import WorkloadEntry
 from sregym.generators.workload.stream import StreamWorkloadManager
 from sregym.paths import TARGET_MICROSERVICES
+from sregym.service.waits import await_deleted
 
 # Mimicked the Wrk2 class
 
@@ -145,22 +146,10 @@ class BHotelWrk:
                 return
 
     def wait_for_job_deletion(self, job_name, namespace, sleep=2, max_wait=60):
-        """Wait for a Kubernetes Job to be deleted before proceeding."""
-        api_instance = client.BatchV1Api()
-        waited = 0
-
-        while waited < max_wait:
-            try:
-                api_instance.read_namespaced_job(name=job_name, namespace=namespace)
-                time.sleep(sleep)
-                waited += sleep
-            except client.exceptions.ApiException as e:
-                if e.status == 404:
-                    console.log(f"[bold green]Job '{job_name}' successfully deleted.")
-                    return
-                else:
-                    console.log(f"[red]Error checking job deletion: {e}")
-                    raise
+        """Wait for a Kubernetes Job to be deleted before proceeding (`sleep` is unused; kept for compatibility)."""
+        if await_deleted("jobs", job_name, namespace=namespace, timeout=max_wait).satisfied:
+            console.log(f"[bold green]Job '{job_name}' successfully deleted.")
+            return
 
         raise TimeoutError(f"[red]Timed out waiting for job '{job_name}' to be deleted.")
 
@@ -241,41 +230,46 @@ class BHotelWrkWorkloadManager(StreamWorkloadManager):
             ok=ok,
         )
 
-    def retrievelog(self) -> list[WorkloadEntry]:
-        namespace = self.namespace
-        grouped_logs = []
-        pods = self.core_v1_api.list_namespaced_pod(namespace, label_selector=f"job-name={self.job_name}")
-        if len(pods.items) == 0:
-            raise Exception(f"No pods found for job {self.job_name} in namespace {namespace}")
+    def log_pod(self) -> str | None:
+        pods = self.core_v1_api.list_namespaced_pod(self.namespace, label_selector=f"job-name={self.job_name}")
+        return pods.items[0].metadata.name if pods.items else None
+
+    def parse_log_line(self, timestamp: str, content: str) -> list[WorkloadEntry]:
+        # A run's report starts at "Finished all requests" and ends before "End of latency distribution"
+        if "Finished all requests" in content:
+            self.log_pool = [content]
+            return []
+        if not self.log_pool:
+            return []
+        if "End of latency distribution" in content:
+            entry = self._parse_log(self.log_pool)
+            self.log_pool = []
+            return [entry]
+        self.log_pool.append(content)
+        return []
+
+    def retrievelog(self, start_time: float | None = None) -> list[WorkloadEntry]:
+        """
+        Entries in the log of the workload job newer than start_time (a pod timestamp).
+        Callers wait for the job to complete first, so the log is read in one request
+        rather than followed.
+        """
+        pod = self.log_pod()
+        if pod is None:
+            raise Exception(f"No pods found for job {self.job_name} in namespace {self.namespace}")
 
         try:
-            logs = self.core_v1_api.read_namespaced_pod_log(pods.items[0].metadata.name, namespace)
-            logs = logs.split("\n")
+            logs = self.core_v1_api.read_namespaced_pod_log(pod, self.namespace, timestamps=True)
         except Exception as e:
             logger.error(f"Error retrieving logs from {self.job_name} : {e}")
             return []
 
-        extracted_logs = self._extract_target_logs(
-            logs, startlog="Finished all requests", endlog="End of latency distribution"
-        )
-        grouped_logs.append(self._parse_log(extracted_logs))
-        return grouped_logs
-
-    def _extract_target_logs(self, logs: list[str], startlog: str, endlog: str) -> list[str]:
-        start_index = None
-        end_index = None
-
-        for i, log_line in enumerate(logs):
-            if startlog in log_line:
-                start_index = i
-            elif endlog in log_line and start_index is not None:
-                end_index = i
-                break
-
-        if start_index is not None and end_index is not None:
-            return logs[start_index:end_index]
-
-        return []
+        self.log_pool = []
+        entries = []
+        for line in logs.splitlines():
+            timestamp, _, content = line.partition(" ")
+            entries.extend(self.parse_log_line(timestamp, content))
+        return [entry for entry in entries if start_time is None or entry.time > start_time]
 
     def _run_cpu_containment_sequence(self):
         """
@@ -506,6 +500,7 @@ class BHotelWrkWorkloadManager(StreamWorkloadManager):
 
     def stop(self):
         logger.info("Stop Workload with Blueprint Hotel Workload Manager")
+        self.stop_following()
         if self.continuous:
             self.wrk.delete_bhotelwrk_deployment(deployment_name=self.deployment_name, namespace=self.namespace)
         else:
@@ -0,0 +1,121 @@
+"""
+Latency histograms built from wrk2's HdrHistogram output.
+
+wrk2 run with --latency (-L) prints, after each round, the "Detailed Percentile
+spectrum" of its recorded latencies, i.e. corrected for coordinated omission:
+one row per percentile tick with the latency value (ms) and the cumulative
+request count. parse_wrk2_spectrum() turns that into a LatencyHistogram, whose
+log-linear buckets can be merged across rounds to answer percentile queries over
+any window of entries.
+"""
+
+import math
+import re
+from collections.abc import Iterable
+
+# Relative width of a bucket; percentiles are reported within this relative error
+BUCKET_PRECISION = 0.01
+_LOG_BASE = math.log1p(BUCKET_PRECISION)
+# Zero latencies (below wrk2's resolution) sort before every other bucket
+_ZERO_BUCKET = -(10**9)
+
+_SPECTRUM_ROW = re.compile(r"^\s*([\d.]+)\s+([\d.]+)\s+(\d+)\s+(?:[\d.]+|inf)\s*$")
+
+
+class LatencyHistogram:
+    """Mergeable latency histogram (milliseconds) with buckets BUCKET_PRECISION wide on a log scale."""
+
+    def __init__(self, counts: dict[int, int] | None = None):
+        # bucket index -> requests
+        self.counts: dict[int, int] = dict(counts or {})
+
+    @staticmethod
+    def _bucket(value: float) -> int:
+        if value <= 0:
+            return _ZERO_BUCKET
+        return math.floor(math.log(value) / _LOG_BASE)
+
+    @staticmethod
+    def _value(bucket: int) -> float:
+        """Upper edge of a bucket, so a percentile never under-reports (as HdrHistogram does)."""
+        if bucket == _ZERO_BUCKET:
+            return 0.0
+        return math.exp((bucket + 1) * _LOG_BASE)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def record(self, value: float, count: int = 1):
+        if count > 0:
+            bucket = self._bucket(value)
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        return self
+
+    @classmethod
+    def merged(cls, histograms: Iterable["LatencyHistogram | None"]) -> "LatencyHistogram":
+        result = cls()
+        for histogram in histograms:
+            if histogram is not None:
+                result.merge(histogram)
+        return result
+
+    def percentile(self, percentile: float) -> float | None:
+        """Latency (ms) at or below which `percentile` percent of requests completed; None when empty."""
+        total = self.total
+        if not total:
+            return None
+        target = max(1, math.ceil(total * percentile / 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= target:
+                return self._value(bucket)
+        return self._value(max(self.counts))
+
+    def to_dict(self) -> dict[str, int]:
+        return {str(bucket): count for bucket, count in self.counts.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, int]) -> "LatencyHistogram":
+        return cls({int(bucket): count for bucket, count in data.items()})
+
+    def __repr__(self) -> str:
+        if not self.counts:
+            return "LatencyHistogram(empty)"
+        return (
+            f"LatencyHistogram(n={self.total}, p50={self.percentile(50):.2f}ms, "
+            f"p99={self.percentile(99):.2f}ms, max={self.percentile(100):.2f}ms)"
+        )
+
+
+def parse_wrk2_spectrum(lines: list[str]) -> LatencyHistogram | None:
+    """
+    Histogram of the recorded (corrected) latency spectrum in one wrk2 round's
+    output, or None if the round has none (wrk2 run without --latency).
+    """
+    histogram = None
+    section = None
+    previous_count = 0
+    for line in lines:
+        if "HdrHistogram - " in line:
+            # "Recorded Latency" is corrected for coordinated omission; -U adds an "Uncorrected Latency" section
+            section = "recorded" if "Recorded Latency" in line else "other"
+        elif "Detailed Percentile spectrum" in line and section == "recorded":
+            histogram = LatencyHistogram()
+            previous_count = 0
+        elif histogram is not None and section == "recorded":
+            if line.lstrip().startswith("#[") or line.startswith("-" * 10):
+                section = "done"
+                continue
+            match = _SPECTRUM_ROW.match(line)
+            if match:
+                # The requests between two ticks took at most the later tick's value
+                value, total_count = float(match.group(1)), int(match.group(3))
+                histogram.record(value, total_count - previous_count)
+                previous_count = max(previous_count, total_count)
+    return histogram
@@ -1,22 +1,24 @@
 import contextlib
 import json
 import logging
-import math
-import time
 from datetime import datetime
 
 import yaml
-from kubernetes import client, config, stream
+from kubernetes import client, config
 
 from sregym.generators.workload.base import WorkloadEntry
-from sregym.generators.workload.stream import STREAM_WORKLOAD_EPS, StreamWorkloadManager
+from sregym.generators.workload.stream import StreamWorkloadManager
 from sregym.paths import BASE_DIR
 from sregym.service.kubectl import KubeCtl
+from sregym.service.waits import await_condition
 
 logger = logging.getLogger("all.infra.workload")
 logger.propagate = True
 logger.setLevel(logging.DEBUG)
 
+# Maximum seconds to wait for the locust-fetcher pod to become ready or go away
+FETCHER_WAIT_TIMEOUT = 300
+
 
 class LocustWorkloadManager(StreamWorkloadManager):
     def __init__(self, namespace: str, locust_url: str):
@@ -25,8 +27,8 @@ class LocustWorkloadManager(StreamWorkloadManager):
         self.namespace = namespace
         self.locust_url = locust_url
 
+        # Lines of the round being read
         self.log_pool = []
-        self.last_log_line_time = None
 
         config.load_kube_config()
         self.core_v1_api = client.CoreV1Api()
@@ -43,13 +45,16 @@ class LocustWorkloadManager(StreamWorkloadManager):
                     namespace=self.namespace,
                     body=client.V1DeleteOptions(grace_period_seconds=0, propagation_policy="Background"),
                 )
-                while True:
-                    time.sleep(5)
-                    pods = self.core_v1_api.list_namespaced_pod(
-                        namespace=self.namespace, label_selector="app=locust-fetcher"
-                    )
-                    if not pods.items:
-                        break
+                result = await_condition(
+                    "pods",
+                    lambda pods: not pods,
+                    namespace=self.namespace,
+                    label_selector="app=locust-fetcher",
+                    timeout=FETCHER_WAIT_TIMEOUT,
+                    description="locust-fetcher pod deletion",
+                )
+                if not result.satisfied:
+                    print(f"locust-fetcher pod still present after {FETCHER_WAIT_TIMEOUT}s")
         except client.exceptions.ApiException as e:
             if e.status != 404:
                 print(f"Error removing pod: {e}")
@@ -73,16 +78,25 @@ class LocustWorkloadManager(StreamWorkloadManager):
                 body=job_template,
             )
             print("Waiting for locust-fetcher pod to be created...")
-            while True:
-                pod = self.core_v1_api.read_namespaced_pod_status(
-                    name="locust-fetcher",
-                    namespace=self.namespace,
+
+            def fetcher_ready(pods) -> bool:
+                return any(
+                    cond.type == "Ready" and cond.status == "True"
+                    for pod in pods
+                    for cond in (pod.status.conditions or [])
                 )
-                conditions = pod.status.conditions or []
-                ready = any(cond.type == "Ready" and cond.status == "True" for cond in conditions)
-                if ready:
-                    break
-                time.sleep(5)
+
+            result = await_condition(
+                "pods",
+                fetcher_ready,
+                namespace=self.namespace,
+                field_selector="metadata.name=locust-fetcher",
+                timeout=FETCHER_WAIT_TIMEOUT,
+                description="locust-fetcher pod readiness",
+            )
+            if not result.satisfied:
+                print(f"locust-fetcher pod not ready after {FETCHER_WAIT_TIMEOUT}s")
+                return
             print("Pod locust-fetcher created.")
         except client.exceptions.ApiException as e:
             print(f"Error creating pod: {e}")
@@ -120,75 +134,35 @@ class LocustWorkloadManager(StreamWorkloadManager):
             ok=not has_error,
         )
 
-    def retrievelog(self, start_time: float | None = None) -> list[WorkloadEntry]:
+    def log_pod(self) -> str | None:
         pods = self.core_v1_api.list_namespaced_pod(self.namespace, label_selector="app=locust-fetcher")
+        return pods.items[0].metadata.name if pods.items else None
 
-        if len(pods.items) == 0:
-            raise Exception(f"No load-generator found in namespace {self.namespace}")
-
-        kwargs = {
-            "timestamps": True,
-        }
-        if start_time is not None:
-            resp = stream.stream(
-                self.core_v1_api.connect_get_namespaced_pod_exec,
-                name=pods.items[0].metadata.name,
-                namespace=self.namespace,
-                command=["date", "-Ins"],
-                stderr=True,
-                stdin=False,
-                stdout=True,
-                tty=False,
-            )
-
-            shorter = resp.strip()[:26]
-            pod_current_time = datetime.strptime(shorter, "%Y-%m-%dT%H:%M:%S,%f").timestamp()
-            # Use the difference between pod's current time and requested start_time
-            kwargs["since_seconds"] = math.ceil(pod_current_time - start_time) + STREAM_WORKLOAD_EPS
-
-        try:
-            logs = self.core_v1_api.read_namespaced_pod_log(pods.items[0].metadata.name, self.namespace, **kwargs)
-            logs = logs.split("\n")
-        except Exception as e:
-            print(f"Error retrieving logs from {self.job_name} : {e}")
-            return []
-
-        for log in logs:
-            timestamp = log[0:30]
-            content = log[31:]
-
-            # last_log_line_time: in string format, e.g. "2025-01-01T12:34:56.789012345Z"
-            if self.last_log_line_time is not None and timestamp <= self.last_log_line_time:
-                continue
-
-            self.last_log_line_time = timestamp
-            self.log_pool.append(dict(time=timestamp, content=content))
-
-        grouped_logs = []
-
-        last_end = 0
-        for i, log in enumerate(self.log_pool):
-            if "Running Locust on round #" in log["content"]:
+    def parse_log_line(self, timestamp: str, content: str) -> list[WorkloadEntry]:
+        # Each round starts with "Running Locust on round #", which completes the previous one
+        entries = []
+        if "Running Locust on round #" in content:
+            if self.log_pool:
                 with contextlib.suppress(Exception):
                     # Skip initialization logs and json parsing errors
-                    grouped_logs.append(self._parse_log(self.log_pool[last_end:i]))
-                last_end = i
-
-        self.log_pool = self.log_pool[last_end:]
-
-        return grouped_logs
+                    entries.append(self._parse_log(self.log_pool))
+            self.log_pool = []
+        self.log_pool.append(dict(time=timestamp, content=content))
+        return entries
 
     def start(self):
         logger.info("Start Workload with Locust")
         logger.info("AstronomyShop has a built-in load generator.")
         logger.info("Creating locust-fetcher pod...")
         self.create_fetcher()
+        self.start_following()
         logger.debug("Workload started")
 
     def stop(self):
         logger.info("Stop Workload with Locust")
         logger.info("AstronomyShop's built-in load generator is automatically managed.")
         logger.info("Removing locust-fetcher pod if it exists...")
+        self.stop_following()
         self.remove_fetcher()
         logger.debug("Workload stopped")
 
@@ -1,93 +1,167 @@
+import itertools
+import logging
+import math
+import threading
 import time
 from abc import abstractmethod
 from bisect import bisect_left
+from collections import deque
+
+from kubernetes.watch.watch import iter_resp_lines
 
 from sregym.generators.workload.base import WorkloadEntry, WorkloadManager
 
+logger = logging.getLogger("all.infra.workload")
+
 STREAM_WORKLOAD_TIMEOUT = 60 * 1.5  # 1.5 minutes
-STREAM_WORKLOAD_EPS = 10  # 5 seconds
+STREAM_WORKLOAD_EPS = 10  # seconds of overlap when re-opening the log stream
+STREAM_WORKLOAD_BUFFER = 4096  # entries kept in memory, hours of wrk2/locust rounds
+STREAM_RECONNECT_INTERVAL = 5  # seconds between attempts to (re)open the log stream
 
 
 class StreamWorkloadManager(WorkloadManager):
     """
     Stream-like workload manager
+
+    A background thread follows the log of the workload pod (log_pod()) and feeds
+    each new line to parse_log_line(); the finished entries go into a bounded ring
+    buffer, so collect() and recent_entries() are in-memory lookups that return as
+    soon as enough requests have been reported.
     """
 
-    log_history: list[WorkloadEntry] = []
     last_log_time: float | None = None  # The timestamp inside the pod
 
-    def __init__(self):
+    def __init__(self, max_entries: int = STREAM_WORKLOAD_BUFFER):
         super().__init__()
 
         self.last_log_time = None
+        self.log_history: deque[WorkloadEntry] = deque(maxlen=max_entries)
+        self._appended = 0  # entries ever appended, so positions survive ring buffer eviction
+        self._new_entries = threading.Condition()
+
+        self._follower: threading.Thread | None = None
+        self._stop_following = threading.Event()
+        self._response = None
+        # Pod timestamp of the last line read (RFC 3339, compares as a string) and when it arrived
+        self._last_line_time: str | None = None
+        self._last_line_received: float | None = None
 
     @abstractmethod
-    def retrievelog(self, start_time: float | None = None) -> list[WorkloadEntry]:
+    def log_pod(self) -> str | None:
         """
-        Retrieve new logs. Like a stream, it should return only new logs since the last retrieval.
+        Name of the pod whose log carries the workload output, or None if it does not exist yet.
         """
-
         raise NotImplementedError("Subclasses must implement this method.")
 
-    def _extractlog(self):
+    @abstractmethod
+    def parse_log_line(self, timestamp: str, content: str) -> list[WorkloadEntry]:
         """
-        Stream-like log extraction.
+        Consume one log line; return the entries it completes (usually none).
         """
-        while True:
-            # In case of byte limits
-            new_logs = self.retrievelog(self.last_log_time)
-
-            if not new_logs:
-                return
-
-            if not sorted(new_logs, key=lambda x: x.time):
-                raise ValueError("Logs are not sorted by time.")
-
-            first_greater = 0
-            if self.last_log_time is not None:
-                while first_greater < len(new_logs) and new_logs[first_greater].time <= self.last_log_time:
-                    first_greater += 1
+        raise NotImplementedError("Subclasses must implement this method.")
 
-            if first_greater < len(new_logs):
-                self.log_history.extend(new_logs[first_greater:])
-                self.last_log_time = new_logs[-1].time
+    def retrievelog(self, start_time: float | None = None) -> list[WorkloadEntry]:
+        """
+        Buffered entries newer than start_time (a pod timestamp).
+        """
+        self.start_following()
+        with self._new_entries:
+            return [entry for entry in self.log_history if start_time is None or entry.time > start_time]
+
+    def start_following(self):
+        """Start the log follower thread if it is not running."""
+        if self._follower is not None and self._follower.is_alive():
+            return
+        self._stop_following.clear()
+        self._follower = threading.Thread(target=self._follow, name=f"{type(self).__name__}-log", daemon=True)
+        self._follower.start()
+
+    def stop_following(self):
+        self._stop_following.set()
+        response = self._response
+        if response is not None:
+            # Unblocks the follower, which is waiting for the next line
+            response.close()
+
+    def _follow(self):
+        while not self._stop_following.is_set():
+            try:
+                pod = self.log_pod()
+                if pod is not None:
+                    self._follow_pod(pod)
+            except Exception as e:
+                if not self._stop_following.is_set():
+                    logger.debug(f"Workload log stream interrupted: {e}")
+            self._stop_following.wait(STREAM_RECONNECT_INTERVAL)
+
+    def _follow_pod(self, pod: str):
+        kwargs = {"follow": True, "timestamps": True, "_preload_content": False}
+        if self._last_line_received is not None:
+            # Measured on our clock, so the pod's clock does not matter; the overlap is dropped below
+            kwargs["since_seconds"] = math.ceil(time.monotonic() - self._last_line_received) + STREAM_WORKLOAD_EPS
+        self._response = self.core_v1_api.read_namespaced_pod_log(pod, self.namespace, **kwargs)
+        # A re-opened stream starts with lines that were already read
+        replaying = self._last_line_time is not None
+        try:
+            for line in iter_resp_lines(self._response):
+                timestamp, _, content = line.partition(" ")
+                if replaying:
+                    if timestamp <= self._last_line_time:
+                        continue
+                    replaying = False
+                self._last_line_time = timestamp
+                self._last_line_received = time.monotonic()
+                entries = self.parse_log_line(timestamp, content)
+                if entries:
+                    self._append(entries)
+        finally:
+            self._response.release_conn()
+            self._response = None
+
+    def _append(self, entries: list[WorkloadEntry]):
+        with self._new_entries:
+            for entry in entries:
+                if self.last_log_time is not None and entry.time <= self.last_log_time:
+                    continue
+                self.log_history.append(entry)
+                self._appended += 1
+                self.last_log_time = entry.time
+            self._new_entries.notify_all()
+
+    def _entries_from(self, position: int) -> list[WorkloadEntry]:
+        """Entries from the given append position on; evicted ones are skipped. Call with the lock held."""
+        first = self._appended - len(self.log_history)
+        return list(itertools.islice(self.log_history, max(position - first, 0), None))
+
+    def _position_of(self, start_time: float) -> int:
+        """Append position of the first entry at or after start_time. Call with the lock held."""
+        index = bisect_left(self.log_history, start_time, key=lambda x: x.time)
+        return self._appended - len(self.log_history) + index
 
     def collect(self, number=100, since_seconds=None) -> list[WorkloadEntry]:
         """
         Run the workload generator until collected data is sufficient.
         """
-        if since_seconds is not None:
-            if not isinstance(since_seconds, (int, float)):
-                raise TypeError("since_seconds must be a int or float")
-            if since_seconds > self.last_log_time:
-                since_seconds = self.last_log_time
-
-        # I put it here becuase the first run of it may be very late
-        self._extractlog()
-
-        collect_start_time = time.time()
-
-        if since_seconds is None or self.last_log_time is None:
-            start_entry = len(self.log_history)
-        else:
-            start_entry = bisect_left(
-                self.log_history,
-                self.last_log_time - since_seconds,
-                key=lambda x: x.time if isinstance(x, WorkloadEntry) else x,
-            )
-
-        end_entry = start_entry
-
-        accumulated_logs = 0
-
-        while time.time() - collect_start_time < STREAM_WORKLOAD_TIMEOUT:
-            while end_entry < len(self.log_history):
-                accumulated_logs += self.log_history[end_entry].number
-                end_entry += 1
-            if accumulated_logs >= number:
-                return self.log_history[start_entry:end_entry]
-            time.sleep(5)
-            self._extractlog()
+        if since_seconds is not None and not isinstance(since_seconds, (int, float)):
+            raise TypeError("since_seconds must be a int or float")
+
+        self.start_following()
+        deadline = time.monotonic() + STREAM_WORKLOAD_TIMEOUT
+
+        with self._new_entries:
+            if since_seconds is None or self.last_log_time is None:
+                start = self._appended
+            else:
+                start = self._position_of(self.last_log_time - since_seconds)
+
+            while True:
+                entries = self._entries_from(start)
+                if sum(entry.number for entry in entries) >= number:
+                    return entries
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._new_entries.wait(remaining)
 
         raise TimeoutError("Workload generator did not collect enough data within the timeout period.")
 
@@ -95,11 +169,8 @@ class StreamWorkloadManager(WorkloadManager):
         """
         Return recently collected data within the given duration (seconds).
         """
-        self._extractlog()
-        start_time = self.last_log_time - duration
-        start_entry = bisect_left(
-            self.log_history,
-            start_time,
-            key=lambda x: x.time if isinstance(x, WorkloadEntry) else x,
-        )
-        return self.log_history[start_entry:]
+        self.start_following()
+        with self._new_entries:
+            if self.last_log_time is None:
+                return []
+            return self._entries_from(self._position_of(self.last_log_time - duration))
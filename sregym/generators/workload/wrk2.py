@@ -1,17 +1,18 @@
 import logging
-import math
 import textwrap
 import time
 from datetime import datetime
 from pathlib import Path
 
 import yaml
-from kubernetes import client, config, stream
+from kubernetes import client, config
 
 from logger import console
 from sregym.generators.workload.base import WorkloadEntry
-from sregym.generators.workload.stream import STREAM_WORKLOAD_EPS, StreamWorkloadManager
+from sregym.generators.workload.latency import parse_wrk2_spectrum
+from sregym.generators.workload.stream import StreamWorkloadManager
 from sregym.paths import BASE_DIR
+from sregym.service.waits import await_deleted
 
 logger = logging.getLogger("all.infra.workload")
 logger.propagate = True
@@ -52,7 +53,7 @@ class Wrk2:
             -s /scripts/{payload_script_path.name} \\
             {url} \\
             -R {str(self.rate)} \\
-            -L {"--latency" if self.latency else ""}
+            {"--latency" if self.latency else ""}
             sleep 1
         done
         """
@@ -160,22 +161,10 @@ class Wrk2:
                 return
 
     def wait_for_job_deletion(self, job_name, namespace, sleep=2, max_wait=60):
-        """Wait for a Kubernetes Job to be deleted before proceeding."""
-        api_instance = client.BatchV1Api()
-        waited = 0
-
-        while waited < max_wait:
-            try:
-                api_instance.read_namespaced_job(name=job_name, namespace=self.namespace)
-                time.sleep(sleep)
-                waited += sleep
-            except client.exceptions.ApiException as e:
-                if e.status == 404:
-                    console.log(f"[bold green]Job '{job_name}' successfully deleted.")
-                    return
-                else:
-                    console.log(f"[red]Error checking job deletion: {e}")
-                    raise
+        """Wait for a Kubernetes Job to be deleted before proceeding (`sleep` is unused; kept for compatibility)."""
+        if await_deleted("jobs", job_name, namespace=self.namespace, timeout=max_wait).satisfied:
+            console.log(f"[bold green]Job '{job_name}' successfully deleted.")
+            return
 
         raise TimeoutError(f"[red]Timed out waiting for job '{job_name}' to be deleted.")
 
@@ -197,11 +186,9 @@ class Wrk2WorkloadManager(StreamWorkloadManager):
         self.core_v1_api = client.CoreV1Api()
         self.batch_v1_api = client.BatchV1Api()
 
+        # Lines of the round being read
         self.log_pool = []
 
-        # different from self.last_log_time, which is the timestamp of the whole entry
-        self.last_log_line_time = None
-
     def create_task(self):
         configmap_name = "wrk2-payload-script"
 
@@ -248,79 +235,36 @@ class Wrk2WorkloadManager(StreamWorkloadManager):
             number = 0
             start_time = -1
 
+        contents = [part["content"] for part in logs]
         return WorkloadEntry(
             time=start_time,
             number=number,
-            log="\n".join([part["content"] for part in logs]),
+            log="\n".join(contents),
             ok=ok,
+            latency=parse_wrk2_spectrum(contents),
         )
 
-    def retrievelog(self, start_time: float | None = None) -> list[WorkloadEntry]:
+    def log_pod(self) -> str | None:
         pods = self.core_v1_api.list_namespaced_pod(self.namespace, label_selector=f"job-name={self.job_name}")
-        if len(pods.items) == 0:
-            raise Exception(f"No pods found for job {self.job_name} in namespace {self.namespace}")
-
-        kwargs = {
-            "timestamps": True,
-        }
-        if start_time is not None:
-            # Get the current time inside the pod by executing 'date +%s' in the pod
-            resp = stream.stream(
-                self.core_v1_api.connect_get_namespaced_pod_exec,
-                name=pods.items[0].metadata.name,
-                namespace=self.namespace,
-                command=["date", "-Ins"],
-                stderr=True,
-                stdin=False,
-                stdout=True,
-                tty=False,
-            )
-
-            # 2025-01-01T12:34:56,123456
-            shorter = resp.strip()[:26]
-            pod_current_time = datetime.strptime(shorter, "%Y-%m-%dT%H:%M:%S,%f").timestamp()
-            # Use the difference between pod's current time and requested start_time
-            kwargs["since_seconds"] = math.ceil(pod_current_time - start_time) + STREAM_WORKLOAD_EPS
-
-        try:
-            logs = self.core_v1_api.read_namespaced_pod_log(pods.items[0].metadata.name, self.namespace, **kwargs)
-            logs = logs.split("\n")
-        except Exception as e:
-            logger.error(f"Error retrieving logs from {self.job_name} : {e}")
-            return []
-
-        for log in logs:
-            timestamp = log[0:30]
-            content = log[31:]
+        return pods.items[0].metadata.name if pods.items else None
 
-            # last_log_line_time: in string format, e.g. "2025-01-01T12:34:56.789012345Z"
-            if self.last_log_line_time is not None and timestamp <= self.last_log_line_time:
-                continue
-
-            self.last_log_line_time = timestamp
-            self.log_pool.append(dict(time=timestamp, content=content))
-
-        # End pattern is:
+    def parse_log_line(self, timestamp: str, content: str) -> list[WorkloadEntry]:
+        # A round ends with:
         #   - Requests/sec:
         #   - Transfer/sec:
-
-        grouped_logs = []
-
-        last_end = 0
-        for i, log in enumerate(self.log_pool):
-            if (i > 0 and "Requests/sec:" in self.log_pool[i - 1]["content"]) and "Transfer/sec:" in log["content"]:
-                result = self._parse_log(self.log_pool[last_end : i + 1])
-                grouped_logs.append(result)
-                last_end = i + 1
-
-        self.log_pool = self.log_pool[last_end:]
-
-        return grouped_logs
+        self.log_pool.append(dict(time=timestamp, content=content))
+        if len(self.log_pool) > 1 and "Requests/sec:" in self.log_pool[-2]["content"] and "Transfer/sec:" in content:
+            entry = self._parse_log(self.log_pool)
+            self.log_pool = []
+            return [entry]
+        return []
 
     def start(self):
         logger.info("Start Workload with Wrk2")
         self.create_task()
+        self.start_following()
 
     def stop(self):
         logger.info("Stop Workload of Wrk2")
+        self.stop_following()
         self.wrk.stop_workload(job_name=self.job_name)
@@ -27,28 +27,28 @@ class Jaeger:
 
     def _ensure_namespace_ready(self, timeout: int = 120):
         """Ensure the observe namespace exists and is not terminating."""
-        from kubernetes import client as k8s_client
-        from kubernetes.client.rest import ApiException
+        from sregym.service.waits import await_condition
 
-        core_v1 = k8s_client.CoreV1Api()
-        t0 = time.time()
-        while time.time() - t0 < timeout:
-            try:
-                ns = core_v1.read_namespace(name=self.namespace)
-                if ns.status.phase == "Active":
-                    return
-                logger.info(f"Namespace '{self.namespace}' is {ns.status.phase}, waiting...")
-            except ApiException as e:
-                if e.status == 404:
-                    # Namespace doesn't exist, create it
-                    logger.info(f"Creating namespace '{self.namespace}'")
-                    self.run_cmd(
-                        f"kubectl create namespace {self.namespace} --dry-run=client -o yaml | kubectl apply -f -"
-                    )
-                    return
-                raise
-            time.sleep(3)
-        raise RuntimeError(f"Namespace '{self.namespace}' not ready within {timeout}s")
+        def active_or_absent(namespaces) -> bool:
+            for ns in namespaces:
+                if ns.status.phase != "Active":
+                    logger.info(f"Namespace '{self.namespace}' is {ns.status.phase}, waiting...")
+                    return False
+            return True
+
+        result = await_condition(
+            "namespaces",
+            active_or_absent,
+            field_selector=f"metadata.name={self.namespace}",
+            timeout=timeout,
+            description=f"namespace '{self.namespace}' to be active",
+        )
+        if not result.satisfied:
+            raise RuntimeError(f"Namespace '{self.namespace}' not ready within {timeout}s")
+        if result.object is None:
+            # Namespace doesn't exist, create it
+            logger.info(f"Creating namespace '{self.namespace}'")
+            self.run_cmd(f"kubectl create namespace {self.namespace} --dry-run=client -o yaml | kubectl apply -f -")
 
     def wait_for_service(self, service: str, timeout: int = 60):
         """Wait until the Jaeger service exists in Kubernetes."""
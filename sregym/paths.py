@@ -10,7 +10,8 @@ TARGET_MICROSERVICES = BASE_PARENT_DIR / "SREGym-applications"
 
 # Cache directories
 CACHE_DIR = HOME_DIR / "cache_dir"
-LLM_CACHE_FILE = CACHE_DIR / "llm_cache.json"
+LLM_CACHE_DIR = CACHE_DIR / "llm_cache"
+JUDGE_VERDICT_CACHE_DIR = CACHE_DIR / "judge_verdicts"
 
 # Cluster baseline state snapshot (captured from a fresh cluster)
 CLUSTER_BASELINE_STATE_FILE = CACHE_DIR / "cluster_baseline_state.json"
@@ -0,0 +1,85 @@
+"""
+Append-only journal of benchmark attempt results.
+
+The driver appends one JSON line per finished attempt and fsyncs it, so a crash
+loses at most the attempt that was running. The CSVs people read are
+materialized from the journal (compact()) instead of being rewritten after
+every attempt, and --resume reads the journal directly.
+"""
+
+import csv
+import json
+import logging
+import os
+from collections import Counter
+from pathlib import Path
+
+logger = logging.getLogger("all.sregym.results_journal")
+
+
+def write_results_csv(path: str | Path, rows: list[dict]):
+    """Write result rows to a CSV whose columns are the union of all row keys."""
+    fieldnames = sorted({key for row in rows for key in row})
+    with open(path, "w", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_results(path: str | Path) -> list[dict]:
+    """Rows of a results journal (.jsonl) or of a results CSV written from one."""
+    path = Path(path)
+    if path.suffix == ".jsonl":
+        return ResultsJournal(path).rows()
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def completed_attempts(rows: list[dict]) -> Counter[str]:
+    """Attempts per problem that ran to completion; an attempt whose deploy failed does not count."""
+    return Counter(
+        row["problem_id"] for row in rows if str(row.get("deploy_failed") or "").lower() not in ("true", "1")
+    )
+
+
+class ResultsJournal:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._tail_checked = False
+
+    def append(self, row: dict):
+        """Durably record one attempt's results."""
+        line = json.dumps(row, default=str) + "\n"
+        if not self._tail_checked:
+            # A crash mid-append leaves a torn last line; start on a fresh one
+            if self.path.exists() and self.path.stat().st_size:
+                with open(self.path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        line = "\n" + line
+            self._tail_checked = True
+        with open(self.path, "a") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def rows(self) -> list[dict]:
+        if not self.path.exists():
+            return []
+        rows = []
+        with open(self.path) as f:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Torn by a crash in the middle of append(); that attempt is simply not recorded
+                    logger.warning(f"Ignoring incomplete line {lineno} of {self.path}")
+        return rows
+
+    def compact(self, csv_path: str | Path, extra_rows: list[dict] | None = None) -> list[dict]:
+        """Materialize the journal (after extra_rows, e.g. resumed ones) as a CSV. Returns the rows written."""
+        rows = [*(extra_rows or []), *self.rows()]
+        write_results_csv(csv_path, rows)
+        return rows
@@ -0,0 +1,395 @@
+"""
+Snapshot-and-restore reset for a deployed application.
+
+Deleting an app's namespace after every problem and redeploying it for the next
+one is the largest per-problem cost when consecutive problems share an app.
+Instead, AppSnapshotManager.capture() records every top-level object in the
+app's namespaces right after its first healthy deploy: the manifest as the API
+server returned it, its resourceVersion and a hash of everything but its status.
+restore() lists the live objects again and only touches what drifted. Objects
+whose resourceVersion moved and whose hash no longer matches are replaced, or
+deleted and recreated when the change is to an immutable field. Missing objects
+are created. Objects that were not there at capture time (workload jobs, chaos
+resources, whatever the agent created) are deleted. Finally it waits for the
+Deployments and StatefulSets to roll out again.
+
+Objects owned by another object (ReplicaSets, Pods, EndpointSlices, ...) are
+left to their controllers. Data inside volumes is not part of the snapshot, so
+a problem's recover_fault() still has to undo what its fault changed there.
+"""
+
+import contextlib
+import copy
+import hashlib
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from kubernetes import client, dynamic
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import ConflictError, NotFoundError
+from kubernetes.dynamic.resource import Resource, ResourceList
+
+from sregym.service.waits import await_condition
+
+logger = logging.getLogger("all.infra.app_snapshot")
+logger.propagate = True
+logger.setLevel(logging.DEBUG)
+
+# Kinds maintained by controllers or the API server rather than by the app's manifests
+MANAGED_KINDS = frozenset({"Event", "Endpoints", "EndpointSlice", "Lease"})
+# Objects every namespace gets automatically
+MANAGED_OBJECTS = frozenset({("ConfigMap", "kube-root-ca.crt")})
+# Metadata the API server maintains; left out of manifests and hashes
+SERVER_METADATA = (
+    "uid",
+    "resourceVersion",
+    "generation",
+    "creationTimestamp",
+    "managedFields",
+    "selfLink",
+    "deletionTimestamp",
+    "deletionGracePeriodSeconds",
+)
+SERVER_ANNOTATIONS = ("deployment.kubernetes.io/revision",)
+# Annotations a PVC gets when it is bound, which must not be carried over to a new claim
+PVC_BINDING_ANNOTATIONS = ("pv.kubernetes.io/", "volume.kubernetes.io/", "volume.beta.kubernetes.io/")
+# Labels and selector the Job controller generates from the Job's uid
+JOB_GENERATED_LABELS = (
+    "controller-uid",
+    "job-name",
+    "batch.kubernetes.io/controller-uid",
+    "batch.kubernetes.io/job-name",
+)
+
+# Creation order (Helm's install order, namespaced kinds only); unlisted kinds (custom resources) come last
+KIND_ORDER = [
+    "NetworkPolicy",
+    "ResourceQuota",
+    "LimitRange",
+    "PodDisruptionBudget",
+    "ServiceAccount",
+    "Secret",
+    "ConfigMap",
+    "PersistentVolumeClaim",
+    "Role",
+    "RoleBinding",
+    "Service",
+    "DaemonSet",
+    "Pod",
+    "ReplicationController",
+    "ReplicaSet",
+    "Deployment",
+    "HorizontalPodAutoscaler",
+    "StatefulSet",
+    "Job",
+    "CronJob",
+    "Ingress",
+]
+# Resource kinds listed at once while taking or diffing a snapshot
+LIST_CONCURRENCY = 8
+# How long a restore waits for an object to be deleted, and for the workloads to roll out
+RESTORE_TIMEOUT_SECONDS = 300
+# Replacements of one object that may conflict with a controller writing to it (e.g. its status)
+REPLACE_ATTEMPTS = 5
+
+# (namespace, apiVersion, kind, name)
+ResourceKey = tuple[str, str, str, str]
+
+
+def resource_key(obj: dict) -> ResourceKey:
+    metadata = obj["metadata"]
+    return metadata.get("namespace") or "", obj["apiVersion"], obj["kind"], metadata["name"]
+
+
+def describe(key: ResourceKey) -> str:
+    namespace, _, kind, name = key
+    return f"{kind} {namespace}/{name}"
+
+
+def is_app_object(obj: dict) -> bool:
+    """True for the objects a snapshot covers: the top-level ones the app's manifests define."""
+    metadata = obj["metadata"]
+    if metadata.get("ownerReferences") or obj["kind"] in MANAGED_KINDS:
+        return False
+    if (obj["kind"], metadata["name"]) in MANAGED_OBJECTS:
+        return False
+    return not (obj["kind"] == "Secret" and obj.get("type") == "kubernetes.io/service-account-token")
+
+
+def manifest(obj: dict) -> dict:
+    """The object without its status and the metadata the API server maintains."""
+    result = copy.deepcopy(obj)
+    result.pop("status", None)
+    metadata = result["metadata"]
+    for key in SERVER_METADATA:
+        metadata.pop(key, None)
+    annotations = metadata.get("annotations") or {}
+    for key in SERVER_ANNOTATIONS:
+        annotations.pop(key, None)
+    if not annotations:
+        metadata.pop("annotations", None)
+    return result
+
+
+def spec_hash(obj: dict) -> str:
+    return hashlib.sha256(json.dumps(manifest(obj), sort_keys=True).encode()).hexdigest()
+
+
+def creatable(body: dict) -> dict:
+    """A captured manifest that can be created again: without the fields assigned at its first creation."""
+    body = copy.deepcopy(body)
+    kind = body["kind"]
+    spec = body.get("spec") or {}
+    if kind == "Service" and spec.get("clusterIP") != "None":
+        spec.pop("clusterIP", None)
+        spec.pop("clusterIPs", None)
+    elif kind == "PersistentVolumeClaim":
+        spec.pop("volumeName", None)
+        annotations = body["metadata"].get("annotations") or {}
+        for key in [key for key in annotations if key.startswith(PVC_BINDING_ANNOTATIONS)]:
+            del annotations[key]
+    elif kind == "Job" and not spec.get("manualSelector"):
+        spec.pop("selector", None)
+        labels = (spec.get("template") or {}).get("metadata", {}).get("labels") or {}
+        for key in JOB_GENERATED_LABELS:
+            labels.pop(key, None)
+    return body
+
+
+def _kind_rank(key: ResourceKey) -> tuple[int, ResourceKey]:
+    kind = key[2]
+    return (KIND_ORDER.index(kind) if kind in KIND_ORDER else len(KIND_ORDER)), key
+
+
+@dataclass
+class SnapshotEntry:
+    resource_version: str
+    spec_hash: str
+    manifest: dict
+
+
+@dataclass
+class AppSnapshot:
+    """The objects in an app's namespaces right after it was deployed."""
+
+    # Identifies the app and its deploy inputs; a snapshot only restores the app it was taken of
+    app_key: str
+    namespaces: list[str]
+    entries: dict[ResourceKey, SnapshotEntry] = field(default_factory=dict)
+    captured_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class RestorePlan:
+    unchanged: list[ResourceKey] = field(default_factory=list)
+    # Drifted: replaced in place, or recreated if the change cannot be applied
+    update: list[ResourceKey] = field(default_factory=list)
+    # Being deleted: recreated once gone
+    recreate: list[ResourceKey] = field(default_factory=list)
+    create: list[ResourceKey] = field(default_factory=list)
+    delete: list[ResourceKey] = field(default_factory=list)
+
+
+def plan_restore(snapshot: AppSnapshot, live: dict[ResourceKey, dict]) -> RestorePlan:
+    """What it takes to turn the live objects back into the snapshot."""
+    plan = RestorePlan()
+    for key, entry in snapshot.entries.items():
+        obj = live.get(key)
+        if obj is None:
+            plan.create.append(key)
+        elif obj["metadata"].get("deletionTimestamp"):
+            plan.recreate.append(key)
+        elif obj["metadata"].get("resourceVersion") == entry.resource_version or spec_hash(obj) == entry.spec_hash:
+            # Status updates move the resourceVersion too, hence the hash
+            plan.unchanged.append(key)
+        else:
+            plan.update.append(key)
+    plan.delete = [
+        key for key, obj in live.items() if key not in snapshot.entries and not obj["metadata"].get("deletionTimestamp")
+    ]
+    return plan
+
+
+def _rolled_out(workloads: list) -> bool:
+    """True once every Deployment or StatefulSet runs only ready pods of its current spec."""
+    for workload in workloads:
+        replicas = 1 if workload.spec.replicas is None else workload.spec.replicas
+        status = workload.status
+        if (status.observed_generation or 0) < (workload.metadata.generation or 0):
+            return False
+        if (status.updated_replicas or 0) < replicas or (status.ready_replicas or 0) < replicas:
+            return False
+        if (status.replicas or 0) > replicas:
+            return False
+    return True
+
+
+class AppSnapshotManager:
+    """Captures the objects in an app's namespaces and restores them (see the module docstring)."""
+
+    def __init__(self, api_client: client.ApiClient | None = None):
+        self.api_client = api_client
+        self._dynamic: dynamic.DynamicClient | None = None
+
+    @property
+    def dynamic(self) -> dynamic.DynamicClient:
+        if self._dynamic is None:
+            self._dynamic = dynamic.DynamicClient(self.api_client or client.ApiClient())
+        return self._dynamic
+
+    def _resources(self) -> list[Resource]:
+        """The namespaced resource kinds (preferred versions) an app can define objects of."""
+        resources = []
+        for resource in self.dynamic.resources.search():
+            if isinstance(resource, ResourceList) or not resource.namespaced or not resource.preferred:
+                continue
+            if resource.kind in MANAGED_KINDS or not {"list", "create", "update", "delete"} <= set(
+                resource.verbs or ()
+            ):
+                continue
+            resources.append(resource)
+        return resources
+
+    def _resource(self, key: ResourceKey) -> Resource:
+        _, api_version, kind, _ = key
+        return self.dynamic.resources.get(api_version=api_version, kind=kind)
+
+    def list_objects(self, namespaces: list[str]) -> dict[ResourceKey, dict]:
+        """The app objects (see is_app_object()) in the given namespaces, as dicts."""
+
+        def list_kind(resource: Resource, namespace: str) -> list[dict]:
+            try:
+                items = resource.get(namespace=namespace).items
+            except ApiException as e:
+                if e.status in (403, 404, 405):
+                    logger.debug(f"Cannot list {resource.kind} in {namespace}: {e.status}")
+                    return []
+                raise
+            objects = []
+            for item in items:
+                obj = item.to_dict()
+                # List items come without apiVersion and kind
+                obj.setdefault("apiVersion", resource.group_version)
+                obj.setdefault("kind", resource.kind)
+                objects.append(obj)
+            return objects
+
+        work = [(resource, namespace) for resource in self._resources() for namespace in namespaces]
+        with ThreadPoolExecutor(max_workers=LIST_CONCURRENCY) as executor:
+            results = list(executor.map(lambda args: list_kind(*args), work))
+        return {resource_key(obj): obj for objects in results for obj in objects if is_app_object(obj)}
+
+    def capture(self, app_key: str, namespaces: list[str]) -> AppSnapshot:
+        start = time.monotonic()
+        snapshot = AppSnapshot(app_key=app_key, namespaces=list(namespaces))
+        for key, obj in self.list_objects(namespaces).items():
+            snapshot.entries[key] = SnapshotEntry(
+                resource_version=obj["metadata"].get("resourceVersion", ""),
+                spec_hash=spec_hash(obj),
+                manifest=manifest(obj),
+            )
+        logger.info(
+            f"Captured {len(snapshot.entries)} objects in {', '.join(namespaces)} in {time.monotonic() - start:.1f}s"
+        )
+        return snapshot
+
+    def restore(self, snapshot: AppSnapshot, timeout: float = RESTORE_TIMEOUT_SECONDS) -> dict:
+        """
+        Bring the app's namespaces back to the snapshot and wait for its workloads to
+        roll out. Returns a summary of the changes; raises if an object cannot be
+        restored or the workloads do not become ready within `timeout`.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        live = self.list_objects(snapshot.namespaces)
+        plan = plan_restore(snapshot, live)
+        changes = {"unchanged": len(plan.unchanged), "updated": [], "recreated": [], "created": [], "deleted": []}
+
+        # Extra objects first, so what they hold (names, node ports, quota) is free again
+        for key in sorted(plan.delete, key=_kind_rank, reverse=True):
+            self._delete(key, propagation="Background")
+            changes["deleted"].append(describe(key))
+
+        for key in sorted(plan.update + plan.recreate + plan.create, key=_kind_rank):
+            entry = snapshot.entries[key]
+            if key in plan.update:
+                try:
+                    self._replace(key, entry, live[key])
+                    changes["updated"].append(describe(key))
+                    continue
+                except ApiException as e:
+                    if e.status != 422:
+                        raise
+                    logger.info(f"{describe(key)} cannot be updated in place, recreating it: {e.reason}")
+                self._delete(key, propagation="Foreground")
+            if key in live:
+                self._await_gone(key, deadline)
+                changes["recreated"].append(describe(key))
+            else:
+                changes["created"].append(describe(key))
+            self._resource(key).create(body=creatable(entry.manifest), namespace=key[0])
+
+        for namespace in snapshot.namespaces:
+            for kind in ("deployments", "statefulsets"):
+                result = await_condition(
+                    kind,
+                    _rolled_out,
+                    namespace=namespace,
+                    timeout=max(0.0, deadline - time.monotonic()),
+                    api_client=self.api_client,
+                    description=f"{kind} in {namespace} to roll out",
+                )
+                if not result.satisfied:
+                    raise TimeoutError(f"{kind} in {namespace} did not roll out within {timeout}s of the restore")
+
+        changes["seconds"] = round(time.monotonic() - start, 1)
+        logger.info(f"Restored {', '.join(snapshot.namespaces)} from its snapshot: {changes}")
+        return changes
+
+    def _replace(self, key: ResourceKey, entry: SnapshotEntry, obj: dict):
+        """
+        Replace the object with its captured manifest. The resourceVersion from the
+        listing is often stale by now (controllers keep writing status), so on a
+        conflict the object is read again and the replace retried.
+        """
+        namespace, _, _, name = key
+        resource = self._resource(key)
+        resource_version = obj["metadata"]["resourceVersion"]
+        for attempt in range(1, REPLACE_ATTEMPTS + 1):
+            body = copy.deepcopy(entry.manifest)
+            body["metadata"]["resourceVersion"] = resource_version
+            try:
+                resource.replace(body=body, namespace=namespace)
+                return
+            except ConflictError:
+                if attempt == REPLACE_ATTEMPTS:
+                    raise
+                logger.debug(f"{describe(key)} changed since it was listed, retrying the replace")
+            resource_version = resource.get(name=name, namespace=namespace).metadata.resourceVersion
+
+    def _delete(self, key: ResourceKey, propagation: str):
+        namespace, _, _, name = key
+        with contextlib.suppress(NotFoundError):
+            self._resource(key).delete(name=name, namespace=namespace, body={"propagationPolicy": propagation})
+
+    def _await_gone(self, key: ResourceKey, deadline: float):
+        namespace, _, _, name = key
+        resource = self._resource(key)
+        try:
+            obj = resource.get(name=name, namespace=namespace)
+        except NotFoundError:
+            return
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            for event in resource.watch(
+                namespace=namespace,
+                name=name,
+                resource_version=obj.metadata.resourceVersion,
+                timeout=max(1, int(remaining)),
+            ):
+                if event["type"] == "DELETED":
+                    return
+        raise TimeoutError(f"{describe(key)} was not deleted within the restore timeout")
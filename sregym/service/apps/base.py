@@ -1,13 +1,43 @@
 import json
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 
 from sregym.paths import TARGET_MICROSERVICES
 
+# Suffix appended to the namespace of every app constructed inside namespace_suffix(),
+# so several instances of the same app can run side by side on one cluster
+_namespace_suffix: ContextVar[str | None] = ContextVar("namespace_suffix", default=None)
+# Templated namespace -> the namespace in the app's metadata
+_base_namespaces: dict[str, str] = {}
+
+
+@contextmanager
+def namespace_suffix(suffix: str | None):
+    """Give apps (and so problems and their oracles) constructed in this block namespaces ending in -<suffix>."""
+    token = _namespace_suffix.set(suffix)
+    try:
+        yield
+    finally:
+        _namespace_suffix.reset(token)
+
+
+def current_namespace_suffix() -> str | None:
+    return _namespace_suffix.get()
+
+
+def base_namespace(namespace: str) -> str:
+    """The metadata namespace a (possibly templated) app namespace was derived from."""
+    return _base_namespaces.get(namespace, namespace)
+
 
 class Application:
     """Base class for all microservice applications."""
 
+    # False for apps that hard-code their namespace (their problems run exclusively instead)
+    namespace_templatable = True
+
     def _validated_path(self, path, label: str) -> Path:
         """Resolve *path* and raise FileNotFoundError with a clear message if it doesn't exist."""
         resolved = Path(path).expanduser().resolve()
@@ -35,9 +65,11 @@ class Application:
             metadata = json.load(file)
 
         self.name = metadata["Name"]
-        self.namespace = metadata["Namespace"]
+        self.namespace = self._templated(metadata["Namespace"])
         if "Helm Config" in metadata:
             self.helm_configs = metadata["Helm Config"]
+            if "namespace" in self.helm_configs:
+                self.helm_configs["namespace"] = self._templated(self.helm_configs["namespace"])
             chart_path = self.helm_configs.get("chart_path")
 
             if chart_path and not self.helm_configs.get("remote_chart", False):
@@ -50,6 +82,14 @@ class Application:
                 TARGET_MICROSERVICES / metadata["K8S Deploy Path"], "K8S deploy path"
             )
 
+    def _templated(self, namespace: str) -> str:
+        suffix = current_namespace_suffix()
+        if not suffix or not self.namespace_templatable:
+            return namespace
+        templated = f"{namespace}-{suffix}"
+        _base_namespaces[templated] = namespace
+        return templated
+
     def get_app_json(self) -> dict:
         """Get application metadata in JSON format.
 
@@ -69,7 +109,7 @@ class Application:
         """
         app_json = self.get_app_json()
         app_name = app_json.get("Name", "")
-        namespace = app_json.get("Namespace", "")
+        namespace = self.namespace or app_json.get("Namespace", "")
         desc = app_json.get("Desc", "")
         supported_operations = app_json.get("Supported Operations", [])
         operations_str = "\n".join([f"  - {op}" for op in supported_operations])
@@ -91,7 +91,7 @@ class HotelReservation(Application):
 
         self.kubectl.wait_for_namespace_deletion(self.namespace)
         pvs = self.kubectl.exec_command(
-            "kubectl get pv --no-headers | grep 'hotel-reservation' | awk '{print $1}'"
+            f"kubectl get pv --no-headers | grep ' {self.namespace}/' | awk '{{print $1}}'"
         ).splitlines()
 
         for pv in pvs:
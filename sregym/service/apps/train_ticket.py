@@ -12,6 +12,9 @@ from sregym.service.kubectl import KubeCtl
 
 
 class TrainTicket(Application):
+    # The deploy job and its waits are bound to the train-ticket namespace
+    namespace_templatable = False
+
     def __init__(self):
         super().__init__(str(TRAIN_TICKET_METADATA))
         self.load_app_json()
@@ -3,13 +3,19 @@
 import hashlib
 import json
 import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 
+from sregym.service.informer import stop_namespace_informers
 from sregym.service.kubectl import KubeCtl
+from sregym.service.waits import await_condition
 
 logger = logging.getLogger("all.infra.cluster_state")
 logger.propagate = True
@@ -22,6 +28,11 @@ logger.setLevel(logging.DEBUG)
 # every problem and the next noise injection silently fails.
 PROTECTED_NAMESPACES = frozenset({"kube-system", "kube-public", "kube-node-lease", "default", "sregym", "chaos-mesh"})
 
+# Maximum deletions in flight per resource kind during reconciliation
+DELETE_CONCURRENCY = 8
+# How long reconciliation waits for deleted namespaces and PVs to disappear
+TERMINATION_TIMEOUT_SECONDS = 300
+
 
 def _is_chaos_mesh_resource(name: str) -> bool:
     """True if the cluster-scoped resource (CRD / ClusterRole / RoleBinding /
@@ -119,6 +130,12 @@ class ClusterStateManager:
     def __init__(self, kubectl: KubeCtl):
         self.kubectl = kubectl
         self.baseline: ClusterBaseline | None = None
+        # Shared platform resources added on top of the baseline that reconciliation keeps (warm platform mode)
+        self.platform: ClusterBaseline | None = None
+        # An app kept deployed for the next problem (see sregym.service.app_snapshot) that reconciliation keeps
+        self.app: ClusterBaseline | None = None
+        # Seconds spent in each phase of the last reconcile_to_baseline()
+        self.phase_seconds: dict[str, float] = {}
 
         # Initialize Kubernetes API clients
         self.core_v1 = client.CoreV1Api()
@@ -133,22 +150,91 @@ class ClusterStateManager:
         Should be called after infrastructure is deployed but before any problems run.
         """
         logger.info("Capturing cluster baseline state...")
+        self.baseline = self._snapshot()
+        return self.baseline
+
+    def _snapshot(self) -> ClusterBaseline:
+        getters = {
+            "namespaces": self._get_namespaces,
+            "cluster_roles": self._get_cluster_roles,
+            "cluster_role_bindings": self._get_cluster_role_bindings,
+            "persistent_volumes": self._get_persistent_volumes,
+            "storage_classes": self._get_storage_classes,
+            "crds": self._get_crds,
+            "validating_webhook_configs": self._get_validating_webhook_configs,
+            "mutating_webhook_configs": self._get_mutating_webhook_configs,
+            "node_labels": self._get_node_labels,
+            "node_taints": self._get_node_taints,
+            "coredns_configmap_data": self._get_coredns_configmap_data,
+        }
+        with ThreadPoolExecutor(max_workers=len(getters)) as executor:
+            futures = {field_name: executor.submit(getter) for field_name, getter in getters.items()}
+            return ClusterBaseline(**{field_name: future.result() for field_name, future in futures.items()})
 
-        self.baseline = ClusterBaseline(
-            namespaces=self._get_namespaces(),
-            cluster_roles=self._get_cluster_roles(),
-            cluster_role_bindings=self._get_cluster_role_bindings(),
-            persistent_volumes=self._get_persistent_volumes(),
-            storage_classes=self._get_storage_classes(),
-            crds=self._get_crds(),
-            validating_webhook_configs=self._get_validating_webhook_configs(),
-            mutating_webhook_configs=self._get_mutating_webhook_configs(),
-            node_labels=self._get_node_labels(),
-            node_taints=self._get_node_taints(),
-            coredns_configmap_data=self._get_coredns_configmap_data(),
+    def record_platform_state(self, namespaces: set[str]) -> ClusterBaseline | None:
+        """
+        Whitelist the shared platform for reconciliation: the given namespaces plus the
+        cluster-scoped resources present now but not in the baseline. Should be called
+        right after the platform is deployed and before the problem's app is.
+        PersistentVolumes are only kept if they are bound to claims in those namespaces.
+        """
+        if self.baseline is None:
+            return None
+        current = self._snapshot()
+        base = self.baseline
+        self.platform = ClusterBaseline(
+            namespaces=set(namespaces),
+            cluster_roles=current.cluster_roles - base.cluster_roles,
+            cluster_role_bindings=current.cluster_role_bindings - base.cluster_role_bindings,
+            persistent_volumes=self._get_persistent_volumes_claimed_in(namespaces) - base.persistent_volumes,
+            storage_classes=current.storage_classes - base.storage_classes,
+            crds=current.crds - base.crds,
+            validating_webhook_configs=current.validating_webhook_configs - base.validating_webhook_configs,
+            mutating_webhook_configs=current.mutating_webhook_configs - base.mutating_webhook_configs,
         )
+        logger.info(f"Platform resources kept across problems: {self.platform.to_dict()}")
+        return self.platform
 
-        return self.baseline
+    def record_app_state(self, namespaces: set[str]) -> ClusterBaseline | None:
+        """
+        Whitelist a deployed app for reconciliation: its namespaces, the PersistentVolumes
+        bound to claims in them, and the cluster-scoped resources present now but neither
+        in the baseline nor in the platform whitelist. Should be called right after the
+        app is deployed and before any fault is injected.
+        """
+        if self.baseline is None:
+            return None
+        current = self._snapshot()
+        # Diffed against the baseline and platform only, not against a previously kept app
+        self.app = None
+        self.app = ClusterBaseline(
+            namespaces=set(namespaces),
+            cluster_roles=current.cluster_roles - self._expected("cluster_roles"),
+            cluster_role_bindings=current.cluster_role_bindings - self._expected("cluster_role_bindings"),
+            storage_classes=current.storage_classes - self._expected("storage_classes"),
+            crds=current.crds - self._expected("crds"),
+            validating_webhook_configs=current.validating_webhook_configs
+            - self._expected("validating_webhook_configs"),
+            mutating_webhook_configs=current.mutating_webhook_configs - self._expected("mutating_webhook_configs"),
+        )
+        logger.info(f"App resources kept across problems: {self.app.to_dict()}")
+        return self.app
+
+    def release_app_state(self):
+        """Stop keeping the app recorded by record_app_state(); the next reconciliation removes it."""
+        self.app = None
+
+    def _expected(self, attr: str) -> set[str]:
+        """Baseline names of a resource type, plus the whitelisted platform and app ones."""
+        expected = getattr(self.baseline, attr)
+        if self.platform is not None:
+            expected = expected | getattr(self.platform, attr)
+        if self.app is not None:
+            expected = expected | getattr(self.app, attr)
+            if attr == "persistent_volumes":
+                # Looked up every time: a restore may have replaced a claim and so its volume
+                expected = expected | self._get_persistent_volumes_claimed_in(self.app.namespaces)
+        return expected
 
     def save_baseline_state(self, path: Path) -> None:
         """
@@ -184,7 +270,14 @@ class ClusterStateManager:
     def reconcile_to_baseline(self) -> dict:
         """
         Reset cluster to baseline state.
-        Returns a summary of changes made.
+        Returns a summary of changes made; the time spent in each phase is kept in
+        self.phase_seconds.
+
+        The full diff is computed up front, then deletions are issued concurrently
+        (at most DELETE_CONCURRENCY in flight per resource kind). Ordering constraints
+        are kept as phases: CR finalizers are stripped before any CRD is deleted, and
+        the LocalPV sweep runs only once the deleted namespaces and PVs are gone,
+        which is awaited with one watch per kind rather than one wait per object.
         """
         if self.baseline is None:
             logger.warning("No baseline captured. Skipping reconciliation.")
@@ -204,150 +297,167 @@ class ClusterStateManager:
             "nodes_taints_reset": [],
             "coredns_reset": False,
         }
+        self.phase_seconds = {}
+
+        # 1. Diff: everything present now that is neither in the baseline nor whitelisted
+        with self._phase("diff"):
+            current = self._snapshot()
+            unexpected = {
+                "namespaces": current.namespaces - self._expected("namespaces") - PROTECTED_NAMESPACES,
+                "cluster_roles": {
+                    r
+                    for r in current.cluster_roles - self._expected("cluster_roles")
+                    # Skip system roles that may have been auto-created
+                    if not r.startswith(("system:", "kubeadm:")) and not _is_chaos_mesh_resource(r)
+                },
+                "cluster_role_bindings": {
+                    b
+                    for b in current.cluster_role_bindings - self._expected("cluster_role_bindings")
+                    if not b.startswith(("system:", "kubeadm:")) and not _is_chaos_mesh_resource(b)
+                },
+                "persistent_volumes": current.persistent_volumes - self._expected("persistent_volumes"),
+                "storage_classes": current.storage_classes - self._expected("storage_classes"),
+                "crds": {c for c in current.crds - self._expected("crds") if not _is_chaos_mesh_resource(c)},
+                "validating_webhook_configs": {
+                    w
+                    for w in current.validating_webhook_configs - self._expected("validating_webhook_configs")
+                    if not _is_chaos_mesh_resource(w)
+                },
+                "mutating_webhook_configs": {
+                    w
+                    for w in current.mutating_webhook_configs - self._expected("mutating_webhook_configs")
+                    if not _is_chaos_mesh_resource(w)
+                },
+            }
 
-        # 1. Delete unexpected namespaces
-        current_namespaces = self._get_namespaces()
-        unexpected_namespaces = current_namespaces - self.baseline.namespaces - PROTECTED_NAMESPACES
-        for ns in unexpected_namespaces:
-            logger.info(f"Deleting unexpected namespace: {ns}")
-            try:
-                self.kubectl.delete_namespace(ns)
-                changes["namespaces_deleted"].append(ns)
-            except Exception as e:
-                logger.warning(f"Failed to delete namespace {ns}: {e}")
-
-        # 2. Delete unexpected ClusterRoles
-        current_cluster_roles = self._get_cluster_roles()
-        unexpected_roles = current_cluster_roles - self.baseline.cluster_roles
-        for role in unexpected_roles:
-            # Skip system roles that may have been auto-created
-            if role.startswith("system:") or role.startswith("kubeadm:"):
-                continue
-            if _is_chaos_mesh_resource(role):
-                continue
-            logger.info(f"Deleting unexpected ClusterRole: {role}")
-            try:
-                self.rbac_v1.delete_cluster_role(name=role)
-                changes["cluster_roles_deleted"].append(role)
-            except ApiException as e:
-                if e.status != 404:
-                    logger.warning(f"Failed to delete ClusterRole {role}: {e}")
-
-        # 3. Delete unexpected ClusterRoleBindings
-        current_bindings = self._get_cluster_role_bindings()
-        unexpected_bindings = current_bindings - self.baseline.cluster_role_bindings
-        for binding in unexpected_bindings:
-            if binding.startswith("system:") or binding.startswith("kubeadm:"):
-                continue
-            if _is_chaos_mesh_resource(binding):
-                continue
-            logger.info(f"Deleting unexpected ClusterRoleBinding: {binding}")
-            try:
-                self.rbac_v1.delete_cluster_role_binding(name=binding)
-                changes["cluster_role_bindings_deleted"].append(binding)
-            except ApiException as e:
-                if e.status != 404:
-                    logger.warning(f"Failed to delete ClusterRoleBinding {binding}: {e}")
-
-        # 4. Delete unexpected PersistentVolumes
-        current_pvs = self._get_persistent_volumes()
-        unexpected_pvs = current_pvs - self.baseline.persistent_volumes
-        for pv in unexpected_pvs:
-            logger.info(f"Deleting unexpected PersistentVolume: {pv}")
-            try:
-                self.core_v1.delete_persistent_volume(name=pv)
-                changes["persistent_volumes_deleted"].append(pv)
-            except ApiException as e:
-                if e.status != 404:
-                    logger.warning(f"Failed to delete PersistentVolume {pv}: {e}")
+        # 2. Strip finalizers from CRs of the CRDs about to be deleted, so deletion cannot hang
+        with self._phase("finalizers"):
+            self._run_bounded(self._strip_cr_finalizers, sorted(unexpected["crds"]))
+
+        # 3. Issue every deletion concurrently, bounded per kind
+        deleters = {
+            "namespaces": ("Namespace", self.core_v1.delete_namespace),
+            "cluster_roles": ("ClusterRole", self.rbac_v1.delete_cluster_role),
+            "cluster_role_bindings": ("ClusterRoleBinding", self.rbac_v1.delete_cluster_role_binding),
+            "persistent_volumes": ("PersistentVolume", self.core_v1.delete_persistent_volume),
+            "storage_classes": ("StorageClass", self.storage_v1.delete_storage_class),
+            "crds": ("CRD", self.apiextensions_v1.delete_custom_resource_definition),
+            "validating_webhook_configs": (
+                "ValidatingWebhookConfiguration",
+                self.admission_v1.delete_validating_webhook_configuration,
+            ),
+            "mutating_webhook_configs": (
+                "MutatingWebhookConfiguration",
+                self.admission_v1.delete_mutating_webhook_configuration,
+            ),
+        }
+        with self._phase("delete"), ThreadPoolExecutor(max_workers=len(deleters)) as executor:
+            futures = {
+                attr: executor.submit(self._delete_all, label, delete, sorted(unexpected[attr]))
+                for attr, (label, delete) in deleters.items()
+            }
+            for attr, future in futures.items():
+                changes[f"{attr}_deleted"] = future.result()
+
+        # 4. Wait for the deletions that take a while (namespace contents, bound PVs) to finish
+        with self._phase("terminate"):
+            self._await_gone(
+                {
+                    "namespaces": set(changes["namespaces_deleted"]),
+                    "persistentvolumes": set(changes["persistent_volumes_deleted"]),
+                }
+            )
+            for namespace in changes["namespaces_deleted"]:
+                stop_namespace_informers(namespace)
 
         # 4b. Garbage-collect orphaned OpenEBS LocalPV hostpath dirs.
-        # The openebs namespace is itself "unexpected" and gets deleted in step 1
-        # above, which kills the openebs-localpv-provisioner before it can run
-        # cleanup helper pods for any PVs it provisioned. Additionally, on
+        # Unless kept by warm platform mode, the openebs namespace is itself
+        # "unexpected" and gets deleted above, which kills the
+        # openebs-localpv-provisioner before it can run cleanup helper pods
+        # for any PVs it provisioned. Additionally, on
         # control-plane nodes the dm-flakey path is intentionally skipped, so
         # those nodes never get the rm -rf wipe that workers do at dm-flakey
         # setup. Either path leaks /var/openebs/local/pvc-* dirs, eventually
         # filling the disk and breaking subsequent deploys. Sweep them now that
         # all unexpected PVs are gone from the API. Best-effort.
-        try:
-            gc_results = self.kubectl.gc_orphan_localpv_dirs()
-            total = sum(c for c in gc_results.values() if c > 0)
-            if total:
-                changes["localpv_dirs_gc"] = {"removed": total, "by_node": gc_results}
-                logger.info(f"[gc_localpv] Removed {total} orphan LocalPV dir(s) total")
-        except Exception as e:
-            logger.warning(f"Failed to GC orphan LocalPV dirs: {e}")
-
-        # 5. Delete unexpected StorageClasses
-        current_scs = self._get_storage_classes()
-        unexpected_scs = current_scs - self.baseline.storage_classes
-        for sc in unexpected_scs:
-            logger.info(f"Deleting unexpected StorageClass: {sc}")
+        with self._phase("localpv_gc"):
             try:
-                self.storage_v1.delete_storage_class(name=sc)
-                changes["storage_classes_deleted"].append(sc)
-            except ApiException as e:
-                if e.status != 404:
-                    logger.warning(f"Failed to delete StorageClass {sc}: {e}")
+                gc_results = self.kubectl.gc_orphan_localpv_dirs()
+                total = sum(c for c in gc_results.values() if c > 0)
+                if total:
+                    changes["localpv_dirs_gc"] = {"removed": total, "by_node": gc_results}
+                    logger.info(f"[gc_localpv] Removed {total} orphan LocalPV dir(s) total")
+            except Exception as e:
+                logger.warning(f"Failed to GC orphan LocalPV dirs: {e}")
+
+        # 5. Reset node labels and taints, and CoreDNS if modified
+        with self._phase("nodes"), ThreadPoolExecutor(max_workers=3) as executor:
+            labels = executor.submit(self._reconcile_node_labels)
+            taints = executor.submit(self._reconcile_node_taints)
+            if self._is_coredns_modified():
+                logger.info("Resetting CoreDNS ConfigMap to baseline")
+                executor.submit(self._restore_coredns_configmap).result()
+                changes["coredns_reset"] = True
+            changes["nodes_labels_reset"] = labels.result()
+            changes["nodes_taints_reset"] = taints.result()
 
-        # 6. Delete unexpected CRDs (strip finalizers from CRs first to prevent hanging)
-        current_crds = self._get_crds()
-        unexpected_crds = current_crds - self.baseline.crds
-        for crd in unexpected_crds:
-            if _is_chaos_mesh_resource(crd):
-                continue
-            logger.info(f"Deleting unexpected CRD: {crd}")
-            self._strip_cr_finalizers(crd)
-            try:
-                self.apiextensions_v1.delete_custom_resource_definition(name=crd)
-                changes["crds_deleted"].append(crd)
-            except ApiException as e:
-                if e.status != 404:
-                    logger.warning(f"Failed to delete CRD {crd}: {e}")
+        logger.info(f"Reconciliation complete: {changes}")
+        logger.info(
+            "Reconciliation phases: "
+            + ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in self.phase_seconds.items())
+        )
+        return changes
 
-        # 7. Delete unexpected ValidatingWebhookConfigurations
-        current_vwc = self._get_validating_webhook_configs()
-        unexpected_vwc = current_vwc - self.baseline.validating_webhook_configs
-        for vwc in unexpected_vwc:
-            if _is_chaos_mesh_resource(vwc):
-                continue
-            logger.info(f"Deleting unexpected ValidatingWebhookConfiguration: {vwc}")
-            try:
-                self.admission_v1.delete_validating_webhook_configuration(name=vwc)
-                changes["validating_webhook_configs_deleted"].append(vwc)
-            except ApiException as e:
-                if e.status != 404:
-                    logger.warning(f"Failed to delete ValidatingWebhookConfiguration {vwc}: {e}")
+    @contextmanager
+    def _phase(self, name: str):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.phase_seconds[name] = round(time.monotonic() - start, 3)
 
-        # 8. Delete unexpected MutatingWebhookConfigurations
-        current_mwc = self._get_mutating_webhook_configs()
-        unexpected_mwc = current_mwc - self.baseline.mutating_webhook_configs
-        for mwc in unexpected_mwc:
-            if _is_chaos_mesh_resource(mwc):
-                continue
-            logger.info(f"Deleting unexpected MutatingWebhookConfiguration: {mwc}")
+    def _run_bounded(self, func: Callable, items: list) -> list:
+        """Apply func to every item with at most DELETE_CONCURRENCY calls in flight."""
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(DELETE_CONCURRENCY, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def _delete_all(self, label: str, delete: Callable, names: list[str]) -> list[str]:
+        """Delete the named cluster-scoped objects concurrently. Returns the names whose deletion was accepted."""
+
+        def delete_one(name: str) -> str | None:
+            logger.info(f"Deleting unexpected {label}: {name}")
             try:
-                self.admission_v1.delete_mutating_webhook_configuration(name=mwc)
-                changes["mutating_webhook_configs_deleted"].append(mwc)
+                delete(name=name)
+                return name
             except ApiException as e:
                 if e.status != 404:
-                    logger.warning(f"Failed to delete MutatingWebhookConfiguration {mwc}: {e}")
+                    logger.warning(f"Failed to delete {label} {name}: {e}")
+            return None
 
-        # 9. Reset node labels
-        changes["nodes_labels_reset"] = self._reconcile_node_labels()
+        return [name for name in self._run_bounded(delete_one, names) if name is not None]
 
-        # 10. Reset node taints
-        changes["nodes_taints_reset"] = self._reconcile_node_taints()
+    def _await_gone(self, names_by_kind: dict[str, set[str]]):
+        """Wait, with one watch per kind, until none of the named objects exist any more."""
 
-        # 11. Reset CoreDNS ConfigMap if modified
-        if self._is_coredns_modified():
-            logger.info("Resetting CoreDNS ConfigMap to baseline")
-            self._restore_coredns_configmap()
-            changes["coredns_reset"] = True
+        def await_kind(kind: str, names: set[str]):
+            result = await_condition(
+                kind,
+                lambda objects: not any(obj.metadata.name in names for obj in objects),
+                timeout=TERMINATION_TIMEOUT_SECONDS,
+                description=f"termination of {len(names)} {kind}",
+            )
+            if not result.satisfied:
+                remaining = sorted(obj.metadata.name for obj in result.objects if obj.metadata.name in names)
+                logger.warning(f"Still terminating after {TERMINATION_TIMEOUT_SECONDS}s: {kind} {remaining}")
 
-        logger.info(f"Reconciliation complete: {changes}")
-        return changes
+        pending = {kind: names for kind, names in names_by_kind.items() if names}
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            for future in [executor.submit(await_kind, kind, names) for kind, names in pending.items()]:
+                future.result()
 
     def _get_namespaces(self) -> set[str]:
         """Get all namespace names in the cluster."""
@@ -385,6 +495,19 @@ class ClusterStateManager:
             logger.error(f"Failed to list PersistentVolumes: {e}")
             return set()
 
+    def _get_persistent_volumes_claimed_in(self, namespaces: set[str]) -> set[str]:
+        """Get names of PersistentVolumes bound to claims in the given namespaces."""
+        try:
+            pvs = self.core_v1.list_persistent_volume()
+            return {
+                pv.metadata.name
+                for pv in pvs.items
+                if pv.spec.claim_ref is not None and pv.spec.claim_ref.namespace in namespaces
+            }
+        except ApiException as e:
+            logger.error(f"Failed to list PersistentVolumes: {e}")
+            return set()
+
     def _get_storage_classes(self) -> set[str]:
         """Get all StorageClass names."""
         try:
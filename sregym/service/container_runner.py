@@ -7,6 +7,8 @@ import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from sregym.paths import LLM_CACHE_DIR
+
 logger = logging.getLogger("all.sregym.container_runner")
 
 
@@ -220,6 +222,14 @@ class ContainerRunner:
             self.config.logs_path.mkdir(parents=True, exist_ok=True)
             args.extend(["-v", f"{self.config.logs_path.resolve()}:/logs"])
 
+        # Share the host's LLM record/replay cache with agents that query through LiteLLMBackend
+        llm_cache_mode = os.environ.get("LLM_CACHE_MODE", "off")
+        if llm_cache_mode != "off":
+            llm_cache_dir = Path(os.environ.get("LLM_CACHE_DIR") or LLM_CACHE_DIR)
+            llm_cache_dir.mkdir(parents=True, exist_ok=True)
+            args.extend(["-v", f"{llm_cache_dir.resolve()}:/llm_cache"])
+            args.extend(["-e", f"LLM_CACHE_MODE={llm_cache_mode}", "-e", "LLM_CACHE_DIR=/llm_cache"])
+
         # Mount only the needed SREGym-applications subdirectories (read-only)
         if self.config.sregym_apps_path and self.config.sregym_app_subdirs:
             for subdir in self.config.sregym_app_subdirs:
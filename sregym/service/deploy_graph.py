@@ -0,0 +1,161 @@
+"""
+Dependency-graph executor for environment setup.
+
+Conductor.deploy_app() describes its setup (platform components and the
+problem's app) as DeploySteps with explicit dependencies. run_deploy_graph()
+starts every step whose dependencies have finished, runs independent steps
+concurrently on a small thread pool, and joins only on real dependencies. Each
+step's run function is expected to return once the step is ready, so a
+dependent never starts against a half-deployed dependency.
+
+The returned DeployReport holds per-step timings and the critical path, the
+chain of steps that determined the total setup time.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+logger = logging.getLogger("all.infra.deploy_graph")
+logger.propagate = True
+logger.setLevel(logging.DEBUG)
+
+
+@dataclass
+class DeployStep:
+    """One node of the setup graph. run() deploys the step and blocks until it is ready."""
+
+    name: str
+    # May return a short status for the report (e.g. "kept" for a warm platform component)
+    run: Callable[[], str | None]
+    depends_on: list[str] = field(default_factory=list)
+
+
+@dataclass
+class StepTiming:
+    name: str
+    # "ok", a status returned by the step, "failed", or "not run" (a dependency failed)
+    status: str
+    # Seconds since the graph started
+    start: float = 0.0
+    end: float = 0.0
+    error: str | None = None
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class DeployReport:
+    timings: dict[str, StepTiming]
+    depends_on: dict[str, list[str]]
+    wall_time: float
+
+    @property
+    def failed(self) -> list[StepTiming]:
+        return [t for t in self.timings.values() if t.status == "failed"]
+
+    def critical_path(self) -> list[str]:
+        """Steps on the longest dependency chain, from the first started to the last finished."""
+        ran = {name: t for name, t in self.timings.items() if t.status != "not run"}
+        if not ran:
+            return []
+        path = [max(ran.values(), key=lambda t: t.end).name]
+        while True:
+            deps = [ran[d] for d in self.depends_on.get(path[-1], []) if d in ran]
+            if not deps:
+                break
+            # The dependency that finished last is the one this step actually waited for
+            path.append(max(deps, key=lambda t: t.end).name)
+        return list(reversed(path))
+
+    def format(self) -> str:
+        """Per-step timing table; critical path steps are marked with '*'."""
+        critical = set(self.critical_path())
+        width = max((len(name) for name in self.timings), default=4)
+        lines = [f"  {'step':<{width}}  {'start':>7}  {'duration':>8}  status"]
+        for t in sorted(self.timings.values(), key=lambda t: (t.status == "not run", t.start)):
+            marker = "*" if t.name in critical else " "
+            timing = f"{t.start:>6.1f}s  {t.duration:>7.1f}s" if t.status != "not run" else f"{'-':>7}  {'-':>8}"
+            lines.append(f"{marker} {t.name:<{width}}  {timing}  {t.status}")
+        lines.append(f"  wall time {self.wall_time:.1f}s, critical path: {' -> '.join(self.critical_path())}")
+        return "\n".join(lines)
+
+
+def run_deploy_graph(steps: list[DeployStep], max_workers: int = 8) -> DeployReport:
+    """
+    Run the steps in dependency order, independent ones concurrently. Ready steps
+    are started in list order, so max_workers=1 runs the graph sequentially.
+    A failed step's dependents are not run; the other branches finish first, then
+    the first failure is re-raised. Raises ValueError for unknown or cyclic dependencies.
+    """
+    by_name = {step.name: step for step in steps}
+    for step in steps:
+        unknown = [d for d in step.depends_on if d not in by_name]
+        if unknown:
+            raise ValueError(f"Deploy step '{step.name}' depends on unknown step(s): {unknown}")
+    _check_acyclic(steps)
+
+    timings = {step.name: StepTiming(step.name, "not run") for step in steps}
+    pending = list(steps)
+    done: set[str] = set()
+    blocked: set[str] = set()
+    running: dict[Future, DeployStep] = {}
+    first_error: BaseException | None = None
+    t0 = time.monotonic()
+
+    def execute(step: DeployStep) -> str | None:
+        timings[step.name].start = time.monotonic() - t0
+        try:
+            return step.run()
+        finally:
+            timings[step.name].end = time.monotonic() - t0
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="deploy") as executor:
+        while pending or running:
+            for step in list(pending):
+                if any(d in blocked for d in step.depends_on):
+                    pending.remove(step)
+                    blocked.add(step.name)
+                elif all(d in done for d in step.depends_on) and len(running) < max_workers:
+                    pending.remove(step)
+                    logger.info(f"[DEPLOY] Starting {step.name}")
+                    running[executor.submit(execute, step)] = step
+
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                step = running.pop(future)
+                timing = timings[step.name]
+                try:
+                    timing.status = future.result() or "ok"
+                    done.add(step.name)
+                    logger.info(f"[DEPLOY] {step.name} ready after {timing.duration:.1f}s")
+                except Exception as e:
+                    timing.status = "failed"
+                    timing.error = str(e)
+                    blocked.add(step.name)
+                    first_error = first_error or e
+                    logger.error(f"[DEPLOY] {step.name} failed after {timing.duration:.1f}s: {e}")
+
+    report = DeployReport(timings, {s.name: list(s.depends_on) for s in steps}, time.monotonic() - t0)
+    if first_error is not None:
+        skipped = [t.name for t in timings.values() if t.status == "not run"]
+        if skipped:
+            logger.error(f"[DEPLOY] Not run because a dependency failed: {', '.join(skipped)}")
+        raise first_error
+    return report
+
+
+def _check_acyclic(steps: list[DeployStep]):
+    remaining = {step.name: set(step.depends_on) for step in steps}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps & remaining.keys()]
+        if not ready:
+            raise ValueError(f"Deploy steps have a dependency cycle among: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
@@ -0,0 +1,320 @@
+"""
+Watch-backed shared cluster cache (informers).
+
+An informer LISTs one resource kind in one namespace, then keeps a local copy
+up to date from a Kubernetes watch stream (resuming from the last seen
+resourceVersion and re-listing when the server reports 410 Gone). Readers query
+the cache in memory, and waiters block on change events instead of sleeping.
+
+The cache is opt-in: call enable_cluster_cache() (the Conductor does this when
+ConductorConfig.use_informer_cache is set). Once enabled, KubeCtl list calls,
+its wait helpers and the mitigation/readiness oracles read from the shared
+cache instead of issuing a fresh LIST on every poll.
+
+Cached objects are shared between readers and must be treated as read-only.
+
+Informers live until their namespace is deleted (KubeCtl.delete_namespace and
+cluster reconciliation call stop_namespace_informers()) or the cache is disabled,
+so a run that deploys app after app does not accumulate watch threads.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from kubernetes import client, watch
+from kubernetes.client.rest import ApiException
+
+logger = logging.getLogger("all.infra.informer")
+logger.propagate = True
+logger.setLevel(logging.DEBUG)
+
+# kind -> (API class, namespaced list method, all-namespaces/cluster list method)
+RESOURCE_KINDS: dict[str, tuple[type, str | None, str]] = {
+    "pods": (client.CoreV1Api, "list_namespaced_pod", "list_pod_for_all_namespaces"),
+    "services": (client.CoreV1Api, "list_namespaced_service", "list_service_for_all_namespaces"),
+    "endpoints": (client.CoreV1Api, "list_namespaced_endpoints", "list_endpoints_for_all_namespaces"),
+    "events": (client.CoreV1Api, "list_namespaced_event", "list_event_for_all_namespaces"),
+    "nodes": (client.CoreV1Api, None, "list_node"),
+    "namespaces": (client.CoreV1Api, None, "list_namespace"),
+    "persistentvolumes": (client.CoreV1Api, None, "list_persistent_volume"),
+    "deployments": (client.AppsV1Api, "list_namespaced_deployment", "list_deployment_for_all_namespaces"),
+    "statefulsets": (client.AppsV1Api, "list_namespaced_stateful_set", "list_stateful_set_for_all_namespaces"),
+    "jobs": (client.BatchV1Api, "list_namespaced_job", "list_job_for_all_namespaces"),
+}
+
+# Server-side watch timeout; the stream is re-opened from the last resourceVersion afterwards
+WATCH_TIMEOUT_SECONDS = 300
+# Maximum time to wait for an informer's initial LIST
+SYNC_TIMEOUT_SECONDS = 30
+# Backoff after an unexpected watch error before re-listing
+ERROR_BACKOFF_SECONDS = 1
+
+
+def matches_label_selector(labels: dict[str, str] | None, selector: str | None) -> bool:
+    """
+    Evaluate an equality-based label selector ("a=b,c!=d,e,!f") against a label dict.
+    Raises ValueError for set-based selectors ("in", "notin"), which the cache does not support.
+    """
+    if not selector:
+        return True
+    labels = labels or {}
+    for term in (t.strip() for t in selector.split(",")):
+        if not term:
+            continue
+        if "(" in term or " in " in term or " notin " in term:
+            raise ValueError(f"Unsupported label selector term: {term!r}")
+        if "!=" in term:
+            key, value = (part.strip() for part in term.split("!=", 1))
+            if labels.get(key) == value:
+                return False
+        elif "=" in term:
+            key, value = (part.strip() for part in term.replace("==", "=").split("=", 1))
+            if labels.get(key) != value:
+                return False
+        elif term.startswith("!"):
+            if term[1:].strip() in labels:
+                return False
+        elif term not in labels:
+            return False
+    return True
+
+
+def resolve_list_func(kind: str, namespace: str | None, api_client: client.ApiClient | None = None):
+    """Return (list function, positional args) for LIST/WATCH of `kind` in `namespace` (None = all/cluster)."""
+    if kind not in RESOURCE_KINDS:
+        raise ValueError(f"Unsupported resource kind '{kind}'. Supported: {sorted(RESOURCE_KINDS)}")
+    api_cls, namespaced_method, cluster_method = RESOURCE_KINDS[kind]
+    api = api_cls(api_client=api_client) if api_client else api_cls()
+    if namespace is not None and namespaced_method is not None:
+        return getattr(api, namespaced_method), (namespace,)
+    return getattr(api, cluster_method), ()
+
+
+def object_key(obj) -> str:
+    return f"{obj.metadata.namespace or ''}/{obj.metadata.name}"
+
+
+class Informer:
+    """Keeps an in-memory copy of one resource kind in one namespace (or cluster-wide)."""
+
+    def __init__(self, kind: str, namespace: str | None = None, api_client: client.ApiClient | None = None):
+        self.kind = kind
+        self.namespace = namespace
+        self._list_func, self._list_args = resolve_list_func(kind, namespace, api_client)
+
+        self._objects: dict[str, object] = {}
+        self._resource_version: str | None = None
+        # Bumped on every change; waiters block on the condition until it moves
+        self.version = 0
+        self._changed = threading.Condition()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watch: watch.Watch | None = None
+        self._thread: threading.Thread | None = None
+
+    def __repr__(self):
+        return f"Informer({self.kind!r}, namespace={self.namespace!r})"
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=f"informer-{self.kind}-{self.namespace}", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._watch is not None:
+            self._watch.stop()
+        with self._changed:
+            self._changed.notify_all()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    def wait_for_sync(self, timeout: float = SYNC_TIMEOUT_SECONDS) -> bool:
+        return self._synced.wait(timeout)
+
+    def _relist(self):
+        result = self._list_func(*self._list_args)
+        with self._changed:
+            self._objects = {object_key(obj): obj for obj in result.items}
+            self._resource_version = result.metadata.resource_version
+            self.version += 1
+            self._changed.notify_all()
+        self._synced.set()
+
+    def _apply(self, event_type: str, obj):
+        if event_type == "BOOKMARK":
+            # Bookmarks are not deserialized; they only advance the resume point
+            self._resource_version = obj["metadata"]["resourceVersion"]
+            return
+        with self._changed:
+            if event_type == "DELETED":
+                self._objects.pop(object_key(obj), None)
+            else:
+                self._objects[object_key(obj)] = obj
+            self._resource_version = obj.metadata.resource_version
+            self.version += 1
+            self._changed.notify_all()
+
+    def _run(self):
+        need_relist = True
+        while not self._stopped.is_set():
+            try:
+                if need_relist:
+                    self._relist()
+                    need_relist = False
+                self._watch = watch.Watch()
+                for event in self._watch.stream(
+                    self._list_func,
+                    *self._list_args,
+                    resource_version=self._resource_version,
+                    timeout_seconds=WATCH_TIMEOUT_SECONDS,
+                    allow_watch_bookmarks=True,
+                ):
+                    if self._stopped.is_set():
+                        break
+                    self._apply(event["type"], event["object"])
+            except ApiException as e:
+                if e.status == 410:
+                    logger.debug(f"{self}: resourceVersion expired, re-listing")
+                else:
+                    logger.warning(f"{self}: watch failed: {e}")
+                    self._stopped.wait(ERROR_BACKOFF_SECONDS)
+                need_relist = True
+            except Exception as e:
+                logger.warning(f"{self}: watch failed: {e}")
+                self._stopped.wait(ERROR_BACKOFF_SECONDS)
+                need_relist = True
+
+    def list(self, label_selector: str | None = None) -> list:
+        with self._changed:
+            objects = list(self._objects.values())
+        return [obj for obj in objects if matches_label_selector(obj.metadata.labels, label_selector)]
+
+    def get(self, name: str, namespace: str | None = None):
+        with self._changed:
+            return self._objects.get(f"{namespace or self.namespace or ''}/{name}")
+
+    def wait_for_change(self, since: int, timeout: float) -> int:
+        """Block until the cache version moves past `since` or `timeout` seconds pass. Returns the version."""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != since or self._stopped.is_set(), timeout)
+            return self.version
+
+
+class ClusterCache:
+    """Shared registry of informers, started lazily per (kind, namespace)."""
+
+    def __init__(self, api_client: client.ApiClient | None = None):
+        self.api_client = api_client
+        self._informers: dict[tuple[str, str | None], Informer] = {}
+        self._lock = threading.Lock()
+
+    def informer(self, kind: str, namespace: str | None = None) -> Informer:
+        """Return the informer for (kind, namespace), starting it and waiting for its initial sync."""
+        if kind in RESOURCE_KINDS and RESOURCE_KINDS[kind][1] is None:
+            namespace = None  # cluster-scoped kind
+        key = (kind, namespace)
+        with self._lock:
+            informer = self._informers.get(key)
+            if informer is None:
+                informer = Informer(kind, namespace, api_client=self.api_client)
+                self._informers[key] = informer
+                informer.start()
+        if not informer.wait_for_sync():
+            raise TimeoutError(f"{informer} did not sync within {SYNC_TIMEOUT_SECONDS}s")
+        return informer
+
+    def list(self, kind: str, namespace: str | None = None, label_selector: str | None = None) -> list:
+        return self.informer(kind, namespace).list(label_selector)
+
+    def get(self, kind: str, name: str, namespace: str | None = None):
+        return self.informer(kind, namespace).get(name, namespace)
+
+    def wait_until(
+        self,
+        kind: str,
+        namespace: str | None,
+        predicate: Callable[[], bool],
+        timeout: float,
+        recheck_interval: float | None = None,
+    ) -> bool:
+        """
+        Block until predicate() holds, re-evaluating it on every change to the cached kind.
+        recheck_interval additionally re-evaluates it periodically (for time-based predicates).
+        Returns False if the timeout expires first.
+        """
+        informer = self.informer(kind, namespace)
+        deadline = time.monotonic() + timeout
+        while True:
+            if informer.stopped:
+                # Its namespace was deleted under us; carry on with a fresh informer
+                informer = self.informer(kind, namespace)
+            version = informer.version
+            if predicate():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            informer.wait_for_change(
+                version, remaining if recheck_interval is None else min(remaining, recheck_interval)
+            )
+
+    def stop_namespace(self, namespace: str) -> int:
+        """Stop and drop the informers watching `namespace`. Returns how many were stopped."""
+        with self._lock:
+            keys = [key for key in self._informers if key[1] == namespace]
+            informers = [self._informers.pop(key) for key in keys]
+        for informer in informers:
+            informer.stop()
+        if informers:
+            logger.debug(f"Stopped {len(informers)} informer(s) for namespace {namespace}")
+        return len(informers)
+
+    def stop(self):
+        with self._lock:
+            informers, self._informers = list(self._informers.values()), {}
+        for informer in informers:
+            informer.stop()
+
+
+# Module-level singleton, shared by every KubeCtl instance in the process
+_cluster_cache: ClusterCache | None = None
+_cluster_cache_lock = threading.Lock()
+
+
+def enable_cluster_cache(api_client: client.ApiClient | None = None) -> ClusterCache:
+    """Enable the shared informer cache (idempotent)."""
+    global _cluster_cache
+    with _cluster_cache_lock:
+        if _cluster_cache is None:
+            _cluster_cache = ClusterCache(api_client=api_client)
+            logger.info("Informer-backed cluster cache enabled")
+        return _cluster_cache
+
+
+def get_cluster_cache() -> ClusterCache | None:
+    """Return the shared cache, or None if it has not been enabled."""
+    return _cluster_cache
+
+
+def stop_namespace_informers(namespace: str):
+    """Stop the shared cache's informers for a deleted namespace (no-op when the cache is disabled)."""
+    cache = _cluster_cache
+    if cache is not None:
+        cache.stop_namespace(namespace)
+
+
+def disable_cluster_cache():
+    """Stop all informers and fall back to direct API calls."""
+    global _cluster_cache
+    with _cluster_cache_lock:
+        if _cluster_cache is not None:
+            _cluster_cache.stop()
+            _cluster_cache = None
+            logger.info("Informer-backed cluster cache disabled")
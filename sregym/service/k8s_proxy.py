@@ -12,18 +12,32 @@ The proxy:
 3. Returns 403 Forbidden for direct access to hidden namespaces or hidden resources
 4. Filters cluster-wide resource listings to exclude resources in hidden namespaces
 5. Filters resources with hidden labels (e.g. load generators) from list responses
+6. Filters watch streams (?watch=true) event by event
+
+Responses that need no filtering (namespaced lists, logs, discovery, errors) are
+streamed through chunk by chunk with their Content-Encoding preserved. Filtered
+cluster-wide lists are paginated upstream and streamed out page by page, so peak
+memory stays bounded by the page size rather than the list size.
+
+Requests are served concurrently (one thread per client connection) and share a
+pool of keep-alive TLS connections to the upstream API server, so parallel
+kubectl calls from agents neither queue behind each other nor pay a fresh TLS
+handshake each.
 """
 
 import base64
 import contextlib
+import gzip
+import http.client
 import json
 import logging
 import os
 import ssl
 import tempfile
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from urllib.parse import urlparse
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
 
 import urllib3
 from kubernetes import config
@@ -43,10 +57,116 @@ HIDDEN_LABELS: dict[str, set[str]] = {
     "opentelemetry.io/name": {"load-generator"},
 }
 
+# Page size used when the proxy paginates filtered list requests upstream
+LIST_PAGE_SIZE = 500
+
+# Read size for streamed (pass-through and watch) responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Methods safe to replay when a reused connection drops before the response arrives
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Errors raised when the API server has closed an idle keep-alive connection
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+# Hop-by-hop headers that must not be forwarded between the client and upstream connections
+HOP_BY_HOP_HEADERS: set[str] = {"connection", "keep-alive", "proxy-connection", "te", "trailer", "upgrade"}
+
 # Disable SSL warnings for self-signed certs
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+class UpstreamConnectionPool:
+    """Thread-safe pool of keep-alive HTTPS connections to the upstream API server.
+
+    The SSL context is built once and shared by every connection, and idle
+    connections are reused so concurrent proxy requests skip the TLS handshake.
+    """
+
+    def __init__(self, host: str, port: int, context: ssl.SSLContext, max_idle: int = 16, timeout: float = 60.0):
+        self.host = host
+        self.port = port
+        self.context = context
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self._idle: list[http.client.HTTPSConnection] = []
+        self._lock = threading.Lock()
+
+    def acquire(self, fresh: bool = False) -> tuple[http.client.HTTPSConnection, bool]:
+        """Return a connection and whether it was reused from the idle pool."""
+        if not fresh:
+            with self._lock:
+                if self._idle:
+                    return self._idle.pop(), True
+        return http.client.HTTPSConnection(self.host, self.port, context=self.context, timeout=self.timeout), False
+
+    def send(self, method: str, path: str, body: bytes | None, headers: dict, long_lived: bool = False):
+        """Send a request over a pooled connection. Returns (connection, response).
+
+        A reused keep-alive connection may have been closed by the API server while
+        idle; the request is then retried once on a fresh connection. A failure while
+        sending means the server never got the request, so any method is retried; a
+        failure while awaiting the response only retries idempotent methods, since the
+        server may already have applied a POST, PATCH or DELETE. Long-lived requests
+        (watches, log follows) disable the socket timeout, since the stream may
+        legitimately stay idle for minutes.
+        """
+        conn, reused = self.acquire()
+        try:
+            self._send_on(conn, method, path, body, headers, long_lived)
+        except STALE_CONNECTION_ERRORS:
+            conn.close()
+            if not reused:
+                raise
+            return self._send_fresh(method, path, body, headers, long_lived)
+        except Exception:
+            conn.close()
+            raise
+        try:
+            return conn, conn.getresponse()
+        except STALE_CONNECTION_ERRORS:
+            conn.close()
+            if not reused or method.upper() not in IDEMPOTENT_METHODS:
+                raise
+            return self._send_fresh(method, path, body, headers, long_lived)
+        except Exception:
+            conn.close()
+            raise
+
+    def _send_fresh(self, method, path, body, headers, long_lived):
+        conn, _ = self.acquire(fresh=True)
+        try:
+            self._send_on(conn, method, path, body, headers, long_lived)
+            return conn, conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+
+    @staticmethod
+    def _send_on(conn, method, path, body, headers, long_lived):
+        if long_lived:
+            conn.timeout = None
+            if conn.sock is not None:
+                conn.sock.settimeout(None)
+        conn.request(method, path, body=body, headers=headers)
+
+    def release(self, conn: http.client.HTTPSConnection, reusable: bool = True):
+        """Return a connection to the pool, or close it if it cannot be reused."""
+        if reusable:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
 class KubernetesAPIProxy:
     """Manages the Kubernetes API filtering proxy."""
 
@@ -59,14 +179,19 @@ class KubernetesAPIProxy:
         hidden_namespaces: set[str] | None = None,
         hidden_labels: dict[str, set[str]] | None = None,
         listen_port: int = 6443,
+        max_upstream_connections: int = 16,
+        kubeconfig_path: str | None = None,
     ):
         self.hidden_namespaces: set[str] = hidden_namespaces if hidden_namespaces is not None else HIDDEN_NAMESPACES
         self.hidden_labels: dict[str, set[str]] = hidden_labels if hidden_labels is not None else HIDDEN_LABELS
         self.listen_port = listen_port
-        self.server: HTTPServer | None = None
+        self.max_upstream_connections = max_upstream_connections
+        self.server: ThreadingHTTPServer | None = None
         self.server_thread: threading.Thread | None = None
         self._temp_files: list = []
         self._bearer_token: str | None = None
+        self._ssl_context: ssl.SSLContext | None = None
+        self._upstream_pool: UpstreamConnectionPool | None = None
 
         if os.path.exists(self._INCLUSTER_TOKEN_PATH):
             # Running inside a Kubernetes pod — use ServiceAccount credentials
@@ -81,12 +206,12 @@ class KubernetesAPIProxy:
             self.api_port = int(os.environ.get("KUBERNETES_SERVICE_PORT", "443"))
         else:
             # Running outside the cluster — load from kubeconfig
-            # Always load from the default kubeconfig path, ignoring KUBECONFIG env var
+            # Default to the standard kubeconfig path, ignoring KUBECONFIG env var
             # This prevents circular dependency if KUBECONFIG points to our proxy
-            default_kubeconfig = os.path.expanduser("~/.kube/config")
-            config.load_kube_config(config_file=default_kubeconfig)
+            kubeconfig_path = kubeconfig_path or os.path.expanduser("~/.kube/config")
+            config.load_kube_config(config_file=kubeconfig_path)
             self.api_host, self.api_port, self.ca_cert, self.client_cert, self.client_key = self._load_cluster_config(
-                kubeconfig_path=default_kubeconfig
+                kubeconfig_path=kubeconfig_path
             )
 
     def _load_cluster_config(self, kubeconfig_path: str | None = None):
@@ -177,36 +302,48 @@ class KubernetesAPIProxy:
 
         return files
 
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        """Build the upstream SSL context once and cache it for all connections."""
+        if self._ssl_context is None:
+            cert_files = self._create_temp_cert_files()
+            context = ssl.create_default_context()
+            if cert_files.get("ca"):
+                context.load_verify_locations(cert_files["ca"])
+            else:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+
+            if cert_files.get("cert") and cert_files.get("key"):
+                context.load_cert_chain(cert_files["cert"], cert_files["key"])
+            self._ssl_context = context
+        return self._ssl_context
+
     def start(self):
         """Start the proxy server in a background thread."""
-        cert_files = self._create_temp_cert_files()
+        self._upstream_pool = UpstreamConnectionPool(
+            self.api_host, self.api_port, self._get_ssl_context(), max_idle=self.max_upstream_connections
+        )
+        upstream_pool = self._upstream_pool
         hidden_namespaces = self.hidden_namespaces
         hidden_labels = self.hidden_labels
-        api_host = self.api_host
-        api_port = self.api_port
         bearer_token = self._bearer_token
 
         class FilteringProxyHandler(BaseHTTPRequestHandler):
             """HTTP request handler that proxies and filters Kubernetes API responses."""
 
+            # HTTP/1.1 lets clients such as kubectl keep their connection to the proxy open.
+            # Every response carries an explicit Content-Length, which keep-alive requires.
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; without TCP_NODELAY, Nagle plus delayed ACKs
+            # stall every keep-alive response by ~40ms.
+            disable_nagle_algorithm = True
+
             def log_message(self, format, *args):
                 logger.debug(f"Proxy: {format % args}")
 
-            def _get_upstream_connection(self):
-                """Create HTTPS connection to upstream Kubernetes API."""
-                import http.client
-
-                context = ssl.create_default_context()
-                if cert_files.get("ca"):
-                    context.load_verify_locations(cert_files["ca"])
-                else:
-                    context.check_hostname = False
-                    context.verify_mode = ssl.CERT_NONE
-
-                if cert_files.get("cert") and cert_files.get("key"):
-                    context.load_cert_chain(cert_files["cert"], cert_files["key"])
-
-                return http.client.HTTPSConnection(api_host, api_port, context=context)
+            def _send_upstream(self, method: str, path: str, body: bytes | None, headers: dict, long_lived=False):
+                """Send a request upstream over a pooled connection. Returns (connection, response)."""
+                return upstream_pool.send(method, path, body, headers, long_lived)
 
             def _is_hidden_namespace_request(self, path: str) -> bool:
                 """Check if request is for a hidden namespace."""
@@ -296,78 +433,308 @@ class KubernetesAPIProxy:
 
                 return None
 
+            @staticmethod
+            def _query_params(path: str) -> dict[str, str]:
+                return dict(parse_qsl(urlsplit(path).query, keep_blank_values=True))
+
+            @staticmethod
+            def _with_query(path: str, params: dict[str, str]) -> str:
+                """Return path with the given query parameters set (replacing existing values)."""
+                parsed = urlsplit(path)
+                query = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if k not in params]
+                query.extend(params.items())
+                return urlunsplit(("", "", parsed.path, urlencode(query), ""))
+
+            def _is_watch_request(self, path: str) -> bool:
+                """Check for a watch stream (?watch=true or the legacy /watch/ path prefix)."""
+                return self._query_params(path).get("watch") in ("true", "1") or "/watch/" in urlsplit(path).path
+
+            @staticmethod
+            def _resource_path_segments(path: str) -> list[str] | None:
+                """
+                Return the segments after the API group/version and namespace prefix, e.g.
+                ["pods"] for a collection or ["pods", "name", "log"] for a subresource.
+                Returns None for discovery and other non-resource paths.
+                """
+                parts = [p for p in urlsplit(path).path.split("/") if p]
+                if parts[:1] == ["api"] and len(parts) >= 2:
+                    rest = parts[2:]
+                elif parts[:1] == ["apis"] and len(parts) >= 3:
+                    rest = parts[3:]
+                else:
+                    return None
+                if len(rest) >= 3 and rest[0] == "namespaces":
+                    rest = rest[2:]
+                return rest or None
+
+            def _needs_object_check(self, method: str, path: str) -> bool:
+                """
+                Whether a JSON response must be inspected for a hidden individual resource.
+                Collection GETs and non-resource paths are streamed through untouched.
+                """
+                segments = self._resource_path_segments(path)
+                if segments is None:
+                    return False
+                return len(segments) > 1 or method not in ("GET", "HEAD")
+
+            def _send_headers(self, response, content_length: int | None = None, keep_encoding: bool = False):
+                """Send status and upstream headers; the body is chunked when its length is unknown."""
+                self.send_response(response.status)
+                for header, value in response.getheaders():
+                    name = header.lower()
+                    # Skip headers we're modifying
+                    if name in ("transfer-encoding", "content-length") or name in HOP_BY_HOP_HEADERS:
+                        continue
+                    if name == "content-encoding" and not keep_encoding:
+                        continue
+                    self.send_header(header, value)
+                self._chunked = False
+                if content_length is not None:
+                    self.send_header("Content-Length", str(content_length))
+                elif self.request_version == "HTTP/1.1":
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self._chunked = True
+                else:
+                    # HTTP/1.0 clients cannot receive chunks; delimit the body by closing the connection
+                    self.close_connection = True
+                self.end_headers()
+                self._response_started = True
+
+            def _write_body(self, data: bytes):
+                if not data:
+                    return
+                if self._chunked:
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                else:
+                    self.wfile.write(data)
+
+            def _end_body(self):
+                if self._chunked:
+                    self.wfile.write(b"0\r\n\r\n")
+
+            def _stream_passthrough(self, response):
+                """Forward the upstream body chunk by chunk, preserving its Content-Encoding."""
+                content_length = response.getheader("Content-Length")
+                if content_length is None and (self.command == "HEAD" or response.status in (204, 304)):
+                    content_length = 0
+                self._send_headers(
+                    response,
+                    content_length=int(content_length) if content_length is not None else None,
+                    keep_encoding=True,
+                )
+                while chunk := response.read1(STREAM_CHUNK_SIZE):
+                    self._write_body(chunk)
+                # read1 does not mark a Content-Length body complete; read() does, so the connection can be reused
+                response.read()
+                self._end_body()
+
+            def _filter_watch_event(self, line: bytes, filter_type: str | None) -> bytes | None:
+                """Filter one newline-delimited watch event; returns None if it must be dropped."""
+                if not line.strip():
+                    return None
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    return line
+                obj = event.get("object")
+                if event.get("type") in ("BOOKMARK", "ERROR") or not isinstance(obj, dict):
+                    return line
+                # Table watches (kubectl get -w) wrap each object in a single-row Table
+                if "rows" in obj:
+                    if filter_type == "namespaces":
+                        self._filter_namespace_list(obj)
+                    else:
+                        self._filter_resource_list(obj)
+                    return json.dumps(event).encode() if obj["rows"] else None
+                metadata = obj.get("metadata") or {}
+                if filter_type == "namespaces":
+                    hidden = metadata.get("name") in hidden_namespaces
+                else:
+                    hidden = metadata.get("namespace") in hidden_namespaces or self._has_hidden_label(metadata)
+                return None if hidden else line
+
+            def _stream_watch(self, response, filter_type: str | None):
+                """Relay a watch stream, filtering it event by event."""
+                self._send_headers(response)
+                decoder = (
+                    zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    if response.getheader("Content-Encoding", "") == "gzip"
+                    else None
+                )
+                pending = b""
+                while chunk := response.read1(STREAM_CHUNK_SIZE):
+                    if decoder:
+                        chunk = decoder.decompress(chunk)
+                    *lines, pending = (pending + chunk).split(b"\n")
+                    events = [
+                        event for event in (self._filter_watch_event(line, filter_type) for line in lines) if event
+                    ]
+                    if events:
+                        self._write_body(b"\n".join(events) + b"\n")
+                response.read()
+                tail = self._filter_watch_event(pending, filter_type)
+                if tail:
+                    self._write_body(tail + b"\n")
+                self._end_body()
+
+            @staticmethod
+            def _read_decoded_body(response) -> bytes:
+                body = response.read()
+                if response.getheader("Content-Encoding", "") == "gzip":
+                    body = gzip.decompress(body)
+                return body
+
+            def _fetch_list_page(self, path: str, headers: dict, continue_token: str) -> dict:
+                """Fetch the next page of a paginated list from upstream."""
+                page_path = self._with_query(path, {"limit": str(LIST_PAGE_SIZE), "continue": continue_token})
+                conn, response = self._send_upstream("GET", page_path, None, headers)
+                try:
+                    body = self._read_decoded_body(response)
+                    upstream_pool.release(conn, reusable=not response.will_close)
+                    conn = None
+                finally:
+                    if conn is not None:
+                        conn.close()
+                if response.status != 200:
+                    raise RuntimeError(f"upstream returned {response.status} while paging {path}")
+                return json.loads(body)
+
+            def _send_filtered(self, response, path: str, headers: dict, filter_type: str | None, paginated: bool):
+                """
+                Filter a JSON response. Lists that the proxy paginated upstream are streamed to the
+                client page by page, so peak memory is bounded by the page size, not the list size.
+                """
+                body = self._read_decoded_body(response)
+                try:
+                    data = json.loads(body)
+                except json.JSONDecodeError:
+                    data = None  # Not valid JSON, pass through as-is
+
+                if not isinstance(data, dict):
+                    self._send_headers(response, content_length=len(body))
+                    self._write_body(body)
+                    return
+
+                if filter_type is None:
+                    if self._has_hidden_label(data.get("metadata", {})):
+                        # Block direct access to individual hidden resources
+                        self.send_error(403, "Forbidden: Access to this resource is not allowed")
+                        return
+                    self._send_headers(response, content_length=len(body))
+                    self._write_body(body)
+                    return
+
+                filter_list = self._filter_namespace_list if filter_type == "namespaces" else self._filter_resource_list
+                data = filter_list(data)
+                continue_token = (data.get("metadata") or {}).get("continue") if paginated else None
+                if not continue_token:
+                    body = json.dumps(data).encode()
+                    self._send_headers(response, content_length=len(body))
+                    self._write_body(body)
+                    return
+
+                # Stream the list: header fields from the first page, then items from every page
+                list_key = "rows" if "rows" in data and "items" not in data else "items"
+                head = {k: v for k, v in data.items() if k != list_key}
+                head["metadata"] = {
+                    k: v for k, v in (head.get("metadata") or {}).items() if k not in ("continue", "remainingItemCount")
+                }
+                self._send_headers(response)
+                self._write_body(json.dumps(head)[:-1].encode() + b', "%s": [' % list_key.encode())
+                first = True
+                page = data
+                while True:
+                    items = page.get(list_key) or []
+                    if items:
+                        chunk = b",".join(json.dumps(item).encode() for item in items)
+                        self._write_body(chunk if first else b"," + chunk)
+                        first = False
+                    if not continue_token:
+                        break
+                    page = filter_list(self._fetch_list_page(path, headers, continue_token))
+                    continue_token = (page.get("metadata") or {}).get("continue")
+                self._write_body(b"]}")
+                self._end_body()
+
             def _proxy_request(self, method: str):
-                """Proxy request to upstream API and filter response."""
+                """Proxy request to upstream API, streaming or filtering the response as needed."""
                 path = self.path
+                self._response_started = False
+                self._chunked = False
 
                 # Block direct access to hidden namespaces
                 if self._is_hidden_namespace_request(path):
                     self.send_error(403, "Forbidden: Access to this namespace is not allowed")
                     return
 
-                # Read request body if present
-                content_length = int(self.headers.get("Content-Length", 0))
-                body = self.rfile.read(content_length) if content_length > 0 else None
+                body = self._read_request_body()
+                params = self._query_params(path)
+                filter_type = self._should_filter_response(path)
+                is_watch = self._is_watch_request(path)
+                long_lived = is_watch or params.get("follow") in ("true", "1")
+                # Page through filtered lists ourselves unless the client already asked for pages
+                paginated = method == "GET" and filter_type is not None and not is_watch and "limit" not in params
+                upstream_path = self._with_query(path, {"limit": str(LIST_PAGE_SIZE)}) if paginated else path
 
                 # Forward request to upstream
+                conn = None
                 try:
-                    conn = self._get_upstream_connection()
-                    # Forward headers (except Host and Accept-Encoding to avoid gzip)
-                    headers = {k: v for k, v in self.headers.items() if k.lower() not in ("host", "accept-encoding")}
+                    # Forward headers (except Host and hop-by-hop headers)
+                    headers = {
+                        k: v
+                        for k, v in self.headers.items()
+                        if k.lower() not in ("host", "transfer-encoding") and k.lower() not in HOP_BY_HOP_HEADERS
+                    }
+                    if body is not None:
+                        headers["Content-Length"] = str(len(body))
                     # In-cluster mode: authenticate to the API server with the ServiceAccount bearer token
                     if bearer_token:
                         headers["Authorization"] = f"Bearer {bearer_token}"
-                    conn.request(method, path, body=body, headers=headers)
-                    response = conn.getresponse()
+                    conn, response = self._send_upstream(method, upstream_path, body, headers, long_lived=long_lived)
 
-                    # Read response
-                    response_body = response.read()
                     content_type = response.getheader("Content-Type", "")
-                    content_encoding = response.getheader("Content-Encoding", "")
-
-                    # Decompress if gzip-encoded
-                    if content_encoding == "gzip":
-                        import gzip
-
-                        response_body = gzip.decompress(response_body)
-
-                    # Filter JSON responses if needed
-                    filter_type = self._should_filter_response(path)
-                    if response.status == 200 and "application/json" in content_type:
-                        try:
-                            data = json.loads(response_body)
-                            if filter_type == "namespaces":
-                                data = self._filter_namespace_list(data)
-                                response_body = json.dumps(data).encode()
-                            elif filter_type == "resources":
-                                data = self._filter_resource_list(data)
-                                response_body = json.dumps(data).encode()
-                            elif filter_type is None and self._has_hidden_label(data.get("metadata", {})):
-                                # Block direct access to individual hidden resources
-                                self.send_error(403, "Forbidden: Access to this resource is not allowed")
-                                conn.close()
-                                return
-                        except json.JSONDecodeError:
-                            pass  # Not valid JSON, pass through as-is
-
-                    # Send response to client
-                    self.send_response(response.status)
-                    for header, value in response.getheaders():
-                        # Skip headers we're modifying
-                        if header.lower() not in ("transfer-encoding", "content-length", "content-encoding"):
-                            self.send_header(header, value)
-                    self.send_header("Content-Length", str(len(response_body)))
-                    self.end_headers()
-                    self.wfile.write(response_body)
-
-                    conn.close()
+                    is_json_ok = response.status == 200 and "application/json" in content_type
+                    if is_json_ok and is_watch:
+                        self._stream_watch(response, filter_type)
+                    elif is_json_ok and (filter_type is not None or self._needs_object_check(method, path)):
+                        self._send_filtered(response, path, headers, filter_type, paginated)
+                    else:
+                        self._stream_passthrough(response)
+
+                    # The body has been fully consumed, so the connection can go back to the pool
+                    upstream_pool.release(conn, reusable=not (long_lived or response.will_close))
+                    conn = None
 
                 except BrokenPipeError:
                     # Client closed while agent still has in-flight request open. Ignore
-                    pass
+                    self.close_connection = True
                 except Exception as e:
                     logger.error(f"Proxy error: {e}")
-                    self.send_error(502, f"Bad Gateway: {str(e)}")
+                    if self._response_started:
+                        # Too late to report an error status; abort the body so the client notices
+                        self.close_connection = True
+                    else:
+                        self.send_error(502, f"Bad Gateway: {str(e)}")
+                finally:
+                    if conn is not None:
+                        conn.close()
+
+            def _read_request_body(self) -> bytes | None:
+                """Read the client request body, honouring chunked transfer encoding."""
+                if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+                    chunks = []
+                    while True:
+                        size = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+                        if size == 0:
+                            # Consume optional trailers up to the terminating blank line
+                            while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                                pass
+                            break
+                        chunks.append(self.rfile.read(size))
+                        self.rfile.readline()
+                    return b"".join(chunks)
+                content_length = int(self.headers.get("Content-Length", 0))
+                return self.rfile.read(content_length) if content_length > 0 else None
 
             def do_GET(self):
                 self._proxy_request("GET")
@@ -391,7 +758,8 @@ class KubernetesAPIProxy:
                 self._proxy_request("HEAD")
 
         # Create and start server
-        self.server = HTTPServer(("127.0.0.1", self.listen_port), FilteringProxyHandler)
+        self.server = ThreadingHTTPServer(("127.0.0.1", self.listen_port), FilteringProxyHandler)
+        self.server.daemon_threads = True
         self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
         self.server_thread.start()
         logger.info(f"Kubernetes API filtering proxy started on port {self.listen_port}")
@@ -402,22 +770,28 @@ class KubernetesAPIProxy:
         """Stop the proxy server."""
         if self.server:
             self.server.shutdown()
+            self.server.server_close()
             self.server = None
             self.server_thread = None
             logger.info("Kubernetes API filtering proxy stopped")
 
+        if self._upstream_pool:
+            self._upstream_pool.close()
+            self._upstream_pool = None
+
         # Cleanup temp files
         for temp_file in self._temp_files:
             with contextlib.suppress(OSError):
                 os.unlink(temp_file)
         self._temp_files = []
+        self._ssl_context = None
 
     def generate_agent_kubeconfig(self, output_path: str | None = None) -> str:
         """
         Generate a kubeconfig file for agents that points to this proxy.
 
         Args:
-            output_path: Path to write kubeconfig. If None, writes to temp file.
+            output_path: Path to write kubeconfig. If None, writes to a temp file named after the listen port.
 
         Returns:
             Path to the generated kubeconfig file.
@@ -458,7 +832,7 @@ class KubernetesAPIProxy:
         }
 
         if output_path is None:
-            output_path = os.path.join(tempfile.gettempdir(), "sregym-agent-kubeconfig")
+            output_path = os.path.join(tempfile.gettempdir(), f"sregym-agent-kubeconfig-{self.listen_port}")
 
         with open(output_path, "w") as f:
             yaml.dump(kubeconfig, f)
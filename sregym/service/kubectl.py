@@ -5,6 +5,7 @@ import json
 import logging
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger("all.infra.kubectl")
 logger.propagate = True
@@ -22,6 +23,12 @@ from kubernetes.client import api_client  # noqa: E402
 from kubernetes.client.rest import ApiException  # noqa: E402
 
 from logger import console  # noqa: E402
+from sregym.service.informer import (  # noqa: E402
+    get_cluster_cache,
+    matches_label_selector,
+    stop_namespace_informers,
+)
+from sregym.service.waits import await_condition, await_job_finished, await_namespace_deleted  # noqa: E402
 
 WAIT_FOR_POD_READY_TIMEOUT = int(os.getenv("WAIT_FOR_POD_READY_TIMEOUT", "600"))
 
@@ -37,22 +44,51 @@ class KubeCtl:
         self.core_v1_api = client.CoreV1Api()
         self.apps_v1_api = client.AppsV1Api()
 
+    def _cached_list(self, kind: str, namespace: str | None, label_selector: str | None = None) -> list | None:
+        """Return objects from the shared informer cache, or None if the cache is disabled or cannot serve them."""
+        cache = get_cluster_cache()
+        if cache is None:
+            return None
+        try:
+            return cache.list(kind, namespace, label_selector=label_selector)
+        except (TimeoutError, ValueError) as e:
+            logger.debug(f"Informer cache cannot serve {kind} in {namespace}: {e}; falling back to the API")
+            return None
+
     def list_namespaces(self):
         """Return a list of all namespaces in the cluster."""
         return self.core_v1_api.list_namespace()
 
-    def list_pods(self, namespace):
+    def list_pods(self, namespace, label_selector: str | None = None):
         """Return a list of all pods within a specified namespace."""
+        items = self._cached_list("pods", namespace, label_selector)
+        if items is not None:
+            return client.V1PodList(items=items)
+        if label_selector:
+            return self.core_v1_api.list_namespaced_pod(namespace, label_selector=label_selector)
         return self.core_v1_api.list_namespaced_pod(namespace)
 
     def list_services(self, namespace):
         """Return a list of all services within a specified namespace."""
+        items = self._cached_list("services", namespace)
+        if items is not None:
+            return client.V1ServiceList(items=items)
         return self.core_v1_api.list_namespaced_service(namespace)
 
     def list_nodes(self):
         """Return a list of all running nodes."""
+        items = self._cached_list("nodes", None)
+        if items is not None:
+            return client.V1NodeList(items=items)
         return self.core_v1_api.list_node()
 
+    def list_events(self, namespace):
+        """Return a list of all events within a specified namespace."""
+        items = self._cached_list("events", namespace)
+        if items is not None:
+            return client.CoreV1EventList(items=items)
+        return self.core_v1_api.list_namespaced_event(namespace)
+
     def get_concise_deployments_info(self, namespace=None):
         """Return a concise info of a deployment."""
         cmd = f"kubectl get deployment {f'-n {namespace}' if namespace else ''} -o wide"
@@ -67,6 +103,9 @@ class KubeCtl:
 
     def list_deployments(self, namespace):
         """Return a list of all deployments within a specified namespace."""
+        items = self._cached_list("deployments", namespace)
+        if items is not None:
+            return client.V1DeploymentList(items=items)
         return self.apps_v1_api.list_namespaced_deployment(namespace)
 
     def get_cluster_ip(self, service_name, namespace):
@@ -86,7 +125,7 @@ class KubeCtl:
 
     def get_pod_name(self, namespace, label_selector):
         """Get the name of the first pod in a namespace that matches a given label selector."""
-        pod_info = self.core_v1_api.list_namespaced_pod(namespace, label_selector=label_selector)
+        pod_info = self.list_pods(namespace, label_selector=label_selector)
         return pod_info.items[0].metadata.name
 
     def get_pod_logs(self, pod_name, namespace):
@@ -131,6 +170,36 @@ class KubeCtl:
         """Fetch the service configuration."""
         return client.CoreV1Api().read_namespaced_service(name=name, namespace=namespace)
 
+    def wait_until(
+        self,
+        kind: str,
+        namespace: str | None,
+        predicate,
+        sleep: float = 2,
+        max_wait: float = 300,
+    ) -> bool:
+        """Block until predicate() returns True or max_wait seconds pass.
+
+        With the informer cache enabled, the predicate is re-evaluated on every change to the cached
+        `kind` in `namespace` (and at least every `sleep` seconds); otherwise it is polled every
+        `sleep` seconds. Returns False on timeout.
+        """
+        cache = get_cluster_cache()
+        if cache is not None:
+            try:
+                return cache.wait_until(kind, namespace, predicate, max_wait, recheck_interval=sleep)
+            except TimeoutError as e:
+                logger.debug(f"Informer cache cannot serve {kind} in {namespace}: {e}; polling instead")
+
+        deadline = time.monotonic() + max_wait
+        while True:
+            if predicate():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(sleep, remaining))
+
     def wait_for_ready(
         self,
         namespace: str,
@@ -144,7 +213,7 @@ class KubeCtl:
             namespace: The namespace to check
             service_names: If provided (str or list), only wait for pods belonging to these services.
                            If None, wait for all pods in the namespace.
-            sleep: Seconds between checks
+            sleep: Unused; the wait is driven by pod watch events. Kept for backwards compatibility.
             max_wait: Maximum seconds to wait
         """
 
@@ -172,56 +241,37 @@ class KubeCtl:
 
         console.log(f"[bold yellow]Waiting for all pods in {display_name} to be ready...")
 
-        wait = 0
-
-        while wait < max_wait:
-            try:
-                if label_selectors:
-                    # Collect pods from all services
-                    all_pods = []
-                    for selector in label_selectors:
-                        pod_list = self.core_v1_api.list_namespaced_pod(namespace=namespace, label_selector=selector)
-                        all_pods.extend(pod_list.items)
-                else:
-                    all_pods = self.list_pods(namespace).items or []
-
-                if all_pods:
-                    ready_pods = [
-                        pod
-                        for pod in all_pods
-                        if pod.status.container_statuses and all(cs.ready for cs in pod.status.container_statuses)
-                    ]
-
-                    if len(ready_pods) == len(all_pods):
-                        console.log(f"[bold green]All pods in {display_name} are ready.")
-                        return
-
-            except Exception as e:
-                console.log(f"[red]Error checking pod statuses: {e}")
+        def all_ready(pods) -> bool:
+            if label_selectors:
+                # Only pods belonging to one of the services
+                pods = [
+                    pod
+                    for pod in pods
+                    if any(matches_label_selector(pod.metadata.labels, selector) for selector in label_selectors)
+                ]
+            return bool(pods) and all(
+                pod.status.container_statuses and all(cs.ready for cs in pod.status.container_statuses) for pod in pods
+            )
 
-            time.sleep(sleep)
-            wait += sleep
+        result = await_condition(
+            "pods", all_ready, namespace=namespace, timeout=max_wait, description=f"pods in {display_name} to be ready"
+        )
+        if result.satisfied:
+            console.log(f"[bold green]All pods in {display_name} are ready.")
+            return
 
         raise Exception(
             f"[red]Timeout: Not all pods in {display_name} reached the Ready state within {max_wait} seconds."
         )
 
     def wait_for_namespace_deletion(self, namespace, sleep=2, max_wait=300):
-        """Wait for a namespace to be fully deleted before proceeding."""
+        """Wait for a namespace to be fully deleted before proceeding (`sleep` is unused; kept for compatibility)."""
 
         console.log("[bold yellow]Waiting for namespace deletion...")
 
-        wait = 0
-
-        while wait < max_wait:
-            try:
-                self.core_v1_api.read_namespace(name=namespace)
-            except Exception:
-                console.log(f"[bold green]Namespace '{namespace}' has been deleted.")
-                return
-
-            time.sleep(sleep)
-            wait += sleep
+        if await_namespace_deleted(namespace, timeout=max_wait).satisfied:
+            console.log(f"[bold green]Namespace '{namespace}' has been deleted.")
+            return
 
         raise Exception(f"[red]Timeout: Namespace '{namespace}' was not deleted within {max_wait} seconds.")
 
@@ -253,21 +303,19 @@ class KubeCtl:
     def wait_for_stable(self, namespace: str, sleep: int = 2, max_wait: int = 300):
         console.log(f"[bold yellow]Waiting for namespace '{namespace}' to be stable...")
 
-        wait = 0
+        def all_stable(pods) -> bool:
+            return bool(pods) and all(self.is_ready(pod) for pod in pods)
 
-        while wait < max_wait:
-            try:
-                pod_list = self.list_pods(namespace)
-
-                if pod_list.items:
-                    if all(self.is_ready(pod) for pod in pod_list.items):
-                        console.log(f"[bold green]All pods in namespace '{namespace}' are stable.")
-                        return
-            except Exception as e:
-                console.log(f"[red]Error checking pod statuses: {e}")
-
-            time.sleep(sleep)
-            wait += sleep
+        result = await_condition(
+            "pods",
+            all_stable,
+            namespace=namespace,
+            timeout=max_wait,
+            description=f"namespace '{namespace}' to be stable",
+        )
+        if result.satisfied:
+            console.log(f"[bold green]All pods in namespace '{namespace}' are stable.")
+            return
 
         raise Exception(f"[red]Timeout: Namespace '{namespace}' was not deleted within {max_wait} seconds.")
 
@@ -322,52 +370,39 @@ class KubeCtl:
                 default (proxy-pointed) kubeconfig — useful for the workload oracle which
                 needs to access workload-generator jobs that are hidden from the agent.
         """
-        api_instance = client.BatchV1Api(api_client=api_client) if api_client else client.BatchV1Api()
-        start_time = time.time()
-
         console.log(f"[yellow]Waiting for job '{job_name}' to complete...")
-        while time.time() - start_time < timeout:
-            try:
-                job = api_instance.read_namespaced_job(name=job_name, namespace=namespace)
-
-                # Check job status conditions first (more reliable)
-                if job.status.conditions:
-                    for condition in job.status.conditions:
-                        if condition.type == "Complete" and condition.status == "True":
-                            console.log(f"[bold green]Job '{job_name}' completed successfully!")
-                            return
-                        elif condition.type == "Failed" and condition.status == "True":
-                            error_msg = f"Job '{job_name}' failed."
-                            if condition.reason:
-                                error_msg += f"\nReason: {condition.reason}"
-                            if condition.message:
-                                error_msg += f"\nMessage: {condition.message}"
-                            console.log(f"[bold red]{error_msg}")
-                            raise Exception(error_msg)
-
-                # Check numeric status as fallback
-                succeeded = job.status.succeeded or 0
-                failed = job.status.failed or 0
-
-                if succeeded > 0:
-                    console.log(f"[bold green]Job '{job_name}' completed successfully! (succeeded: {succeeded})")
-                    return
-                elif failed > 0:
-                    console.log(f"[bold red]Job '{job_name}' failed! (failed: {failed})")
-                    raise Exception(f"Job '{job_name}' failed.")
-
-                time.sleep(2)
-
-            except client.exceptions.ApiException as e:
-                if e.status == 404:
-                    console.log(f"[red]Job '{job_name}' not found!")
-                    raise Exception(f"Job '{job_name}' not found in namespace '{namespace}'") from e
-                else:
-                    console.log(f"[red]Error checking job status: {e}")
-                    raise
+        result = await_job_finished(job_name, namespace=namespace, timeout=timeout, api_client=api_client)
+        job = result.object
+
+        if not result.satisfied:
+            console.log(f"[bold red]Timeout waiting for job '{job_name}' to complete!")
+            raise TimeoutError(f"Timeout: Job '{job_name}' did not complete within {timeout} seconds.")
 
-        console.log(f"[bold red]Timeout waiting for job '{job_name}' to complete!")
-        raise TimeoutError(f"Timeout: Job '{job_name}' did not complete within {timeout} seconds.")
+        if job is None:
+            console.log(f"[red]Job '{job_name}' not found!")
+            raise Exception(f"Job '{job_name}' not found in namespace '{namespace}'")
+
+        # Check job status conditions first (more reliable)
+        for condition in job.status.conditions or []:
+            if condition.type == "Complete" and condition.status == "True":
+                console.log(f"[bold green]Job '{job_name}' completed successfully!")
+                return
+            elif condition.type == "Failed" and condition.status == "True":
+                error_msg = f"Job '{job_name}' failed."
+                if condition.reason:
+                    error_msg += f"\nReason: {condition.reason}"
+                if condition.message:
+                    error_msg += f"\nMessage: {condition.message}"
+                console.log(f"[bold red]{error_msg}")
+                raise Exception(error_msg)
+
+        # Check numeric status as fallback
+        if job.status.succeeded:
+            console.log(f"[bold green]Job '{job_name}' completed successfully! (succeeded: {job.status.succeeded})")
+            return
+
+        console.log(f"[bold red]Job '{job_name}' failed! (failed: {job.status.failed})")
+        raise Exception(f"Job '{job_name}' failed.")
 
     def update_deployment(self, name: str, namespace: str, deployment):
         """Update the deployment configuration."""
@@ -479,12 +514,15 @@ class KubeCtl:
                 logger.warning(f"Namespace '{namespace}' not found.")
             else:
                 logger.error(f"Error deleting namespace '{namespace}': {e}")
+                return
+        stop_namespace_informers(namespace)
 
     def gc_orphan_localpv_dirs(
         self,
         localpv_path: str = "/var/openebs/local",
         pod_namespace: str = "default",
         timeout: int = 180,
+        max_parallel: int = 16,
     ) -> dict:
         """Garbage-collect orphaned OpenEBS LocalPV hostpath directories on every node.
 
@@ -499,7 +537,8 @@ class KubeCtl:
         This sweep computes the set of currently-live PVs and removes any
         ``pvc-*`` directory that doesn't correspond to one. It runs on every node
         — including control-plane — by launching a one-shot privileged pod with a
-        host filesystem mount and toleration for all taints.
+        host filesystem mount and toleration for all taints. Up to ``max_parallel``
+        nodes are swept at once.
 
         Best-effort: failures on individual nodes are logged but don't raise.
         Returns a dict mapping node name -> number of orphan dirs removed.
@@ -545,7 +584,7 @@ class KubeCtl:
             'echo "GC_REMOVED=$removed"\n'
         )
 
-        for node_name in node_names:
+        def sweep(node_name: str) -> int:
             try:
                 count = self._run_localpv_gc_pod_on_node(
                     node_name=node_name,
@@ -554,14 +593,18 @@ class KubeCtl:
                     keep_blob=keep_blob,
                     timeout=timeout,
                 )
-                results[node_name] = count
                 if count:
                     logger.info(f"[gc_localpv] {node_name}: removed {count} orphan dir(s)")
                 else:
                     logger.debug(f"[gc_localpv] {node_name}: nothing to remove")
+                return count
             except Exception as e:
                 logger.warning(f"[gc_localpv] Failed on {node_name}: {e}")
-                results[node_name] = -1
+                return -1
+
+        # Nodes are swept concurrently; each sweep is one short-lived pod
+        with ThreadPoolExecutor(max_workers=min(max_parallel, len(node_names))) as executor:
+            results.update(zip(node_names, executor.map(sweep, node_names), strict=True))
 
         return results
 
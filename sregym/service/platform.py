@@ -0,0 +1,195 @@
+"""
+Warm platform mode: keep shared infrastructure deployed across problems.
+
+Every problem needs the same platform components (metrics-server, OpenEBS,
+Prometheus, Jaeger, the OTel Collector, Loki). Re-applying and re-waiting on all
+of them for every problem costs minutes per problem in a long sweep. In warm
+mode each component's inputs (manifests, Helm chart and values, patches) are
+hashed and the hash is recorded in a ConfigMap in the cluster after a
+successful deploy. On the next problem a component whose recorded hash matches
+and which is still healthy is left alone; anything else is deployed as usual.
+
+Remote manifests (the metrics-server and OpenEBS URLs) are hashed by URL, so an
+upstream release behind the same URL is only picked up after the recorded hash
+is cleared (PlatformManager.forget()) or the cluster is recreated.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+logger = logging.getLogger("all.infra.platform")
+logger.propagate = True
+logger.setLevel(logging.DEBUG)
+
+STATE_CONFIGMAP = "sregym-platform-hashes"
+STATE_NAMESPACE = "sregym"
+
+
+def _is_helm_artifact(path: Path) -> bool:
+    return path.suffix == ".tgz" or path.name == "Chart.lock" or any(p.startswith("tmpcharts") for p in path.parts)
+
+
+def content_hash(*parts) -> str:
+    """
+    Stable SHA-256 over the given parts. Paths are hashed by content (directories
+    recursively, in sorted order, skipping what `helm dependency update` writes
+    into a chart); dicts and lists by their sorted JSON; anything else by its
+    string form.
+    """
+    digest = hashlib.sha256()
+
+    def feed(part):
+        if isinstance(part, Path):
+            if part.is_dir():
+                for path in sorted(p for p in part.rglob("*") if p.is_file() and not _is_helm_artifact(p)):
+                    digest.update(str(path.relative_to(part)).encode())
+                    digest.update(path.read_bytes())
+            elif part.is_file():
+                digest.update(part.read_bytes())
+            else:
+                digest.update(f"missing:{part}".encode())
+        elif isinstance(part, (dict, list, tuple)):
+            digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+        else:
+            digest.update(str(part).encode())
+        digest.update(b"\0")
+
+    for part in parts:
+        feed(part)
+    return digest.hexdigest()
+
+
+@dataclass
+class PlatformComponent:
+    """One shared platform component and how to deploy and health-check it."""
+
+    name: str
+    # Namespaces the component lives in; reconciliation keeps them in warm mode
+    namespaces: list[str]
+    deploy: Callable[[], None]
+    is_healthy: Callable[[], bool]
+    # Everything that determines what gets deployed (files, dirs, Helm configs, inline manifests)
+    inputs: list = field(default_factory=list)
+    # Steps that must be deployed and ready before this one starts
+    depends_on: list[str] = field(default_factory=list)
+    # Called before redeploying a component whose inputs changed (e.g. a Helm uninstall)
+    teardown: Callable[[], None] | None = None
+
+    def digest(self) -> str:
+        return content_hash(self.name, *self.inputs)
+
+
+class PlatformManager:
+    """Deploys platform components, skipping unchanged healthy ones when warm."""
+
+    def __init__(self, warm: bool = False):
+        self.warm = warm
+        self.core_v1 = client.CoreV1Api()
+        self.deployed: dict[str, PlatformComponent] = {}
+        self.skipped: list[str] = []
+        # Components are ensured concurrently; guards the ConfigMap read-modify-write and the lists above
+        self._lock = threading.Lock()
+
+    def ensure(self, component: PlatformComponent) -> str:
+        """Deploy the component unless warm mode finds it unchanged and healthy. Returns "kept" or "deployed"."""
+        with self._lock:
+            self.deployed[component.name] = component
+        if not self.warm:
+            component.deploy()
+            return "deployed"
+
+        digest = component.digest()
+        recorded = self._recorded_hashes().get(component.name)
+        if recorded == digest and component.is_healthy():
+            logger.info(f"[PLATFORM] {component.name} unchanged ({digest[:12]}), skipping redeploy")
+            with self._lock:
+                self.skipped.append(component.name)
+            return "kept"
+
+        if recorded is None:
+            logger.info(f"[PLATFORM] {component.name} has no recorded hash, deploying")
+        elif recorded != digest:
+            logger.info(f"[PLATFORM] {component.name} changed ({recorded[:12]} -> {digest[:12]}), redeploying")
+            if component.teardown is not None:
+                component.teardown()
+        else:
+            logger.info(f"[PLATFORM] {component.name} is unhealthy, redeploying")
+        component.deploy()
+        self._record_hash(component.name, digest)
+        return "deployed"
+
+    def namespaces(self) -> set[str]:
+        """Namespaces of every component ensured so far."""
+        with self._lock:
+            return {ns for component in self.deployed.values() for ns in component.namespaces}
+
+    def forget(self, name: str | None = None):
+        """Drop the recorded hash of one component (or all), forcing a redeploy next time."""
+        with self._lock:
+            hashes = self._recorded_hashes()
+            if name is None:
+                hashes = {}
+            else:
+                hashes.pop(name, None)
+            self._write_hashes(hashes)
+
+    def _recorded_hashes(self) -> dict[str, str]:
+        try:
+            cm = self.core_v1.read_namespaced_config_map(STATE_CONFIGMAP, STATE_NAMESPACE)
+        except ApiException as e:
+            if e.status != 404:
+                logger.warning(f"Failed to read platform hashes: {e}")
+            return {}
+        return dict(cm.data or {})
+
+    def _record_hash(self, name: str, digest: str):
+        with self._lock:
+            hashes = self._recorded_hashes()
+            hashes[name] = digest
+            self._write_hashes(hashes)
+
+    def _write_hashes(self, hashes: dict[str, str]):
+        body = client.V1ConfigMap(
+            metadata=client.V1ObjectMeta(name=STATE_CONFIGMAP, namespace=STATE_NAMESPACE), data=hashes
+        )
+        try:
+            self._ensure_state_namespace()
+            try:
+                self.core_v1.replace_namespaced_config_map(STATE_CONFIGMAP, STATE_NAMESPACE, body)
+            except ApiException as e:
+                if e.status != 404:
+                    raise
+                self.core_v1.create_namespaced_config_map(STATE_NAMESPACE, body)
+        except ApiException as e:
+            # Not fatal: the component is simply redeployed next time
+            logger.warning(f"Failed to record platform hashes: {e}")
+
+    def _ensure_state_namespace(self):
+        try:
+            self.core_v1.create_namespace(client.V1Namespace(metadata=client.V1ObjectMeta(name=STATE_NAMESPACE)))
+        except ApiException as e:
+            if e.status != 409:
+                raise
+
+
+def deployments_ready(namespace: str, names: list[str] | None = None) -> bool:
+    """True if the namespace has the named deployments (or any, if names is None) and all are fully ready."""
+    try:
+        deployments = client.AppsV1Api().list_namespaced_deployment(namespace).items
+    except ApiException:
+        return False
+    if names is not None:
+        deployments = [d for d in deployments if d.metadata.name in names]
+        if len(deployments) != len(names):
+            return False
+    if not deployments:
+        return False
+    return all((d.status.ready_replicas or 0) >= (d.spec.replicas or 0) for d in deployments)
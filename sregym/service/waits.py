@@ -0,0 +1,262 @@
+"""
+Event-driven wait primitives built on Kubernetes watch streams.
+
+await_condition() LISTs the matching objects, evaluates the predicate, then
+follows a watch from the list's resourceVersion and re-evaluates the predicate
+on every event, so a wait returns as soon as the cluster reaches the desired
+state instead of at the next poll tick. Expired resourceVersions (410 Gone) are
+handled by re-listing. When the shared informer cache is enabled, waits are
+served from it instead of opening a dedicated watch.
+
+Every wait returns a WaitResult recording how long it actually took; the most
+recent results are kept for inspection via recent_waits().
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from kubernetes import client, watch
+from kubernetes.client.rest import ApiException
+
+from sregym.service.informer import get_cluster_cache, object_key, resolve_list_func
+
+logger = logging.getLogger("all.infra.waits")
+logger.propagate = True
+logger.setLevel(logging.DEBUG)
+
+# Backoff after an unexpected API error before re-listing
+ERROR_BACKOFF_SECONDS = 1
+# Number of completed waits kept for recent_waits()
+WAIT_HISTORY_SIZE = 256
+
+
+@dataclass
+class WaitResult:
+    """Outcome and timing of a single wait."""
+
+    description: str
+    satisfied: bool
+    elapsed: float
+    events: int = 0
+    objects: list = field(default_factory=list)
+
+    @property
+    def object(self):
+        """The first matching object when the wait targeted a single resource, else None."""
+        return self.objects[0] if self.objects else None
+
+    def as_dict(self) -> dict:
+        return {
+            "description": self.description,
+            "satisfied": self.satisfied,
+            "elapsed": round(self.elapsed, 3),
+            "events": self.events,
+        }
+
+
+_wait_history: deque[WaitResult] = deque(maxlen=WAIT_HISTORY_SIZE)
+_wait_history_lock = threading.Lock()
+
+
+def recent_waits() -> list[dict]:
+    """Return timing records for the most recent waits, oldest first."""
+    with _wait_history_lock:
+        return [result.as_dict() for result in _wait_history]
+
+
+def _record(result: WaitResult) -> WaitResult:
+    with _wait_history_lock:
+        _wait_history.append(result)
+    outcome = "satisfied" if result.satisfied else "timed out"
+    logger.info(f"Wait for {result.description} {outcome} after {result.elapsed:.2f}s ({result.events} events)")
+    return result
+
+
+def _name_from_field_selector(field_selector: str | None) -> str | None:
+    """Return X for a field selector of exactly "metadata.name=X", else None."""
+    if field_selector and "," not in field_selector and field_selector.startswith("metadata.name="):
+        return field_selector.split("=", 1)[1]
+    return None
+
+
+def _await_cached(kind, namespace, predicate, label_selector, name, timeout) -> tuple[bool, list, int]:
+    cache = get_cluster_cache()
+    informer = cache.informer(kind, namespace)
+    start_version = informer.version
+    objects: list = []
+
+    def check() -> bool:
+        nonlocal objects
+        objects = [obj for obj in informer.list(label_selector) if name is None or obj.metadata.name == name]
+        return predicate(objects)
+
+    satisfied = cache.wait_until(kind, namespace, check, timeout)
+    return satisfied, objects, informer.version - start_version
+
+
+def _await_watched(kind, namespace, predicate, label_selector, field_selector, deadline, api_client):
+    list_func, list_args = resolve_list_func(kind, namespace, api_client)
+    kwargs = {}
+    if label_selector:
+        kwargs["label_selector"] = label_selector
+    if field_selector:
+        kwargs["field_selector"] = field_selector
+
+    objects: dict = {}
+    resource_version = None
+    need_list = True
+    events = 0
+    while True:
+        try:
+            if need_list:
+                result = list_func(*list_args, **kwargs)
+                objects = {object_key(obj): obj for obj in result.items}
+                resource_version = result.metadata.resource_version
+                need_list = False
+            if predicate(list(objects.values())):
+                return True, list(objects.values()), events
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False, list(objects.values()), events
+
+            w = watch.Watch()
+            for event in w.stream(
+                list_func,
+                *list_args,
+                resource_version=resource_version,
+                timeout_seconds=max(1, math.ceil(remaining)),
+                allow_watch_bookmarks=True,
+                **kwargs,
+            ):
+                events += 1
+                obj = event["object"]
+                if event["type"] == "BOOKMARK":
+                    resource_version = obj["metadata"]["resourceVersion"]
+                    continue
+                resource_version = obj.metadata.resource_version
+                if event["type"] == "DELETED":
+                    objects.pop(object_key(obj), None)
+                else:
+                    objects[object_key(obj)] = obj
+                if predicate(list(objects.values())):
+                    w.stop()
+                    return True, list(objects.values()), events
+                if time.monotonic() >= deadline:
+                    w.stop()
+                    break
+            # The stream ended (server-side timeout); loop to re-check and resume from resource_version
+        except ApiException as e:
+            if e.status != 410:
+                logger.warning(f"Watch on {kind} in {namespace or 'cluster'} failed: {e}")
+            # A LIST that keeps failing must not outlive the deadline
+            if time.monotonic() >= deadline:
+                return False, list(objects.values()), events
+            if e.status != 410:
+                time.sleep(max(0, min(ERROR_BACKOFF_SECONDS, deadline - time.monotonic())))
+            need_list = True
+        except Exception as e:
+            logger.warning(f"Watch on {kind} in {namespace or 'cluster'} failed: {e}")
+            if time.monotonic() >= deadline:
+                return False, list(objects.values()), events
+            time.sleep(max(0, min(ERROR_BACKOFF_SECONDS, deadline - time.monotonic())))
+            need_list = True
+
+
+def await_condition(
+    kind: str,
+    predicate: Callable[[list], bool],
+    namespace: str | None = None,
+    label_selector: str | None = None,
+    field_selector: str | None = None,
+    timeout: float = 300,
+    api_client: client.ApiClient | None = None,
+    description: str | None = None,
+) -> WaitResult:
+    """Block until predicate(objects) is true for the objects of `kind` matching the selectors.
+
+    Args:
+        kind: Resource kind, one of sregym.service.informer.RESOURCE_KINDS (e.g. "pods", "jobs").
+        predicate: Called with the current list of matching objects after the initial LIST and
+            after every watch event.
+        namespace: Namespace to watch; None watches cluster-scoped kinds or all namespaces.
+        label_selector: Optional label selector.
+        field_selector: Optional field selector (e.g. "metadata.name=foo").
+        timeout: Maximum seconds to wait.
+        api_client: Optional explicit ApiClient; bypasses the shared informer cache.
+        description: Human-readable label used in timing logs.
+
+    Returns:
+        A WaitResult; `satisfied` is False if the timeout expired first.
+    """
+    description = description or f"{kind} in {namespace or 'cluster'}"
+    start = time.monotonic()
+    name = _name_from_field_selector(field_selector)
+
+    cache = get_cluster_cache()
+    if cache is not None and api_client is None and (field_selector is None or name is not None):
+        try:
+            satisfied, objects, events = _await_cached(kind, namespace, predicate, label_selector, name, timeout)
+            return _record(WaitResult(description, satisfied, time.monotonic() - start, events, objects))
+        except (TimeoutError, ValueError) as e:
+            logger.debug(f"Informer cache cannot serve {description}: {e}; watching directly")
+
+    satisfied, objects, events = _await_watched(
+        kind, namespace, predicate, label_selector, field_selector, start + timeout, api_client
+    )
+    return _record(WaitResult(description, satisfied, time.monotonic() - start, events, objects))
+
+
+def await_deleted(
+    kind: str,
+    name: str,
+    namespace: str | None = None,
+    timeout: float = 300,
+    api_client: client.ApiClient | None = None,
+) -> WaitResult:
+    """Block until the named object no longer exists."""
+    return await_condition(
+        kind,
+        lambda objects: not objects,
+        namespace=namespace,
+        field_selector=f"metadata.name={name}",
+        timeout=timeout,
+        api_client=api_client,
+        description=f"deletion of {kind[:-1]} '{name}'",
+    )
+
+
+def await_namespace_deleted(namespace: str, timeout: float = 300) -> WaitResult:
+    """Block until a namespace has been fully deleted."""
+    return await_deleted("namespaces", namespace, timeout=timeout)
+
+
+def is_job_finished(job) -> bool:
+    """True once a Job has a Complete/Failed condition or any succeeded/failed pods."""
+    for condition in job.status.conditions or []:
+        if condition.type in ("Complete", "Failed") and condition.status == "True":
+            return True
+    return bool(job.status.succeeded or job.status.failed)
+
+
+def await_job_finished(
+    name: str,
+    namespace: str = "default",
+    timeout: float = 600,
+    api_client: client.ApiClient | None = None,
+) -> WaitResult:
+    """Block until the named Job finishes (or disappears). The Job, if any, is in result.object."""
+    return await_condition(
+        "jobs",
+        lambda jobs: not jobs or all(is_job_finished(job) for job in jobs),
+        namespace=namespace,
+        field_selector=f"metadata.name={name}",
+        timeout=timeout,
+        api_client=api_client,
+        description=f"job '{name}' to finish",
+    )
@@ -1,36 +1,120 @@
+import contextlib
+import hashlib
 import json
+import logging
 import os
+import threading
+from pathlib import Path
 
-from sregym.paths import CACHE_DIR, LLM_CACHE_FILE
+from sregym.paths import LLM_CACHE_DIR
+
+logger = logging.getLogger("all.sregym.llm_cache")
+
+# Evict least recently used entries once the store grows past this many bytes
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(2 * 1024**3)))
+# off: no cache. record: always query the model and store the response. replay: answer only from the
+# cache and raise LLMCacheMiss otherwise (no network). read-through: answer from the cache, query on a miss.
+LLM_CACHE_MODES = ("off", "record", "replay", "read-through")
+
+
+class LLMCacheMiss(KeyError):
+    """A replay-only cache has no response for the request."""
 
 
 class LLMCache:
-    """A cache for storing the outputs of an LLM."""
+    """
+    Content-addressed store of LLM responses.
 
-    def __init__(self) -> None:
-        if os.path.exists(LLM_CACHE_FILE):
-            with open(LLM_CACHE_FILE) as f:
-                self.cache_dict = json.load(f)
-        else:
-            os.makedirs(CACHE_DIR, exist_ok=True)
-            self.cache_dict = {}
+    Each entry is one JSON file named after the SHA-256 of its request, sharded
+    into 256 directories by the first two hex digits (<dir>/3f/3fa9...json), so
+    several processes can share a store without a lock: writes are atomic
+    renames, and a hit bumps the file's mtime for least-recently-used eviction.
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_bytes: int = LLM_CACHE_MAX_BYTES):
+        self.directory = Path(directory or os.getenv("LLM_CACHE_DIR") or LLM_CACHE_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._size: int | None = None
+        self._lock = threading.Lock()
 
     @staticmethod
-    def process_payload(payload):
-        if isinstance(payload, (list, dict)):
-            return json.dumps(payload)
-        return payload
-
-    def get_from_cache(self, payload):
-        payload_cache = self.process_payload(payload)
-        if payload_cache in self.cache_dict:
-            return self.cache_dict[payload_cache]
-        return None
-
-    def add_to_cache(self, payload, output):
-        payload_cache = self.process_payload(payload)
-        self.cache_dict[payload_cache] = output
-
-    def save_cache(self):
-        with open(LLM_CACHE_FILE, "w") as f:
-            json.dump(self.cache_dict, f, indent=4)
+    def request_key(payload) -> str:
+        """Hash of a JSON-serializable request; equal requests give equal keys regardless of dict order."""
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry
+
+    def put(self, key: str, entry: dict):
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        data = json.dumps(entry, ensure_ascii=False, default=str).encode("utf-8")
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._disk_usage()
+            else:
+                self._size += len(data) - replaced
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list[Path]:
+        return list(self.directory.glob("??/*.json"))
+
+    def _disk_usage(self) -> int:
+        total = 0
+        for path in self._entries():
+            with contextlib.suppress(FileNotFoundError):
+                total += path.stat().st_size
+        return total
+
+    def _evict(self):
+        # Rescan: other processes sharing the store have been writing too
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        size = sum(entry[1] for entry in entries)
+        # Free down to 90% so a full store does not evict on every write
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        for _mtime, entry_size, path in entries:
+            if size <= target:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+            evicted += 1
+        self._size = size
+        if evicted:
+            logger.info(f"Evicted {evicted} LLM cache entries from {self.directory} ({size / 1024**2:.0f} MiB kept)")
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries()), "bytes": self._disk_usage()}
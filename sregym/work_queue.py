@@ -0,0 +1,144 @@
+"""
+File-backed problem queue shared by the shard processes of a sharded run.
+
+The queue is a small JSON document next to a lock file. Every operation takes
+an exclusive flock on the lock file, reads the document, updates it and
+atomically replaces it, so any number of driver processes on the same host can
+claim work from it safely.
+
+The queue also counts the attempts each problem has completed, so a problem
+that is re-queued (a resumed run, a crashed shard, a retry after a failure)
+runs only the attempts it is still missing.
+"""
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+# Times a failed problem is put back on the queue before it is reported as failed
+MAX_FAILURE_RETRIES = 1
+
+
+class WorkQueue:
+    """Problems waiting to run ("pending"), running ("claimed"), finished ("done") or given up on ("failed")."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+
+    @classmethod
+    def create(cls, path: str | Path, problem_ids: list[str], attempts: dict[str, int] | None = None) -> "WorkQueue":
+        """Create (or overwrite) a queue holding problem_ids in order; `attempts` are already completed ones."""
+        queue = cls(path)
+        queue.path.parent.mkdir(parents=True, exist_ok=True)
+        attempts = {pid: count for pid, count in (attempts or {}).items() if pid in problem_ids and count}
+        with queue._locked():
+            queue._write(
+                {
+                    "pending": list(problem_ids),
+                    "claimed": {},
+                    "done": [],
+                    "failed": [],
+                    "attempts": attempts,
+                    "failures": {},
+                }
+            )
+        return queue
+
+    @contextmanager
+    def _locked(self):
+        with open(self.lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read(self) -> dict:
+        with open(self.path) as f:
+            state = json.load(f)
+        for key, empty in (("failed", []), ("attempts", {}), ("failures", {})):
+            state.setdefault(key, empty)
+        return state
+
+    def _write(self, state: dict):
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def claim(self, shard: str) -> str | None:
+        """Take the next pending problem for `shard`, or None when nothing is left."""
+        with self._locked():
+            state = self._read()
+            if not state["pending"]:
+                return None
+            problem_id = state["pending"].pop(0)
+            state["claimed"][problem_id] = shard
+            self._write(state)
+            return problem_id
+
+    def attempts(self, problem_id: str) -> int:
+        """Attempts of `problem_id` completed so far, by any shard or a resumed run."""
+        with self._locked():
+            return self._read()["attempts"].get(problem_id, 0)
+
+    def record_attempt(self, problem_id: str) -> int:
+        """Count one more completed attempt of `problem_id`; returns the new count."""
+        with self._locked():
+            state = self._read()
+            count = state["attempts"][problem_id] = state["attempts"].get(problem_id, 0) + 1
+            self._write(state)
+            return count
+
+    def complete(self, problem_id: str):
+        """Mark a claimed problem as finished."""
+        with self._locked():
+            state = self._read()
+            state["claimed"].pop(problem_id, None)
+            if problem_id not in state["done"]:
+                state["done"].append(problem_id)
+            self._write(state)
+
+    def fail(self, problem_id: str, max_retries: int = MAX_FAILURE_RETRIES) -> bool:
+        """
+        Record that a claimed problem failed. It goes back to the end of the queue (possibly
+        for another shard) until it has failed `max_retries` times more, then it is marked
+        failed. Returns whether it was re-queued.
+        """
+        with self._locked():
+            state = self._read()
+            state["claimed"].pop(problem_id, None)
+            failures = state["failures"][problem_id] = state["failures"].get(problem_id, 0) + 1
+            retry = failures <= max_retries
+            if retry:
+                state["pending"].append(problem_id)
+            elif problem_id not in state["failed"]:
+                state["failed"].append(problem_id)
+            self._write(state)
+            return retry
+
+    def release(self, shard: str) -> list[str]:
+        """Put the problems `shard` had claimed back at the front of the queue (e.g. after it crashed)."""
+        with self._locked():
+            state = self._read()
+            released = [pid for pid, owner in state["claimed"].items() if owner == shard]
+            for pid in released:
+                del state["claimed"][pid]
+            state["pending"] = released + state["pending"]
+            self._write(state)
+            return released
+
+    def counts(self) -> dict[str, int]:
+        with self._locked():
+            state = self._read()
+        return {key: len(state[key]) for key in ("pending", "claimed", "done", "failed")}
+
+    def failed(self) -> list[str]:
+        with self._locked():
+            return list(self._read()["failed"])
+
+    def total(self) -> int:
+        return sum(self.counts().values())
@@ -0,0 +1,207 @@
+"""
+Benchmark the Kubernetes API filtering proxy against a local stub API server.
+
+Starts a TLS stub that serves a canned pod list, points a KubernetesAPIProxy at it
+through a temporary kubeconfig, then drives concurrent keep-alive clients through
+the proxy and reports p50/p99 latency and requests/sec.
+
+### Example
+uv run tests/benchmarks/k8s_proxy_bench.py --requests 2000 --concurrency 16 --items 200
+"""
+
+import argparse
+import base64
+import datetime
+import http.client
+import ipaddress
+import json
+import os
+import ssl
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import yaml
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from sregym.service.k8s_proxy import KubernetesAPIProxy  # noqa: E402
+
+
+def make_self_signed_cert() -> tuple[bytes, bytes]:
+    """Return a (cert_pem, key_pem) pair valid for 127.0.0.1."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "sregym-stub-apiserver")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), True)
+        .sign(key, hashes.SHA256())
+    )
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    return cert.public_bytes(serialization.Encoding.PEM), key_pem
+
+
+def make_pod_list(n_items: int) -> bytes:
+    items = [
+        {
+            "metadata": {"name": f"pod-{i}", "namespace": "khaos" if i % 10 == 0 else "default", "labels": {}},
+            "status": {"phase": "Running"},
+        }
+        for i in range(n_items)
+    ]
+    return json.dumps({"kind": "PodList", "apiVersion": "v1", "items": items}).encode()
+
+
+def start_stub_server(cert_file: str, key_file: str, body: bytes, latency: float) -> ThreadingHTTPServer:
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_file, key_file)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def write_kubeconfig(path: str, port: int, ca_pem: bytes):
+    kubeconfig = {
+        "apiVersion": "v1",
+        "kind": "Config",
+        "current-context": "stub",
+        "clusters": [
+            {
+                "name": "stub",
+                "cluster": {
+                    "server": f"https://127.0.0.1:{port}",
+                    "certificate-authority-data": base64.b64encode(ca_pem).decode(),
+                },
+            }
+        ],
+        "contexts": [{"name": "stub", "context": {"cluster": "stub", "user": "stub"}}],
+        "users": [{"name": "stub", "user": {"token": "stub"}}],
+    }
+    with open(path, "w") as f:
+        yaml.safe_dump(kubeconfig, f)
+
+
+def run_load(port: int, path: str, n_requests: int, concurrency: int) -> tuple[list[float], float, int]:
+    """Drive n_requests through the proxy; each worker reuses one keep-alive connection."""
+    per_worker = [n_requests // concurrency + (1 if i < n_requests % concurrency else 0) for i in range(concurrency)]
+    errors = 0
+    errors_lock = threading.Lock()
+
+    def worker(count: int) -> list[float]:
+        nonlocal errors
+        latencies = []
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        for _ in range(count):
+            start = time.perf_counter()
+            try:
+                conn.request("GET", path)
+                resp = conn.getresponse()
+                resp.read()
+                if resp.status != 200:
+                    raise RuntimeError(resp.status)
+            except Exception:
+                with errors_lock:
+                    errors += 1
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                continue
+            latencies.append(time.perf_counter() - start)
+        conn.close()
+        return latencies
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(worker, per_worker))
+    elapsed = time.perf_counter() - start
+    return [lat for worker_lats in results for lat in worker_lats], elapsed, errors
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the k8s API filtering proxy against a stub API server")
+    parser.add_argument("--requests", type=int, default=1000, help="Total requests to send (default: 1000)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent client connections (default: 8)")
+    parser.add_argument("--items", type=int, default=100, help="Pods in the stub list response (default: 100)")
+    parser.add_argument(
+        "--upstream-latency", type=float, default=0.0, help="Artificial stub latency in seconds (default: 0)"
+    )
+    parser.add_argument("--path", type=str, default="/api/v1/pods", help="Request path (default: /api/v1/pods)")
+    args = parser.parse_args()
+
+    cert_pem, key_pem = make_self_signed_cert()
+    with tempfile.TemporaryDirectory() as tmp:
+        cert_file = os.path.join(tmp, "stub.crt")
+        key_file = os.path.join(tmp, "stub.key")
+        kubeconfig_file = os.path.join(tmp, "kubeconfig")
+        with open(cert_file, "wb") as f:
+            f.write(cert_pem)
+        with open(key_file, "wb") as f:
+            f.write(key_pem)
+
+        stub = start_stub_server(cert_file, key_file, make_pod_list(args.items), args.upstream_latency)
+        write_kubeconfig(kubeconfig_file, stub.server_address[1], cert_pem)
+
+        proxy = KubernetesAPIProxy(listen_port=0, kubeconfig_path=kubeconfig_file)
+        proxy.start()
+        port = proxy.server.server_address[1]
+        try:
+            # Warm up the upstream pool and the client path
+            run_load(port, args.path, args.concurrency, args.concurrency)
+            latencies, elapsed, errors = run_load(port, args.path, args.requests, args.concurrency)
+        finally:
+            proxy.stop()
+            stub.shutdown()
+
+    latencies.sort()
+    print(f"requests:     {len(latencies)} ok, {errors} errors")
+    print(f"concurrency:  {args.concurrency}")
+    print(f"throughput:   {len(latencies) / elapsed:.1f} req/s")
+    print(f"latency p50:  {percentile(latencies, 50) * 1000:.2f} ms")
+    print(f"latency p99:  {percentile(latencies, 99) * 1000:.2f} ms")
+    print(f"latency mean: {statistics.fmean(latencies) * 1000:.2f} ms" if latencies else "latency mean: n/a")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark the kubectl MCP tool with and without the in-process execution engine.
+
+Creates a scratch namespace with a zero-replica deployment in the current kube
+context, then runs every verb through KubectlCmdRunner.exec_kubectl_cmd_safely
+(dry-run, rollback-state capture and execution, exactly as an agent step does)
+once with the kubectl binary and once with the in-process engine, and reports
+per-verb p50/p99 latency.
+
+Requires a reachable cluster and the kubectl binary on PATH.
+
+### Example
+uv run tests/benchmarks/kubectl_engine_bench.py --iterations 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from mcp_server.configs.kubectl_tool_cfg import KubectlToolCfg  # noqa: E402
+from mcp_server.kubectl_server_helper.action_stack import ActionStack  # noqa: E402
+from mcp_server.kubectl_server_helper.kubectl_cmd_runner import KubectlCmdRunner  # noqa: E402
+
+DEPLOYMENT_MANIFEST = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: bench
+  labels:
+    app: bench
+spec:
+  replicas: 0
+  selector:
+    matchLabels:
+      app: bench
+  template:
+    metadata:
+      labels:
+        app: bench
+    spec:
+      containers:
+      - name: web
+        image: nginx:1.25
+"""
+
+
+def kubectl(command: str):
+    subprocess.run(command, shell=True, check=True, capture_output=True)  # nosec B602
+
+
+def verb_commands(namespace: str, manifest: str, iteration: int) -> dict[str, str]:
+    """The command each verb runs on a given iteration."""
+    return {
+        "get": f"kubectl get pods -n {namespace}",
+        "get -o yaml": f"kubectl get deployment bench -n {namespace} -o yaml",
+        "describe": f"kubectl describe deployment bench -n {namespace}",
+        "patch": (
+            f"kubectl patch deployment bench -n {namespace} "
+            f'-p \'{{"metadata":{{"annotations":{{"bench/iteration":"{iteration}"}}}}}}\''
+        ),
+        "scale": f"kubectl scale deployment bench -n {namespace} --replicas=0",
+        "set image": f"kubectl set image deployment/bench web=nginx:1.25.{iteration % 2} -n {namespace}",
+        "apply": f"kubectl apply -f {manifest} -n {namespace}",
+        "delete": f"kubectl delete configmap bench-{iteration} -n {namespace}",
+    }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_mode(use_engine: bool, namespace: str, manifest: str, iterations: int, output_dir: str):
+    config = KubectlToolCfg(output_dir=output_dir, namespace=namespace, use_inprocess_engine=use_engine)
+    runner = KubectlCmdRunner(config, ActionStack())
+    latencies: dict[str, list[float]] = {}
+    failures: dict[str, int] = {}
+
+    # Warm-up: client setup and discovery happen once per process, not per step
+    runner.exec_kubectl_cmd_safely(f"kubectl get deployment bench -n {namespace}")
+
+    for iteration in range(iterations):
+        kubectl(f"kubectl create configmap bench-{iteration} -n {namespace} --from-literal=i={iteration}")
+        for verb, command in verb_commands(namespace, manifest, iteration).items():
+            start = time.perf_counter()
+            result = runner.exec_kubectl_cmd_safely(command)
+            latencies.setdefault(verb, []).append(time.perf_counter() - start)
+            if result.startswith("Command Rejected"):
+                failures[verb] = failures.get(verb, 0) + 1
+    return latencies, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the kubectl MCP tool with and without the in-process engine"
+    )
+    parser.add_argument("--iterations", type=int, default=10, help="Runs of each verb per mode (default: 10)")
+    parser.add_argument(
+        "--namespace",
+        type=str,
+        default="kubectl-engine-bench",
+        help="Scratch namespace (default: kubectl-engine-bench)",
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch namespace afterwards")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = os.path.join(tmp, "deployment.yaml")
+        with open(manifest, "w") as f:
+            f.write(DEPLOYMENT_MANIFEST)
+
+        kubectl(f"kubectl create namespace {args.namespace} --dry-run=client -o yaml | kubectl apply -f -")
+        kubectl(f"kubectl apply -f {manifest} -n {args.namespace}")
+        results = {}
+        try:
+            for mode, use_engine in (("binary", False), ("engine", True)):
+                kubectl(f"kubectl delete configmap -n {args.namespace} --all")
+                results[mode] = run_mode(use_engine, args.namespace, manifest, args.iterations, os.path.join(tmp, mode))
+        finally:
+            if not args.keep:
+                kubectl(f"kubectl delete namespace {args.namespace} --wait=false")
+
+    print(f"{'verb':<12} {'binary p50':>11} {'binary p99':>11} {'engine p50':>11} {'engine p99':>11} {'speedup':>8}")
+    for verb in verb_commands(args.namespace, "", 0):
+        binary = results["binary"][0].get(verb, [])
+        engine = results["engine"][0].get(verb, [])
+        speedup = statistics.median(binary) / statistics.median(engine) if binary and engine else float("nan")
+        print(
+            f"{verb:<12} {percentile(binary, 50) * 1000:>9.1f}ms {percentile(binary, 99) * 1000:>9.1f}ms "
+            f"{percentile(engine, 50) * 1000:>9.1f}ms {percentile(engine, 99) * 1000:>9.1f}ms {speedup:>7.1f}x"
+        )
+    for mode, (_, failures) in results.items():
+        if failures:
+            print(f"{mode} rejected commands: {failures}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Load-test MCP tool dispatch with many concurrent sessions.
+
+Serves a synthetic MCP server over SSE (the same transport as sregym_mcp_server)
+with a `work` tool that blocks for a configurable time, like a slow kubectl or
+Loki call, and a trivial `ping` tool. N simulated sessions call `work`
+concurrently while a probe session keeps calling `ping`; the probe latency
+shows whether slow tool bodies stall other sessions' streams.
+
+--mode pool runs tool bodies on a ToolWorkerPool (what the MCP tools do);
+--mode inline blocks inside the event loop, which is what synchronous tools did
+on fastmcp versions that ran them inline.
+
+### Example
+uv run tests/benchmarks/mcp_tool_pool_load.py --sessions 16 --calls 10 --work-seconds 0.2
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+import uvicorn
+from fastmcp import Client, Context, FastMCP
+from fastmcp.server.http import create_sse_app
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from mcp_server.tool_pool import ToolWorkerPool, session_key  # noqa: E402
+
+
+def build_server(mode: str, pool: ToolWorkerPool) -> FastMCP:
+    mcp = FastMCP("Load Test MCP Server")
+
+    @mcp.tool(name="work")
+    async def work(seconds: float, ctx: Context) -> str:
+        """Block for `seconds`."""
+        if mode == "inline":
+            time.sleep(seconds)
+        else:
+            await pool.run(session_key(ctx), time.sleep, seconds)
+        return "done"
+
+    @mcp.tool(name="ping")
+    async def ping() -> str:
+        """Return immediately."""
+        return "pong"
+
+    return mcp
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(mcp: FastMCP, port: int) -> uvicorn.Server:
+    server = uvicorn.Server(
+        uvicorn.Config(create_sse_app(mcp, "/messages/", "/sse"), host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run_session(url: str, session: int, calls: int, work_seconds: float, latencies: list[float]):
+    async with Client(f"{url}?session_id=load-{session}") as client:
+        for _ in range(calls):
+            start = time.perf_counter()
+            await client.call_tool("work", {"seconds": work_seconds})
+            latencies.append(time.perf_counter() - start)
+
+
+async def run_probe(url: str, interval: float, stop: asyncio.Event, latencies: list[float]):
+    async with Client(f"{url}?session_id=probe") as client:
+        while not stop.is_set():
+            start = time.perf_counter()
+            await client.call_tool("ping", {})
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(interval)
+
+
+async def drive(url: str, args) -> tuple[list[float], list[float], float]:
+    work_latencies: list[float] = []
+    ping_latencies: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(run_probe(url, args.probe_interval, stop, ping_latencies))
+    await asyncio.sleep(0.5)
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(run_session(url, i, args.calls, args.work_seconds, work_latencies) for i in range(args.sessions))
+    )
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    return work_latencies, ping_latencies, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test MCP tool dispatch with concurrent sessions")
+    parser.add_argument("--sessions", type=int, default=16, help="Concurrent simulated sessions (default: 16)")
+    parser.add_argument("--calls", type=int, default=10, help="Tool calls per session (default: 10)")
+    parser.add_argument("--work-seconds", type=float, default=0.2, help="Blocking time per call (default: 0.2)")
+    parser.add_argument("--mode", choices=["pool", "inline"], default="pool", help="Tool execution mode")
+    parser.add_argument("--workers", type=int, default=32, help="Pool worker threads (default: 32)")
+    parser.add_argument("--session-limit", type=int, default=4, help="Concurrent calls per session (default: 4)")
+    parser.add_argument("--probe-interval", type=float, default=0.05, help="Seconds between probe pings")
+    args = parser.parse_args()
+
+    pool = ToolWorkerPool(args.workers, args.session_limit)
+    port = free_port()
+    server = start_server(build_server(args.mode, pool), port)
+    try:
+        work, ping, elapsed = asyncio.run(drive(f"http://127.0.0.1:{port}/sse", args))
+    finally:
+        server.should_exit = True
+        pool.shutdown()
+
+    total = args.sessions * args.calls
+    print(f"mode:            {args.mode}")
+    print(f"sessions:        {args.sessions} x {args.calls} calls of {args.work_seconds}s")
+    print(f"wall time:       {elapsed:.2f}s ({len(work)}/{total} calls, {len(work) / elapsed:.1f} calls/s)")
+    print(f"work p50/p99:    {percentile(work, 50) * 1000:.1f} / {percentile(work, 99) * 1000:.1f} ms")
+    print(
+        f"ping p50/p99:    {percentile(ping, 50) * 1000:.1f} / {percentile(ping, 99) * 1000:.1f} ms "
+        f"(max {max(ping, default=float('nan')) * 1000:.1f} ms, mean {statistics.fmean(ping) * 1000:.1f} ms)"
+        if ping
+        else "ping p50/p99:    n/a"
+    )
+    if args.mode == "pool":
+        stats = pool.stats()
+        print(f"peak queue:      {stats['peak_queue_depth']}")
+        print(f"mean queue wait: {stats['mean_queue_wait_ms']} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark start-up cost of the problem registry.
+
+Each scenario runs in a fresh interpreter, so module import caches do not carry
+over between runs:
+
+- list:      import the registry and list every problem ID
+- metadata:  also query the metadata index (find_problems)
+- build-one: also import the modules of one problem (what a run pays per problem)
+- eager:     import every problem module, i.e. what listing problem IDs cost
+             before the registry imported problems on demand
+
+None of the scenarios builds a problem, so no cluster or kubeconfig is needed.
+
+### Example
+uv run tests/benchmarks/problem_registry_startup.py --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess  # nosec B404
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+SCENARIOS = {
+    "list": "r = ProblemRegistry(); r.get_problem_ids(all=True)",
+    "metadata": "r = ProblemRegistry(); r.get_problem_ids(all=True); r.find_problems(requires_khaos=True)",
+    "build-one": "r = ProblemRegistry(); r.get_problem('{problem}').load()",
+    "eager": "[spec.load() for spec in PROBLEMS.values()]",
+}
+
+
+def run_once(statement: str) -> float:
+    """Wall time of a fresh interpreter importing the registry and running `statement`."""
+    code = f"from sregym.conductor.problems.registry import PROBLEMS, ProblemRegistry\n{statement}"
+    env = {**os.environ, "PYTHONPATH": REPO_ROOT, "LITELLM_LOCAL_MODEL_COST_MAP": "True"}
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, env=env, capture_output=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark problem registry start-up time")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per scenario (default: 5)")
+    parser.add_argument(
+        "--problem", type=str, default="incorrect_image", help="Problem for build-one (default: incorrect_image)"
+    )
+    args = parser.parse_args()
+
+    print(f"{'scenario':<10} {'median':>9} {'min':>9} {'max':>9}")
+    for name, statement in SCENARIOS.items():
+        times = [run_once(statement.format(problem=args.problem)) for _ in range(args.runs)]
+        print(f"{name:<10} {statistics.median(times):>8.2f}s {min(times):>8.2f}s {max(times):>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
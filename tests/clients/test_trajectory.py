@@ -0,0 +1,107 @@
+import json
+
+from clients.stratus.stratus_utils.trajectory import DeltaEncoder, TrajectoryReader, write_trajectory
+
+
+def msg(i: int, role: str = "ai") -> dict:
+    return {"type": role, "content": f"message {i}"}
+
+
+def stage_events(stage: str, histories: list[list[dict]]) -> list[dict]:
+    return [
+        {"type": "event", "stage": stage, "event_index": i, "num_steps": i, "messages": history}
+        for i, history in enumerate(histories)
+    ]
+
+
+def as_v1(event: dict) -> dict:
+    expected = dict(event)
+    if event.get("messages"):
+        expected["last_message"] = event["messages"][-1]
+    else:
+        expected.pop("messages", None)
+    return expected
+
+
+HISTORIES = [
+    [msg(0, "human")],
+    [msg(0, "human"), msg(1)],
+    [msg(0, "human"), msg(1), msg(2), msg(3)],
+    # Summarized: the history is rewritten, not extended
+    [msg(0, "human"), {"type": "ai", "content": "summary"}],
+    [msg(0, "human"), {"type": "ai", "content": "summary"}, msg(4)],
+    [],
+    [msg(0, "human"), {"type": "ai", "content": "summary"}, msg(4), msg(5)],
+]
+
+
+def test_encoder_stores_deltas_between_checkpoints():
+    encoder = DeltaEncoder(checkpoint_every=3)
+    history = [msg(i) for i in range(6)]
+
+    assert encoder.encode(history[:1]) == {"checkpoint": True, "messages": history[:1]}
+    assert encoder.encode(history[:3]) == {"messages_base": 1, "new_messages": history[1:3]}
+    assert encoder.encode(history[:3]) == {"messages_base": 3, "new_messages": []}
+    # Every checkpoint_every events the full history is stored again
+    assert encoder.encode(history[:4]) == {"checkpoint": True, "messages": history[:4]}
+    # A rewritten history cannot be expressed as a delta
+    assert encoder.encode([msg(9)])["checkpoint"] is True
+
+    encoder.reset()
+    assert encoder.encode(history[:2])["checkpoint"] is True
+
+
+def test_v2_round_trip(tmp_path):
+    path = tmp_path / "trajectory.jsonl"
+    stages = [
+        ("diagnosis", stage_events("diagnosis", HISTORIES)),
+        ("mitigation", stage_events("mitigation", HISTORIES)),
+    ]
+    write_trajectory(path, {"type": "metadata", "problem_id": "p"}, stages, checkpoint_every=3)
+
+    reader = TrajectoryReader(path)
+    assert reader.version == 2
+    assert reader.metadata["problem_id"] == "p"
+    expected = [as_v1(event) for _, events in stages for event in events]
+    assert list(reader.events()) == expected
+    # Random access replays from the nearest checkpoint and gives the same records
+    assert [reader.event(*key) for key in reversed(reader.event_keys())] == expected[::-1]
+
+    # Deltas keep the file well below a v1 file of the same events
+    lines = path.read_text().splitlines()
+    assert sum("new_messages" in json.loads(line) for line in lines) >= 4
+
+
+def test_reads_a_file_appended_to_event_by_event(tmp_path):
+    """The agent driver appends each event as it happens, as write_trajectory() would have written it."""
+    path = tmp_path / "trajectory.jsonl"
+    encoder = DeltaEncoder()
+    with open(path, "w") as f:
+        f.write(json.dumps({"type": "metadata", "format_version": 2}) + "\n")
+        f.write(json.dumps({"type": "stage_start", "stage": "diagnosis"}) + "\n")
+    for event in stage_events("diagnosis", HISTORIES[:3]):
+        record = {k: v for k, v in event.items() if k != "messages"}
+        record.update(encoder.encode(event["messages"]))
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+
+    reader = TrajectoryReader(path)
+    assert reader.messages("diagnosis", 2) == HISTORIES[2]
+    assert reader.event("diagnosis", 1)["last_message"] == msg(1)
+
+
+def test_reads_v1_files(tmp_path):
+    path = tmp_path / "trajectory.jsonl"
+    events = [as_v1(event) for event in stage_events("diagnosis", HISTORIES)]
+    with open(path, "w") as f:
+        f.write(json.dumps({"type": "metadata", "problem_id": "p"}) + "\n")
+        f.write(json.dumps({"type": "stage_start", "stage": "diagnosis"}) + "\n")
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+        f.write("not json\n")
+
+    reader = TrajectoryReader(path)
+    assert reader.version == 1
+    assert list(reader.events()) == events
+    assert reader.event("diagnosis", 2) == events[2]
+    assert reader.messages("diagnosis", 5) == []
@@ -0,0 +1,85 @@
+import asyncio
+
+from sregym.conductor.multi_tenant import Admission
+
+
+async def started(task: asyncio.Task) -> bool:
+    """Whether the admit() task got its slot once the loop has run everything it can."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+    return task.done()
+
+
+def test_shared_problems_are_bounded_by_max_concurrent():
+    async def scenario():
+        admission = Admission(max_concurrent=2)
+        await admission.admit("a", exclusive=False)
+        await admission.admit("b", exclusive=False)
+        third = asyncio.create_task(admission.admit("c", exclusive=False))
+        assert not await started(third)
+
+        await admission.release("a")
+        assert await started(third)
+        assert set(admission.running) == {"b", "c"}
+
+    asyncio.run(scenario())
+
+
+def test_exclusive_problem_waits_for_an_idle_cluster_and_runs_alone():
+    async def scenario():
+        admission = Admission(max_concurrent=4)
+        await admission.admit("shared", exclusive=False)
+        exclusive = asyncio.create_task(admission.admit("exclusive", exclusive=True))
+        assert not await started(exclusive)
+        # A waiting exclusive problem holds back new shared ones so it is not starved
+        late = asyncio.create_task(admission.admit("late", exclusive=False))
+        assert not await started(late)
+
+        await admission.release("shared")
+        assert await started(exclusive)
+        assert not await started(late)
+
+        await admission.release("exclusive")
+        assert await started(late)
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_exclusive_waiter_unblocks_shared_problems():
+    async def scenario():
+        admission = Admission(max_concurrent=4)
+        await admission.admit("shared", exclusive=False)
+        exclusive = asyncio.create_task(admission.admit("exclusive", exclusive=True))
+        late = asyncio.create_task(admission.admit("late", exclusive=False))
+        assert not await started(late)
+
+        exclusive.cancel()
+        assert await started(late)
+
+    asyncio.run(scenario())
+
+
+def test_nothing_is_admitted_while_the_idle_cluster_is_reconciled():
+    async def scenario():
+        admission = Admission(max_concurrent=2)
+        reconciling = asyncio.Event()
+        reconciled = asyncio.Event()
+        running_during_reconcile = []
+
+        async def reconcile():
+            reconciling.set()
+            await reconciled.wait()
+            running_during_reconcile.extend(admission.running)
+
+        await admission.admit("a", exclusive=False)
+        release = asyncio.create_task(admission.release("a", when_idle=reconcile))
+        await reconciling.wait()
+        waiting = asyncio.create_task(admission.admit("b", exclusive=False))
+        assert not await started(waiting)
+
+        reconciled.set()
+        await release
+        assert await started(waiting)
+        assert running_during_reconcile == []
+
+    asyncio.run(scenario())
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+from sregym.conductor import multi_tenant
+from sregym.conductor.conductor import Conductor
+from sregym.conductor.constants import StartProblemResult
+from sregym.conductor.multi_tenant import MultiTenantConductor
+
+
+class FakeProblems:
+    def get_problem_instance(self, problem_id, suffix):
+        app = SimpleNamespace(namespace=f"hotel-reservation-{suffix}")
+        return SimpleNamespace(app=app, is_exclusive=lambda: False)
+
+
+def deploying_tenant(deploys: threading.Barrier):
+    """A Conductor whose deploy only finishes once every other tenant's deploy has started too."""
+
+    class DeployingTenant(Conductor):
+        def __init__(self, config):
+            self.config = config
+            self.problems = FakeProblems()
+            self.agent_name = "stratus"
+            self.problem_id = None
+            self.submission_stage = None
+            self.results = {}
+            self._submit_future = None
+            self._baseline_captured = False
+
+        def register_agent(self, agent_name):
+            self.agent_name = agent_name
+
+        def _start_problem_blocking(self, problem=None):
+            deploys.wait()
+            return StartProblemResult.SUCCESS
+
+    return DeployingTenant
+
+
+def test_tenants_deploy_side_by_side(monkeypatch):
+    # Times out (BrokenBarrierError) if the deploys ran one after the other
+    deploys = threading.Barrier(2, timeout=5)
+    monkeypatch.setattr(multi_tenant, "Conductor", deploying_tenant(deploys))
+
+    async def scenario():
+        conductor = MultiTenantConductor(max_concurrent=2)
+        conductor._platform_ready = True
+        started = await asyncio.gather(conductor.start_problem("geo_crash"), conductor.start_problem("rate_crash"))
+        assert [result for _, result in started] == [StartProblemResult.SUCCESS] * 2
+        for token, _ in started:
+            await conductor.finish(token)
+        assert conductor.sessions == {}
+
+    asyncio.run(scenario())
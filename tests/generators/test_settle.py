@@ -0,0 +1,139 @@
+from types import SimpleNamespace
+
+import pytest
+
+from sregym.generators.fault import settle as settle_module
+from sregym.generators.fault.base import FaultInjector
+from sregym.generators.fault.settle import (
+    SettleCondition,
+    collect_settle_reports,
+    deployment_rolled,
+    pods_replaced,
+    settle,
+)
+from sregym.service.waits import WaitResult
+
+NAMESPACE = "hotel-reservation"
+
+
+class FixedCondition(SettleCondition):
+    """A condition whose wait returns a fixed outcome and records the timeout it was given."""
+
+    def __init__(self, description: str, satisfied: bool):
+        super().__init__(description, "pods", lambda objects: satisfied)
+        self.satisfied = satisfied
+        self.timeouts: list[float] = []
+
+    def wait(self, timeout: float) -> WaitResult:
+        self.timeouts.append(timeout)
+        return WaitResult(self.description, self.satisfied, 0.01)
+
+
+def pod(name: str, uid: str, deleting: bool = False):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, uid=uid, deletion_timestamp="now" if deleting else None),
+    )
+
+
+def deployment(uid: str, generation: int, observed: int, updated: int, replicas: int = 1):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name="geo", uid=uid, generation=generation),
+        spec=SimpleNamespace(replicas=replicas),
+        status=SimpleNamespace(observed_generation=observed, updated_replicas=updated),
+    )
+
+
+@pytest.fixture
+def listed(monkeypatch):
+    """Objects the builders see when they read the pre-injection state."""
+    objects: list = []
+    monkeypatch.setattr(settle_module, "_list", lambda kind, namespace, **kwargs: objects)
+    return objects
+
+
+def test_settle_reports_each_condition_and_collects():
+    ready = FixedCondition("ready", True)
+    stuck = FixedCondition("stuck", False)
+    with collect_settle_reports() as reports:
+        report = settle("misconfig_app", [ready, stuck], timeout=5)
+
+    assert reports == [report]
+    assert report.settled is False
+    assert report.outcome == "timed out"
+    assert [wait["description"] for wait in report.waits] == ["ready", "stuck"]
+    # Conditions share one deadline rather than getting the full timeout each
+    assert 0 < stuck.timeouts[0] <= ready.timeouts[0] <= 5
+
+
+def test_settle_outside_collector_is_not_recorded():
+    with collect_settle_reports() as reports:
+        pass
+    assert settle("misconfig_app", [FixedCondition("ready", True)]).settled is True
+    assert reports == []
+
+
+def test_pods_replaced_waits_for_old_pods_to_go(listed):
+    listed.extend([pod("geo-1", "a"), pod("rate-1", "b")])
+    condition = pods_replaced(NAMESPACE, "geo pods", pod_filter=lambda p: p.metadata.name.startswith("geo"))
+
+    assert not condition.predicate([pod("geo-1", "a"), pod("rate-1", "b")])
+    # The old pod terminating is not enough without a replacement
+    assert not condition.predicate([pod("geo-1", "a", deleting=True)])
+    assert condition.predicate([pod("geo-1", "a", deleting=True), pod("geo-2", "c")])
+    # Unrelated pods never count as replacements
+    assert not condition.predicate([pod("rate-2", "d")])
+
+
+def test_deployment_rolled_needs_a_new_generation_or_object(listed):
+    listed.append(deployment("uid-1", generation=3, observed=3, updated=1))
+    condition = deployment_rolled(NAMESPACE, "geo")
+
+    assert not condition.predicate([deployment("uid-1", generation=3, observed=3, updated=1)])
+    assert not condition.predicate([deployment("uid-1", generation=4, observed=3, updated=1)])
+    assert not condition.predicate([deployment("uid-1", generation=4, observed=4, updated=0)])
+    assert condition.predicate([deployment("uid-1", generation=4, observed=4, updated=1)])
+    # Deleted and re-applied: a new uid at generation 1
+    assert condition.predicate([deployment("uid-2", generation=1, observed=1, updated=1)])
+    assert not condition.predicate([])
+
+
+class RecordingInjector(FaultInjector):
+    def __init__(self, condition=None, fail=False):
+        super().__init__(None)
+        self.calls: list[tuple] = []
+        self.condition = condition
+        self.fail = fail
+
+    def inject_declared(self, microservices):
+        self.calls.append(("inject", microservices))
+
+    def settle_declared(self, microservices):
+        self.calls.append(("settle", microservices))
+        if self.fail:
+            raise RuntimeError("deployment not found")
+        return self.condition
+
+    def inject_undeclared(self):
+        self.calls.append(("inject",))
+
+
+def test_inject_reads_settle_conditions_before_injecting():
+    injector = RecordingInjector(FixedCondition("rolled", True))
+    with collect_settle_reports() as reports:
+        injector._inject("declared", ["geo"])
+
+    assert injector.calls == [("settle", ["geo"]), ("inject", ["geo"])]
+    assert reports[0].fault_type == "declared"
+    assert reports[0].settled is True
+
+
+@pytest.mark.parametrize("fault_type, fail", [("undeclared", False), ("declared", True)])
+def test_inject_falls_back_to_fixed_wait(monkeypatch, fault_type, fail):
+    monkeypatch.setattr(settle_module, "UNDECLARED_SETTLE_SECONDS", 0)
+    injector = RecordingInjector(fail=fail)
+    with collect_settle_reports() as reports:
+        injector._inject(fault_type, ["geo"] if fault_type == "declared" else None)
+
+    assert injector.calls[-1][0] == "inject"
+    assert reports[0].settled is None
+    assert reports[0].outcome == "fixed wait"
@@ -0,0 +1,230 @@
+"""The in-process kubectl engine must reach the cluster through the filtering API proxy, as the binary does."""
+
+import base64
+import datetime
+import ipaddress
+import json
+import socket
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+import yaml
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from mcp_server.kubectl_server_helper.kubectl_engine import KubectlEngine
+from sregym.service.k8s_proxy import KubernetesAPIProxy
+
+NAMESPACES = ["default", "hotel-reservation", "chaos-mesh", "khaos"]
+
+
+def namespace(name: str) -> dict:
+    return {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": name, "uid": f"uid-{name}"}}
+
+
+def pod(name: str, ns: str) -> dict:
+    return {"apiVersion": "v1", "kind": "Pod", "metadata": {"name": name, "namespace": ns, "uid": f"uid-{name}"}}
+
+
+PODS = [pod("frontend", "hotel-reservation"), pod("chaos-daemon", "chaos-mesh"), pod("khaos-agent", "khaos")]
+
+RESOURCES = {
+    "/version": {"major": "1", "minor": "30", "gitVersion": "v1.30.0"},
+    "/api": {"kind": "APIVersions", "versions": ["v1"]},
+    "/apis": {"kind": "APIGroupList", "apiVersion": "v1", "groups": []},
+    "/api/v1": {
+        "kind": "APIResourceList",
+        "groupVersion": "v1",
+        "resources": [
+            {
+                "name": "namespaces",
+                "singularName": "namespace",
+                "namespaced": False,
+                "kind": "Namespace",
+                "shortNames": ["ns"],
+                "verbs": ["get", "list"],
+            },
+            {
+                "name": "pods",
+                "singularName": "pod",
+                "namespaced": True,
+                "kind": "Pod",
+                "shortNames": ["po"],
+                "verbs": ["get", "list"],
+            },
+        ],
+    },
+    "/api/v1/namespaces": {"kind": "NamespaceList", "metadata": {}, "items": [namespace(ns) for ns in NAMESPACES]},
+    "/api/v1/pods": {"kind": "PodList", "metadata": {}, "items": PODS},
+    **{
+        f"/api/v1/namespaces/{ns}/pods": {
+            "kind": "PodList",
+            "metadata": {},
+            "items": [p for p in PODS if p["metadata"]["namespace"] == ns],
+        }
+        for ns in NAMESPACES
+    },
+}
+
+
+def self_signed_certificate(tmp_path) -> tuple[str, str, bytes]:
+    """A certificate for 127.0.0.1; returns (cert file, key file, cert PEM)."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "fake-apiserver")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_pem = cert.public_bytes(serialization.Encoding.PEM)
+    cert_file, key_file = tmp_path / "apiserver.crt", tmp_path / "apiserver.key"
+    cert_file.write_bytes(cert_pem)
+    key_file.write_bytes(
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    )
+    return str(cert_file), str(key_file), cert_pem
+
+
+class FakeApiServer:
+    """A TLS API server answering GETs for the paths in RESOURCES; records every path it was asked for."""
+
+    def __init__(self, cert_file: str, key_file: str):
+        self.paths: list[str] = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_file, key_file)
+        self.server.socket = context.wrap_socket(self.server.socket, server_side=True)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server.server_port
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                path = urlsplit(self.path).path.rstrip("/")
+                fake.paths.append(path)
+                data = RESOURCES.get(path)
+                status = 200 if data is not None else 404
+                if data is None:
+                    data = {
+                        "kind": "Status",
+                        "apiVersion": "v1",
+                        "status": "Failure",
+                        "reason": "NotFound",
+                        "code": 404,
+                    }
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """An engine configured only through KUBECONFIG, which points at a filtering proxy in front of the fake server."""
+    cert_file, key_file, cert_pem = self_signed_certificate(tmp_path)
+    with FakeApiServer(cert_file, key_file) as upstream:
+        upstream_kubeconfig = tmp_path / "upstream.yaml"
+        upstream_kubeconfig.write_text(
+            yaml.safe_dump(
+                {
+                    "apiVersion": "v1",
+                    "kind": "Config",
+                    "current-context": "upstream",
+                    "clusters": [
+                        {
+                            "name": "upstream",
+                            "cluster": {
+                                "server": f"https://127.0.0.1:{upstream.port}",
+                                "certificate-authority-data": base64.b64encode(cert_pem).decode(),
+                            },
+                        }
+                    ],
+                    "contexts": [{"name": "upstream", "context": {"cluster": "upstream", "user": "admin"}}],
+                    "users": [{"name": "admin", "user": {}}],
+                }
+            )
+        )
+        proxy = KubernetesAPIProxy(listen_port=free_port(), kubeconfig_path=str(upstream_kubeconfig))
+        proxy.start()
+        try:
+            monkeypatch.setenv("KUBECONFIG", proxy.generate_agent_kubeconfig(str(tmp_path / "agent.yaml")))
+            yield KubectlEngine(), upstream
+        finally:
+            proxy.stop()
+
+
+def test_hidden_namespaces_stay_hidden(engine):
+    kubectl, _ = engine
+    result = kubectl.exec_command("kubectl get namespaces -o name")
+    assert result.returncode == 0
+    assert result.stdout.split() == ["namespace/default", "namespace/hotel-reservation"]
+
+    result = kubectl.exec_command("kubectl get pods -A -o json")
+    assert result.returncode == 0
+    assert [item["metadata"]["name"] for item in json.loads(result.stdout)["items"]] == ["frontend"]
+
+
+def test_hidden_namespace_access_is_forbidden(engine):
+    kubectl, upstream = engine
+    result = kubectl.exec_command("kubectl get pods -n khaos -o name")
+    assert result.returncode == 1
+    assert "Forbidden" in result.stderr
+    # The proxy refused the request without forwarding it
+    assert "/api/v1/namespaces/khaos/pods" not in upstream.paths
+
+
+def test_default_namespace_comes_from_the_kubeconfig_context(engine):
+    kubectl, upstream = engine
+    assert kubectl.exec_command("kubectl get pods -o name").returncode == 0
+    assert "/api/v1/namespaces/default/pods" in upstream.paths
+
+
+def test_unusable_kubeconfig_does_not_fall_back_to_in_cluster_credentials(tmp_path, monkeypatch):
+    monkeypatch.setenv("KUBECONFIG", str(tmp_path / "missing.yaml"))
+    monkeypatch.setattr(
+        "kubernetes.config.load_incluster_config",
+        lambda **kwargs: pytest.fail("in-cluster credentials would bypass the proxy"),
+    )
+    with pytest.raises(Exception, match="API client unavailable"):
+        KubectlEngine()._ensure_client()
@@ -0,0 +1,40 @@
+import logging
+
+from logger.handler import RateLimitFilter
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_rate_limit_notes_drops_on_its_own_handler_only():
+    limited, unlimited = ListHandler(), ListHandler()
+    # No refill during the test: only the burst gets through
+    limited.addFilter(RateLimitFilter(rate=1e-9, burst=2))
+    log = logging.getLogger("all.test.rate_limit")
+    log.propagate = False
+    log.setLevel(logging.DEBUG)
+    log.addHandler(limited)
+    log.addHandler(unlimited)
+    try:
+        for i in range(4):
+            log.info("step %d", i)
+        log.warning("pod %s crashed", "geo")
+        limited.filters[0]._buckets[log.name][0] = 1
+        log.info("step %d", 4)
+    finally:
+        log.removeHandler(limited)
+        log.removeHandler(unlimited)
+
+    assert limited.messages == [
+        "step 0",
+        "step 1",
+        "pod geo crashed",
+        "step 4 [rate limited: 2 earlier records from this logger dropped]",
+    ]
+    assert unlimited.messages == ["step 0", "step 1", "step 2", "step 3", "pod geo crashed", "step 4"]
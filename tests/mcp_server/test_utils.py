@@ -0,0 +1,159 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_server import utils
+from mcp_server.utils import ResponseCache, fetch_json
+
+
+@pytest.fixture(autouse=True)
+def frozen_bucket(monkeypatch):
+    """Pin the wall clock so every lookup in a test falls in the same TTL bucket."""
+    monkeypatch.setattr(utils.time, "time", lambda: 1_000_000.0)
+
+
+class Fetcher:
+    """A fetch function that counts its calls and returns the call number."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"call": self.calls}
+
+
+def test_second_lookup_is_a_hit():
+    cache, fetch = ResponseCache(ttl=60), Fetcher()
+
+    first = cache.get_or_fetch("up", fetch)
+    second = cache.get_or_fetch("up", fetch)
+
+    assert first == second == {"call": 1}
+    assert fetch.calls == 1
+    assert cache.stats() == {
+        "ttl_seconds": 60,
+        "entries": 1,
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+
+
+def test_different_keys_and_expired_entries_miss(monkeypatch):
+    cache, fetch = ResponseCache(ttl=60), Fetcher()
+    cache.get_or_fetch("up", fetch)
+    cache.get_or_fetch("down", fetch)
+    assert fetch.calls == 2
+
+    now = utils.time.monotonic()
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now + 61)
+    assert cache.get_or_fetch("up", fetch) == {"call": 3}
+
+
+def test_zero_ttl_disables_the_cache():
+    cache, fetch = ResponseCache(ttl=0), Fetcher()
+
+    cache.get_or_fetch("up", fetch)
+    cache.get_or_fetch("up", fetch)
+
+    assert fetch.calls == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_concurrent_misses_share_one_fetch():
+    cache = ResponseCache(ttl=60)
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(5)
+        return {"series": []}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_fetch("q", slow_fetch))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    # Let every thread reach the cache before the single fetch completes
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    assert cache.stats()["misses"] == 1
+
+
+def test_failed_fetch_is_not_cached_and_waiters_retry():
+    cache = ResponseCache(ttl=60)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def flaky_fetch():
+        calls.append(1)
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+            raise ConnectionError("prometheus unavailable")
+        return {"series": ["up"]}
+
+    errors, results = [], []
+
+    def first_caller():
+        try:
+            cache.get_or_fetch("q", flaky_fetch)
+        except ConnectionError as e:
+            errors.append(e)
+
+    first = threading.Thread(target=first_caller)
+    first.start()
+    started.wait(5)
+    waiter = threading.Thread(target=lambda: results.append(cache.get_or_fetch("q", flaky_fetch)))
+    waiter.start()
+    release.set()
+    first.join(5)
+    waiter.join(5)
+
+    assert len(errors) == 1
+    # The waiter did not get the failure; it fetched again itself
+    assert results == [{"series": ["up"]}]
+    assert len(calls) == 2
+    assert cache.get_or_fetch("q", flaky_fetch) == {"series": ["up"]}
+    assert len(calls) == 2
+
+
+def test_full_cache_evicts_the_oldest_entries():
+    cache, fetch = ResponseCache(ttl=60, max_entries=2), Fetcher()
+
+    for key in ("a", "b", "c"):
+        cache.get_or_fetch(key, fetch)
+
+    assert cache.stats()["entries"] == 2
+    cache.get_or_fetch("c", fetch)
+    assert fetch.calls == 3
+    cache.get_or_fetch("a", fetch)
+    assert fetch.calls == 4
+
+
+def test_fetch_json_hands_each_caller_its_own_copy(monkeypatch):
+    monkeypatch.setattr(utils, "response_cache", ResponseCache(ttl=60))
+    requests = []
+
+    def make_request(method, url, params=None):
+        requests.append((method, url, params))
+        return SimpleNamespace(status_code=200, json=lambda: {"data": {"alerts": [{"name": "HighLatency"}]}})
+
+    client = SimpleNamespace(make_request=make_request)
+
+    first = fetch_json(client, "http://prometheus/api/v1/alerts", params={"query": "up  "})
+    first["data"]["alerts"].clear()
+    second = fetch_json(client, "http://prometheus/api/v1/alerts", params={"query": " up"})
+
+    assert second == {"data": {"alerts": [{"name": "HighLatency"}]}}
+    # Whitespace-only differences in the query share the cache entry
+    assert len(requests) == 1
@@ -0,0 +1,119 @@
+import threading
+import time
+
+import pytest
+
+from sregym.conductor.oracles.base import Oracle
+from sregym.conductor.oracles.compound import CompoundedOracle
+
+
+class ScriptedOracle(Oracle):
+    """Sleeps, then returns `result` (or raises it); records how many children ran at once."""
+
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, result, delay: float = 0.0, release: threading.Event | None = None):
+        super().__init__(problem=None)
+        self.result = result
+        self.delay = delay
+        self.release = release
+
+    def evaluate(self, *args, **kwargs):
+        cls = ScriptedOracle
+        with cls.lock:
+            cls.running += 1
+            cls.peak = max(cls.peak, cls.running)
+        try:
+            if self.release is not None:
+                self.release.wait(5)
+            time.sleep(self.delay)
+            if isinstance(self.result, Exception):
+                raise self.result
+            return dict(self.result) if isinstance(self.result, dict) else self.result
+        finally:
+            with cls.lock:
+                cls.running -= 1
+
+
+@pytest.fixture(autouse=True)
+def reset_peak():
+    ScriptedOracle.running = ScriptedOracle.peak = 0
+
+
+def outcomes(result: dict) -> dict[str, dict]:
+    return {child["name"]: child for child in result["oracles"]}
+
+
+def test_children_run_one_at_a_time_by_default():
+    compound = CompoundedOracle(None, *(ScriptedOracle({"success": True}, delay=0.02) for _ in range(3)))
+    result = compound.evaluate()
+    assert result["success"] is True
+    assert result["accuracy"] == 100.0
+    assert ScriptedOracle.peak == 1
+
+
+def test_concurrent_results_keep_declaration_order():
+    compound = CompoundedOracle(
+        None,
+        slow=ScriptedOracle({"success": True}, delay=0.2),
+        fast=ScriptedOracle({"success": False, "accuracy": 50.0}),
+        max_workers=2,
+    )
+    result = compound.evaluate()
+    assert ScriptedOracle.peak == 2
+    assert [child["name"] for child in result["oracles"]] == ["slow", "fast"]
+    assert result["success"] is False
+    assert result["accuracy"] == pytest.approx(75.0)
+    assert all("wall_time" in child for child in result["oracles"])
+
+
+@pytest.mark.parametrize("bad", [RuntimeError("kubectl failed"), None, "ok"])
+def test_failing_or_malformed_child_fails_alone(bad):
+    compound = CompoundedOracle(None, bad=ScriptedOracle(bad), good=ScriptedOracle({"success": True}), max_workers=2)
+    children = outcomes(compound.evaluate())
+    assert children["bad"]["success"] is False
+    assert "wall_time" in children["bad"]
+    assert children["good"]["success"] is True
+
+
+def test_child_past_the_timeout_fails():
+    release = threading.Event()
+    compound = CompoundedOracle(
+        None,
+        stuck=ScriptedOracle({"success": True}, release=release),
+        quick=ScriptedOracle({"success": True}),
+        max_workers=2,
+        timeout=0.2,
+    )
+    try:
+        started = time.monotonic()
+        children = outcomes(compound.evaluate())
+        assert time.monotonic() - started < 2
+    finally:
+        release.set()
+    assert children["stuck"]["timed_out"] is True
+    assert children["stuck"]["success"] is False
+    assert children["stuck"]["wall_time"] == pytest.approx(0.2, abs=0.2)
+    assert children["quick"]["success"] is True
+
+
+def test_required_failure_skips_the_rest():
+    release = threading.Event()
+    compound = CompoundedOracle(
+        None,
+        gate=ScriptedOracle({"success": False}),
+        waiting=ScriptedOracle({"success": True}, release=release),
+        later=ScriptedOracle({"success": True}, delay=0.5),
+        max_workers=2,
+        required=["gate"],
+        short_circuit=True,
+    )
+    try:
+        children = outcomes(compound.evaluate())
+    finally:
+        release.set()
+    assert children["gate"]["success"] is False
+    assert children["waiting"] == {"success": False, "skipped": True, "wall_time": 0.0, "name": "waiting"}
+    assert children["later"]["skipped"] is True
@@ -0,0 +1,197 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from kubernetes import client
+
+from sregym.conductor.oracles.sustained_readiness import SustainedReadinessOracle
+
+NAMESPACE = "test-ns"
+
+
+def pod(name: str, ready: bool = True, restarts: int = 0, phase: str = "Running", waiting: str | None = None) -> dict:
+    state = {"waiting": {"reason": waiting}} if waiting else {"running": {"startedAt": "2025-01-01T00:00:00Z"}}
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {"name": name, "namespace": NAMESPACE, "uid": f"uid-{name}"},
+        "status": {
+            "phase": phase,
+            "containerStatuses": [
+                {
+                    "name": "app",
+                    "image": "app:latest",
+                    "imageID": "",
+                    "ready": ready,
+                    "restartCount": restarts,
+                    "state": state,
+                }
+            ],
+        },
+    }
+
+
+class FakeApiServer:
+    """
+    Serves the pods of one namespace: the initial `pods`, then `events` replayed as
+    (seconds after start, type, pod). LISTs see the events that are due; watches
+    stream them from the requested resourceVersion (event i has resourceVersion i + 2).
+    """
+
+    def __init__(self, pods: list[dict], events: list[tuple[float, str, dict]]):
+        self.pods = pods
+        self.events = events
+        self.requests: list[str] = []
+        self.start = time.monotonic()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.start = time.monotonic()
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def api_client(self) -> client.ApiClient:
+        return client.ApiClient(client.Configuration(host=f"http://127.0.0.1:{self.server.server_port}"))
+
+    def _due(self) -> int:
+        elapsed = time.monotonic() - self.start
+        return sum(1 for at, _, _ in self.events if at <= elapsed)
+
+    def _list(self) -> dict:
+        due = self._due()
+        pods = {p["metadata"]["name"]: p for p in self.pods}
+        for _, kind, p in self.events[:due]:
+            if kind == "DELETED":
+                pods.pop(p["metadata"]["name"], None)
+            else:
+                pods[p["metadata"]["name"]] = p
+        return {
+            "apiVersion": "v1",
+            "kind": "PodList",
+            "metadata": {"resourceVersion": str(due + 1)},
+            "items": [dict(p, metadata=dict(p["metadata"], resourceVersion=str(due + 1))) for p in pods.values()],
+        }
+
+    def _watch(self, handler, resource_version: int, timeout: float):
+        deadline = time.monotonic() + timeout
+        for index in range(max(resource_version - 1, 0), len(self.events)):
+            at, kind, p = self.events[index]
+            wait = self.start + at - time.monotonic()
+            if time.monotonic() + wait >= deadline:
+                break
+            time.sleep(max(wait, 0))
+            obj = dict(p, metadata=dict(p["metadata"], resourceVersion=str(index + 2)))
+            try:
+                line = json.dumps({"type": kind, "object": obj}).encode() + b"\n"
+                # Chunked like the real API server, so the client sees each event as it is sent
+                handler.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                handler.wfile.flush()
+            except OSError:
+                return
+        time.sleep(max(deadline - time.monotonic(), 0))
+        handler.wfile.write(b"0\r\n\r\n")
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                assert url.path == f"/api/v1/namespaces/{NAMESPACE}/pods"
+                watching = query.get("watch", [""])[0].lower() == "true"
+                server.requests.append("watch" if watching else "list")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                if not watching:
+                    body = json.dumps(server._list()).encode()
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                server._watch(self, int(query["resourceVersion"][0]), float(query["timeoutSeconds"][0]))
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+class FakeProblem:
+    namespace = NAMESPACE
+
+
+def evaluate(pods, events, buffer_period=2, sustained_period=3) -> tuple[dict, float, list[str]]:
+    with FakeApiServer(pods, events) as server:
+        oracle = SustainedReadinessOracle(
+            FakeProblem(), buffer_period=buffer_period, sustained_period=sustained_period, api_client=server.api_client
+        )
+        start = time.monotonic()
+        result = oracle.evaluate()
+        return result, time.monotonic() - start, server.requests
+
+
+def test_pods_that_stay_ready_succeed():
+    result, elapsed, requests = evaluate([pod("a"), pod("b")], [(0.5, "MODIFIED", pod("b"))])
+    assert result["success"]
+    assert elapsed >= 3
+    # One LIST and watch per phase, no polling
+    assert requests == ["list", "list", "watch"]
+
+
+def test_pods_becoming_ready_within_buffer_succeed():
+    result, _, _ = evaluate(
+        [pod("a", ready=False, waiting="ContainerCreating"), pod("b", ready=False)],
+        [(0.3, "MODIFIED", pod("a")), (0.6, "MODIFIED", pod("b"))],
+    )
+    assert result["success"]
+
+
+def test_pods_not_ready_after_buffer_fail():
+    result, elapsed, _ = evaluate([pod("a"), pod("b", phase="Pending", ready=False)], [], buffer_period=1)
+    assert not result["success"]
+    assert elapsed < 2
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        pod("b", ready=False),
+        pod("b", restarts=1),
+        pod("b", waiting="CrashLoopBackOff", ready=False, restarts=1),
+    ],
+    ids=["not-ready", "restart", "crash-loop"],
+)
+def test_violation_ends_window_early(change):
+    result, elapsed, _ = evaluate([pod("a"), pod("b")], [(1.0, "MODIFIED", change)], sustained_period=30)
+    assert not result["success"]
+    assert elapsed < 5
+
+
+def test_restart_during_buffer_waits_for_readiness_again():
+    result, _, _ = evaluate(
+        [pod("a", ready=False)],
+        [(0.3, "MODIFIED", pod("a", ready=False, restarts=1)), (0.6, "MODIFIED", pod("a", restarts=1))],
+    )
+    assert result["success"]
+
+
+def test_deleted_pod_does_not_count_as_restart():
+    result, _, _ = evaluate(
+        [pod("a"), pod("b", restarts=2)],
+        [(0.5, "DELETED", pod("b", restarts=2)), (0.8, "ADDED", pod("c"))],
+    )
+    assert result["success"]
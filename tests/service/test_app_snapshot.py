@@ -0,0 +1,362 @@
+import copy
+from types import SimpleNamespace
+
+import pytest
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import ConflictError, NotFoundError, UnprocessibleEntityError
+
+from sregym.conductor.conductor import Conductor, ConductorConfig
+from sregym.service import app_snapshot
+from sregym.service.app_snapshot import (
+    AppSnapshot,
+    AppSnapshotManager,
+    SnapshotEntry,
+    creatable,
+    is_app_object,
+    manifest,
+    plan_restore,
+    resource_key,
+    spec_hash,
+)
+from sregym.service.waits import WaitResult
+
+NAMESPACE = "hotel-reservation"
+
+
+def deployment(name: str, image: str = "app:1", resource_version: str = "100", **metadata) -> dict:
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {
+            "name": name,
+            "namespace": NAMESPACE,
+            "uid": f"uid-{name}",
+            "resourceVersion": resource_version,
+            "generation": 1,
+            "creationTimestamp": "2025-01-01T00:00:00Z",
+            "annotations": {"deployment.kubernetes.io/revision": "1"},
+            **metadata,
+        },
+        "spec": {"replicas": 1, "template": {"spec": {"containers": [{"name": name, "image": image}]}}},
+        "status": {"readyReplicas": 1},
+    }
+
+
+def snapshot_of(*objects: dict) -> AppSnapshot:
+    entries = {
+        resource_key(obj): SnapshotEntry(obj["metadata"]["resourceVersion"], spec_hash(obj), manifest(obj))
+        for obj in objects
+    }
+    return AppSnapshot(app_key="hotel", namespaces=[NAMESPACE], entries=entries)
+
+
+def live(*objects: dict) -> dict:
+    return {resource_key(obj): obj for obj in objects}
+
+
+def test_manifest_drops_server_fields():
+    result = manifest(deployment("frontend"))
+    assert "status" not in result
+    assert set(result["metadata"]) == {"name", "namespace"}
+
+
+def test_status_and_revision_changes_are_not_drift():
+    captured = deployment("frontend")
+    current = deployment("frontend", resource_version="250")
+    current["status"] = {"readyReplicas": 0}
+    current["metadata"]["generation"] = 2
+    current["metadata"]["annotations"]["deployment.kubernetes.io/revision"] = "2"
+
+    plan = plan_restore(snapshot_of(captured), live(current))
+    assert plan.unchanged == [resource_key(captured)]
+    assert not (plan.update or plan.create or plan.delete or plan.recreate)
+
+
+def test_plan_finds_drifted_missing_extra_and_terminating_objects():
+    frontend, geo, rate, search = (deployment(name) for name in ("frontend", "geo", "rate", "search"))
+    drifted = deployment("geo", image="app:broken", resource_version="300")
+    terminating = deployment("search", deletionTimestamp="2025-01-01T00:10:00Z")
+    extra = deployment("debug-shell")
+    leaving = deployment("old-extra", deletionTimestamp="2025-01-01T00:10:00Z")
+
+    plan = plan_restore(snapshot_of(frontend, geo, rate, search), live(frontend, drifted, terminating, extra, leaving))
+    assert plan.unchanged == [resource_key(frontend)]
+    assert plan.update == [resource_key(geo)]
+    assert plan.create == [resource_key(rate)]
+    assert plan.recreate == [resource_key(search)]
+    assert plan.delete == [resource_key(extra)]
+
+
+def test_only_top_level_app_objects_are_snapshotted():
+    owned = deployment("rs", ownerReferences=[{"kind": "Deployment", "name": "frontend"}])
+    root_ca = {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "kube-root-ca.crt"}}
+    token = {
+        "apiVersion": "v1",
+        "kind": "Secret",
+        "type": "kubernetes.io/service-account-token",
+        "metadata": {"name": "t"},
+    }
+    event = {"apiVersion": "v1", "kind": "Event", "metadata": {"name": "e"}}
+    assert is_app_object(deployment("frontend"))
+    assert not any(is_app_object(obj) for obj in (owned, root_ca, token, event))
+
+
+def test_creatable_drops_assigned_fields():
+    service = {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": {"name": "frontend"},
+        "spec": {"clusterIP": "10.0.0.5", "clusterIPs": ["10.0.0.5"], "ports": [{"port": 5000}]},
+    }
+    headless = copy.deepcopy(service)
+    headless["spec"].update(clusterIP="None", clusterIPs=["None"])
+    claim = {
+        "apiVersion": "v1",
+        "kind": "PersistentVolumeClaim",
+        "metadata": {"name": "data", "annotations": {"pv.kubernetes.io/bind-completed": "yes", "team": "sre"}},
+        "spec": {"volumeName": "pvc-123", "resources": {"requests": {"storage": "1Gi"}}},
+    }
+    job = {
+        "apiVersion": "batch/v1",
+        "kind": "Job",
+        "metadata": {"name": "init"},
+        "spec": {
+            "selector": {"matchLabels": {"batch.kubernetes.io/controller-uid": "abc"}},
+            "template": {"metadata": {"labels": {"app": "init", "batch.kubernetes.io/controller-uid": "abc"}}},
+        },
+    }
+
+    assert creatable(service)["spec"] == {"ports": [{"port": 5000}]}
+    assert creatable(headless)["spec"]["clusterIP"] == "None"
+    assert "volumeName" not in creatable(claim)["spec"]
+    assert creatable(claim)["metadata"]["annotations"] == {"team": "sre"}
+    assert "selector" not in creatable(job)["spec"]
+    assert creatable(job)["spec"]["template"]["metadata"]["labels"] == {"app": "init"}
+    # The captured manifests themselves are left alone
+    assert service["spec"]["clusterIP"] == "10.0.0.5"
+
+
+class FakeResource:
+    """One kind in FakeDynamic's store, with the calls AppSnapshotManager makes."""
+
+    def __init__(self, cluster: "FakeDynamic", api_version: str, kind: str):
+        self.cluster = cluster
+        self.group_version = api_version
+        self.kind = kind
+        self.namespaced = True
+        self.preferred = True
+        self.verbs = ["list", "create", "update", "delete"]
+
+    def _key(self, namespace: str, name: str):
+        return namespace, self.group_version, self.kind, name
+
+    def get(self, namespace: str, name: str | None = None):
+        if name is None:
+            items = [
+                SimpleNamespace(to_dict=lambda obj=obj: copy.deepcopy(obj))
+                for key, obj in self.cluster.objects.items()
+                if key[:3] == (namespace, self.group_version, self.kind)
+            ]
+            return SimpleNamespace(items=items)
+        obj = self.cluster.objects.get(self._key(namespace, name))
+        if obj is None:
+            raise NotFoundError(ApiException(status=404, reason="Not Found"))
+        return SimpleNamespace(metadata=SimpleNamespace(resourceVersion=obj["metadata"]["resourceVersion"]))
+
+    def create(self, body: dict, namespace: str):
+        self.cluster.calls.append(("create", body["metadata"]["name"]))
+        self.cluster.store(self._key(namespace, body["metadata"]["name"]), body)
+
+    def replace(self, body: dict, namespace: str):
+        key = self._key(namespace, body["metadata"]["name"])
+        self.cluster.calls.append(("replace", key[3]))
+        # A controller writes the status between the last read and the PUT
+        if self.cluster.status_writes.get(key[3]):
+            self.cluster.status_writes[key[3]] -= 1
+            self.cluster.store(key, self.cluster.objects[key])
+        if body["metadata"]["resourceVersion"] != self.cluster.objects[key]["metadata"]["resourceVersion"]:
+            raise ConflictError(ApiException(status=409, reason="Conflict"))
+        if key[3] in self.cluster.immutable:
+            raise UnprocessibleEntityError(ApiException(status=422, reason="Invalid"))
+        self.cluster.store(key, body)
+
+    def delete(self, name: str, namespace: str, body: dict):
+        self.cluster.calls.append(("delete", name))
+        if self.cluster.objects.pop(self._key(namespace, name), None) is None:
+            raise NotFoundError(ApiException(status=404, reason="Not Found"))
+
+
+class FakeDynamic:
+    """A stand-in for kubernetes.dynamic.DynamicClient over an in-memory store of Deployments."""
+
+    def __init__(self, *objects: dict):
+        self.objects: dict = {}
+        self.version = 100
+        self.calls: list[tuple[str, str]] = []
+        # Name -> replaces that race a status write; names whose changes need a recreate
+        self.status_writes: dict[str, int] = {}
+        self.immutable: set[str] = set()
+        for obj in objects:
+            self.store(resource_key(obj), obj)
+        deployments = FakeResource(self, "apps/v1", "Deployment")
+        self.resources = SimpleNamespace(search=lambda: [deployments], get=lambda api_version, kind: deployments)
+
+    def store(self, key, obj: dict):
+        self.version += 1
+        obj = copy.deepcopy(obj)
+        obj["metadata"]["resourceVersion"] = str(self.version)
+        self.objects[key] = obj
+
+
+def snapshot_manager(cluster: FakeDynamic) -> AppSnapshotManager:
+    manager = AppSnapshotManager()
+    manager._dynamic = cluster
+    return manager
+
+
+@pytest.fixture
+def restore(monkeypatch):
+    """restore() against a FakeDynamic; the roll-out wait is satisfied at once."""
+    monkeypatch.setattr(app_snapshot, "await_condition", lambda kind, *a, **kw: WaitResult(kind, True, 0.0))
+    return lambda cluster, snapshot: snapshot_manager(cluster).restore(snapshot)
+
+
+def images(cluster: FakeDynamic) -> dict[str, str]:
+    return {key[3]: obj["spec"]["template"]["spec"]["containers"][0]["image"] for key, obj in cluster.objects.items()}
+
+
+def test_restore_brings_the_namespace_back_to_the_snapshot(restore):
+    frontend, geo, rate = (deployment(name) for name in ("frontend", "geo", "rate"))
+    cluster = FakeDynamic(frontend, geo, rate)
+    snapshot = snapshot_manager(cluster).capture("hotel", [NAMESPACE])
+    # The problem breaks geo, deletes rate and leaves a debug deployment behind
+    cluster.store(resource_key(geo), deployment("geo", image="app:broken"))
+    del cluster.objects[resource_key(rate)]
+    cluster.store(resource_key(deployment("debug-shell")), deployment("debug-shell"))
+
+    changes = restore(cluster, snapshot)
+    assert images(cluster) == {"frontend": "app:1", "geo": "app:1", "rate": "app:1"}
+    assert changes["unchanged"] == 1
+    assert changes["updated"] == [f"Deployment {NAMESPACE}/geo"]
+    assert changes["created"] == [f"Deployment {NAMESPACE}/rate"]
+    assert changes["deleted"] == [f"Deployment {NAMESPACE}/debug-shell"]
+    assert ("replace", "frontend") not in cluster.calls
+
+
+def test_restore_retries_a_replace_that_conflicts(restore):
+    geo = deployment("geo")
+    cluster = FakeDynamic(geo)
+    snapshot = snapshot_of(cluster.objects[resource_key(geo)])
+    cluster.store(resource_key(geo), deployment("geo", image="app:broken"))
+    cluster.status_writes["geo"] = 2
+
+    changes = restore(cluster, snapshot)
+    assert changes["updated"] == [f"Deployment {NAMESPACE}/geo"]
+    assert images(cluster) == {"geo": "app:1"}
+    assert cluster.calls.count(("replace", "geo")) == 3
+
+
+def test_restore_gives_up_on_an_object_that_keeps_conflicting(restore):
+    geo = deployment("geo")
+    cluster = FakeDynamic(geo)
+    snapshot = snapshot_of(cluster.objects[resource_key(geo)])
+    cluster.store(resource_key(geo), deployment("geo", image="app:broken"))
+    cluster.status_writes["geo"] = app_snapshot.REPLACE_ATTEMPTS
+
+    with pytest.raises(ConflictError):
+        restore(cluster, snapshot)
+
+
+def test_restore_recreates_what_cannot_be_updated_in_place(restore):
+    geo = deployment("geo")
+    cluster = FakeDynamic(geo)
+    snapshot = snapshot_of(cluster.objects[resource_key(geo)])
+    cluster.store(resource_key(geo), deployment("geo", image="app:broken"))
+    cluster.immutable.add("geo")
+
+    changes = restore(cluster, snapshot)
+    assert changes["recreated"] == [f"Deployment {NAMESPACE}/geo"]
+    assert cluster.calls == [("replace", "geo"), ("delete", "geo"), ("create", "geo")]
+    assert images(cluster) == {"geo": "app:1"}
+
+
+class FakeApp:
+    def __init__(self, name: str = "hotel", namespace: str = NAMESPACE):
+        self.name = name
+        self.namespace = namespace
+        self.cleaned_up = 0
+
+    def cleanup(self):
+        self.cleaned_up += 1
+
+
+class FakeSnapshots:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.restored: list[AppSnapshot] = []
+
+    def restore(self, snapshot: AppSnapshot):
+        if self.fail:
+            raise TimeoutError("deployments did not roll out")
+        self.restored.append(snapshot)
+
+
+class FakeClusterState:
+    def __init__(self):
+        self.reconciled = 0
+
+    def release_app_state(self):
+        pass
+
+    def reconcile_to_baseline(self):
+        self.reconciled += 1
+
+
+@pytest.fixture
+def conductor():
+    """A Conductor with just the state the app reuse methods touch (no cluster)."""
+    conductor = Conductor.__new__(Conductor)
+    conductor.config = ConductorConfig(reuse_apps=True)
+    conductor.logger = SimpleNamespace(info=lambda msg: None, warning=lambda msg: None)
+    conductor.cluster_state = FakeClusterState()
+    conductor._baseline_captured = True
+    conductor.app_snapshots = FakeSnapshots()
+    conductor.app_snapshot = None
+    conductor._retained_app = None
+    return conductor
+
+
+def test_reset_app_keeps_a_restored_app_for_the_next_problem(conductor):
+    app = FakeApp()
+    conductor.app_snapshot = AppSnapshot(app_key=conductor._app_key(app), namespaces=[NAMESPACE])
+    conductor._reset_app(app)
+    assert conductor.app_snapshots.restored == [conductor.app_snapshot]
+    assert app.cleaned_up == 0
+
+    # The next problem on the same app takes it as is
+    assert conductor._take_retained_app(FakeApp()) is True
+    assert conductor._retained_app is app
+
+
+def test_reset_app_undeploys_when_the_restore_fails(conductor):
+    app = FakeApp()
+    conductor.app_snapshots = FakeSnapshots(fail=True)
+    conductor.app_snapshot = AppSnapshot(app_key=conductor._app_key(app), namespaces=[NAMESPACE])
+    conductor._reset_app(app)
+    assert app.cleaned_up == 1
+    assert conductor.app_snapshot is None and conductor._retained_app is None
+    assert conductor._take_retained_app(app) is False
+
+
+def test_a_different_app_tears_the_kept_one_down(conductor):
+    app = FakeApp()
+    conductor.app_snapshot = AppSnapshot(app_key=conductor._app_key(app), namespaces=[NAMESPACE])
+    conductor._reset_app(app)
+
+    assert conductor._take_retained_app(FakeApp(name="social", namespace="social-network")) is False
+    assert app.cleaned_up == 1
+    assert conductor.cluster_state.reconciled == 1
+    assert conductor._retained_app is None
+    # Nothing left to tear down at the end of the run
+    conductor.teardown_retained_app()
+    assert app.cleaned_up == 1
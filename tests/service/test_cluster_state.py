@@ -0,0 +1,161 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from sregym.service import cluster_state
+from sregym.service.cluster_state import ClusterBaseline, ClusterStateManager
+
+CRD = "widgets.example.com"
+NODE_LABELS = {"kubernetes.io/hostname": "node-1"}
+
+
+def named(*names: str) -> SimpleNamespace:
+    return SimpleNamespace(items=[SimpleNamespace(metadata=SimpleNamespace(name=name)) for name in sorted(names)])
+
+
+class FakeCluster:
+    """Cluster-scoped state behind every API the reconciler uses; records each call in order."""
+
+    def __init__(self):
+        self.namespaces = {"default", "kube-system", "hotel-reservation"}
+        self.persistent_volumes = {"pv-base", "pv-hotel"}
+        self.crds = {CRD}
+        self.custom_objects = [{"metadata": {"name": "w1", "namespace": "hotel-reservation", "finalizers": ["x"]}}]
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def record(self, call: str):
+        with self._lock:
+            self.calls.append(call)
+
+    def index(self, call: str) -> int:
+        return self.calls.index(call)
+
+    # CoreV1Api
+    def list_namespace(self):
+        return named(*self.namespaces)
+
+    def delete_namespace(self, name):
+        self.record(f"delete namespace {name}")
+
+    def list_persistent_volume(self):
+        return named(*self.persistent_volumes)
+
+    def delete_persistent_volume(self, name):
+        self.record(f"delete pv {name}")
+
+    def list_node(self):
+        node = SimpleNamespace(
+            metadata=SimpleNamespace(name="node-1", labels=dict(NODE_LABELS)), spec=SimpleNamespace(taints=None)
+        )
+        return SimpleNamespace(items=[node])
+
+    def read_namespaced_config_map(self, name, namespace):
+        return SimpleNamespace(data={"Corefile": "."})
+
+    # RbacAuthorizationV1Api, StorageV1Api, AdmissionregistrationV1Api
+    def list_cluster_role(self):
+        return named()
+
+    list_cluster_role_binding = list_storage_class = list_cluster_role
+    list_validating_webhook_configuration = list_mutating_webhook_configuration = list_cluster_role
+
+    def delete_cluster_role(self, name):
+        self.record(f"delete cluster-scoped {name}")
+
+    delete_cluster_role_binding = delete_storage_class = delete_cluster_role
+    delete_validating_webhook_configuration = delete_mutating_webhook_configuration = delete_cluster_role
+
+    # ApiextensionsV1Api
+    def list_custom_resource_definition(self):
+        return named(*self.crds)
+
+    def read_custom_resource_definition(self, name):
+        return SimpleNamespace(spec=SimpleNamespace(versions=[SimpleNamespace(name="v1")]))
+
+    def delete_custom_resource_definition(self, name):
+        self.record(f"delete crd {name}")
+
+    # CustomObjectsApi
+    def list_cluster_custom_object(self, group, version, plural):
+        return {"items": self.custom_objects}
+
+    def patch_namespaced_custom_object(self, group, version, namespace, plural, name, body):
+        self.record(f"strip finalizers {name}")
+
+    # KubeCtl
+    def gc_orphan_localpv_dirs(self):
+        time.sleep(0.05)
+        self.record("localpv gc")
+        return {}
+
+
+@pytest.fixture
+def cluster(monkeypatch):
+    cluster = FakeCluster()
+
+    def await_condition(kind, predicate, timeout, description):
+        cluster.record(f"await {kind}")
+        if kind == "persistentvolumes":
+            cluster.persistent_volumes = {"pv-base"}
+        return SimpleNamespace(satisfied=True, objects=[])
+
+    monkeypatch.setattr(cluster_state, "await_condition", await_condition)
+    monkeypatch.setattr(cluster_state.client, "CustomObjectsApi", lambda: cluster)
+    return cluster
+
+
+@pytest.fixture
+def manager(cluster) -> ClusterStateManager:
+    manager = ClusterStateManager.__new__(ClusterStateManager)
+    manager.kubectl = cluster
+    manager.platform = None
+    manager.app = None
+    manager.phase_seconds = {}
+    manager.core_v1 = manager.rbac_v1 = manager.storage_v1 = cluster
+    manager.apiextensions_v1 = manager.admission_v1 = cluster
+    manager.baseline = ClusterBaseline(
+        namespaces={"default", "kube-system"},
+        persistent_volumes={"pv-base"},
+        node_labels={"node-1": dict(NODE_LABELS)},
+        node_taints={"node-1": []},
+        coredns_configmap_data={"Corefile": "."},
+    )
+    return manager
+
+
+def test_reconcile_deletes_what_is_not_in_the_baseline(manager):
+    changes = manager.reconcile_to_baseline()
+
+    assert changes["namespaces_deleted"] == ["hotel-reservation"]
+    assert changes["persistent_volumes_deleted"] == ["pv-hotel"]
+    assert changes["crds_deleted"] == [CRD]
+    assert not changes["coredns_reset"]
+    assert changes["nodes_labels_reset"] == changes["nodes_taints_reset"] == []
+
+
+def test_reconcile_phases_run_in_order(manager, cluster):
+    manager.reconcile_to_baseline()
+
+    # CR finalizers are stripped before their CRD is deleted, so the deletion cannot hang
+    assert cluster.index("strip finalizers w1") < cluster.index(f"delete crd {CRD}")
+    # The LocalPV sweep only runs once the deleted PVs are gone
+    assert cluster.index("delete pv pv-hotel") < cluster.index("await persistentvolumes") < cluster.index("localpv gc")
+    assert cluster.index("delete namespace hotel-reservation") < cluster.index("await namespaces")
+
+
+def test_reconcile_records_time_per_phase(manager):
+    manager.reconcile_to_baseline()
+
+    assert list(manager.phase_seconds) == ["diff", "finalizers", "delete", "terminate", "localpv_gc", "nodes"]
+    assert all(seconds >= 0 for seconds in manager.phase_seconds.values())
+    assert manager.phase_seconds["localpv_gc"] >= 0.05
+
+
+def test_reconcile_without_a_baseline_is_skipped(manager, cluster):
+    manager.baseline = None
+
+    assert manager.reconcile_to_baseline() == {"skipped": True, "reason": "no_baseline"}
+    assert cluster.calls == []
@@ -0,0 +1,141 @@
+import threading
+import time
+
+import pytest
+
+from sregym.service.deploy_graph import DeployReport, DeployStep, StepTiming, run_deploy_graph
+
+
+class Recorder:
+    """Builds fake steps that sleep for a while and record when they ran."""
+
+    def __init__(self):
+        self.runs: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def step(self, name, seconds=0.0, depends_on=(), run=None, status=None) -> DeployStep:
+        def record():
+            start = time.monotonic()
+            try:
+                if run is not None:
+                    run()
+                time.sleep(seconds)
+                return status
+            finally:
+                with self._lock:
+                    self.runs[name] = (start, time.monotonic())
+
+        return DeployStep(name, record, list(depends_on))
+
+
+def test_independent_steps_run_concurrently():
+    recorder = Recorder()
+    # Each step only finishes once all three are running at the same time
+    together = threading.Barrier(3, timeout=5)
+    steps = [recorder.step(name, run=together.wait) for name in ("openebs", "prometheus", "jaeger")]
+
+    report = run_deploy_graph(steps)
+
+    assert set(recorder.runs) == {"openebs", "prometheus", "jaeger"}
+    assert all(t.status == "ok" for t in report.timings.values())
+
+
+def test_max_workers_one_runs_in_list_order():
+    recorder = Recorder()
+    steps = [recorder.step(name, seconds=0.01) for name in ("a", "b", "c")]
+
+    run_deploy_graph(steps, max_workers=1)
+
+    (_, a_end), (b_start, b_end), (c_start, _) = (recorder.runs[n] for n in ("a", "b", "c"))
+    assert a_end <= b_start and b_end <= c_start
+
+
+def test_dependent_waits_for_its_dependency_to_finish():
+    recorder = Recorder()
+    steps = [
+        recorder.step("app", depends_on=["openebs"]),
+        recorder.step("openebs", seconds=0.1),
+        recorder.step("prometheus", seconds=0.02),
+    ]
+
+    report = run_deploy_graph(steps)
+
+    assert recorder.runs["openebs"][1] <= recorder.runs["app"][0]
+    # The unrelated step did not wait for openebs
+    assert recorder.runs["prometheus"][0] < recorder.runs["openebs"][1]
+    assert report.timings["app"].start >= report.timings["openebs"].end
+
+
+def test_failed_dependency_skips_dependents_and_reraises_after_other_branches():
+    recorder = Recorder()
+
+    def fail():
+        raise RuntimeError("helm install failed")
+
+    steps = [
+        recorder.step("openebs", run=fail),
+        recorder.step("app", depends_on=["openebs"]),
+        recorder.step("workload", depends_on=["app"]),
+        recorder.step("prometheus", seconds=0.05),
+    ]
+
+    with pytest.raises(RuntimeError, match="helm install failed"):
+        run_deploy_graph(steps)
+
+    assert "app" not in recorder.runs and "workload" not in recorder.runs
+    assert "prometheus" in recorder.runs
+
+
+def test_step_status_is_reported():
+    recorder = Recorder()
+
+    report = run_deploy_graph([recorder.step("openebs", status="kept"), recorder.step("app", depends_on=["openebs"])])
+
+    assert report.timings["openebs"].status == "kept"
+    assert report.timings["app"].status == "ok"
+    assert report.failed == []
+
+
+def test_critical_path_follows_the_chain_that_finished_last():
+    recorder = Recorder()
+    steps = [
+        recorder.step("openebs", seconds=0.1),
+        recorder.step("prometheus", seconds=0.02),
+        recorder.step("app", seconds=0.02, depends_on=["openebs", "prometheus"]),
+        recorder.step("jaeger", seconds=0.01),
+    ]
+
+    report = run_deploy_graph(steps)
+
+    assert report.critical_path() == ["openebs", "app"]
+    assert report.wall_time >= report.timings["app"].end
+    formatted = report.format()
+    assert "critical path: openebs -> app" in formatted
+    assert [line[0] for line in formatted.splitlines() if "prometheus" in line] == [" "]
+
+
+def test_critical_path_ignores_steps_that_did_not_run():
+    report = DeployReport(
+        timings={
+            "openebs": StepTiming("openebs", "ok", start=0.0, end=5.0),
+            "app": StepTiming("app", "failed", start=5.0, end=6.0, error="boom"),
+            "workload": StepTiming("workload", "not run"),
+        },
+        depends_on={"openebs": [], "app": ["openebs"], "workload": ["app"]},
+        wall_time=6.0,
+    )
+
+    assert report.critical_path() == ["openebs", "app"]
+    assert [t.name for t in report.failed] == ["app"]
+
+
+@pytest.mark.parametrize(
+    "steps, message",
+    [
+        ([DeployStep("app", lambda: None, ["openebs"])], "unknown"),
+        ([DeployStep("a", lambda: None, ["b"]), DeployStep("b", lambda: None, ["a"])], "cycle"),
+    ],
+)
+def test_invalid_graphs_are_rejected(steps, message):
+    with pytest.raises(ValueError, match=message):
+        run_deploy_graph(steps)
@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+from sregym.service import informer as informer_module
+from sregym.service.informer import ClusterCache, stop_namespace_informers
+
+
+class FakeInformer:
+    """Stands in for an Informer: synced at once, counts as stopped once stop() is called."""
+
+    instances: list["FakeInformer"] = []
+
+    def __init__(self, kind, namespace=None, api_client=None):
+        self.kind = kind
+        self.namespace = namespace
+        self.version = 0
+        self.started = False
+        self._stopped = threading.Event()
+        FakeInformer.instances.append(self)
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self._stopped.set()
+
+    def wait_for_sync(self, timeout=None) -> bool:
+        return True
+
+    def wait_for_change(self, since, timeout) -> int:
+        self._stopped.wait(timeout)
+        return self.version
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    FakeInformer.instances = []
+    monkeypatch.setattr(informer_module, "Informer", FakeInformer)
+    cache = ClusterCache()
+    yield cache
+    cache.stop()
+
+
+def test_stop_namespace_stops_only_that_namespace(cache):
+    pods = cache.informer("pods", "hotel-reservation-1")
+    jobs = cache.informer("jobs", "hotel-reservation-1")
+    other = cache.informer("pods", "hotel-reservation-2")
+    nodes = cache.informer("nodes", "hotel-reservation-1")  # cluster-scoped, keyed without a namespace
+
+    assert cache.stop_namespace("hotel-reservation-1") == 2
+
+    assert pods.stopped and jobs.stopped
+    assert not other.stopped and not nodes.stopped
+    assert cache.informer("pods", "hotel-reservation-2") is other
+    # A later wait on the namespace starts a fresh informer
+    fresh = cache.informer("pods", "hotel-reservation-1")
+    assert fresh is not pods and fresh.started
+
+
+def test_stop_namespace_informers_uses_the_shared_cache(cache, monkeypatch):
+    stop_namespace_informers("hotel-reservation-1")  # no cache enabled: nothing to do
+
+    pods = cache.informer("pods", "hotel-reservation-1")
+    monkeypatch.setattr(informer_module, "_cluster_cache", cache)
+    stop_namespace_informers("hotel-reservation-1")
+
+    assert pods.stopped
+
+
+def test_wait_until_moves_to_a_fresh_informer_when_its_namespace_is_stopped(cache):
+    first = cache.informer("pods", "hotel-reservation-1")
+    checks = []
+
+    def predicate():
+        checks.append(FakeInformer.instances[-1])
+        return len(FakeInformer.instances) > 1
+
+    timer = threading.Timer(0.1, cache.stop_namespace, args=("hotel-reservation-1",))
+    timer.start()
+    try:
+        assert cache.wait_until("pods", "hotel-reservation-1", predicate, timeout=5)
+    finally:
+        timer.cancel()
+
+    assert checks[0] is first
+    assert checks[-1] is not first and not checks[-1].stopped
@@ -0,0 +1,92 @@
+import http.client
+
+import pytest
+
+from sregym.service.k8s_proxy import UpstreamConnectionPool
+
+
+class FakeConnection:
+    """An upstream connection that fails at `fail_at` ("request" or "response") or answers "ok"."""
+
+    def __init__(self, fail_at: str | None = None, error: Exception | None = None):
+        self.fail_at = fail_at
+        self.error = error or http.client.RemoteDisconnected("Remote end closed connection without response")
+        self.sock = None
+        self.timeout = 60
+        self.requests: list[tuple[str, str]] = []
+        self.closed = False
+
+    def request(self, method, path, body=None, headers=None):
+        if self.fail_at == "request":
+            raise self.error
+        self.requests.append((method, path))
+
+    def getresponse(self):
+        if self.fail_at == "response":
+            raise self.error
+        return "ok"
+
+    def close(self):
+        self.closed = True
+
+
+class FakePool(UpstreamConnectionPool):
+    """A pool whose idle connection is `stale`; fresh connections always succeed."""
+
+    def __init__(self, stale: FakeConnection):
+        super().__init__("127.0.0.1", 6443, context=None)
+        self._idle = [stale]
+        self.fresh: list[FakeConnection] = []
+
+    def acquire(self, fresh: bool = False):
+        if not fresh and self._idle:
+            return self._idle.pop(), True
+        conn = FakeConnection()
+        self.fresh.append(conn)
+        return conn, False
+
+
+@pytest.mark.parametrize("method", ["GET", "HEAD", "OPTIONS"])
+def test_idempotent_request_is_retried_when_the_response_never_arrives(method):
+    stale = FakeConnection(fail_at="response")
+    pool = FakePool(stale)
+
+    conn, response = pool.send(method, "/api/v1/pods", None, {})
+
+    assert response == "ok"
+    assert stale.closed
+    assert conn is pool.fresh[0] and conn.requests == [(method, "/api/v1/pods")]
+
+
+@pytest.mark.parametrize("method", ["POST", "PUT", "PATCH", "DELETE"])
+@pytest.mark.parametrize(
+    "error", [http.client.RemoteDisconnected("closed"), ConnectionResetError("reset")], ids=["disconnected", "reset"]
+)
+def test_mutating_request_is_not_replayed_once_it_was_sent(method, error):
+    pool = FakePool(FakeConnection(fail_at="response", error=error))
+
+    with pytest.raises(type(error)):
+        pool.send(method, "/api/v1/namespaces/default/pods", b"{}", {})
+
+    assert pool.fresh == []
+
+
+@pytest.mark.parametrize("method", ["GET", "POST", "DELETE"])
+def test_any_request_is_retried_when_sending_on_a_stale_connection_fails(method):
+    stale = FakeConnection(fail_at="request", error=BrokenPipeError("broken pipe"))
+    pool = FakePool(stale)
+
+    conn, response = pool.send(method, "/api/v1/namespaces/default/pods", b"{}", {})
+
+    assert response == "ok"
+    assert stale.closed and stale.requests == []
+    assert conn.requests == [(method, "/api/v1/namespaces/default/pods")]
+
+
+def test_fresh_connection_failures_are_not_retried():
+    pool = FakePool(FakeConnection())
+    pool._idle = []
+    pool.acquire = lambda fresh=False: (FakeConnection(fail_at="response"), False)
+
+    with pytest.raises(http.client.RemoteDisconnected):
+        pool.send("GET", "/api/v1/pods", None, {})
@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from sregym.service.apps.base import Application, base_namespace, current_namespace_suffix, namespace_suffix
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "app.json"
+    path.write_text(json.dumps({"Name": "Hotel Reservation", "Namespace": "hotel-reservation"}))
+    return str(path)
+
+
+class FixedNamespaceApp(Application):
+    namespace_templatable = False
+
+
+def test_apps_built_inside_a_suffix_get_their_own_namespace(config_file):
+    with namespace_suffix("3fa9c1"):
+        app = Application(config_file)
+        app.load_app_json()
+    assert app.namespace == "hotel-reservation-3fa9c1"
+    assert base_namespace(app.namespace) == "hotel-reservation"
+
+    app = Application(config_file)
+    app.load_app_json()
+    assert app.namespace == "hotel-reservation"
+    assert base_namespace(app.namespace) == "hotel-reservation"
+
+
+def test_suffix_is_scoped_to_the_block():
+    with namespace_suffix("a"):
+        with namespace_suffix("b"):
+            assert current_namespace_suffix() == "b"
+        assert current_namespace_suffix() == "a"
+    assert current_namespace_suffix() is None
+
+
+def test_apps_that_hard_code_their_namespace_are_not_templated(config_file):
+    with namespace_suffix("3fa9c1"):
+        app = FixedNamespaceApp(config_file)
+        app.load_app_json()
+    assert app.namespace == "hotel-reservation"
@@ -0,0 +1,54 @@
+import threading
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from sregym.service import waits
+from sregym.service.waits import await_condition
+
+
+@pytest.fixture
+def failing_list(monkeypatch):
+    """Make every LIST raise the error in `failing_list.error`, counting the calls."""
+    state = {"calls": 0, "error": ApiException(status=500, reason="Internal Server Error")}
+
+    def list_func(**kwargs):
+        state["calls"] += 1
+        raise state["error"]
+
+    monkeypatch.setattr(waits, "resolve_list_func", lambda kind, namespace, api_client: (list_func, ()))
+    monkeypatch.setattr(waits, "get_cluster_cache", lambda: None)
+    monkeypatch.setattr(waits, "ERROR_BACKOFF_SECONDS", 0.05)
+    return state
+
+
+def run_with_timeout(**kwargs):
+    """Run await_condition in a thread so a wait that never returns fails the test instead of hanging it."""
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(await_condition("pods", lambda objects: bool(objects), **kwargs)),
+        daemon=True,
+    )
+    thread.start()
+    thread.join(5)
+    assert results, "await_condition kept re-listing past its deadline"
+    return results[0]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ApiException(status=500, reason="Internal Server Error"),
+        ApiException(status=410, reason="Gone"),
+        ConnectionError("connection refused"),
+    ],
+)
+def test_failing_list_returns_at_the_deadline(failing_list, error):
+    failing_list["error"] = error
+
+    result = run_with_timeout(namespace="default", timeout=0.3)
+
+    assert not result.satisfied
+    assert result.objects == []
+    assert 0.3 <= result.elapsed < 2
+    assert failing_list["calls"] >= 1
@@ -0,0 +1,49 @@
+from sregym.results_journal import completed_attempts
+from sregym.work_queue import WorkQueue
+
+
+def test_claim_in_order_and_complete(tmp_path):
+    queue = WorkQueue.create(tmp_path / "queue.json", ["a", "b"])
+    assert queue.claim("shard-1") == "a"
+    assert queue.claim("shard-2") == "b"
+    assert queue.claim("shard-1") is None
+
+    queue.complete("a")
+    assert queue.counts() == {"pending": 0, "claimed": 1, "done": 1, "failed": 0}
+
+
+def test_attempts_survive_a_crashed_shard(tmp_path):
+    queue = WorkQueue.create(tmp_path / "queue.json", ["a", "b"], attempts={"a": 1, "other": 3})
+    assert queue.attempts("a") == 1
+    assert queue.attempts("other") == 0  # not queued
+
+    assert queue.claim("shard-1") == "a"
+    assert queue.record_attempt("a") == 2
+    # shard-1 dies; the next shard picks up after the attempts already completed
+    assert queue.release("shard-1") == ["a"]
+    assert queue.claim("shard-2") == "a"
+    assert queue.attempts("a") == 2
+
+
+def test_failed_problem_is_retried_then_reported(tmp_path):
+    queue = WorkQueue.create(tmp_path / "queue.json", ["a", "b"])
+    assert queue.claim("shard-1") == "a"
+    assert queue.fail("a") is True
+    # Re-queued behind the problems that have not run yet
+    assert queue.claim("shard-1") == "b"
+    assert queue.claim("shard-2") == "a"
+    assert queue.fail("a") is False
+
+    assert queue.failed() == ["a"]
+    assert queue.counts() == {"pending": 0, "claimed": 1, "done": 0, "failed": 1}
+
+
+def test_completed_attempts_ignore_failed_deploys():
+    rows = [
+        {"problem_id": "a", "attempt": 1},
+        {"problem_id": "a", "attempt": 2, "deploy_failed": True},
+        # Read back from a CSV, where every value is a string
+        {"problem_id": "b", "attempt": "1", "deploy_failed": ""},
+        {"problem_id": "b", "attempt": "2", "deploy_failed": "True"},
+    ]
+    assert completed_attempts(rows) == {"a": 1, "b": 1}
@@ -0,0 +1,112 @@
+import os
+import threading
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from llm_backend.get_llm_backend import LiteLLMBackend
+from sregym.utils.cache import LLMCache, LLMCacheMiss
+
+
+class FakeModel:
+    """Stands in for the ChatLiteLLM client; counts the requests that reach the model."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, input):
+        self.calls += 1
+        return AIMessage(content=f"answer {self.calls}")
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    """A backend in the given cache mode, sharing one store and one fake model per test."""
+    model = FakeModel()
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path / "llm_cache"))
+
+    def make(mode: str) -> LiteLLMBackend:
+        monkeypatch.setenv("LLM_CACHE_MODE", mode)
+        llm = LiteLLMBackend("gpt-4o", api_key="unused")
+        llm.llm = model
+        return llm
+
+    make.model = model
+    return make
+
+
+def test_request_key_is_stable_and_content_addressed():
+    request = {"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}], "temperature": 0.0}
+    reordered = {"temperature": 0.0, "messages": [{"content": "hi", "role": "user"}], "model": "gpt-4o"}
+    assert LLMCache.request_key(request) == LLMCache.request_key(reordered)
+    # A fixed digest, so keys recorded by an earlier run stay valid
+    assert LLMCache.request_key({"a": 1}) == "015abd7f5cc57a2dd94b7590f04ad8084273905ee33ec5cebeae62276a97f862"
+    assert LLMCache.request_key({**request, "temperature": 0.5}) != LLMCache.request_key(request)
+
+
+def test_record_then_replay(backend):
+    prompt = [HumanMessage(content="why is geo crashing?")]
+    recorded = backend("record").inference(prompt)
+    # record always asks the model
+    backend("record").inference(prompt)
+    assert backend.model.calls == 2
+
+    replay = backend("replay")
+    assert replay.inference(prompt).content == "answer 2"
+    assert replay.totals["cache_hits"] == 1
+    assert backend.model.calls == 2
+    assert recorded.content == "answer 1"
+
+    with pytest.raises(LLMCacheMiss):
+        replay.inference([HumanMessage(content="never recorded")])
+    assert backend.model.calls == 2
+
+
+def test_read_through_queries_only_on_a_miss(backend):
+    llm = backend("read-through")
+    prompt = [HumanMessage(content="why is geo crashing?")]
+    assert llm.inference(prompt).content == "answer 1"
+    assert llm.inference(prompt).content == "answer 1"
+    assert backend.model.calls == 1
+
+
+def test_off_neither_reads_nor_writes(backend, tmp_path):
+    llm = backend("off")
+    assert llm.cache is None
+    prompt = [HumanMessage(content="why is geo crashing?")]
+    llm.inference(prompt)
+    llm.inference(prompt)
+    assert backend.model.calls == 2
+    assert not (tmp_path / "llm_cache").exists()
+
+
+def test_concurrent_writes_leave_whole_entries(tmp_path):
+    # Two handles on one store, as two agent processes would have
+    caches = [LLMCache(tmp_path), LLMCache(tmp_path)]
+    key = LLMCache.request_key({"prompt": "shared"})
+    entries = [{"writer": i, "response": "x" * 10_000} for i in range(16)]
+
+    threads = [threading.Thread(target=caches[i % 2].put, args=(key, entry)) for i, entry in enumerate(entries)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert caches[0].get(key) in entries
+    assert caches[1].stats()["entries"] == 1
+    # No temporary files are left behind
+    assert [path.name for path in tmp_path.rglob("*") if path.is_file()] == [f"{key}.json"]
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = LLMCache(tmp_path, max_bytes=250)
+    keys = [LLMCache.request_key(i) for i in range(3)]
+    for age, key in enumerate(keys[:2]):
+        cache.put(key, {"response": "x" * 80})
+        os.utime(cache._path(key), (1000 + age, 1000 + age))
+    # Reading the older entry makes the other one the least recently used
+    cache.get(keys[0])
+    cache.put(keys[2], {"response": "x" * 80})
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import pytest
+
+from sregym.generators.workload.blueprint_hotel_work import BHotelWrkWorkloadManager
+from sregym.generators.workload.stream import StreamWorkloadManager
+
+
+def run_report(start: str, requests: int) -> list[str]:
+    return [
+        "Finished all requests",
+        f"Start time: {start}",
+        f"Total requests: {requests}",
+        "Successful requests: 0",
+        "Failed requests: 0",
+        "Duration: 60s",
+        "Latencies:",
+        "12.5",
+        "13.1",
+        "End of latency distribution",
+    ]
+
+
+class FakeCoreV1:
+    def __init__(self, log: str):
+        self.log = log
+
+    def list_namespaced_pod(self, namespace, label_selector):
+        assert label_selector == "job-name=bhotelwrk-wlgen-job"
+        return SimpleNamespace(items=[SimpleNamespace(metadata=SimpleNamespace(name="bhotelwrk-wlgen-job-x7k2p"))])
+
+    def read_namespaced_pod_log(self, name, namespace, timestamps=False):
+        return self.log
+
+
+def make_manager(log_lines: list[str]) -> BHotelWrkWorkloadManager:
+    # No cluster: skip the kubeconfig loading in __init__
+    manager = BHotelWrkWorkloadManager.__new__(BHotelWrkWorkloadManager)
+    StreamWorkloadManager.__init__(manager)
+    manager.namespace = "blueprint-hotel-reservation"
+    manager.job_name = "bhotelwrk-wlgen-job"
+    manager.log_pool = []
+    manager.core_v1_api = FakeCoreV1("\n".join(f"2025-01-01T00:00:{i:02d}Z {line}" for i, line in enumerate(log_lines)))
+    return manager
+
+
+def test_retrievelog_parses_each_run_of_the_job():
+    log = ["wlgen starting"] + run_report("2025-01-01T00:00:00.000000Z", 1000)
+    log += run_report("2025-01-01T00:01:00.000000Z", 900)
+    manager = make_manager(log)
+
+    entries = manager.retrievelog()
+    assert [entry.number for entry in entries] == [1000, 900]
+    assert entries[0].log == "12.5\n13.1"
+    assert [entry.number for entry in manager.retrievelog(start_time=entries[0].time)] == [900]
+
+
+def test_unfinished_run_yields_nothing():
+    manager = make_manager(run_report("2025-01-01T00:00:00.000000Z", 1000)[:-1])
+    assert manager.retrievelog() == []
+
+
+def test_stream_managers_must_implement_the_log_hooks():
+    class Incomplete(StreamWorkloadManager):
+        def start(self):
+            pass
+
+        def stop(self):
+            pass
+
+    with pytest.raises(TypeError, match="log_pod"):
+        Incomplete()
@@ -0,0 +1,137 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from sregym.conductor.oracles.latency_slo import DEFAULT_LATENCY_SLO, LatencySLOMitigationOracle
+from sregym.generators.workload.base import WorkloadEntry
+from sregym.generators.workload.latency import BUCKET_PRECISION, LatencyHistogram, parse_wrk2_spectrum
+from sregym.generators.workload.stream import StreamWorkloadManager
+from sregym.generators.workload.wrk2 import Wrk2WorkloadManager
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def fixture_lines(name: str) -> list[str]:
+    return (FIXTURES / name).read_text().splitlines()
+
+
+def wrk2_summary(lines: list[str]) -> dict[float, float]:
+    """The percentiles wrk2 printed itself ("Latency Distribution"), in milliseconds."""
+    summary = {}
+    for line in lines:
+        match = re.match(r"^\s*([\d.]+)%\s+([\d.]+)(ms|s)$", line)
+        if match:
+            value = float(match.group(2))
+            summary[float(match.group(1))] = value * 1000 if match.group(3) == "s" else value
+    return summary
+
+
+def timestamped(lines: list[str], second: int) -> list[tuple[str, str]]:
+    """Lines as the log follower sees them: (pod timestamp, content)."""
+    return [(f"2025-01-01T00:{second // 60:02d}:{second % 60:02d}.{i:09d}Z", line) for i, line in enumerate(lines)]
+
+
+def make_manager() -> Wrk2WorkloadManager:
+    # No cluster: skip the kubeconfig loading in __init__
+    manager = Wrk2WorkloadManager.__new__(Wrk2WorkloadManager)
+    StreamWorkloadManager.__init__(manager)
+    manager.log_pool = []
+    return manager
+
+
+class FakeWorkload:
+    def __init__(self, entries):
+        self.entries = entries
+
+    def collect(self, number=100, since_seconds=None):
+        return self.entries
+
+
+class FakeProblem:
+    def __init__(self, latency_slo=None):
+        if latency_slo is not None:
+            self.latency_slo = latency_slo
+
+
+@pytest.mark.parametrize("name", ["wrk2_round_healthy.txt", "wrk2_round_degraded.txt"])
+def test_spectrum_matches_wrk2_percentiles(name):
+    lines = fixture_lines(name)
+    histogram = parse_wrk2_spectrum(lines)
+
+    total = int(re.search(r"Total count\s+=\s+(\d+)", "\n".join(lines)).group(1))
+    assert histogram.total == total
+    for percentile, expected in wrk2_summary(lines).items():
+        # The summary is rounded, the spectrum only has ticks every few tenths of a percentile
+        # near the tail, and a bucket reports its upper edge
+        assert expected * (1 - BUCKET_PRECISION) <= histogram.percentile(percentile) <= expected * 1.03
+
+
+def test_round_without_latency_has_no_histogram():
+    assert parse_wrk2_spectrum(fixture_lines("wrk2_round_no_latency.txt")) is None
+
+
+def test_histograms_merge_across_rounds():
+    healthy = parse_wrk2_spectrum(fixture_lines("wrk2_round_healthy.txt"))
+    degraded = parse_wrk2_spectrum(fixture_lines("wrk2_round_degraded.txt"))
+    merged = LatencyHistogram.merged([healthy, None, degraded])
+
+    assert merged.total == healthy.total + degraded.total
+    assert healthy.percentile(50) < merged.percentile(50) < degraded.percentile(50)
+    assert merged.percentile(100) == degraded.percentile(100)
+    assert LatencyHistogram.from_dict(merged.to_dict()).counts == merged.counts
+
+
+def test_manager_attaches_histogram_to_each_round():
+    manager = make_manager()
+    entries = []
+    rounds = ["wrk2_round_healthy.txt", "wrk2_round_no_latency.txt", "wrk2_round_degraded.txt"]
+    for second, name in zip((10, 50, 90), rounds, strict=True):
+        for timestamp, content in timestamped(fixture_lines(name), second):
+            entries.extend(manager.parse_log_line(timestamp, content))
+
+    assert [entry.number for entry in entries] == [3006, 3000, 2440]
+    assert [entry.ok for entry in entries] == [True, True, False]
+    assert entries[0].latency.total == 3006
+    assert entries[1].latency is None
+    assert entries[2].latency.total == 2440
+    assert manager.log_pool == []
+
+
+def test_slo_met_by_healthy_rounds():
+    entry = WorkloadEntry(
+        time=0, number=3006, log="", ok=True, latency=parse_wrk2_spectrum(fixture_lines("wrk2_round_healthy.txt"))
+    )
+    oracle = LatencySLOMitigationOracle(FakeProblem(), wrk_manager=FakeWorkload([entry]))
+    results = oracle.evaluate()
+
+    assert results["success"]
+    assert results["requests"] == 3006
+    assert set(results["latency_ms"]) == set(DEFAULT_LATENCY_SLO)
+
+
+def test_slo_violated_by_degraded_rounds():
+    lines = fixture_lines("wrk2_round_degraded.txt")
+    entry = WorkloadEntry(time=0, number=2440, log="", ok=False, latency=parse_wrk2_spectrum(lines))
+    oracle = LatencySLOMitigationOracle(FakeProblem(), wrk_manager=FakeWorkload([entry]))
+    results = oracle.evaluate()
+
+    assert not results["success"]
+    assert results["violations"] == ["p99", "p99.9"]
+
+
+def test_problem_slo_overrides_default():
+    entry = WorkloadEntry(
+        time=0, number=3006, log="", ok=True, latency=parse_wrk2_spectrum(fixture_lines("wrk2_round_healthy.txt"))
+    )
+    problem = FakeProblem(latency_slo={"p50": 1.0})
+    results = LatencySLOMitigationOracle(problem, wrk_manager=FakeWorkload([entry])).evaluate()
+
+    assert not results["success"]
+    assert results["violations"] == ["p50"]
+
+
+def test_no_latency_data_fails():
+    entry = WorkloadEntry(time=0, number=3000, log="", ok=True)
+    results = LatencySLOMitigationOracle(FakeProblem(), wrk_manager=FakeWorkload([entry])).evaluate()
+    assert not results["success"]
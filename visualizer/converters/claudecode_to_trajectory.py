@@ -12,6 +12,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# for the shared trajectory format (clients/stratus/stratus_utils/trajectory.py)
+sregym_core_path = Path(__file__).resolve().parents[2]
+if str(sregym_core_path) not in sys.path:
+    sys.path.insert(0, str(sregym_core_path))
+
+from clients.stratus.stratus_utils.trajectory import write_trajectory  # noqa: E402
+
 
 def _extract_text(content: list[dict]) -> str:
     """Join all text blocks from a content list."""
@@ -222,34 +229,16 @@ def convert(
     messages, submitted = _parse_stream_json(input_path)
     events = _build_incremental_events(messages, submitted, stage, problem_id, timestamp)
 
-    with output_path.open("w", encoding="utf-8") as f:
-        # Metadata line
-        f.write(
-            json.dumps(
-                {
-                    "type": "metadata",
-                    "problem_id": problem_id,
-                    "timestamp": timestamp,
-                    "timestamp_readable": timestamp_readable,
-                    "total_stages": 1,
-                    "total_events": len(events),
-                    "agent": "claudecode",
-                },
-                ensure_ascii=False,
-            )
-            + "\n"
-        )
-        # Stage marker
-        f.write(
-            json.dumps(
-                {"type": "stage_start", "stage": stage, "num_events": len(events)},
-                ensure_ascii=False,
-            )
-            + "\n"
-        )
-        # Events
-        for ev in events:
-            f.write(json.dumps(ev, ensure_ascii=False) + "\n")
+    metadata = {
+        "type": "metadata",
+        "problem_id": problem_id,
+        "timestamp": timestamp,
+        "timestamp_readable": timestamp_readable,
+        "total_stages": 1,
+        "total_events": len(events),
+        "agent": "claudecode",
+    }
+    write_trajectory(output_path, metadata, [(stage, events)])
 
     print(f"[claudecode_to_trajectory] Wrote {len(events)} event(s) → {output_path}")
     return output_path
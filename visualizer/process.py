@@ -3,6 +3,7 @@ import csv
 import json
 import re
 import subprocess
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from html import escape
@@ -11,6 +12,13 @@ from typing import Any
 
 import pandas as pd
 
+# for the shared trajectory format (clients/stratus/stratus_utils/trajectory.py)
+sregym_core_path = Path(__file__).resolve().parents[1]
+if str(sregym_core_path) not in sys.path:
+    sys.path.insert(0, str(sregym_core_path))
+
+from clients.stratus.stratus_utils.trajectory import TrajectoryReader, has_messages, write_trajectory  # noqa: E402
+
 
 # Keep ONLY the single highest-event_index "event" record per stage (per file),
 # but render the FULL event using your existing HTML logic.
@@ -525,6 +533,13 @@ def stream_pick_highest_event_index_per_stage(
         elif s in best_fallback:
             out.append(best_fallback[s][1])
 
+    # v2 files store only each event's new messages; rebuild the full history of the picked events
+    reader: TrajectoryReader | None = None
+    for i, rec in enumerate(out):
+        if "new_messages" in rec and isinstance(rec.get("event_index"), int):
+            reader = reader or TrajectoryReader(path)
+            out[i] = reader.event(rec.get("stage", ""), rec["event_index"])
+
     return out, errors, total_lines
 
 
@@ -1835,31 +1850,16 @@ def _convert_agent_file(
 
     events = _build_trajectory_events(messages, submitted, stage, problem_id, timestamp)
 
-    with output_path.open("w", encoding="utf-8") as f:
-        f.write(
-            json.dumps(
-                {
-                    "type": "metadata",
-                    "problem_id": problem_id,
-                    "timestamp": timestamp,
-                    "timestamp_readable": timestamp_readable,
-                    "total_stages": 1,
-                    "total_events": len(events),
-                    "agent": agent,
-                },
-                ensure_ascii=False,
-            )
-            + "\n"
-        )
-        f.write(
-            json.dumps(
-                {"type": "stage_start", "stage": stage, "num_events": len(events)},
-                ensure_ascii=False,
-            )
-            + "\n"
-        )
-        for ev in events:
-            f.write(json.dumps(ev, ensure_ascii=False) + "\n")
+    metadata = {
+        "type": "metadata",
+        "problem_id": problem_id,
+        "timestamp": timestamp,
+        "timestamp_readable": timestamp_readable,
+        "total_stages": 1,
+        "total_events": len(events),
+        "agent": agent,
+    }
+    write_trajectory(output_path, metadata, [(stage, events)])
 
     print(f"[{agent}_to_trajectory] Wrote {len(events)} event(s) → {output_path}")
     return output_path
@@ -1890,7 +1890,7 @@ def _trajectory_has_messages(traj_path: Path) -> bool:
                     obj = json.loads(line)
                 except json.JSONDecodeError:
                     continue
-                if obj.get("type") == "event" and obj.get("messages"):
+                if obj.get("type") == "event" and has_messages(obj):
                     return True
     except OSError:
         pass
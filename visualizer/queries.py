@@ -1,6 +1,7 @@
 import argparse
 import base64
 import json
+import sys
 import warnings
 from collections import Counter, defaultdict
 from datetime import datetime
@@ -11,6 +12,13 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+# for the shared trajectory format (clients/stratus/stratus_utils/trajectory.py)
+sregym_core_path = Path(__file__).resolve().parents[1]
+if str(sregym_core_path) not in sys.path:
+    sys.path.insert(0, str(sregym_core_path))
+
+from clients.stratus.stratus_utils.trajectory import TrajectoryReader  # noqa: E402
+
 
 def pick_results_csv_with_most_rows(root: Path) -> Path:
     """
@@ -174,47 +182,33 @@ def load_jsonl_into_df(problem_id: str, jsonl_index: dict[str, Path]) -> pd.Data
     if not jsonl_path:
         raise FileNotFoundError(f"No JSONL found for problem_id={problem_id}")
 
-    with jsonl_path.open("r", encoding="utf-8", errors="ignore") as file:
-        first_obj = None
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-            first_obj = json.loads(line)
-            break
+    # Reads v1 and delta-encoded v2 files; each event yields its full message history
+    reader = TrajectoryReader(jsonl_path)
+    if not reader.metadata:
+        raise ValueError(f"No metadata record in {jsonl_path}")
+    problem = reader.metadata.get("problem_id", problem_id)
 
-        if not isinstance(first_obj, dict):
-            raise ValueError(f"First JSON record in {jsonl_path} is not a dict")
+    for obj in reader.events():
+        stage = obj.get("stage", "")
+        num_steps = obj.get("num_steps", 0)
+        messages = obj.get("messages", [])
 
-        problem = first_obj.get("problem_id", problem_id)
-
-        # Continue from current file position
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-            obj = json.loads(line)
-
-            stage = obj.get("stage", "")
-            num_steps = obj.get("num_steps", 0)
-            messages = obj.get("messages", [])
+        if not isinstance(messages, list):
+            continue
 
-            if not isinstance(messages, list):
+        for msg in messages:
+            if not isinstance(msg, dict):
                 continue
-
-            for msg in messages:
-                if not isinstance(msg, dict):
-                    continue
-                rows.append(
-                    {
-                        "problem_id": problem,
-                        "types": msg.get("type", ""),
-                        "contents": msg.get("content", ""),
-                        "tool_calls": extract_tool_calls(msg),
-                        "stage": stage,
-                        "num_steps": num_steps,
-                    }
-                )
+            rows.append(
+                {
+                    "problem_id": problem,
+                    "types": msg.get("type", ""),
+                    "contents": msg.get("content", ""),
+                    "tool_calls": extract_tool_calls(msg),
+                    "stage": stage,
+                    "num_steps": num_steps,
+                }
+            )
 
     return pd.DataFrame(rows)
 